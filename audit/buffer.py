@@ -0,0 +1,129 @@
+"""
+Batched writes of resource versions and audit log entries.
+
+Inside ``audit_batch()``, ``AuditManager.create_version`` and
+``AuditManager.log_action`` collect unsaved records instead of inserting
+them one at a time. The batch inserts them with ``bulk_create`` when the
+block exits, inside the same transaction as the changes they describe, so
+the changes and their audit trail commit or roll back together. Batches
+nest: an inner ``audit_batch()`` joins the outer one.
+
+Example:
+    >>> with audit_batch():
+    ...     for resource in resources:
+    ...         resource.save()  # version and audit entry are buffered
+"""
+
+import json
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from django.db import transaction
+from django.db.models import Max
+
+from directory.models import AuditLog, Resource, ResourceVersion
+
+BATCH_SIZE = 500
+
+_local = threading.local()
+
+
+class AuditBuffer:
+    """Unsaved ResourceVersion and AuditLog records of one batch."""
+
+    def __init__(self) -> None:
+        self.versions: List[ResourceVersion] = []
+        self.logs: List[AuditLog] = []
+        self._full_snapshots: Dict[int, Dict[str, Any]] = {}
+
+    def add_version(
+        self, version: ResourceVersion, full_snapshot: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Buffer a version.
+
+        Args:
+            version: Unsaved version
+            full_snapshot: Full state to store instead if the version's number
+                turns out to be taken (a delta saved from a stale instance)
+        """
+        if full_snapshot is not None:
+            self._full_snapshots[id(version)] = full_snapshot
+        self.versions.append(version)
+
+    def add_log(self, log: AuditLog) -> None:
+        """Buffer an audit log entry."""
+        self.logs.append(log)
+
+    def flush(self) -> None:
+        """Insert the buffered records and empty the buffer."""
+        if self.versions:
+            self._renumber_stale_versions()
+            ResourceVersion.objects.bulk_create(self.versions, batch_size=BATCH_SIZE)
+        if self.logs:
+            AuditLog.objects.bulk_create(self.logs, batch_size=BATCH_SIZE)
+
+        self.versions = []
+        self.logs = []
+        self._full_snapshots = {}
+
+    def _renumber_stale_versions(self) -> None:
+        """Move versions whose number is already taken after the latest one."""
+        latest = dict(
+            ResourceVersion.objects.filter(
+                resource_id__in={version.resource_id for version in self.versions}
+            )
+            .values("resource_id")
+            .annotate(latest=Max("version_number"))
+            .values_list("resource_id", "latest")
+        )
+
+        renumbered = set()
+        for version in self.versions:
+            previous = latest.get(version.resource_id, 0)
+            if version.version_number <= previous:
+                version.version_number = previous + 1
+                full_snapshot = self._full_snapshots.get(id(version))
+                if full_snapshot is not None:
+                    version.snapshot_json = json.dumps(full_snapshot)
+                    version.is_full_snapshot = True
+                renumbered.add(version.resource_id)
+            latest[version.resource_id] = version.version_number
+
+        for resource_id in renumbered:
+            Resource._base_manager.filter(pk=resource_id).update(current_version=latest[resource_id])
+        for version in self.versions:
+            if version.resource_id in renumbered:
+                version.resource.current_version = latest[version.resource_id]
+
+
+def current_buffer() -> Optional[AuditBuffer]:
+    """Return the buffer of the enclosing ``audit_batch()``, if any."""
+    return getattr(_local, "buffer", None)
+
+
+@contextmanager
+def audit_batch() -> Iterator[AuditBuffer]:
+    """
+    Buffer versions and audit entries and insert them in bulk at the end.
+
+    Runs the block in a transaction; the buffered records are inserted just
+    before it commits. Nothing is written if the block raises.
+
+    Yields:
+        The active AuditBuffer
+    """
+    buffer = current_buffer()
+    if buffer is not None:
+        yield buffer
+        return
+
+    with transaction.atomic():
+        buffer = AuditBuffer()
+        _local.buffer = buffer
+        try:
+            yield buffer
+        finally:
+            _local.buffer = None
+        buffer.flush()
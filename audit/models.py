@@ -1,17 +1,76 @@
 """
 Audit models and signals for tracking changes.
+
+Versions and audit entries are inserted as they happen, or in bulk inside
+``audit.buffer.audit_batch()``.
 """
 
 import json
-from typing import Any, Dict, List
+from datetime import date
+from typing import Any, Dict, List, Optional
 
+from django.conf import settings
 from django.contrib.auth.models import User
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models import F, Max
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.utils import timezone
 
 from directory.models import AuditLog, Resource, ResourceVersion
+from directory.services.related_resources import schedule_related_rebuild
+from directory.services.result_sets import schedule_invalidation
+
+from .buffer import audit_batch, current_buffer
+
+# Every Nth version stores the full resource state; the rest store deltas
+DEFAULT_SNAPSHOT_INTERVAL = 10
+
+# Resource fields recorded in version snapshots (attribute names)
+SNAPSHOT_FIELDS = (
+    "name",
+    "category_id",
+    "description",
+    "phone",
+    "email",
+    "website",
+    "address1",
+    "address2",
+    "city",
+    "state",
+    "county",
+    "postal_code",
+    "status",
+    "source",
+    "notes",
+    "hours_of_operation",
+    "is_emergency_service",
+    "is_24_hour_service",
+    "eligibility_requirements",
+    "populations_served",
+    "insurance_accepted",
+    "cost_information",
+    "languages_available",
+    "capacity",
+    "last_verified_at",
+    "last_verified_by_id",
+    "created_at",
+    "updated_at",
+    "created_by_id",
+    "updated_by_id",
+    "is_deleted",
+    "is_archived",
+)
+
+# Fields that change on every save and are not reported as changed
+UNTRACKED_CHANGES = ("updated_at",)
+
+
+def _snapshot_value(value: Any) -> Any:
+    """Return a JSON-serializable snapshot value."""
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
 
 
 class AuditManager:
@@ -36,15 +95,21 @@ class AuditManager:
             metadata: Optional additional context data
 
         Returns:
-            Created AuditLog instance
+            Created AuditLog instance (unsaved inside ``audit_batch()``)
         """
-        return AuditLog.objects.create(
+        log = AuditLog(
             actor=actor,
             action=action,
             target_table=target_table,
             target_id=str(target_id),
             metadata_json=json.dumps(metadata) if metadata else "",
         )
+        buffer = current_buffer()
+        if buffer is not None:
+            buffer.add_log(log)
+        else:
+            log.save(force_insert=True)
+        return log
 
     @staticmethod
     def create_version(
@@ -52,6 +117,8 @@ class AuditManager:
         changed_by: User,
         change_type: str,
         changed_fields: List[str] = None,
+        delta: Optional[Dict[str, Any]] = None,
+        version_number: Optional[int] = None,
     ) -> ResourceVersion:
         """
         Create a new version of a resource.
@@ -61,57 +128,207 @@ class AuditManager:
             changed_by: User making the changes
             change_type: Type of change (create, update, status_change)
             changed_fields: List of field names that were changed
+            delta: Changed snapshot values since the previous version. Stored
+                instead of the full snapshot unless one is due (see
+                VERSION_SNAPSHOT_INTERVAL); None always stores a full snapshot.
+            version_number: Number assigned by ``Resource.save``
+                (``current_version``); None claims the next number, for
+                versions recorded without a save
 
         Returns:
-            Created ResourceVersion instance
+            Created ResourceVersion instance (unsaved inside ``audit_batch()``)
         """
-        # Get the next version number
-        latest_version = (
-            ResourceVersion.objects.filter(resource=resource)
-            .order_by("-version_number")
-            .first()
-        )
+        if version_number is None:
+            Resource._base_manager.filter(pk=resource.pk).update(
+                current_version=F("current_version") + 1
+            )
+            resource.refresh_from_db(fields=["current_version"])
+            version_number = resource.current_version
+
+        interval = getattr(settings, "VERSION_SNAPSHOT_INTERVAL", DEFAULT_SNAPSHOT_INTERVAL)
+        if (version_number - 1) % interval == 0:
+            delta = None
+
+        buffer = current_buffer()
+        if buffer is not None:
+            full_snapshot = AuditManager.snapshot_resource(resource)
+            version = ResourceVersion(
+                resource=resource,
+                version_number=version_number,
+                snapshot_json=json.dumps(full_snapshot if delta is None else delta),
+                is_full_snapshot=delta is None,
+                changed_fields=json.dumps(changed_fields or []),
+                change_type=change_type,
+                changed_by=changed_by,
+            )
+            buffer.add_version(version, full_snapshot if delta is not None else None)
+            return version
+
+        try:
+            with transaction.atomic():
+                return ResourceVersion.objects.create(
+                    resource=resource,
+                    version_number=version_number,
+                    snapshot_json=json.dumps(
+                        AuditManager.snapshot_resource(resource) if delta is None else delta
+                    ),
+                    is_full_snapshot=delta is None,
+                    changed_fields=json.dumps(changed_fields or []),
+                    change_type=change_type,
+                    changed_by=changed_by,
+                )
+        except IntegrityError:
+            # The instance was stale: another save already took this number.
+            # Record the full state after the latest version instead.
+            latest = ResourceVersion.objects.filter(resource=resource).aggregate(
+                latest=Max("version_number")
+            )["latest"]
+            resource.current_version = (latest or 0) + 1
+            Resource._base_manager.filter(pk=resource.pk).update(
+                current_version=resource.current_version
+            )
+            return ResourceVersion.objects.create(
+                resource=resource,
+                version_number=resource.current_version,
+                snapshot_json=json.dumps(AuditManager.snapshot_resource(resource)),
+                changed_fields=json.dumps(changed_fields or []),
+                change_type=change_type,
+                changed_by=changed_by,
+            )
+
+    @staticmethod
+    def update_resources(
+        queryset: Any,
+        actor: User,
+        action: str,
+        change_type: str = "update",
+        **values: Any,
+    ) -> int:
+        """
+        Update resources in bulk, recording a version and audit entry for each.
+
+        The rows are changed with one ``UPDATE``; their versions (deltas of
+        the updated fields) and audit entries are written through
+        ``audit_batch()``, so the query count does not grow with the number
+        of resources.
+
+        ``QuerySet.update`` sends no ``post_save``, so this also does what the
+        save handlers would: sets ``updated_at``, and once the transaction
+        commits expires cached result sets and recomputes the resources'
+        related-resource lists.
+
+        Args:
+            queryset: Resources to update
+            actor: User making the change
+            action: Audit log action (e.g. "publish_resource")
+            change_type: Version change type (update, status_change)
+            **values: Field values, as for ``QuerySet.update``
+
+        Returns:
+            int: Number of resources updated
+        """
+        fields = [Resource._meta.get_field(name) for name in values]
+        changed_fields = [field.name for field in fields]
+        tracked = [field.attname for field in fields if field.attname in SNAPSHOT_FIELDS]
 
-        version_number = (latest_version.version_number + 1) if latest_version else 1
+        with audit_batch():
+            # Fix the rows first: the update may take them out of the queryset
+            ids = list(queryset.values_list("pk", flat=True))
+            if not ids:
+                return 0
+            rows = Resource._base_manager.filter(pk__in=ids)
+            values.setdefault("updated_at", timezone.now())
+            updated = rows.update(current_version=F("current_version") + 1, **values)
+            schedule_invalidation()
+            schedule_related_rebuild(ids)
 
-        # Create snapshot of current resource state
-        snapshot_data = {
+            for resource in rows.all():
+                AuditManager.create_version(
+                    resource=resource,
+                    changed_by=actor,
+                    change_type=change_type,
+                    changed_fields=changed_fields,
+                    delta={attname: _snapshot_value(getattr(resource, attname)) for attname in tracked},
+                    version_number=resource.current_version,
+                )
+                AuditManager.log_action(
+                    actor=actor,
+                    action=action,
+                    target_table="resource",
+                    target_id=resource.id,
+                    metadata=AuditManager.resource_metadata(resource, change_type),
+                )
+        return updated
+
+    @staticmethod
+    def snapshot_resource(resource: Resource) -> Dict[str, Any]:
+        """
+        Build the version snapshot of a resource's current state.
+
+        Args:
+            resource: Resource instance to snapshot
+
+        Returns:
+            Dictionary of field values (JSON-serializable)
+        """
+        return {
             "id": resource.id,
-            "name": resource.name,
-            "category_id": resource.category_id,
-            "description": resource.description,
-            "phone": resource.phone,
-            "email": resource.email,
-            "website": resource.website,
-            "address1": resource.address1,
-            "address2": resource.address2,
-            "city": resource.city,
-            "state": resource.state,
-            "postal_code": resource.postal_code,
+            **{
+                attname: _snapshot_value(getattr(resource, attname))
+                for attname in SNAPSHOT_FIELDS
+            },
+        }
+
+    @staticmethod
+    def changed_values(resource: Resource) -> Optional[Dict[str, Any]]:
+        """
+        Return the snapshot values that differ from the resource as loaded.
+
+        Args:
+            resource: Resource instance being saved
+
+        Returns:
+            Dictionary of changed snapshot values, or None if the loaded
+            values are unknown (e.g. the instance was built by hand or loaded
+            with ``only()``)
+        """
+        loaded = getattr(resource, "_loaded_values", None)
+        if loaded is None or not all(attname in loaded for attname in SNAPSHOT_FIELDS):
+            return None
+
+        changed = {}
+        for attname in SNAPSHOT_FIELDS:
+            value = _snapshot_value(getattr(resource, attname))
+            if value != _snapshot_value(loaded[attname]):
+                changed[attname] = value
+        return changed
+
+    @staticmethod
+    def resource_metadata(resource: Resource, change_type: str) -> Dict[str, Any]:
+        """
+        Build the audit log metadata for a resource change.
+
+        Args:
+            resource: Resource instance that changed
+            change_type: Type of change (create, update)
+
+        Returns:
+            Metadata dictionary for AuditLog.metadata_json
+        """
+        metadata = {
+            "resource_name": resource.name,
             "status": resource.status,
-            "source": resource.source,
-            "notes": resource.notes,
-            "last_verified_at": (
-                resource.last_verified_at.isoformat()
-                if resource.last_verified_at
-                else None
-            ),
-            "last_verified_by_id": resource.last_verified_by_id,
-            "created_at": resource.created_at.isoformat(),
-            "updated_at": resource.updated_at.isoformat(),
-            "created_by_id": resource.created_by_id,
-            "updated_by_id": resource.updated_by_id,
-            "is_deleted": resource.is_deleted,
+            "change_type": change_type,
         }
 
-        return ResourceVersion.objects.create(
-            resource=resource,
-            version_number=version_number,
-            snapshot_json=json.dumps(snapshot_data),
-            changed_fields=json.dumps(changed_fields or []),
-            change_type=change_type,
-            changed_by=changed_by,
-        )
+        # Add notes to metadata if present
+        if resource.notes:
+            metadata["notes"] = resource.notes
+            metadata["has_notes"] = True
+        else:
+            metadata["has_notes"] = False
+
+        return metadata
 
 
 @receiver(post_save, sender=Resource)
@@ -131,27 +348,14 @@ def handle_resource_save(
             if hasattr(instance, "_state")
             else []
         )
+        delta = None
     else:
         change_type = "update"
-        # For now, we'll track all fields as changed
-        # In a more sophisticated implementation, you'd compare old vs new values
+        delta = AuditManager.changed_values(instance)
         changed_fields = [
-            "name",
-            "category",
-            "description",
-            "phone",
-            "email",
-            "website",
-            "address1",
-            "address2",
-            "city",
-            "state",
-            "postal_code",
-            "status",
-            "source",
-            "notes",
-            "last_verified_at",
-            "last_verified_by",
+            Resource._meta.get_field(attname).name
+            for attname in (delta or {})
+            if attname not in UNTRACKED_CHANGES
         ]
 
     # Create version
@@ -160,25 +364,15 @@ def handle_resource_save(
         changed_by=instance.updated_by,
         change_type=change_type,
         changed_fields=changed_fields,
+        delta=delta,
+        version_number=instance.current_version,
     )
 
     # Log audit action
     action = "create_resource" if created else "update_resource"
     
-    # Prepare metadata with notes if available
-    metadata = {
-        "resource_name": instance.name,
-        "status": instance.status,
-        "change_type": change_type,
-    }
-    
-    # Add notes to metadata if present
-    if instance.notes:
-        metadata["notes"] = instance.notes
-        metadata["has_notes"] = True
-    else:
-        metadata["has_notes"] = False
-    
+    metadata = AuditManager.resource_metadata(instance, change_type)
+
     AuditManager.log_action(
         actor=instance.updated_by,
         action=action,
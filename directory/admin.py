@@ -2,19 +2,22 @@
 Admin interface for the directory app.
 """
 
-from django.contrib import admin
+from django.contrib import admin, messages
 from django.core.exceptions import PermissionDenied
 from django.http import HttpResponse
 from django.urls import reverse
 from django.utils.html import format_html
 from django.utils.safestring import mark_safe
 
+from audit.models import AuditManager
+
 from .models import AuditLog, Resource, ResourceVersion, ServiceType, TaxonomyCategory
 from .permissions import (user_can_hard_delete, user_can_manage_taxonomies,
                           user_can_manage_users, user_can_publish,
                           user_can_submit_for_review, user_can_verify,
                           user_is_admin, user_is_editor, user_is_reviewer)
-from .utils import export_resources_to_csv
+from .utils import export_resources_to_csv, export_resources_to_parquet, stream_resources_ndjson
+from .utils.export_utils import PARQUET_AVAILABLE
 
 
 @admin.register(ServiceType)
@@ -223,7 +226,7 @@ class ResourceAdmin(admin.ModelAdmin):
         ),
     )
     inlines = [ResourceVersionInline]
-    actions = ["submit_for_review", "publish_resource", "unpublish_resource", "archive_resources", "unarchive_resources", "export_to_csv"]
+    actions = ["submit_for_review", "publish_resource", "unpublish_resource", "archive_resources", "unarchive_resources", "export_to_csv", "export_to_ndjson", "export_to_parquet"]
 
     def needs_verification_display(self, obj):
         """Display verification status with color coding."""
@@ -264,7 +267,13 @@ class ResourceAdmin(admin.ModelAdmin):
                 "You don't have permission to submit resources for review."
             )
 
-        updated = queryset.update(status="needs_review")
+        updated = AuditManager.update_resources(
+            queryset,
+            request.user,
+            "submit_for_review",
+            change_type="status_change",
+            status="needs_review",
+        )
         self.message_user(
             request, f"Successfully submitted {updated} resource(s) for review."
         )
@@ -279,7 +288,11 @@ class ResourceAdmin(admin.ModelAdmin):
         # Update verification info
         from django.utils import timezone
 
-        updated = queryset.update(
+        updated = AuditManager.update_resources(
+            queryset,
+            request.user,
+            "publish_resource",
+            change_type="status_change",
             status="published",
             last_verified_at=timezone.now(),
             last_verified_by=request.user,
@@ -293,7 +306,13 @@ class ResourceAdmin(admin.ModelAdmin):
         if not user_can_publish(request.user):
             raise PermissionDenied("You don't have permission to unpublish resources.")
 
-        updated = queryset.update(status="needs_review")
+        updated = AuditManager.update_resources(
+            queryset,
+            request.user,
+            "unpublish_resource",
+            change_type="status_change",
+            status="needs_review",
+        )
         self.message_user(request, f"Successfully unpublished {updated} resource(s).")
 
     unpublish_resource.short_description = "Unpublish selected resources"
@@ -313,7 +332,10 @@ class ResourceAdmin(admin.ModelAdmin):
         # For bulk archive, we'll set a generic reason
         from django.utils import timezone
         
-        updated = to_archive.update(
+        updated = AuditManager.update_resources(
+            to_archive,
+            request.user,
+            "archive_resource",
             is_archived=True,
             archived_at=timezone.now(),
             archived_by=request.user,
@@ -335,7 +357,10 @@ class ResourceAdmin(admin.ModelAdmin):
             self.message_user(request, "No archived resources to unarchive.")
             return
 
-        updated = to_unarchive.update(
+        updated = AuditManager.update_resources(
+            to_unarchive,
+            request.user,
+            "unarchive_resource",
             is_archived=False,
             archived_at=None,
             archived_by=None,
@@ -358,6 +383,36 @@ class ResourceAdmin(admin.ModelAdmin):
 
     export_to_csv.short_description = "Export selected resources to CSV"
 
+    def export_to_ndjson(self, request, queryset):
+        """Export selected resources to newline-delimited JSON."""
+        if not user_is_admin(request.user):
+            raise PermissionDenied("You don't have permission to export resources.")
+
+        if not queryset.exists():
+            queryset = Resource.objects.filter(is_deleted=False)
+
+        return stream_resources_ndjson(queryset)
+
+    export_to_ndjson.short_description = "Export selected resources to NDJSON"
+
+    def export_to_parquet(self, request, queryset):
+        """Export selected resources to Parquet (requires pyarrow)."""
+        if not user_is_admin(request.user):
+            raise PermissionDenied("You don't have permission to export resources.")
+
+        if not PARQUET_AVAILABLE:
+            self.message_user(
+                request, "Parquet export requires the pyarrow package.", level=messages.ERROR
+            )
+            return None
+
+        if not queryset.exists():
+            queryset = Resource.objects.filter(is_deleted=False)
+
+        return export_resources_to_parquet(queryset)
+
+    export_to_parquet.short_description = "Export selected resources to Parquet"
+
 
 @admin.register(ResourceVersion)
 class ResourceVersionAdmin(admin.ModelAdmin):
@@ -376,6 +431,7 @@ class ResourceVersionAdmin(admin.ModelAdmin):
         "resource",
         "version_number",
         "snapshot_json",
+        "is_full_snapshot",
         "changed_fields",
         "change_type",
         "changed_by",
@@ -387,6 +443,7 @@ class ResourceVersionAdmin(admin.ModelAdmin):
         "change_type",
         "changed_by",
         "changed_at",
+        "is_full_snapshot",
         "snapshot_json",
         "changed_fields",
     ]
@@ -18,3 +18,11 @@ class DirectoryConfig(AppConfig):
     
     default_auto_field = "django.db.models.BigAutoField"
     name = "directory"
+
+    def ready(self):
+        """Import signal handlers when the app is ready."""
+        import directory.services.coverage_index  # noqa
+        import directory.services.related_resources  # noqa
+        import directory.services.result_sets  # noqa
+        import directory.services.service_areas  # noqa
+        import directory.services.suggestions  # noqa
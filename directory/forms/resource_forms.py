@@ -475,3 +475,11 @@ class ResourceForm(forms.ModelForm):
                 import logging
                 logger = logging.getLogger(__name__)
                 logger.warning(f"Error processing service areas for resource {resource.id}: {e}")
+
+        # bulk_create sends no post_save, so rebuild the service-area rows
+        # that location search reads (the delete above already removed them)
+        # and expire cached location results
+        from ..services.result_sets import schedule_invalidation
+        from ..services.service_areas import sync_resources
+        sync_resources([resource.id])
+        schedule_invalidation()
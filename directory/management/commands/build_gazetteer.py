@@ -0,0 +1,58 @@
+"""
+Management command to rebuild the offline geocoding gazetteer.
+
+GazetteerEntry rows map place, county and state names, FIPS codes and ZIP
+codes to a representative point. They are rebuilt automatically by the
+TIGER import commands; run this after other coverage-area changes, or to
+load ZIP codes from a Census ZCTA gazetteer file.
+
+Usage:
+    python manage.py build_gazetteer
+    python manage.py build_gazetteer --zcta-file 2020_Gaz_zcta_national.txt
+
+Author: Resource Directory Team
+Created: 2025-01-15
+Version: 1.0.0
+"""
+
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from directory.services.gazetteer import build_gazetteer, load_zcta_file
+
+
+class Command(BaseCommand):
+    """Rebuild GazetteerEntry rows from coverage areas and ZCTA data."""
+
+    help = "Rebuild the offline geocoding gazetteer"
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            '--zcta-file',
+            help='Census ZCTA gazetteer file to load ZIP codes from'
+        )
+        parser.add_argument(
+            '--zcta-state',
+            help='Two-letter state to record on loaded ZIP codes'
+        )
+        parser.add_argument(
+            '--skip-areas',
+            action='store_true',
+            help='Only load ZIP codes; keep existing coverage-area entries'
+        )
+
+    def handle(self, *args, **options):
+        """Handle the command execution."""
+        zcta_file = options['zcta_file']
+        if zcta_file and not os.path.exists(zcta_file):
+            raise CommandError(f"ZCTA file not found: {zcta_file}")
+
+        if not options['skip_areas']:
+            written = build_gazetteer()
+            self.stdout.write(self.style.SUCCESS(f"Wrote {written} coverage-area gazetteer entries."))
+
+        if zcta_file:
+            loaded = load_zcta_file(zcta_file, options['zcta_state'])
+            self.stdout.write(self.style.SUCCESS(f"Loaded {loaded} ZIP code entries."))
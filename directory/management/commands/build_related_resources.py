@@ -0,0 +1,47 @@
+"""
+Management command to rebuild the precomputed related-resources table.
+
+A resource's suggestions are recomputed when it is saved, but other
+resources' suggestions only change when their own lists are rebuilt. Run
+this command nightly (e.g. from cron) to refresh every list.
+
+Usage:
+    python manage.py build_related_resources
+    python manage.py build_related_resources --resource 12 --resource 40
+
+Author: Resource Directory Team
+Created: 2025-01-15
+Version: 1.0.0
+"""
+
+from django.core.management.base import BaseCommand
+
+from directory.services.related_resources import rebuild_related_resources
+
+
+class Command(BaseCommand):
+    """Rebuild RelatedResource rows for published resources."""
+
+    help = "Rebuild the precomputed related-resources suggestions"
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            '--resource',
+            type=int,
+            action='append',
+            dest='resource_ids',
+            help='Only rebuild suggestions for this resource ID (repeatable)'
+        )
+
+    def handle(self, *args, **options):
+        """Handle the command execution."""
+        resource_ids = options['resource_ids']
+        if resource_ids:
+            self.stdout.write(f"Rebuilding related resources for {len(resource_ids)} resource(s)...")
+        else:
+            self.stdout.write("Rebuilding all related resources...")
+
+        written = rebuild_related_resources(resource_ids)
+
+        self.stdout.write(self.style.SUCCESS(f"Wrote {written} related resource rows."))
@@ -137,6 +137,11 @@ class Command(BaseCommand):
             )
         )
 
+        # Keep the offline geocoding gazetteer in step with the boundaries
+        from directory.services.gazetteer import build_gazetteer
+        entries = build_gazetteer()
+        self.stdout.write(f"Rebuilt gazetteer: {entries} entries")
+
     def _import_state_simple(
         self, 
         state_fips: str, 
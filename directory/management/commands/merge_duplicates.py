@@ -12,15 +12,15 @@ Usage:
     python manage.py merge_duplicates --auto-merge --confidence=high
 """
 
-import json
 from typing import Any, Dict, List, Optional, Set
 
 from django.core.management.base import BaseCommand, CommandError
 from django.contrib.auth.models import User
-from django.db import transaction
 from django.utils import timezone
 
-from directory.models import Resource, ResourceVersion, AuditLog
+from audit.buffer import audit_batch
+from audit.models import AuditManager
+from directory.models import Resource
 
 
 class DuplicateMerger:
@@ -49,7 +49,7 @@ class DuplicateMerger:
             Dictionary with merge results
         """
         try:
-            with transaction.atomic():
+            with audit_batch():
                 # Get the primary resource
                 primary = Resource.objects.get(id=primary_id)
                 duplicates = Resource.objects.filter(id__in=duplicate_ids)
@@ -78,7 +78,8 @@ class DuplicateMerger:
                 return {
                     'success': True,
                     'primary_id': primary_id,
-                    'archived_ids': list(duplicates.values_list('id', flat=True)),
+                    # The duplicates are archived now, so Resource.objects hides them
+                    'archived_ids': [resource.id for resource in archived_resources],
                     'merged_data': merged_data,
                     'message': f"Successfully merged {len(duplicates)} duplicates into primary resource {primary_id}"
                 }
@@ -90,53 +91,12 @@ class DuplicateMerger:
 
     def _create_backup_version(self, resource: Resource, change_type: str) -> None:
         """Create a backup version of the resource before merging."""
-        ResourceVersion.objects.create(
+        AuditManager.create_version(
             resource=resource,
-            version_number=ResourceVersion.objects.filter(resource=resource).count() + 1,
-            snapshot_json=json.dumps(self._get_resource_snapshot(resource)),
-            changed_fields=json.dumps([]),
-            change_type=change_type,
             changed_by=self.user,
+            change_type=change_type,
         )
 
-    def _get_resource_snapshot(self, resource: Resource) -> Dict[str, Any]:
-        """Get a snapshot of the resource's current state."""
-        return {
-            'id': resource.id,
-            'name': resource.name,
-            'category_id': resource.category_id,
-            'description': resource.description,
-            'phone': resource.phone,
-            'email': resource.email,
-            'website': resource.website,
-            'address1': resource.address1,
-            'address2': resource.address2,
-            'city': resource.city,
-            'state': resource.state,
-            'county': resource.county,
-            'postal_code': resource.postal_code,
-            'status': resource.status,
-            'source': resource.source,
-            'notes': resource.notes,
-            'hours_of_operation': resource.hours_of_operation,
-            'is_emergency_service': resource.is_emergency_service,
-            'is_24_hour_service': resource.is_24_hour_service,
-            'eligibility_requirements': resource.eligibility_requirements,
-            'populations_served': resource.populations_served,
-            'insurance_accepted': resource.insurance_accepted,
-            'cost_information': resource.cost_information,
-            'languages_available': resource.languages_available,
-            'capacity': resource.capacity,
-            'last_verified_at': resource.last_verified_at.isoformat() if resource.last_verified_at else None,
-            'last_verified_by_id': resource.last_verified_by_id,
-            'created_at': resource.created_at.isoformat(),
-            'updated_at': resource.updated_at.isoformat(),
-            'created_by_id': resource.created_by_id,
-            'updated_by_id': resource.updated_by_id,
-            'is_deleted': resource.is_deleted,
-            'is_archived': resource.is_archived,
-        }
-
     def _merge_resource_data(self, primary: Resource, duplicates: List[Resource]) -> Dict[str, Any]:
         """Merge data from duplicates into primary resource."""
         merged_data = {
@@ -247,54 +207,53 @@ class DuplicateMerger:
 
     def _archive_duplicates(self, duplicates: List[Resource], primary_id: int, merge_notes: str) -> List[Resource]:
         """Archive duplicate resources."""
-        archived_resources = []
-        
-        for duplicate in duplicates:
-            duplicate.is_archived = True
-            duplicate.archived_at = timezone.now()
-            duplicate.archived_by = self.user
-            duplicate.archive_reason = f"Merged into primary resource ID {primary_id}. {merge_notes}"
-            duplicate.updated_by = self.user
-            duplicate.updated_at = timezone.now()
-            duplicate.save()
-            
-            archived_resources.append(duplicate)
-        
-        return archived_resources
+        now = timezone.now()
+        AuditManager.update_resources(
+            Resource.objects.filter(id__in=[duplicate.id for duplicate in duplicates]),
+            self.user,
+            "update_resource",
+            is_archived=True,
+            archived_at=now,
+            archived_by=self.user,
+            archive_reason=f"Merged into primary resource ID {primary_id}. {merge_notes}",
+            updated_by=self.user,
+            updated_at=now,
+        )
+        return list(duplicates)
 
     def _log_merge_operation(self, primary: Resource, duplicates: List[Resource], merge_notes: str) -> None:
         """Log the merge operation in audit trail."""
         duplicate_ids = [str(d.id) for d in duplicates]
         
         # Log merge action
-        AuditLog.objects.create(
+        AuditManager.log_action(
             actor=self.user,
             action="merge_duplicates",
             target_table="resource",
-            target_id=str(primary.id),
-            metadata_json=json.dumps({
+            target_id=primary.id,
+            metadata={
                 'primary_resource_id': primary.id,
                 'primary_resource_name': primary.name,
                 'duplicate_resource_ids': duplicate_ids,
                 'merge_notes': merge_notes,
                 'merged_at': timezone.now().isoformat(),
-            }),
+            },
         )
         
         # Log archive actions for each duplicate
         for duplicate in duplicates:
-            AuditLog.objects.create(
+            AuditManager.log_action(
                 actor=self.user,
                 action="archive_duplicate",
                 target_table="resource",
-                target_id=str(duplicate.id),
-                metadata_json=json.dumps({
+                target_id=duplicate.id,
+                metadata={
                     'archived_resource_id': duplicate.id,
                     'archived_resource_name': duplicate.name,
                     'merged_into_primary_id': primary.id,
                     'merge_notes': merge_notes,
                     'archived_at': timezone.now().isoformat(),
-                }),
+                },
             )
 
 
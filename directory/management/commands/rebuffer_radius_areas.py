@@ -0,0 +1,53 @@
+"""
+Management command to recompute radius coverage-area geometries.
+
+Radius areas saved before buffers were computed in meters were buffered by
+``radius_m`` degrees, producing planet-sized polygons. This command
+re-buffers every radius area from its center and radius and refreshes the
+bbox of its ResourceServiceArea rows. Run it once after upgrading; it is
+safe to run again.
+
+Usage:
+    python manage.py rebuffer_radius_areas
+    python manage.py rebuffer_radius_areas --area 7 --area 12
+
+Author: Resource Directory Team
+Created: 2025-01-15
+Version: 1.0.0
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from directory.services.service_areas import rebuffer_radius_areas
+
+
+class Command(BaseCommand):
+    """Re-buffer radius coverage areas in meters."""
+
+    help = "Recompute radius coverage-area geometries and their service-area rows"
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            '--area',
+            type=int,
+            action='append',
+            dest='area_ids',
+            help='Only re-buffer this coverage area ID (repeatable)'
+        )
+
+    def handle(self, *args, **options):
+        """Handle the command execution."""
+        if not getattr(settings, 'GIS_ENABLED', False):
+            raise CommandError("Re-buffering radius areas requires GIS to be enabled.")
+
+        area_ids = options['area_ids']
+        if area_ids:
+            self.stdout.write(f"Re-buffering {len(area_ids)} radius area(s)...")
+        else:
+            self.stdout.write("Re-buffering all radius areas...")
+
+        count = rebuffer_radius_areas(area_ids)
+
+        self.stdout.write(self.style.SUCCESS(f"Re-buffered {count} radius areas."))
@@ -0,0 +1,57 @@
+"""
+Management command to install or rebuild the full-text search index.
+
+The index is normally created by migration 0019_add_full_text_search. This
+command repairs it after a bulk load that bypassed triggers, or recreates it
+on a database that was restored without the FTS5 table.
+
+Usage:
+    python manage.py rebuild_search_index
+    python manage.py rebuild_search_index --recreate
+
+Author: Resource Directory Team
+Created: 2025-01-15
+Version: 1.0.0
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import NotSupportedError, connection
+
+from directory.services.search_index import (
+    drop_search_index,
+    get_search_backend,
+    install_search_index,
+    rebuild_search_index,
+)
+
+
+class Command(BaseCommand):
+    """Install or rebuild the backend-specific full-text search index."""
+
+    help = "Install or rebuild the full-text search index (FTS5 or tsvector)"
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            '--recreate',
+            action='store_true',
+            help='Drop and recreate the index, triggers and column'
+        )
+
+    def handle(self, *args, **options):
+        """Handle the command execution."""
+        try:
+            backend = get_search_backend(connection)
+        except NotSupportedError as e:
+            raise CommandError(str(e))
+
+        if options['recreate']:
+            self.stdout.write(f"Recreating {backend} search index...")
+            drop_search_index(connection)
+            install_search_index(connection)
+        else:
+            self.stdout.write(f"Rebuilding {backend} search index...")
+            install_search_index(connection)
+            rebuild_search_index(connection)
+
+        self.stdout.write(self.style.SUCCESS("Search index is up to date."))
@@ -0,0 +1,47 @@
+"""
+Management command to rebuild the resource service-area lookup table.
+
+ResourceServiceArea rows are kept current by signal handlers. This command
+repopulates the table after bulk loads that bypassed signals (e.g. coverage
+imports using bulk_create) or after changing specificity scores.
+
+Usage:
+    python manage.py rebuild_service_areas
+    python manage.py rebuild_service_areas --resource 12 --resource 40
+
+Author: Resource Directory Team
+Created: 2025-01-15
+Version: 1.0.0
+"""
+
+from django.core.management.base import BaseCommand
+
+from directory.services.service_areas import rebuild_service_areas
+
+
+class Command(BaseCommand):
+    """Rebuild ResourceServiceArea rows from ResourceCoverage."""
+
+    help = "Rebuild the denormalized resource service-area table"
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            '--resource',
+            type=int,
+            action='append',
+            dest='resource_ids',
+            help='Only rebuild rows for this resource ID (repeatable)'
+        )
+
+    def handle(self, *args, **options):
+        """Handle the command execution."""
+        resource_ids = options['resource_ids']
+        if resource_ids:
+            self.stdout.write(f"Rebuilding service areas for {len(resource_ids)} resource(s)...")
+        else:
+            self.stdout.write("Rebuilding all resource service areas...")
+
+        written = rebuild_service_areas(resource_ids)
+
+        self.stdout.write(self.style.SUCCESS(f"Wrote {written} service area rows."))
@@ -0,0 +1,26 @@
+# Generated manually to restore full-text search after 0017_remove_fts5_search
+
+from django.db import migrations
+
+from directory.services.search_index import drop_search_index, install_search_index
+
+
+def create_search_index(apps, schema_editor):
+    """Create the FTS5 table (SQLite) or tsvector column (PostgreSQL)."""
+    install_search_index(schema_editor.connection)
+
+
+def remove_search_index(apps, schema_editor):
+    """Drop the full-text index created by create_search_index."""
+    drop_search_index(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("directory", "0018_alter_coveragearea_center_alter_coveragearea_geom"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, remove_search_index),
+    ]
@@ -0,0 +1,119 @@
+# Generated manually to add the denormalized resource service-area table
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def populate_service_areas(apps, schema_editor):
+    """Materialize service-area rows from existing ResourceCoverage rows."""
+    ResourceCoverage = apps.get_model("directory", "ResourceCoverage")
+    CoverageArea = apps.get_model("directory", "CoverageArea")
+    ResourceServiceArea = apps.get_model("directory", "ResourceServiceArea")
+
+    specificity_scores = {
+        "RADIUS": 100,
+        "POLYGON": 90,
+        "CITY": 80,
+        "COUNTY": 60,
+        "STATE": 40,
+    }
+
+    metadata = {}
+    for area in CoverageArea.objects.all().iterator(chunk_size=200):
+        fields = {
+            "kind": area.kind,
+            "specificity": specificity_scores.get(area.kind, 0),
+        }
+        # Geometry fields are GEOS objects only when GIS is enabled
+        geom = getattr(area, "geom", None)
+        if hasattr(geom, "extent"):
+            fields.update(zip(("min_lon", "min_lat", "max_lon", "max_lat"), geom.extent))
+        center = getattr(area, "center", None)
+        if not hasattr(center, "x") and hasattr(geom, "centroid"):
+            center = geom.centroid
+        if hasattr(center, "x"):
+            fields["center_lon"] = center.x
+            fields["center_lat"] = center.y
+        metadata[area.id] = fields
+
+    rows = [
+        ResourceServiceArea(
+            resource_id=resource_id,
+            coverage_area_id=area_id,
+            **metadata[area_id],
+        )
+        for resource_id, area_id in ResourceCoverage.objects.values_list(
+            "resource_id", "coverage_area_id"
+        )
+        if area_id in metadata
+    ]
+    ResourceServiceArea.objects.bulk_create(rows, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("directory", "0019_add_full_text_search"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ResourceServiceArea",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("kind", models.CharField(max_length=20)),
+                ("specificity", models.IntegerField(default=0)),
+                ("min_lon", models.FloatField(blank=True, null=True)),
+                ("min_lat", models.FloatField(blank=True, null=True)),
+                ("max_lon", models.FloatField(blank=True, null=True)),
+                ("max_lat", models.FloatField(blank=True, null=True)),
+                ("center_lon", models.FloatField(blank=True, null=True)),
+                ("center_lat", models.FloatField(blank=True, null=True)),
+                ("refreshed_at", models.DateTimeField(auto_now=True)),
+                (
+                    "coverage_area",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="service_area_entries",
+                        to="directory.coveragearea",
+                    ),
+                ),
+                (
+                    "resource",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="service_areas",
+                        to="directory.resource",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Resource Service Area",
+                "verbose_name_plural": "Resource Service Areas",
+                "indexes": [
+                    models.Index(
+                        fields=["coverage_area", "resource"],
+                        name="service_area_area_res_idx",
+                    ),
+                    models.Index(
+                        fields=["resource", "-specificity"],
+                        name="service_area_res_spec_idx",
+                    ),
+                    models.Index(
+                        fields=["min_lon", "max_lon", "min_lat", "max_lat"],
+                        name="service_area_bbox_idx",
+                    ),
+                ],
+                "unique_together": {("resource", "coverage_area")},
+            },
+        ),
+        migrations.RunPython(populate_service_areas, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,63 @@
+# Generated manually to add the offline geocoding gazetteer table
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("directory", "0020_resourceservicearea"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GazetteerEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("key", models.CharField(db_index=True, max_length=200)),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("STATE", "State"),
+                            ("COUNTY", "County"),
+                            ("CITY", "City"),
+                            ("ZIP", "ZIP Code"),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                ("name", models.CharField(max_length=200)),
+                ("state_abbr", models.CharField(blank=True, max_length=2)),
+                ("rank", models.PositiveSmallIntegerField(default=0)),
+                ("latitude", models.FloatField()),
+                ("longitude", models.FloatField()),
+                (
+                    "coverage_area",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="gazetteer_entries",
+                        to="directory.coveragearea",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Gazetteer Entry",
+                "verbose_name_plural": "Gazetteer Entries",
+                "indexes": [
+                    models.Index(fields=["kind"], name="gazetteer_kind_idx"),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated manually to add the precomputed related-resources table
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("directory", "0021_gazetteerentry"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RelatedResource",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("rank", models.PositiveSmallIntegerField()),
+                ("score", models.FloatField()),
+                ("computed_at", models.DateTimeField(auto_now=True)),
+                (
+                    "related",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="directory.resource",
+                    ),
+                ),
+                (
+                    "resource",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="related_links",
+                        to="directory.resource",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Related Resource",
+                "verbose_name_plural": "Related Resources",
+                "indexes": [
+                    models.Index(fields=["resource", "rank"], name="related_res_rank_idx"),
+                ],
+                "unique_together": {("resource", "related")},
+            },
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated manually to add delta-based resource versions
+
+from django.db import migrations, models
+from django.db.models import Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def populate_current_version(apps, schema_editor):
+    """Set each resource's version counter to its latest version number."""
+    Resource = apps.get_model("directory", "Resource")
+    ResourceVersion = apps.get_model("directory", "ResourceVersion")
+
+    latest = (
+        ResourceVersion.objects.filter(resource=OuterRef("pk"))
+        .values("resource")
+        .annotate(latest=Max("version_number"))
+        .values("latest")
+    )
+    Resource.objects.update(current_version=Coalesce(Subquery(latest), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("directory", "0022_relatedresource"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="resource",
+            name="current_version",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Number of the latest ResourceVersion",
+            ),
+        ),
+        migrations.AddField(
+            model_name="resourceversion",
+            name="is_full_snapshot",
+            field=models.BooleanField(default=True),
+        ),
+        migrations.RunPython(populate_current_version, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated manually to keep the directory generation counter in the database
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("directory", "0023_resource_current_version_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DirectoryGeneration",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("generation", models.BigIntegerField()),
+                ("changed_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "verbose_name": "Directory Generation",
+                "verbose_name_plural": "Directory Generation",
+            },
+        ),
+    ]
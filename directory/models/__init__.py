@@ -36,7 +36,11 @@ from .resource import Resource
 from .taxonomy import ServiceType, TaxonomyCategory
 from .coverage_area import CoverageArea
 from .resource_coverage import ResourceCoverage
+from .resource_service_area import ResourceServiceArea
 from .geocoding_cache import GeocodingCache
+from .gazetteer import GazetteerEntry
+from .related_resource import RelatedResource
+from .directory_generation import DirectoryGeneration
 from .search_analytics import LocationSearchLog, SearchAnalytics
 
 # Import managers for direct access
@@ -51,7 +55,11 @@ __all__ = [
     "AuditLog",
     "CoverageArea",
     "ResourceCoverage",
+    "ResourceServiceArea",
     "GeocodingCache",
+    "GazetteerEntry",
+    "RelatedResource",
+    "DirectoryGeneration",
     "ResourceManager",
     "LocationSearchLog",
     "SearchAnalytics",
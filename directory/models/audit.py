@@ -49,10 +49,17 @@ class ResourceVersion(models.Model):
     Versions are automatically created whenever a resource is saved, providing
     a complete history that can be used for auditing, rollback, or analysis.
     
+    To keep the table small, most versions store only the fields that changed
+    (a delta); every VERSION_SNAPSHOT_INTERVAL-th version, and any version
+    whose previous state is unknown, stores the full state. ``snapshot``
+    rebuilds the full state of any version from the nearest full snapshot.
+    
     Attributes:
         resource (Resource): The resource this version belongs to
         version_number (int): Sequential version number for this resource
-        snapshot_json (str): Full resource state as JSON string
+        snapshot_json (str): Full resource state, or changed values for
+            deltas, as JSON string
+        is_full_snapshot (bool): Whether snapshot_json holds the full state
         changed_fields (str): JSON array of field names that changed
         change_type (str): Type of change (create, update, status_change)
         changed_by (User): User who made the change
@@ -80,7 +87,8 @@ class ResourceVersion(models.Model):
         "directory.Resource", on_delete=models.CASCADE, related_name="versions"
     )
     version_number = models.PositiveIntegerField()
-    snapshot_json = models.TextField()  # Full resource state at save time
+    snapshot_json = models.TextField()  # Full state, or changed values for deltas
+    is_full_snapshot = models.BooleanField(default=True)
     changed_fields = models.TextField()  # JSON array of changed field names
     change_type = models.CharField(max_length=20, choices=CHANGE_TYPES)
     changed_by = models.ForeignKey(
@@ -100,11 +108,65 @@ class ResourceVersion(models.Model):
     def snapshot(self) -> Dict[str, Any]:
         """Get the snapshot data as a dictionary.
         
+        Delta versions are rebuilt from the nearest earlier full snapshot
+        (one query, cached on the instance).
+        
         Returns:
             Dict[str, Any]: The complete resource state at version time
         """
+        if self.is_full_snapshot:
+            return json.loads(self.snapshot_json)
+        if not hasattr(self, "_snapshot"):
+            self._snapshot = self.reconstruct(self.resource_id, self.version_number)
+        return dict(self._snapshot)
+
+    @property
+    def delta(self) -> Dict[str, Any]:
+        """Get the values stored by this version (the full state for snapshots).
+        
+        Returns:
+            Dict[str, Any]: Field values recorded in snapshot_json
+        """
         return json.loads(self.snapshot_json)
 
+    @classmethod
+    def reconstruct(cls, resource_id: int, version_number: int) -> Dict[str, Any]:
+        """Rebuild the full state of a resource at a given version.
+        
+        Applies the deltas after the latest full snapshot at or before
+        ``version_number``, in order.
+        
+        Args:
+            resource_id: ID of the resource
+            version_number: Version to rebuild
+            
+        Returns:
+            Dict[str, Any]: The complete resource state at that version
+        """
+        base = (
+            cls.objects.filter(
+                resource_id=resource_id,
+                is_full_snapshot=True,
+                version_number__lte=version_number,
+            )
+            .order_by("-version_number")
+            .values("version_number")[:1]
+        )
+        chain = (
+            cls.objects.filter(
+                resource_id=resource_id,
+                version_number__lte=version_number,
+                version_number__gte=models.Subquery(base),
+            )
+            .order_by("version_number")
+            .values_list("snapshot_json", flat=True)
+        )
+
+        snapshot: Dict[str, Any] = {}
+        for values in chain:
+            snapshot.update(json.loads(values))
+        return snapshot
+
     @property
     def changed_field_list(self) -> List[str]:
         """Get the list of changed fields.
@@ -260,11 +260,13 @@ class CoverageArea(models.Model):
         try:
             from django.contrib.gis.geos import Point, MultiPolygon
             from django.conf import settings
+            from directory.utils.geodesy import geodesic_buffer
             
             # Process radius-based areas
             if self.kind == "RADIUS" and hasattr(self, 'center') and self.center and self.radius_m:
-                # Create buffer polygon from center point
-                buffer_geom = self.center.buffer(self.radius_m)
+                # Buffer in meters (the center is in degrees, so buffering it
+                # directly would treat radius_m as degrees)
+                buffer_geom = geodesic_buffer(self.center, self.radius_m)
                 
                 # Convert to MultiPolygon if needed
                 if hasattr(self, 'geom'):
@@ -374,7 +376,8 @@ class CoverageArea(models.Model):
         """
         try:
             if hasattr(self, 'geom') and self.geom:
-                return self.geom.area
+                from directory.utils.geodesy import geodesic_area_m2
+                return geodesic_area_m2(self.geom)
         except (ImportError, AttributeError):
             pass
         return None
@@ -398,7 +401,8 @@ class CoverageArea(models.Model):
         """
         try:
             if hasattr(self, 'geom') and self.geom:
-                return self.geom.length
+                from directory.utils.geodesy import geodesic_length_m
+                return geodesic_length_m(self.geom)
         except (ImportError, AttributeError):
             pass
         return None
@@ -0,0 +1,46 @@
+"""
+Directory Generation Model - Version Counter of Directory Data
+
+This module contains the DirectoryGeneration model, a single-row table
+holding the counter that versions every cache of directory data (result
+sets, facet counts, rendered public pages and their ETags). It is bumped
+by directory.services.result_sets whenever a resource, its coverage or the
+taxonomy changes.
+
+The counter lives in the database rather than the Django cache so that
+every process sees the same value: gunicorn workers, the import worker and
+management commands each have their own in-memory cache. Changes bump it
+after their transaction commits, so it never runs ahead of the data.
+
+Author: Resource Directory Team
+Created: 2025-01-15
+Last Modified: 2025-01-15
+Version: 1.0.0
+
+Usage:
+    from directory.services.result_sets import get_generation
+
+    get_generation()
+"""
+
+from django.db import models
+
+
+class DirectoryGeneration(models.Model):
+    """The directory generation counter (a single row, ``pk=1``).
+
+    Attributes:
+        generation: Counter included in every directory cache key
+        changed_at: When the counter was last bumped
+    """
+
+    generation = models.BigIntegerField()
+    changed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Directory Generation"
+        verbose_name_plural = "Directory Generation"
+
+    def __str__(self) -> str:
+        """Return a descriptive string representation."""
+        return f"Generation {self.generation}"
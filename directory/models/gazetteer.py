@@ -0,0 +1,79 @@
+"""
+Gazetteer Model - Offline Place Name → Coordinate Lookup Table
+
+This module contains the GazetteerEntry model, a compact table mapping
+normalized place names, FIPS codes and ZIP codes to a representative point.
+It is built from the imported TIGER coverage areas (states, counties and
+places) plus an optional Census ZCTA gazetteer file, and is read by the
+GazetteerProvider so administrative-area queries never need the network.
+
+Rows are derived data: rebuild them with ``manage.py build_gazetteer``
+(the TIGER import commands do this automatically).
+
+Author: Resource Directory Team
+Created: 2025-01-15
+Last Modified: 2025-01-15
+Version: 1.0.0
+
+Usage:
+    from directory.models import GazetteerEntry
+
+    # All candidates for a normalized query, best first
+    GazetteerEntry.objects.filter(key="corbin ky").order_by("rank")
+"""
+
+from django.db import models
+
+
+class GazetteerEntry(models.Model):
+    """One lookup key for a named place.
+
+    A place has several keys ("london ky", "london kentucky", "london",
+    "2147476"). Keys that name the state are unambiguous and get rank 0;
+    bare names get a higher rank so that, for example, a state outranks a
+    city of the same name.
+
+    Attributes:
+        key: Normalized lookup key (lowercase, punctuation stripped)
+        kind: Place kind (STATE, COUNTY, CITY or ZIP)
+        name: Display name
+        state_abbr: Two-letter state abbreviation, if known
+        rank: Lower is preferred when a key has several entries
+        latitude, longitude: Representative point (centroid or internal point)
+        coverage_area: The coverage area the entry was built from, if any
+    """
+
+    KIND_CHOICES = [
+        ("STATE", "State"),
+        ("COUNTY", "County"),
+        ("CITY", "City"),
+        ("ZIP", "ZIP Code"),
+    ]
+
+    key = models.CharField(max_length=200, db_index=True)
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    name = models.CharField(max_length=200)
+    state_abbr = models.CharField(max_length=2, blank=True)
+    rank = models.PositiveSmallIntegerField(default=0)
+
+    latitude = models.FloatField()
+    longitude = models.FloatField()
+
+    coverage_area = models.ForeignKey(
+        "CoverageArea",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="gazetteer_entries",
+    )
+
+    class Meta:
+        verbose_name = "Gazetteer Entry"
+        verbose_name_plural = "Gazetteer Entries"
+        indexes = [
+            models.Index(fields=["kind"], name="gazetteer_kind_idx"),
+        ]
+
+    def __str__(self) -> str:
+        """Return a descriptive string representation."""
+        return f"{self.key} → {self.name} ({self.kind})"
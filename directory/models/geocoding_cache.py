@@ -26,14 +26,86 @@ Usage:
         query="123 Main St, London, KY",
         expires_at__gt=timezone.now()
     ).first()
+
+Hit accounting:
+    Cache lookups never write. ``get_cached_result`` records hits in an
+    in-process buffer, which is written back with one bulk ``F()`` increment
+    per distinct count. Web workers flush after a response has been sent,
+    once GEOCODING_HIT_FLUSH_SECONDS have passed or the buffer holds
+    GEOCODING_HIT_FLUSH_MAX_PENDING entries. Whatever is still buffered
+    is flushed when the process exits normally (an ``atexit`` hook), which
+    covers worker restarts and scripts. A process that is killed loses its
+    unflushed hits.
 """
 
+import atexit
 import hashlib
-from typing import Optional
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional
 
+from django.conf import settings
+from django.core.signals import request_finished
 from django.db import models
+from django.dispatch import receiver
 from django.utils import timezone
 
+logger = logging.getLogger(__name__)
+
+# Rows per query for bulk lookups and writes (within SQLite's variable limit)
+BULK_BATCH_SIZE = 500
+
+
+class HitCountBuffer:
+    """Thread-safe in-memory buffer of pending cache hit counts.
+    
+    Attributes:
+        last_flush: time.monotonic() of the last flush
+    """
+    
+    def __init__(self):
+        self._pending: Dict[int, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        self.last_flush = time.monotonic()
+    
+    def record(self, entry_id: int) -> None:
+        """Count one hit for a cache entry."""
+        with self._lock:
+            self._pending[entry_id] += 1
+    
+    def pending(self) -> int:
+        """Return the number of entries with unflushed hits."""
+        return len(self._pending)
+    
+    def is_due(self) -> bool:
+        """Return True if the buffer should be flushed now."""
+        if not self._pending:
+            return False
+        interval = getattr(settings, 'GEOCODING_HIT_FLUSH_SECONDS', 60)
+        max_pending = getattr(settings, 'GEOCODING_HIT_FLUSH_MAX_PENDING', 500)
+        return (
+            time.monotonic() - self.last_flush >= interval
+            or len(self._pending) >= max_pending
+        )
+    
+    def drain(self) -> Dict[int, int]:
+        """Remove and return all pending counts."""
+        with self._lock:
+            pending, self._pending = self._pending, defaultdict(int)
+            self.last_flush = time.monotonic()
+        return dict(pending)
+    
+    def restore(self, counts: Dict[int, int]) -> None:
+        """Put counts back after a failed flush."""
+        with self._lock:
+            for entry_id, count in counts.items():
+                self._pending[entry_id] += count
+
+
+hit_buffer = HitCountBuffer()
+
 
 class GeocodingCache(models.Model):
     """Cache model for geocoding results.
@@ -160,12 +232,128 @@ class GeocodingCache(models.Model):
         cached_result = cache_query.order_by('-last_accessed').first()
         
         if cached_result:
-            # Increment hit count
-            cached_result.hit_count += 1
-            cached_result.save(update_fields=['hit_count', 'last_accessed'])
+            # Counted in memory; written back by flush_hit_counts()
+            hit_buffer.record(cached_result.pk)
             
         return cached_result
     
+    @classmethod
+    def get_cached_results(
+        cls, queries: Iterable[str], provider: Optional[str] = None
+    ) -> Dict[str, 'GeocodingCache']:
+        """Get cached results for many queries with one lookup per batch.
+        
+        Args:
+            queries: Geocoding query strings
+            provider: Optional provider name to filter by
+            
+        Returns:
+            Dict mapping each query that has an unexpired entry to that entry
+        """
+        hashes = {query: cls.generate_query_hash(query) for query in queries}
+        if not hashes:
+            return {}
+        
+        by_hash = {}
+        hash_values = list(set(hashes.values()))
+        now = timezone.now()
+        for start in range(0, len(hash_values), BULK_BATCH_SIZE):
+            cache_query = cls.objects.filter(
+                query_hash__in=hash_values[start:start + BULK_BATCH_SIZE],
+                expires_at__gt=now,
+            )
+            if provider:
+                cache_query = cache_query.filter(provider=provider)
+            for entry in cache_query:
+                by_hash[entry.query_hash] = entry
+        
+        results = {}
+        for query, query_hash in hashes.items():
+            entry = by_hash.get(query_hash)
+            if entry is not None:
+                results[query] = entry
+        for entry in by_hash.values():
+            hit_buffer.record(entry.pk)
+        return results
+    
+    @classmethod
+    def store_results(cls, results: List[Dict[str, Any]]) -> int:
+        """Store many geocoding results with a bulk upsert.
+        
+        Args:
+            results: Dicts with the arguments of ``store_result``
+            
+        Returns:
+            int: Number of entries written
+        """
+        now = timezone.now()
+        entries = {}
+        for result in results:
+            query_hash = cls.generate_query_hash(result['query'])
+            entries[query_hash] = cls(
+                query_hash=query_hash,
+                query=result['query'],
+                latitude=result['latitude'],
+                longitude=result['longitude'],
+                address=result['address'],
+                provider=result['provider'],
+                confidence=result.get('confidence'),
+                expires_at=now + timezone.timedelta(hours=result.get('cache_duration_hours', 24)),
+                hit_count=1,
+                last_accessed=now,
+            )
+        
+        cls.objects.bulk_create(
+            entries.values(),
+            batch_size=BULK_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=['query_hash'],
+            update_fields=[
+                'query', 'latitude', 'longitude', 'address', 'provider',
+                'confidence', 'expires_at', 'hit_count', 'last_accessed',
+            ],
+        )
+        return len(entries)
+    
+    @classmethod
+    def flush_hit_counts(cls) -> int:
+        """Write buffered hit counts to the database.
+        
+        Entries with the same number of pending hits are updated together,
+        so a flush costs one UPDATE per distinct count rather than per entry.
+        
+        Returns:
+            int: Number of cache entries updated
+        """
+        counts = hit_buffer.drain()
+        if not counts:
+            return 0
+        
+        by_count: Dict[int, list] = defaultdict(list)
+        for entry_id, count in counts.items():
+            by_count[count].append(entry_id)
+        
+        now = timezone.now()
+        updated = 0
+        while by_count:
+            count, entry_ids = by_count.popitem()
+            try:
+                updated += cls.objects.filter(pk__in=entry_ids).update(
+                    hit_count=models.F('hit_count') + count,
+                    last_accessed=now,
+                )
+            except Exception as e:
+                logger.warning(f"Failed to flush geocoding cache hit counts: {e}")
+                by_count[count] = entry_ids
+                hit_buffer.restore({
+                    entry_id: pending
+                    for pending, ids in by_count.items()
+                    for entry_id in ids
+                })
+                break
+        
+        return updated
+    
     @classmethod
     def store_result(
         cls,
@@ -270,3 +458,17 @@ class GeocodingCache(models.Model):
             'provider_distribution': list(provider_stats),
             'average_hit_count': round(avg_hit_count, 2),
         }
+
+
+@receiver(request_finished)
+def flush_hit_counts_after_request(sender, **kwargs) -> None:
+    """Flush buffered hit counts once the response has been sent."""
+    if hit_buffer.is_due():
+        GeocodingCache.flush_hit_counts()
+
+
+@atexit.register
+def flush_hit_counts_at_exit() -> None:
+    """Flush buffered hit counts before the process exits."""
+    if hit_buffer.pending():
+        GeocodingCache.flush_hit_counts()
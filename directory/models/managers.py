@@ -9,10 +9,9 @@ Managers:
 
 Features:
     - Default filtering to exclude archived/deleted resources
-    - Full-text search using SQLite FTS5
+    - Full-text search using SQLite FTS5 or PostgreSQL tsvector
     - Combined search with exact matches
     - Archive-aware querying methods
-    - Fallback search when FTS5 is unavailable
     - Spatial query methods for location-based filtering (when GIS enabled)
 
 Author: Resource Directory Team
@@ -33,7 +32,7 @@ Usage:
 """
 
 from django.db import connection, models
-from django.db.models import Q, Case, When, Value, IntegerField
+from django.db.models import Q, Case, Exists, When, Value, IntegerField
 from django.conf import settings
 from typing import Optional, Dict, Any, List, Tuple, Union
 import logging
@@ -46,7 +45,7 @@ class ResourceManager(models.Manager):
     
     This manager provides specialized query methods for the Resource model, including:
     - Default filtering to exclude archived and deleted resources
-    - Full-text search using SQLite FTS5
+    - Full-text search using SQLite FTS5 or PostgreSQL tsvector
     - Combined search with exact matches
     - Archive-aware querying
     - Spatial query methods for location-based filtering (when GIS enabled)
@@ -64,7 +63,7 @@ class ResourceManager(models.Manager):
         >>> # Get all resources including archived
         >>> all_resources = Resource.objects.all_including_archived()
         
-        >>> # Search with FTS5
+        >>> # Full-text search
         >>> results = Resource.objects.search_fts("mental health")
         
         >>> # Filter by location (when GIS enabled)
@@ -117,11 +116,12 @@ class ResourceManager(models.Manager):
         return super().get_queryset().filter(is_archived=True, is_deleted=False)
 
     def search_fts(self, query: str) -> models.QuerySet:
-        """Search resources using SQLite FTS5 full-text search.
+        """Search resources using the database's full-text index.
         
-        This method performs full-text search using SQLite's FTS5 extension,
-        which provides fast and relevant search results. The search is performed
-        across multiple fields including name, description, and location data.
+        This method performs full-text search using the index created by
+        migration 0019: an FTS5 virtual table on SQLite/SpatiaLite or the
+        ``search_vector`` tsvector column (GIN-indexed) on PostgreSQL. The
+        engine is chosen at runtime from the active connection.
         
         Args:
             query (str): Search query string to search for
@@ -130,164 +130,120 @@ class ResourceManager(models.Manager):
             QuerySet: Matching resources ordered by relevance score
             
         Raises:
-            Exception: If FTS5 search fails, falls back to basic search
+            NotSupportedError: If the database has no full-text engine
             
         Note:
-            - Falls back to basic icontains search if FTS5 is not available
+            - Every word in the query must match (as a prefix)
+            - Only the first 1000 characters of the query are searched
             - Empty queries return an empty queryset
-            - Results are ordered by relevance (rank) from FTS5
-            - Uses parameterized queries to prevent SQL injection
+            - Results are ordered by relevance (bm25 / ts_rank_cd)
+            - User input is tokenized, never interpolated into SQL
             
         Example:
             >>> results = Resource.objects.search_fts("crisis intervention")
             >>> results = Resource.objects.search_fts("mental health services")
         """
+        from directory.services.search_index import ranked_resource_ids
+
         if not query.strip():
             return self.none()
 
-        try:
-            # Use raw SQL to perform FTS5 search with parameterized query
-            with connection.cursor() as cursor:
-                # FTS5 doesn't support parameter substitution, so we need to escape the query
-                # Use a safer approach by validating and escaping the query
-                escaped_query = self._escape_fts_query(query)
-                sql = """
-                    SELECT resource_id, rank
-                    FROM resource_fts 
-                    WHERE resource_fts MATCH %s
-                    ORDER BY rank
-                """
-                cursor.execute(sql, [escaped_query])
-
-                results = cursor.fetchall()
-
-            if not results:
-                return self.none()
-
-            # Get resource IDs in order of relevance
-            resource_ids = [row[0] for row in results]
-
-            # Create a QuerySet with the results in the correct order
-            preserved = models.Case(
-                *[models.When(pk=pk, then=pos) for pos, pk in enumerate(resource_ids)]
-            )
-            return self.filter(pk__in=resource_ids).order_by(preserved)
-
-        except Exception:
-            # Fallback to basic search if FTS5 is not available
-            return self.filter(
-                Q(name__icontains=query)
-                | Q(description__icontains=query)
-                | Q(city__icontains=query)
-                | Q(state__icontains=query)
-            )
+        resource_ids = ranked_resource_ids(query, connection=connection)
+        if not resource_ids:
+            return self.none()
 
-    def _escape_fts_query(self, query: str) -> str:
-        """Escape and validate FTS5 query to prevent SQL injection.
-        
-        This method sanitizes the FTS5 query string by:
-        1. Removing or escaping dangerous characters
-        2. Validating the query structure
-        3. Ensuring only safe FTS5 syntax is used
-        
-        Args:
-            query (str): Raw query string from user input
-            
-        Returns:
-            str: Sanitized query string safe for FTS5
-            
-        Raises:
-            ValueError: If query contains dangerous patterns
-        """
-        import re
-        
-        # Remove any SQL injection attempts
-        dangerous_patterns = [
-            r'--',  # SQL comments
-            r'/\*.*?\*/',  # SQL block comments
-            r';\s*$',  # Trailing semicolons
-            r'UNION\s+ALL',  # UNION attacks
-            r'DROP\s+TABLE',  # DROP commands
-            r'DELETE\s+FROM',  # DELETE commands
-            r'UPDATE\s+SET',  # UPDATE commands
-            r'INSERT\s+INTO',  # INSERT commands
-            r'CREATE\s+TABLE',  # CREATE commands
-            r'ALTER\s+TABLE',  # ALTER commands
-        ]
-        
-        query_upper = query.upper()
-        for pattern in dangerous_patterns:
-            if re.search(pattern, query_upper, re.IGNORECASE):
-                raise ValueError(f"Query contains dangerous pattern: {pattern}")
-        
-        # Escape special FTS5 characters that could cause issues
-        # FTS5 has its own syntax, so we need to be careful
-        escaped_query = query.replace('"', '""')  # Escape double quotes
-        
-        # Limit query length to prevent DoS
-        if len(escaped_query) > 1000:
-            raise ValueError("Query too long (max 1000 characters)")
-        
-        return escaped_query
+        # Create a QuerySet with the results in the correct order
+        preserved = models.Case(
+            *[models.When(pk=pk, then=pos) for pos, pk in enumerate(resource_ids)]
+        )
+        return self.filter(pk__in=resource_ids).order_by(preserved)
 
     def search_combined(self, query: str) -> models.QuerySet:
-        """Combined search using FTS5 for full-text and icontains for exact matches.
+        """Ranked search combining full-text relevance and exact field matches.
+        
+        This method runs as a single SQL statement. A resource matches when it
+        is found by the full-text index or when the query appears in its name,
+        phone, email, website or postal code. Each row is scored in the
+        database: exact contact matches score highest, followed by name
+        matches, and full-text relevance (normalized to [0, 1)) breaks ties.
         
-        This method combines the power of FTS5 full-text search with exact
-        field matching to provide comprehensive search results. It searches
-        both the FTS5 index and specific fields that might not be included
-        in the full-text index.
+        Because ranking happens in SQL, the returned queryset can be filtered,
+        counted and sliced by the paginator without rebuilding an ID list.
         
         Args:
             query (str): Search query string to search for
             
         Returns:
-            QuerySet: Combined search results from both FTS5 and exact matches
+            QuerySet: Matching resources annotated with ``exact_score``,
+                ``text_rank`` and ``search_rank``, best matches first
             
         Note:
-            - Combines results from FTS5 search and exact field matching
-            - Removes duplicates automatically
+            - Phone numbers are matched on digits only, since they are stored
+              normalized (e.g. "555-1234" matches "6065551234")
             - Empty queries return an empty queryset
             
         Example:
             >>> results = Resource.objects.search_combined("555-1234")
             >>> results = Resource.objects.search_combined("mental health")
         """
-        if not query.strip():
+        from django.db.models.expressions import RawSQL
+        from directory.services.search_index import match_ids_sql, rank_sql
+
+        query = query.strip()
+        if not query:
             return self.none()
 
-        # Get FTS5 results
-        fts_results = self.search_fts(query)
+        # Scores for exact/contains matches on fields outside the text index
+        exact_scores = {
+            'phone': 100,
+            'email': 90,
+            'postal_code': 80,
+            'website': 60,
+            'name': 40,
+        }
 
-        # Get exact match results (for fields not in FTS5)
-        exact_results = self.filter(
-            Q(name__icontains=query)
-            | Q(phone__icontains=query)
-            | Q(email__icontains=query)
-            | Q(website__icontains=query)
-            | Q(postal_code__icontains=query)
+        exact_matches = {
+            'email': Q(email__icontains=query),
+            'postal_code': Q(postal_code__startswith=query),
+            'website': Q(website__icontains=query),
+            'name': Q(name__icontains=query),
+        }
+        phone_digits = "".join(filter(str.isdigit, query))
+        if len(phone_digits) >= 3:
+            exact_matches['phone'] = Q(phone__contains=phone_digits)
+
+        exact_score = Case(
+            *[
+                When(condition, then=Value(exact_scores[field]))
+                for field, condition in sorted(
+                    exact_matches.items(), key=lambda item: -exact_scores[item[0]]
+                )
+            ],
+            default=Value(0),
+            output_field=IntegerField(),
         )
 
-        # Combine and deduplicate results
-        combined_ids = list(fts_results.values_list("pk", flat=True))
-        combined_ids.extend(list(exact_results.values_list("pk", flat=True)))
+        match_filter = Q()
+        for condition in exact_matches.values():
+            match_filter |= condition
 
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_ids = []
-        for pk in combined_ids:
-            if pk not in seen:
-                seen.add(pk)
-                unique_ids.append(pk)
-
-        if not unique_ids:
-            return self.none()
+        match_sql, match_params = match_ids_sql(query, connection)
+        if match_sql:
+            match_filter |= Q(pk__in=RawSQL(match_sql, match_params))
+            rank_expression, rank_params = rank_sql(query, connection)
+            text_rank = RawSQL(rank_expression, rank_params, output_field=models.FloatField())
+        else:
+            text_rank = Value(0.0, output_field=models.FloatField())
 
-        # Return results in the combined order
-        preserved = models.Case(
-            *[models.When(pk=pk, then=pos) for pos, pk in enumerate(unique_ids)]
-        )
-        return self.filter(pk__in=unique_ids).order_by(preserved)
+        return self.filter(match_filter).annotate(
+            exact_score=exact_score,
+            text_rank=text_rank,
+        ).annotate(
+            search_rank=models.ExpressionWrapper(
+                models.F('exact_score') + models.F('text_rank'),
+                output_field=models.FloatField()
+            )
+        ).order_by('-search_rank', 'name', 'pk')
 
     def filter_by_location(
         self, 
@@ -303,6 +259,12 @@ class ResourceManager(models.Manager):
         2. Optionally including resources within a radius of their location
         3. Ranking results by coverage specificity (RADIUS > CITY > COUNTY > STATE)
         
+        The containing coverage areas are looked up in the in-process
+        CoverageAreaIndex (directory.services.coverage_index), and resources
+        are matched against those area IDs through the ResourceServiceArea
+        table, so the database runs a single resource query with no join to
+        CoverageArea.
+        
         Args:
             lat (float): Latitude of the search point (WGS84)
             lon (float): Longitude of the search point (WGS84)
@@ -336,78 +298,21 @@ class ResourceManager(models.Manager):
         
         try:
             from django.contrib.gis.geos import Point
-            from django.contrib.gis.db.models.functions import Distance
             
             # Create point for spatial queries
             search_point = Point(lon, lat, srid=4326)
             
-            # Start with resources that have coverage areas containing the point
-            queryset = self.filter(
-                coverage_areas__geom__contains=search_point
-            ).distinct()
-            
-            # Also include resources with national coverage areas
-            national_resources = self.filter(
-                coverage_areas__name__in=[
-                    'National (Lower 48 States)',
-                    'United States (All States and Territories)'
-                ]
-            ).distinct()
-            
-            # Combine the results
-            combined_ids = list(queryset.values_list('pk', flat=True))
-            combined_ids.extend(list(national_resources.values_list('pk', flat=True)))
-            
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_ids = []
-            for pk in combined_ids:
-                if pk not in seen:
-                    seen.add(pk)
-                    unique_ids.append(pk)
+            match, coverage_match = self._coverage_match(
+                lat, lon, radius_miles, include_radius_search
+            )
             
-            if unique_ids:
-                preserved = Case(
-                    *[When(pk=pk, then=pos) for pos, pk in enumerate(unique_ids)]
-                )
-                queryset = self.filter(pk__in=unique_ids).order_by(preserved)
+            # Local coverage first, then national coverage, then radius matches
+            queryset = self.filter(match).annotate(
+                coverage_match=coverage_match
+            ).order_by('-coverage_match', 'name', 'pk')
             
             # Annotate with coverage specificity and distance
-            queryset = self._annotate_coverage_specificity(queryset, search_point)
-            
-            # Add radius search if requested
-            if include_radius_search and radius_miles:
-                radius_meters = radius_miles * 1609.34  # Convert miles to meters
-                radius_point = Point(lon, lat, srid=4326)
-                
-                # Find resources within radius that don't have coverage areas
-                # Note: Since Resource model doesn't have lat/lon fields, we'll use
-                # text-based location matching for radius search
-                radius_resources = self.filter(
-                    coverage_areas__isnull=True
-                ).filter(
-                    Q(city__isnull=False) | Q(state__isnull=False)
-                )
-                
-                # Combine with coverage area results
-                combined_ids = list(queryset.values_list('pk', flat=True))
-                combined_ids.extend(list(radius_resources.values_list('pk', flat=True)))
-                
-                if combined_ids:
-                    # Preserve order and remove duplicates
-                    seen = set()
-                    unique_ids = []
-                    for pk in combined_ids:
-                        if pk not in seen:
-                            seen.add(pk)
-                            unique_ids.append(pk)
-                    
-                    preserved = Case(
-                        *[When(pk=pk, then=pos) for pos, pk in enumerate(unique_ids)]
-                    )
-                    queryset = self.filter(pk__in=unique_ids).order_by(preserved)
-            
-            return queryset
+            return self._annotate_coverage_specificity(queryset, search_point)
             
         except ImportError:
             logger.error("GIS libraries not available for spatial queries")
@@ -416,6 +321,104 @@ class ResourceManager(models.Manager):
             logger.error(f"Error in spatial location filtering: {e}")
             return self._filter_by_location_fallback(lat, lon, radius_miles)
 
+    def location_filter(
+        self,
+        lat: float,
+        lon: float,
+        radius_miles: Optional[float] = None,
+        include_radius_search: bool = True
+    ) -> Q:
+        """Return a filter matching resources that serve a location.
+        
+        The returned Q can be combined with any other resource filters so
+        location matching, other criteria and proximity ranking run as one
+        SQL statement.
+        
+        Args:
+            lat (float): Latitude of the search point (WGS84)
+            lon (float): Longitude of the search point (WGS84)
+            radius_miles (float, optional): Enables matching resources with
+                location data but no coverage areas
+            include_radius_search (bool): Whether to include radius-based
+                matches. Defaults to True.
+                
+        Returns:
+            Q: Filter for Resource querysets (the text-based fallback filter
+                when GIS is disabled or the spatial lookup fails)
+            
+        Example:
+            >>> Resource.objects.filter(
+            ...     Resource.objects.location_filter(37.1283, -84.0836),
+            ...     status="published",
+            ... )
+        """
+        if not getattr(settings, 'GIS_ENABLED', False):
+            logger.warning("GIS not enabled, falling back to text-based location matching")
+            return self._location_fallback_filter()
+        
+        try:
+            return self._coverage_match(lat, lon, radius_miles, include_radius_search)[0]
+        except Exception as e:
+            logger.error(f"Error in spatial location filtering: {e}")
+            return self._location_fallback_filter()
+
+    def _coverage_match(
+        self,
+        lat: float,
+        lon: float,
+        radius_miles: Optional[float],
+        include_radius_search: bool
+    ) -> Tuple[Q, Case]:
+        """Build the location filter and match-quality expression for a point.
+        
+        Coverage areas containing the point come from the in-process
+        CoverageAreaIndex; resources are matched to those areas through
+        EXISTS on the ResourceServiceArea table.
+        
+        Returns:
+            Tuple of (filter, expression scoring 2 for local coverage, 1 for
+                national coverage and 0 for radius matches)
+        """
+        from directory.services.coverage_index import get_coverage_index
+        from .resource_service_area import ResourceServiceArea
+        
+        # Areas containing the point come from the in-process R-tree;
+        # national areas serve every location
+        index = get_coverage_index()
+        local_area_ids = index.areas_containing(lat, lon)
+        national_area_ids = [
+            pk for pk in index.national_area_ids if pk not in local_area_ids
+        ]
+        
+        served_by = ResourceServiceArea.objects.filter(
+            resource=models.OuterRef('pk')
+        )
+        match = Q(Exists(served_by.filter(
+            coverage_area_id__in=local_area_ids + national_area_ids
+        )))
+        
+        if include_radius_search and radius_miles:
+            # Resources without coverage areas that have location data
+            # Note: Since Resource model doesn't have lat/lon fields, we'll use
+            # text-based location matching for radius search
+            match |= ~Q(Exists(served_by)) & (
+                Q(city__isnull=False) | Q(state__isnull=False)
+            )
+        
+        coverage_match = Case(
+            When(
+                Exists(served_by.filter(coverage_area_id__in=local_area_ids)),
+                then=Value(2),
+            ),
+            When(
+                Exists(served_by.filter(coverage_area_id__in=national_area_ids)),
+                then=Value(1),
+            ),
+            default=Value(0),
+            output_field=IntegerField(),
+        )
+        return match, coverage_match
+
     def find_resources_by_location(
         self,
         location: Union[str, Tuple[float, float]],
@@ -531,9 +534,13 @@ class ResourceManager(models.Manager):
             QuerySet: Resources with location information, ordered by relevance
         """
         # Return resources that have location information
-        return self.filter(
+        return self.filter(self._location_fallback_filter())
+
+    def _location_fallback_filter(self) -> Q:
+        """Filter for resources with any city, state or postal code."""
+        return (
             Q(city__isnull=False) | Q(state__isnull=False) | Q(postal_code__isnull=False)
-        ).exclude(
+        ) & ~(
             Q(city='') & Q(state='') & Q(postal_code='')
         )
 
@@ -565,36 +572,64 @@ class ResourceManager(models.Manager):
             return queryset
         
         try:
-            # Define specificity scores for different coverage area types
-            specificity_scores = {
-                'RADIUS': 100,    # Most specific - exact radius
-                'POLYGON': 90,    # Custom polygon - very specific
-                'CITY': 80,       # City boundary - specific
-                'COUNTY': 60,     # County boundary - moderate
-                'STATE': 40,      # State boundary - broad
-            }
-            
-            # Create Case statement for specificity scoring
-            specificity_case = Case(
-                When(coverage_areas__kind='RADIUS', then=Value(specificity_scores['RADIUS'])),
-                When(coverage_areas__kind='POLYGON', then=Value(specificity_scores['POLYGON'])),
-                When(coverage_areas__kind='CITY', then=Value(specificity_scores['CITY'])),
-                When(coverage_areas__kind='COUNTY', then=Value(specificity_scores['COUNTY'])),
-                When(coverage_areas__kind='STATE', then=Value(specificity_scores['STATE'])),
-                default=Value(0),
-                output_field=IntegerField(),
-            )
-            
-            return queryset.annotate(
-                specificity_score=models.Max(specificity_case),
-                coverage_type=models.Max('coverage_areas__kind'),
-                coverage_count=models.Count('coverage_areas', distinct=True)
-            )
+            return queryset.annotate(**self._service_area_annotations())
             
         except Exception as e:
             logger.error(f"Error annotating coverage specificity: {e}")
             return queryset
 
+    def _service_area_annotations(self) -> Dict[str, Any]:
+        """Build per-resource coverage annotations from ResourceServiceArea.
+        
+        Each annotation is a correlated subquery over the resource's rows in
+        the service-area table, so the outer query never joins the coverage
+        M2M and needs no GROUP BY or DISTINCT.
+        
+        Returns:
+            Dict with specificity_score, coverage_type and coverage_count
+                expressions
+        """
+        from django.db.models.functions import Coalesce
+        from .resource_service_area import ResourceServiceArea
+        
+        areas = ResourceServiceArea.objects.filter(resource=models.OuterRef('pk'))
+        most_specific = areas.order_by('-specificity', 'coverage_area_id')
+        area_count = areas.order_by().values('resource').annotate(
+            count=models.Count('pk')
+        ).values('count')
+        
+        return {
+            # Coverage specificity score of the most specific area
+            'specificity_score': Coalesce(
+                models.Subquery(most_specific.values('specificity')[:1]),
+                Value(0),
+            ),
+            # Kind of the most specific area
+            'coverage_type': models.Subquery(most_specific.values('kind')[:1]),
+            'coverage_count': Coalesce(models.Subquery(area_count), Value(0)),
+        }
+
+    def _min_center_distance(self, lat: float, lon: float) -> models.Subquery:
+        """Distance (meters) from a point to the nearest coverage area center.
+        
+        Args:
+            lat (float): Latitude of the point
+            lon (float): Longitude of the point
+            
+        Returns:
+            Subquery: Correlated subquery over the resource's service areas
+        """
+        from directory.services.proximity import haversine_expression
+        from .resource_service_area import ResourceServiceArea
+        
+        nearest = ResourceServiceArea.objects.filter(
+            resource=models.OuterRef('pk'),
+            center_lat__isnull=False,
+        ).annotate(
+            distance_m=haversine_expression(lat, lon)
+        ).order_by('distance_m').values('distance_m')[:1]
+        return models.Subquery(nearest, output_field=models.FloatField())
+
     def _annotate_coverage_specificity(
         self, 
         queryset: models.QuerySet, 
@@ -613,11 +648,9 @@ class ResourceManager(models.Manager):
             QuerySet: Annotated queryset with specificity and distance information
         """
         try:
-            from django.contrib.gis.db.models.functions import Distance
-            
             # Add distance annotation for coverage areas
             queryset = queryset.annotate(
-                min_distance=Distance('coverage_areas__center', search_point)
+                min_distance=self._min_center_distance(search_point.y, search_point.x)
             )
             
             # Add specificity annotation
@@ -631,18 +664,25 @@ class ResourceManager(models.Manager):
         self, 
         queryset: models.QuerySet, 
         lat: float, 
-        lon: float
+        lon: float,
+        min_distance_miles: Optional[float] = None,
+        max_distance_miles: Optional[float] = None
     ) -> models.QuerySet:
         """Annotate queryset with comprehensive proximity ranking information.
         
         This method adds distance and proximity-based ranking annotations to help
-        sort resources by their proximity to a given location. It combines coverage
-        area distance, resource location distance, and coverage specificity.
+        sort resources by their proximity to a given location. Minimum distance,
+        maximum coverage specificity and coverage count are computed per
+        resource in a single aggregate pass over the service-area table (see
+        directory.services.proximity), and optional distance bounds are
+        applied in the same query.
         
         Args:
             queryset (QuerySet): The queryset to annotate
             lat (float): Latitude of the search point
             lon (float): Longitude of the search point
+            min_distance_miles (float, optional): Exclude resources closer than this
+            max_distance_miles (float, optional): Exclude resources farther than this
             
         Returns:
             QuerySet: Annotated queryset with proximity ranking information
@@ -650,74 +690,29 @@ class ResourceManager(models.Manager):
         Note:
             - Requires GIS to be enabled for spatial annotations
             - Falls back gracefully when GIS is not available
-            - Adds distance_miles, proximity_score, and ranking annotations
+            - Adds distance_miles, proximity_score, specificity_score and
+              coverage_count annotations
             
         Example:
             >>> resources = Resource.objects.annotate_proximity_ranking(
-            ...     Resource.objects.all(), 37.7749, -122.4194
-            ... ).order_by('proximity_score')
+            ...     Resource.objects.all(), 37.7749, -122.4194, max_distance_miles=25
+            ... ).order_by('-proximity_score')
         """
         if not getattr(settings, 'GIS_ENABLED', False):
             # Return queryset unchanged when GIS is not available
             return queryset
         
         try:
-            from django.contrib.gis.geos import Point
-            from django.contrib.gis.db.models.functions import Distance
-            
-            search_point = Point(lon, lat, srid=4326)
-            
-            # Define specificity scores for different coverage area types
-            specificity_scores = {
-                'RADIUS': 100,    # Most specific - exact radius
-                'POLYGON': 90,    # Custom polygon - very specific
-                'CITY': 80,       # City boundary - specific
-                'COUNTY': 60,     # County boundary - moderate
-                'STATE': 40,      # State boundary - broad
-            }
-            
-            # Create Case statement for specificity scoring
-            specificity_case = Case(
-                When(coverage_areas__kind='RADIUS', then=Value(specificity_scores['RADIUS'])),
-                When(coverage_areas__kind='POLYGON', then=Value(specificity_scores['POLYGON'])),
-                When(coverage_areas__kind='CITY', then=Value(specificity_scores['CITY'])),
-                When(coverage_areas__kind='COUNTY', then=Value(specificity_scores['COUNTY'])),
-                When(coverage_areas__kind='STATE', then=Value(specificity_scores['STATE'])),
-                default=Value(0),
-                output_field=IntegerField(),
-            )
-            
-            # Annotate with distance and specificity information
-            queryset = queryset.annotate(
-                # Distance to coverage area centers (in meters)
-                coverage_distance_m=Distance('coverage_areas__center', search_point),
-                # Coverage specificity score
-                specificity_score=models.Max(specificity_case),
-                # Coverage type and count
-                coverage_type=models.Max('coverage_areas__kind'),
-                coverage_count=models.Count('coverage_areas', distinct=True)
+            from directory.services.proximity import annotate_proximity
+            
+            return annotate_proximity(
+                queryset,
+                lat,
+                lon,
+                min_distance_miles=min_distance_miles,
+                max_distance_miles=max_distance_miles,
             )
             
-            # Convert distance to miles and create proximity score
-            # Proximity score combines distance and specificity
-            # Lower distance = higher score, higher specificity = higher score
-            queryset = queryset.annotate(
-                # Convert meters to miles
-                distance_miles=models.ExpressionWrapper(
-                    models.F('coverage_distance_m') / 1609.34,  # Convert meters to miles
-                    output_field=models.FloatField()
-                ),
-                # Calculate proximity score (higher = better)
-                # Formula: specificity_score * (1 / (1 + distance_miles))
-                # This gives higher scores for closer, more specific coverage areas
-                proximity_score=models.ExpressionWrapper(
-                    models.F('specificity_score') * (1.0 / (1.0 + models.F('distance_miles'))),
-                    output_field=models.FloatField()
-                )
-            )
-            
-            return queryset
-            
         except Exception as e:
             logger.error(f"Error in proximity ranking annotation: {e}")
             return queryset
@@ -728,13 +723,15 @@ class ResourceManager(models.Manager):
         lon: float, 
         radius_miles: Optional[float] = None,
         include_radius_search: bool = True,
-        sort_by_proximity: bool = True
+        sort_by_proximity: bool = True,
+        min_distance_miles: Optional[float] = None,
+        max_distance_miles: Optional[float] = None
     ) -> models.QuerySet:
         """Filter resources by location with proximity-based ranking.
         
-        This method extends filter_by_location with comprehensive proximity calculations
-        and ranking. It finds resources that serve a specific location and ranks them
-        by proximity and coverage specificity.
+        This method combines the location filter with proximity ranking in a
+        single query: resources serving the point are matched, then ranked by
+        proximity and coverage specificity, with optional distance bounds.
         
         Args:
             lat (float): Latitude of the search point (WGS84)
@@ -745,6 +742,8 @@ class ResourceManager(models.Manager):
                 for resources without coverage areas. Defaults to True.
             sort_by_proximity (bool): Whether to sort results by proximity score.
                 Defaults to True.
+            min_distance_miles (float, optional): Exclude resources closer than this
+            max_distance_miles (float, optional): Exclude resources farther than this
                 
         Returns:
             QuerySet: Resources that serve the specified location, ranked by proximity
@@ -753,7 +752,7 @@ class ResourceManager(models.Manager):
         Example:
             >>> # Find resources serving a location, ranked by proximity
             >>> resources = Resource.objects.filter_by_location_with_proximity(
-            ...     37.7749, -122.4194, radius_miles=10
+            ...     37.7749, -122.4194, radius_miles=10, max_distance_miles=25
             ... )
         """
         # Check if GIS is enabled for proximity calculations
@@ -767,20 +766,22 @@ class ResourceManager(models.Manager):
                 include_radius_search=include_radius_search
             )
         
-        # First, get resources using the existing spatial query logic
-        queryset = self.filter_by_location(
-            lat=lat,
-            lon=lon,
-            radius_miles=radius_miles,
-            include_radius_search=include_radius_search
+        queryset = self.filter(
+            self.location_filter(lat, lon, radius_miles, include_radius_search)
         )
         
         # Add proximity ranking annotations
-        queryset = self.annotate_proximity_ranking(queryset, lat, lon)
+        queryset = self.annotate_proximity_ranking(
+            queryset,
+            lat,
+            lon,
+            min_distance_miles=min_distance_miles,
+            max_distance_miles=max_distance_miles
+        )
         
         # Sort by proximity score if requested
         if sort_by_proximity:
-            queryset = queryset.order_by('-proximity_score', '-specificity_score', 'distance_miles')
+            queryset = queryset.order_by('-proximity_score', '-specificity_score', 'distance_miles', 'pk')
         
         return queryset
 
@@ -865,8 +866,9 @@ class ResourceManager(models.Manager):
         """Calculate distance from a location to a specific resource.
         
         This method calculates the distance from a given location to a specific
-        resource, including distance to the resource's physical location and
-        coverage area information.
+        resource's coverage areas and reports whether the resource serves the
+        location. It is a single-resource call into the batch eligibility
+        engine (directory.services.eligibility).
         
         Args:
             resource_id (int): ID of the resource to calculate distance for
@@ -883,109 +885,12 @@ class ResourceManager(models.Manager):
             >>> print(f"Distance: {distance_info['distance_miles']} miles")
         """
         try:
-            resource = self.get(id=resource_id)
+            from directory.services.eligibility import check_eligibility
             
-            result = {
-                'resource_id': resource_id,
-                'resource_name': resource.name,
-                'serves_location': False,
-                'distance_miles': None,
-                'coverage_areas': [],
-                'eligibility_reason': 'Unknown',
-            }
-            
-            # Check if GIS is enabled for distance calculations
-            if not getattr(settings, 'GIS_ENABLED', False):
-                result['eligibility_reason'] = 'GIS not enabled for distance calculations'
-                return result
-            
-            from django.contrib.gis.geos import Point
-            from django.contrib.gis.db.models.functions import Distance
-            
-            query_point = Point(lon, lat, srid=4326)
-            
-            # Calculate distance to resource's physical location if available
-            # Note: Resource model doesn't have lat/lon fields, so we'll use coverage area centers
-            # For now, we'll calculate distance to the closest coverage area center
-            
-            # Check coverage areas
-            coverage_areas = resource.coverage_areas.all()
-            if not coverage_areas.exists():
-                result['eligibility_reason'] = 'Resource has no defined coverage areas'
-                return result
-            
-            # Track the closest coverage area for distance calculation
-            closest_distance = float('inf')
-            closest_area = None
-            
-            # Check if location is within any coverage area
-            for coverage_area in coverage_areas:
-                if coverage_area.geom:
-                    # Check if query point is within the coverage area geometry
-                    if coverage_area.geom.contains(query_point):
-                        result['serves_location'] = True
-                        result['eligibility_reason'] = f'Location is within {coverage_area.name} ({coverage_area.kind})'
-                        
-                        # Set distance to 0 for areas that contain the location
-                        area_info = {
-                            'id': coverage_area.id,
-                            'name': coverage_area.name,
-                            'kind': coverage_area.kind,
-                            'distance_miles': 0.0,
-                            'contains_location': True
-                        }
-                        result['coverage_areas'].append(area_info)
-                        result['distance_miles'] = 0.0
-                        break
-                    else:
-                        # Calculate distance to coverage area boundary
-                        distance_to_area = coverage_area.geom.distance(query_point)
-                        distance_miles = round(distance_to_area / 1609.34, 2)
-                        
-                        # Track closest area
-                        if distance_miles < closest_distance:
-                            closest_distance = distance_miles
-                            closest_area = coverage_area
-                        
-                        # Add coverage area info
-                        area_info = {
-                            'id': coverage_area.id,
-                            'name': coverage_area.name,
-                            'kind': coverage_area.kind,
-                            'distance_miles': distance_miles,
-                            'contains_location': False
-                        }
-                        result['coverage_areas'].append(area_info)
-                else:
-                    # No geometry available, use center point if available
-                    if coverage_area.center:
-                        center_distance = query_point.distance(coverage_area.center)
-                        distance_miles = round(center_distance / 1609.34, 2)
-                        
-                        # Track closest area
-                        if distance_miles < closest_distance:
-                            closest_distance = distance_miles
-                            closest_area = coverage_area
-                        
-                        area_info = {
-                            'id': coverage_area.id,
-                            'name': coverage_area.name,
-                            'kind': coverage_area.kind,
-                            'distance_miles': distance_miles,
-                            'contains_location': False,
-                            'note': 'Using center point (no boundary geometry)'
-                        }
-                        result['coverage_areas'].append(area_info)
-            
-            # Set the overall distance to the closest coverage area
-            if closest_area and not result['serves_location']:
-                result['distance_miles'] = closest_distance
-            
-            # If no coverage area contains the location, provide closest area info
-            if not result['serves_location'] and result['coverage_areas']:
-                closest_area = min(result['coverage_areas'], key=lambda x: x['distance_miles'])
-                result['eligibility_reason'] = f'Location not served. Closest area: {closest_area["name"]} ({closest_area["distance_miles"]} miles away)'
+            resource = self.get(id=resource_id)
             
+            result = {'resource_id': resource_id, 'resource_name': resource.name}
+            result.update(check_eligibility(lat, lon, [resource_id])[resource_id])
             return result
             
         except Exception as e:
@@ -1006,7 +911,9 @@ class ResourceManager(models.Manager):
         """Check which resources serve a specific location.
         
         This method finds all resources that serve a given location and provides
-        detailed eligibility information for each resource.
+        detailed eligibility information for each resource. Eligibility for all
+        nearby resources is computed in one batch, so the number of queries
+        does not grow with the number of resources.
         
         Args:
             lat (float): Latitude of the location to check
@@ -1023,21 +930,22 @@ class ResourceManager(models.Manager):
             >>> print(f"Resources serving location: {len(eligibility['serving_resources'])}")
         """
         try:
+            from directory.services.eligibility import check_eligibility
+            
             # Get resources within the search radius
-            nearby_resources = self.filter_by_location(
+            nearby_resources = list(self.filter_by_location(
                 lat=lat, 
                 lon=lon, 
                 radius_miles=radius_miles
-            )
+            ))
+            
+            eligibility = check_eligibility(lat, lon, [r.id for r in nearby_resources])
             
             serving_resources = []
             nearby_resources_list = []
             
             for resource in nearby_resources:
-                # Calculate detailed distance and eligibility info
-                distance_info = self.calculate_resource_distance(
-                    resource.id, lat, lon
-                )
+                distance_info = eligibility[resource.id]
                 
                 resource_info = {
                     'id': resource.id,
@@ -0,0 +1,64 @@
+"""
+Related Resource Model - Precomputed "Related Resources" Suggestions
+
+This module contains the RelatedResource model, a compact table holding the
+top related resources of every published resource, ranked by shared
+category and service types, coverage-area overlap and proximity.
+
+The public detail page reads a resource's suggestions with one indexed
+lookup instead of ranking candidates on every view. Rows are derived data,
+maintained by directory.services.related_resources: a resource's list is
+recomputed when it is saved, and ``manage.py build_related_resources``
+rebuilds every list (run it nightly).
+
+Author: Resource Directory Team
+Created: 2025-01-15
+Last Modified: 2025-01-15
+Version: 1.0.0
+
+Usage:
+    from directory.models import RelatedResource
+
+    # Suggestions for a resource, best first
+    RelatedResource.objects.filter(resource=resource).order_by("rank")
+"""
+
+from django.db import models
+
+
+class RelatedResource(models.Model):
+    """One ranked suggestion: ``related`` is shown on ``resource``'s page.
+
+    Attributes:
+        resource: The resource whose page shows the suggestion
+        related: The suggested resource
+        rank: Position in the list (0 is best)
+        score: Relatedness score the list was ordered by
+        computed_at: When the list was computed
+    """
+
+    resource = models.ForeignKey(
+        "Resource",
+        on_delete=models.CASCADE,
+        related_name="related_links",
+    )
+    related = models.ForeignKey(
+        "Resource",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    rank = models.PositiveSmallIntegerField()
+    score = models.FloatField()
+    computed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ["resource", "related"]
+        verbose_name = "Related Resource"
+        verbose_name_plural = "Related Resources"
+        indexes = [
+            models.Index(fields=["resource", "rank"], name="related_res_rank_idx"),
+        ]
+
+    def __str__(self) -> str:
+        """Return a descriptive string representation."""
+        return f"{self.resource_id} → {self.related_id} (#{self.rank})"
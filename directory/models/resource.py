@@ -173,6 +173,9 @@ class Resource(models.Model):
         User, on_delete=models.CASCADE, related_name="updated_resources"
     )
     is_deleted = models.BooleanField(default=False)
+    current_version = models.PositiveIntegerField(
+        default=0, editable=False, help_text="Number of the latest ResourceVersion"
+    )
 
     # Archive fields
     is_archived = models.BooleanField(default=False, help_text="Mark if this resource is archived")
@@ -402,7 +405,32 @@ class Resource(models.Model):
             *args: Standard save arguments
             **kwargs: Standard save keyword arguments
         """
-        # Normalize data
+        self.normalize_fields()
+        self.full_clean()
+
+        # Number the version the audit signal records for this save
+        self.current_version += 1
+        if kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = {*kwargs["update_fields"], "current_version"}
+
+        super().save(*args, **kwargs)
+        self._loaded_values = {
+            field.attname: getattr(self, field.attname) for field in self._meta.concrete_fields
+        }
+
+    @classmethod
+    def from_db(cls, db: str, field_names: Any, values: Any) -> "Resource":
+        """Remember the loaded field values so saves can tell what changed."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def normalize_fields(self) -> None:
+        """Normalize state, phone and website the way ``save`` stores them.
+        
+        Bulk imports call this directly because ``bulk_create`` bypasses
+        ``save``.
+        """
         if self.state:
             self.state = self.state.upper()
 
@@ -415,9 +443,6 @@ class Resource(models.Model):
             if not self.website.startswith(("http://", "https://")):
                 self.website = "https://" + self.website
 
-        self.full_clean()
-        super().save(*args, **kwargs)
-
     @property
     def needs_verification(self) -> bool:
         """Check if the resource needs verification.
@@ -0,0 +1,103 @@
+"""
+Resource Service Area Model - Denormalized Resource→Coverage Lookup Table
+
+This module contains the ResourceServiceArea model, a materialized copy of the
+ResourceCoverage associations that carries the coverage-area data location
+search needs (kind, specificity score, bounding box and center) on every row.
+
+Location search and proximity ranking read this table instead of joining
+ResourceCoverage to CoverageArea at request time. Rows are maintained by the
+signal handlers in directory.services.service_areas and can be rebuilt with
+the ``rebuild_service_areas`` management command.
+
+Author: Resource Directory Team
+Created: 2025-01-15
+Last Modified: 2025-01-15
+Version: 1.0.0
+
+Usage:
+    from directory.models import ResourceServiceArea
+
+    # Most specific area serving a resource
+    ResourceServiceArea.objects.filter(resource=resource).order_by("-specificity").first()
+"""
+
+from django.db import models
+
+
+class ResourceServiceArea(models.Model):
+    """One row per resource/coverage-area association, with area metadata.
+
+    Coordinates are stored as plain floats (WGS84 degrees) so the table works
+    with or without GIS. Bounding box and center are NULL when the coverage
+    area has no geometry.
+
+    Attributes:
+        resource: The resource served by the area
+        coverage_area: The coverage area
+        kind: Copy of CoverageArea.kind
+        specificity: Ranking score for the kind (RADIUS highest, STATE lowest)
+        min_lon, min_lat, max_lon, max_lat: Bounding box of the area geometry
+        center_lon, center_lat: Center of the area
+        refreshed_at: When the row was last materialized
+    """
+
+    # Specificity scores for coverage area kinds (higher = more specific)
+    SPECIFICITY_SCORES = {
+        "RADIUS": 100,
+        "POLYGON": 90,
+        "CITY": 80,
+        "COUNTY": 60,
+        "STATE": 40,
+    }
+
+    resource = models.ForeignKey(
+        "Resource",
+        on_delete=models.CASCADE,
+        related_name="service_areas",
+    )
+    coverage_area = models.ForeignKey(
+        "CoverageArea",
+        on_delete=models.CASCADE,
+        related_name="service_area_entries",
+    )
+
+    kind = models.CharField(max_length=20)
+    specificity = models.IntegerField(default=0)
+
+    min_lon = models.FloatField(null=True, blank=True)
+    min_lat = models.FloatField(null=True, blank=True)
+    max_lon = models.FloatField(null=True, blank=True)
+    max_lat = models.FloatField(null=True, blank=True)
+    center_lon = models.FloatField(null=True, blank=True)
+    center_lat = models.FloatField(null=True, blank=True)
+
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ["resource", "coverage_area"]
+        verbose_name = "Resource Service Area"
+        verbose_name_plural = "Resource Service Areas"
+        indexes = [
+            models.Index(
+                fields=["coverage_area", "resource"],
+                name="service_area_area_res_idx",
+            ),
+            models.Index(
+                fields=["resource", "-specificity"],
+                name="service_area_res_spec_idx",
+            ),
+            models.Index(
+                fields=["min_lon", "max_lon", "min_lat", "max_lat"],
+                name="service_area_bbox_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        """Return a descriptive string representation."""
+        return f"{self.resource_id} → {self.coverage_area_id} ({self.kind})"
+
+    @classmethod
+    def specificity_for(cls, kind: str) -> int:
+        """Return the specificity score for a coverage area kind."""
+        return cls.SPECIFICITY_SCORES.get(kind, 0)
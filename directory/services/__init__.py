@@ -5,6 +5,16 @@ business logic, and complex operations that don't belong in models or views.
 
 Modules:
     geocoding: Geocoding service abstraction with multiple provider support
+    search_index: Backend-aware full-text search index (FTS5 / tsvector)
+    result_sets: Cached, ordered result sets for paginated search results
+    coverage_index: In-process R-tree for point-in-coverage-area lookups
+    service_areas: Maintenance of the denormalized resource service-area table
+    proximity: Single-pass proximity ranking of resources around a point
+    eligibility: Batch checks of which resources serve a location
+    gazetteer: Offline place-name lookup table built from coverage areas
+    suggestions: In-memory prefix index for location autocomplete
+    facets: Grouped facet counts for public listings
+    related_resources: Precomputed related-resource suggestions
 """
 
-__all__ = ["geocoding"]
+__all__ = ["geocoding", "search_index", "result_sets", "coverage_index", "service_areas", "proximity", "eligibility", "gazetteer", "suggestions", "facets", "related_resources"]
@@ -0,0 +1,326 @@
+"""In-process spatial index of coverage areas for point-in-area lookups.
+
+Finding the coverage areas that contain a point is the core of every
+location search. Doing it in SQL means a ``geom__contains`` test through the
+resource/coverage-area join for every resource row; with all county and city
+boundaries imported that dominates public search latency.
+
+``CoverageAreaIndex`` keeps the bounding box of every coverage area in a
+packed R-tree (Sort-Tile-Recursive bulk load) held in worker memory. A lookup
+walks the tree to the handful of areas whose boxes contain the point and then
+runs an exact prepared-geometry ``contains`` test on just those candidates.
+Candidate geometries are loaded on first use and kept in a bounded cache, so
+steady-state lookups do not touch the database at all.
+
+The index is rebuilt lazily:
+    - immediately in the current process when a CoverageArea is saved or
+      deleted (signal handlers below)
+    - at most every COVERAGE_INDEX_REFRESH_SECONDS in other processes, by
+      comparing the area count and latest ``updated_at`` with the snapshot
+      the index was built from
+
+Classes:
+    STRTree: Static, bulk-loaded R-tree over axis-aligned bounding boxes
+    CoverageAreaIndex: Point-in-coverage-area lookups backed by STRTree
+
+Functions:
+    get_coverage_index: Process-wide CoverageAreaIndex instance
+    invalidate_coverage_index: Mark the process-wide index as stale
+
+Example:
+    >>> index = get_coverage_index()
+    >>> area_ids = index.areas_containing(lat=37.1283, lon=-84.0836)
+    >>> resources = Resource.objects.filter(coverage_areas__id__in=area_ids)
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+logger = logging.getLogger(__name__)
+
+# Coverage areas that serve every location regardless of geometry
+NATIONAL_AREA_NAMES = (
+    "National (Lower 48 States)",
+    "United States (All States and Territories)",
+)
+
+DEFAULT_REFRESH_SECONDS = 60
+DEFAULT_GEOMETRY_CACHE_SIZE = 2000
+
+BBox = Tuple[float, float, float, float]
+
+
+class STRTree:
+    """Static R-tree bulk-loaded with the Sort-Tile-Recursive algorithm.
+
+    Entries are packed bottom-up: boxes are sorted into vertical slices by
+    center x, each slice is sorted by center y and cut into nodes of
+    ``node_capacity`` entries. The process repeats on the parent nodes until
+    a single root remains. The tree cannot be modified after construction;
+    rebuild it instead.
+
+    Attributes:
+        size: Number of indexed entries
+    """
+
+    def __init__(self, entries: Iterable[Tuple[BBox, Any]], node_capacity: int = 16):
+        """Build the tree.
+
+        Args:
+            entries: (minx, miny, maxx, maxy) bounding boxes with their items
+            node_capacity: Maximum number of children per node
+        """
+        if node_capacity < 2:
+            raise ValueError("node_capacity must be at least 2")
+
+        self.node_capacity = node_capacity
+        # Nodes are (minx, miny, maxx, maxy, children, item) tuples; leaves
+        # have children=None
+        level = [(bbox[0], bbox[1], bbox[2], bbox[3], None, item) for bbox, item in entries]
+        self.size = len(level)
+
+        while len(level) > node_capacity:
+            level = self._pack(level)
+        self._root = self._make_node(level) if level else None
+
+    def _pack(self, nodes: List[Tuple]) -> List[Tuple]:
+        """Group one level of nodes into parent nodes."""
+        capacity = self.node_capacity
+        node_count = math.ceil(len(nodes) / capacity)
+        slice_count = math.ceil(math.sqrt(node_count))
+        slice_size = slice_count * capacity
+
+        nodes = sorted(nodes, key=lambda n: n[0] + n[2])
+        parents = []
+        for start in range(0, len(nodes), slice_size):
+            vertical_slice = sorted(nodes[start:start + slice_size], key=lambda n: n[1] + n[3])
+            for offset in range(0, len(vertical_slice), capacity):
+                parents.append(self._make_node(vertical_slice[offset:offset + capacity]))
+        return parents
+
+    @staticmethod
+    def _make_node(children: List[Tuple]) -> Tuple:
+        """Create an internal node covering ``children``."""
+        return (
+            min(c[0] for c in children),
+            min(c[1] for c in children),
+            max(c[2] for c in children),
+            max(c[3] for c in children),
+            children,
+            None,
+        )
+
+    def query_point(self, x: float, y: float) -> List[Any]:
+        """Return the items whose bounding box contains the point (x, y)."""
+        if self._root is None:
+            return []
+
+        found = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            for child in node[4]:
+                if child[0] <= x <= child[2] and child[1] <= y <= child[3]:
+                    if child[4] is None:
+                        found.append(child[5])
+                    else:
+                        stack.append(child)
+        return found
+
+    def __len__(self) -> int:
+        return self.size
+
+
+class CoverageAreaIndex:
+    """Answers "which coverage areas contain this point" from worker memory.
+
+    Only bounding boxes are loaded up front. Full geometries are fetched the
+    first time an area is a candidate for a lookup, prepared, and kept in an
+    LRU cache of ``geometry_cache_size`` entries.
+
+    Attributes:
+        refresh_seconds: How often to check the database for changes made
+            by other processes
+        national_area_ids: IDs of the national coverage areas
+    """
+
+    def __init__(
+        self,
+        refresh_seconds: Optional[int] = None,
+        geometry_cache_size: Optional[int] = None,
+    ):
+        if refresh_seconds is None:
+            refresh_seconds = getattr(
+                settings, "COVERAGE_INDEX_REFRESH_SECONDS", DEFAULT_REFRESH_SECONDS
+            )
+        if geometry_cache_size is None:
+            geometry_cache_size = getattr(
+                settings, "COVERAGE_INDEX_GEOMETRY_CACHE_SIZE", DEFAULT_GEOMETRY_CACHE_SIZE
+            )
+
+        self.refresh_seconds = refresh_seconds
+        self.geometry_cache_size = geometry_cache_size
+        self.national_area_ids: List[int] = []
+
+        self._tree: Optional[STRTree] = None
+        self._snapshot: Optional[Tuple[int, Any]] = None
+        self._checked_at = 0.0
+        self._stale = True
+        self._prepared: "OrderedDict[int, Any]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _database_snapshot() -> Tuple[int, Any]:
+        """Return (area count, latest updated_at) for change detection."""
+        from django.db.models import Count, Max
+
+        from directory.models import CoverageArea
+
+        stats = CoverageArea.objects.aggregate(count=Count("id"), latest=Max("updated_at"))
+        return stats["count"], stats["latest"]
+
+    def invalidate(self) -> None:
+        """Mark the index as stale so the next lookup rebuilds it."""
+        with self._lock:
+            self._stale = True
+
+    def load(self) -> None:
+        """(Re)build the R-tree from the coverage-area bounding boxes.
+
+        Bounding boxes are computed by the database (``Envelope``) so only
+        five-point rectangles cross the wire, not full boundaries.
+        """
+        from django.contrib.gis.db.models.functions import Envelope
+
+        from directory.models import CoverageArea
+
+        with self._lock:
+            started = time.monotonic()
+            snapshot = self._database_snapshot()
+
+            rows = (
+                CoverageArea.objects.filter(geom__isnull=False)
+                .annotate(bbox=Envelope("geom"))
+                .values_list("id", "bbox")
+            )
+            entries = [(envelope.extent, area_id) for area_id, envelope in rows if envelope]
+
+            self._tree = STRTree(entries)
+            self.national_area_ids = list(
+                CoverageArea.objects.filter(name__in=NATIONAL_AREA_NAMES).values_list(
+                    "id", flat=True
+                )
+            )
+            self._prepared.clear()
+            self._snapshot = snapshot
+            self._checked_at = time.monotonic()
+            self._stale = False
+
+            logger.info(
+                "Loaded coverage area index: %d areas in %.0f ms",
+                len(self._tree),
+                (time.monotonic() - started) * 1000,
+            )
+
+    def ensure_fresh(self) -> None:
+        """Rebuild the index if it is stale or the database has changed."""
+        with self._lock:
+            if self._stale or self._tree is None:
+                self.load()
+                return
+
+            if time.monotonic() - self._checked_at < self.refresh_seconds:
+                return
+
+            self._checked_at = time.monotonic()
+            if self._database_snapshot() != self._snapshot:
+                self.load()
+
+    def _prepared_geometries(self, area_ids: Sequence[int]) -> Dict[int, Any]:
+        """Return prepared geometries for ``area_ids``, loading any missing."""
+        from directory.models import CoverageArea
+
+        prepared = {}
+        missing = []
+        for area_id in area_ids:
+            geometry = self._prepared.get(area_id)
+            if geometry is None:
+                missing.append(area_id)
+            else:
+                self._prepared.move_to_end(area_id)
+                prepared[area_id] = geometry
+
+        if missing:
+            rows = CoverageArea.objects.filter(id__in=missing).values_list("id", "geom")
+            for area_id, geom in rows:
+                if geom is None:
+                    continue
+                prepared[area_id] = geom.prepared
+                self._prepared[area_id] = prepared[area_id]
+
+            while len(self._prepared) > self.geometry_cache_size:
+                self._prepared.popitem(last=False)
+
+        return prepared
+
+    def areas_containing(self, lat: float, lon: float) -> List[int]:
+        """Return the IDs of coverage areas whose geometry contains the point.
+
+        Args:
+            lat: Latitude of the point (WGS84)
+            lon: Longitude of the point (WGS84)
+
+        Returns:
+            List of CoverageArea IDs (national areas are not added unless
+            their geometry contains the point)
+        """
+        from django.contrib.gis.geos import Point
+
+        with self._lock:
+            self.ensure_fresh()
+            candidates = self._tree.query_point(lon, lat)
+            if not candidates:
+                return []
+
+            point = Point(lon, lat, srid=4326)
+            prepared = self._prepared_geometries(candidates)
+            return [
+                area_id
+                for area_id in candidates
+                if area_id in prepared and prepared[area_id].contains(point)
+            ]
+
+
+_index: Optional[CoverageAreaIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_coverage_index() -> CoverageAreaIndex:
+    """Return the process-wide coverage area index, creating it on first use."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = CoverageAreaIndex()
+    return _index
+
+
+def invalidate_coverage_index() -> None:
+    """Mark the process-wide index (if built) as stale."""
+    if _index is not None:
+        _index.invalidate()
+
+
+@receiver(post_save, sender="directory.CoverageArea")
+@receiver(post_delete, sender="directory.CoverageArea")
+def handle_coverage_area_change(sender: Any, **kwargs: Any) -> None:
+    """Rebuild the index on next use when a coverage area changes."""
+    invalidate_coverage_index()
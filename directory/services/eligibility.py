@@ -0,0 +1,179 @@
+"""Batch eligibility checks: which resources serve a location, and how close.
+
+Answering "does this resource serve this point?" for a list of resources used
+to cost several queries and GEOS operations per resource. ``check_eligibility``
+answers it for any number of resources with at most two queries:
+
+    1. The resources' coverage areas, from the ResourceServiceArea table
+    2. Boundary distances for the areas that do not contain the point
+       (a single spatial query, skipped when every area contains it)
+
+Containment comes from the in-process CoverageAreaIndex (prepared-geometry
+tests on R-tree candidates), so it costs no query per area. Boundary
+distances are measured on the WGS84 spheroid; areas without a boundary are
+measured to their center with the (vectorized) haversine formula.
+
+Functions:
+    check_eligibility: Serve/not-serve, closest area and distance for many
+        resources at once
+
+Example:
+    >>> results = check_eligibility(37.1283, -84.0836, [12, 40, 41])
+    >>> results[12]["serves_location"]
+    True
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.conf import settings
+
+from directory.utils.geodesy import METERS_PER_MILE, haversine_many
+
+logger = logging.getLogger(__name__)
+
+
+def _empty_result(resource_id: int) -> Dict[str, Any]:
+    """Return the result for a resource before any areas are considered."""
+    return {
+        'resource_id': resource_id,
+        'serves_location': False,
+        'distance_miles': None,
+        'coverage_areas': [],
+        'closest_area': None,
+        'eligibility_reason': 'Resource has no defined coverage areas',
+    }
+
+
+def _boundary_distances(area_ids: Iterable[int], lat: float, lon: float) -> Dict[int, float]:
+    """Return the spheroidal distance in meters from the point to each area.
+
+    Args:
+        area_ids: Coverage area IDs (areas without geometry are skipped)
+        lat: Latitude of the point
+        lon: Longitude of the point
+
+    Returns:
+        Dict mapping area ID to distance in meters
+    """
+    from django.contrib.gis.db.models.functions import Distance
+    from django.contrib.gis.geos import Point
+
+    from directory.models import CoverageArea
+
+    area_ids = list(area_ids)
+    if not area_ids:
+        return {}
+
+    point = Point(lon, lat, srid=4326)
+    rows = (
+        CoverageArea.objects.filter(id__in=area_ids, geom__isnull=False)
+        .annotate(distance=Distance('geom', point, spheroid=True))
+        .values_list('id', 'distance')
+    )
+    return {area_id: distance.m for area_id, distance in rows if distance is not None}
+
+
+def _summarize(result: Dict[str, Any]) -> None:
+    """Fill in serves_location, distance, closest area and reason."""
+    areas: List[Dict[str, Any]] = result['coverage_areas']
+    if not areas:
+        return
+
+    # Containing areas first, then nearest; unknown distances last
+    areas.sort(key=lambda a: (
+        not a['contains_location'],
+        a['distance_miles'] is None,
+        a['distance_miles'] or 0.0,
+        a['name'],
+    ))
+    closest: Optional[Dict[str, Any]] = areas[0]
+
+    if closest['contains_location']:
+        result['serves_location'] = True
+        result['distance_miles'] = 0.0
+        result['eligibility_reason'] = f"Location is within {closest['name']} ({closest['kind']})"
+    elif closest['distance_miles'] is not None:
+        result['distance_miles'] = closest['distance_miles']
+        result['eligibility_reason'] = (
+            f"Location not served. Closest area: {closest['name']} "
+            f"({closest['distance_miles']} miles away)"
+        )
+    else:
+        closest = None
+        result['eligibility_reason'] = 'Unknown'
+
+    result['closest_area'] = closest
+
+
+def check_eligibility(lat: float, lon: float, resource_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+    """Check which of the given resources serve a location.
+
+    Args:
+        lat: Latitude of the location
+        lon: Longitude of the location
+        resource_ids: IDs of the resources to check
+
+    Returns:
+        Dict mapping each resource ID to a dict with serves_location,
+        distance_miles, closest_area, coverage_areas and eligibility_reason
+        (the per-area entries match calculate_resource_distance)
+    """
+    from directory.models import ResourceServiceArea
+
+    from .coverage_index import get_coverage_index
+
+    resource_ids = list(dict.fromkeys(resource_ids))
+    results = {resource_id: _empty_result(resource_id) for resource_id in resource_ids}
+    if not resource_ids:
+        return results
+
+    if not getattr(settings, 'GIS_ENABLED', False):
+        for result in results.values():
+            result['eligibility_reason'] = 'GIS not enabled for distance calculations'
+        return results
+
+    rows = list(
+        ResourceServiceArea.objects.filter(resource_id__in=resource_ids).values_list(
+            'resource_id', 'coverage_area_id', 'coverage_area__name', 'kind',
+            'center_lat', 'center_lon',
+        )
+    )
+
+    containing = set(get_coverage_index().areas_containing(lat, lon))
+    boundary = _boundary_distances(
+        {row[1] for row in rows if row[1] not in containing}, lat, lon
+    )
+
+    center_rows = [
+        row for row in rows
+        if row[1] not in containing and row[1] not in boundary
+        and row[4] is not None and row[5] is not None
+    ]
+    center_distances = dict(zip(
+        (row[1] for row in center_rows),
+        haversine_many(lat, lon, [row[4] for row in center_rows], [row[5] for row in center_rows]),
+    ))
+
+    for resource_id, area_id, name, kind, center_lat, center_lon in rows:
+        area_info: Dict[str, Any] = {
+            'id': area_id,
+            'name': name,
+            'kind': kind,
+            'distance_miles': None,
+            'contains_location': area_id in containing,
+        }
+
+        if area_info['contains_location']:
+            area_info['distance_miles'] = 0.0
+        elif area_id in boundary:
+            area_info['distance_miles'] = round(boundary[area_id] / METERS_PER_MILE, 2)
+        elif area_id in center_distances:
+            area_info['distance_miles'] = round(center_distances[area_id] / METERS_PER_MILE, 2)
+            area_info['note'] = 'Using center point (no boundary geometry)'
+
+        results[resource_id]['coverage_areas'].append(area_info)
+
+    for result in results.values():
+        _summarize(result)
+    return results
@@ -0,0 +1,172 @@
+"""Facet counts for public resource listings.
+
+The public home page and the sidebar of the public resource list show how
+many published resources fall under each category, service type, city and
+state, and how many are emergency or 24-hour services. Instead of one COUNT
+per option, ``count_facets`` computes all of them with two grouped queries:
+
+    1. Resources grouped by (category, city, state, emergency, 24-hour),
+       which the category, city, state and flag counts are summed from
+    2. Service-type links grouped by service type
+
+Facets of all published resources are cached under the result-set
+generation (see directory.services.result_sets), so any resource change,
+including publishing and archiving, expires them. Facets of a filtered
+result set are cached next to that result set.
+
+Functions:
+    published_resources: Queryset of publicly listed resources
+    count_facets: Facet counts for a queryset or a list of resource IDs
+    get_published_facets: Cached facets of all published resources
+    get_result_set_facets: Cached facets of a ResultSet
+
+Example:
+    >>> facets = get_published_facets()
+    >>> facets["total"], facets["categories"][food.id]
+    (412, 37)
+"""
+
+from collections import Counter
+from typing import Any, Dict, Optional, Sequence, Union
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models
+from django.db.models import Count
+
+from .result_sets import DEFAULT_TIMEOUT, ResultSet, get_generation
+
+# Resource IDs per query when counting an explicit ID list
+ID_CHUNK_SIZE = 500
+
+FACET_FIELDS = ("category_id", "city", "state", "is_emergency_service", "is_24_hour_service")
+
+
+def published_resources() -> models.QuerySet:
+    """Return the resources shown on public pages."""
+    from directory.models import Resource
+
+    return Resource.objects.filter(status="published", is_deleted=False, is_archived=False)
+
+
+def _empty_facets() -> Dict[str, Any]:
+    return {
+        "total": 0,
+        "emergency": 0,
+        "twenty_four_hour": 0,
+        "categories": Counter(),
+        "service_types": Counter(),
+        "cities": Counter(),
+        "states": Counter(),
+    }
+
+
+def _add_counts(facets: Dict[str, Any], queryset: models.QuerySet) -> None:
+    """Add the facet counts of ``queryset`` (which must not contain joins)."""
+    from directory.models import Resource
+
+    groups = queryset.order_by().values(*FACET_FIELDS).annotate(count=Count("id"))
+    for group in groups:
+        count = group["count"]
+        facets["total"] += count
+        if group["is_emergency_service"]:
+            facets["emergency"] += count
+        if group["is_24_hour_service"]:
+            facets["twenty_four_hour"] += count
+        if group["category_id"] is not None:
+            facets["categories"][group["category_id"]] += count
+        if group["city"]:
+            facets["cities"][group["city"]] += count
+        if group["state"]:
+            facets["states"][group["state"]] += count
+
+    links = (
+        Resource.service_types.through.objects.filter(resource__in=queryset.values("pk"))
+        .values("servicetype_id")
+        .annotate(count=Count("resource_id"))
+    )
+    for link in links:
+        facets["service_types"][link["servicetype_id"]] += link["count"]
+
+
+def count_facets(resources: Union[models.QuerySet, Sequence[Any]]) -> Dict[str, Any]:
+    """Count facets over a queryset or an explicit list of resource IDs.
+
+    Counts are additive across disjoint sets of resources, so an ID list is
+    counted in chunks of ID_CHUNK_SIZE to stay within query parameter limits.
+
+    Args:
+        resources: Queryset of resources (without joins) or resource IDs
+
+    Returns:
+        Dict with "total", "emergency" and "twenty_four_hour" counts and
+        "categories", "service_types", "cities" and "states" mappings from
+        option (ID or name) to count
+    """
+    facets = _empty_facets()
+    if isinstance(resources, models.QuerySet):
+        _add_counts(facets, resources)
+    else:
+        base = published_resources()
+        for start in range(0, len(resources), ID_CHUNK_SIZE):
+            _add_counts(facets, base.filter(pk__in=resources[start:start + ID_CHUNK_SIZE]))
+
+    for name in ("categories", "service_types", "cities", "states"):
+        facets[name] = dict(facets[name])
+    return facets
+
+
+def get_published_facets(timeout: Optional[int] = None) -> Dict[str, Any]:
+    """Return facet counts of all published resources, cached per generation.
+
+    Args:
+        timeout: Cache timeout in seconds (defaults to the
+            SEARCH_RESULT_CACHE_TIMEOUT setting)
+
+    Returns:
+        Facet dict as returned by ``count_facets``
+    """
+    if timeout is None:
+        timeout = getattr(settings, "SEARCH_RESULT_CACHE_TIMEOUT", DEFAULT_TIMEOUT)
+
+    key = f"facets:published:{get_generation()}"
+    facets = cache.get(key)
+    if facets is None:
+        facets = count_facets(published_resources())
+        cache.set(key, facets, timeout)
+    return facets
+
+
+def get_result_set_facets(
+    result_set: ResultSet,
+    published_facets: Optional[Dict[str, Any]] = None,
+    timeout: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Return facet counts of the resources in a result set.
+
+    A result set as large as the published set is the published set, so
+    its cached facets are reused.
+
+    Args:
+        result_set: Result set of published resources
+        published_facets: Facets of all published resources, if already loaded
+        timeout: Cache timeout in seconds (defaults to the
+            SEARCH_RESULT_CACHE_TIMEOUT setting)
+
+    Returns:
+        Facet dict as returned by ``count_facets``
+    """
+    if timeout is None:
+        timeout = getattr(settings, "SEARCH_RESULT_CACHE_TIMEOUT", DEFAULT_TIMEOUT)
+    if published_facets is None:
+        published_facets = get_published_facets(timeout)
+    if len(result_set) == published_facets["total"]:
+        return published_facets
+
+    key = f"{result_set.cache_key}:facets" if result_set.cache_key else None
+    facets = cache.get(key) if key else None
+    if facets is None:
+        facets = count_facets(result_set.ids)
+        if key:
+            cache.set(key, facets, timeout)
+    return facets
@@ -0,0 +1,201 @@
+"""Offline gazetteer built from imported TIGER coverage areas.
+
+The gazetteer maps normalized place names and codes to a representative
+point so that administrative-area queries ("Corbin, KY", "Laurel County",
+"40741", "21125") are answered without a network geocoder. Entries are
+stored in the GazetteerEntry table and read by GazetteerProvider (see
+directory.services.geocoding).
+
+Sources:
+    - STATE, COUNTY and CITY coverage areas (TIGER imports), using the
+      stored center or the boundary centroid
+    - Optionally, a Census ZCTA gazetteer file for ZIP codes
+      (e.g. 2020_Gaz_zcta_national.txt)
+
+Keys and ranks (lower rank wins when a key has several entries):
+    0: State-qualified names ("london ky", "laurel county kentucky"),
+       place FIPS, state FIPS and ZIP codes
+    1: Bare state names and abbreviations
+    2: Bare county names ("laurel county")
+    3: Bare city names ("london")
+    4: County FIPS codes (five digits, like ZIP codes, which win)
+
+Functions:
+    normalize_place_name: Normalize a query or name to a gazetteer key
+    build_gazetteer: Rebuild entries from coverage areas
+    load_zcta_file: Load ZIP code entries from a Census ZCTA gazetteer file
+
+Example:
+    >>> from directory.services.gazetteer import build_gazetteer
+    >>> build_gazetteer()
+    14210
+"""
+
+import csv
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 1000
+
+RANK_QUALIFIED = 0
+RANK_STATE = 1
+RANK_COUNTY = 2
+RANK_CITY = 3
+RANK_COUNTY_FIPS = 4
+
+
+def normalize_place_name(text: str) -> str:
+    """Lowercase, replace punctuation with spaces and collapse whitespace."""
+    return " ".join("".join(ch if ch.isalnum() else " " for ch in text.lower()).split())
+
+
+def _area_keys(kind: str, name: str, ext_ids: Dict[str, Any]) -> List[tuple]:
+    """Return (key, rank) pairs for a coverage area.
+
+    Args:
+        kind: CoverageArea kind (STATE, COUNTY or CITY)
+        name: CoverageArea name
+        ext_ids: CoverageArea ext_ids (FIPS codes and state names)
+
+    Returns:
+        List of (normalized key, rank) tuples
+    """
+    state_fips = ext_ids.get("state_fips") or ""
+    state_names = [
+        normalize_place_name(value)
+        for value in (ext_ids.get("state_abbr"), ext_ids.get("state_name"))
+        if value
+    ]
+    keys = []
+
+    if kind == "STATE":
+        keys.append((normalize_place_name(name), RANK_STATE))
+        keys.extend((state, RANK_STATE) for state in state_names)
+        if state_fips:
+            keys.append((state_fips, RANK_QUALIFIED))
+
+    elif kind == "COUNTY":
+        county = normalize_place_name(name)
+        keys.append((county, RANK_COUNTY))
+        keys.extend((f"{county} {state}", RANK_QUALIFIED) for state in state_names)
+        county_fips = ext_ids.get("county_fips") or ""
+        if state_fips and county_fips:
+            keys.append((f"{state_fips}{county_fips}", RANK_COUNTY_FIPS))
+
+    elif kind == "CITY":
+        # City areas are named "London, KY"; ext_ids keeps the bare name
+        city = normalize_place_name(ext_ids.get("city_name") or name.split(",")[0])
+        keys.append((city, RANK_CITY))
+        keys.extend((f"{city} {state}", RANK_QUALIFIED) for state in state_names)
+        place_fips = ext_ids.get("place_fips") or ""
+        if state_fips and place_fips:
+            keys.append((f"{state_fips}{place_fips}", RANK_QUALIFIED))
+
+    # The same key can come from two spellings (e.g. name and state_name)
+    return list(dict.fromkeys((key, rank) for key, rank in keys if key))
+
+
+def build_gazetteer() -> int:
+    """Rebuild the gazetteer entries derived from coverage areas.
+
+    ZIP entries (from ``load_zcta_file``) are left in place. Requires GIS,
+    since centers come from area geometries.
+
+    Returns:
+        int: Number of entries written
+    """
+    from directory.models import CoverageArea, GazetteerEntry
+
+    if not getattr(settings, "GIS_ENABLED", False):
+        logger.info("GIS not enabled; gazetteer not built")
+        return 0
+
+    from django.contrib.gis.db.models.functions import Centroid
+
+    rows = (
+        CoverageArea.objects.filter(kind__in=["STATE", "COUNTY", "CITY"])
+        .annotate(centroid=Centroid("geom"))
+        .values_list("id", "kind", "name", "ext_ids", "center", "centroid")
+    )
+
+    entries = []
+    for area_id, kind, name, ext_ids, center, centroid in rows.iterator(chunk_size=BATCH_SIZE):
+        point = center or centroid
+        if point is None:
+            continue
+        ext_ids = ext_ids or {}
+        for key, rank in _area_keys(kind, name, ext_ids):
+            entries.append(GazetteerEntry(
+                key=key[:200],
+                kind=kind,
+                name=name,
+                state_abbr=(ext_ids.get("state_abbr") or "")[:2],
+                rank=rank,
+                latitude=point.y,
+                longitude=point.x,
+                coverage_area_id=area_id,
+            ))
+
+    with transaction.atomic():
+        GazetteerEntry.objects.exclude(kind="ZIP").delete()
+        GazetteerEntry.objects.bulk_create(entries, batch_size=BATCH_SIZE)
+
+    logger.info(f"Built {len(entries)} gazetteer entries from coverage areas")
+    return len(entries)
+
+
+def _zcta_rows(lines: Iterable[str]) -> Iterable[Dict[str, str]]:
+    """Yield ZCTA gazetteer rows with whitespace-stripped column names."""
+    reader = csv.reader(lines, delimiter="\t")
+    header = [column.strip().upper() for column in next(reader, [])]
+    for values in reader:
+        yield dict(zip(header, (value.strip() for value in values)))
+
+
+def load_zcta_file(path: str, state_abbr: Optional[str] = None) -> int:
+    """Replace ZIP code entries from a Census ZCTA gazetteer file.
+
+    The file is tab-delimited with GEOID, INTPTLAT and INTPTLONG columns.
+
+    Args:
+        path: Path to the gazetteer file
+        state_abbr: Two-letter state recorded on the entries (the national
+            file has no state column)
+
+    Returns:
+        int: Number of ZIP entries written
+    """
+    from directory.models import GazetteerEntry
+
+    entries = []
+    with open(path, newline="", encoding="utf-8") as handle:
+        for row in _zcta_rows(handle):
+            zip_code = row.get("GEOID", "")
+            try:
+                latitude = float(row["INTPTLAT"])
+                longitude = float(row["INTPTLONG"])
+            except (KeyError, ValueError):
+                continue
+            if len(zip_code) != 5 or not zip_code.isdigit():
+                continue
+            entries.append(GazetteerEntry(
+                key=zip_code,
+                kind="ZIP",
+                name=zip_code,
+                state_abbr=(state_abbr or "")[:2].upper(),
+                rank=RANK_QUALIFIED,
+                latitude=latitude,
+                longitude=longitude,
+            ))
+
+    with transaction.atomic():
+        GazetteerEntry.objects.filter(kind="ZIP").delete()
+        GazetteerEntry.objects.bulk_create(entries, batch_size=BATCH_SIZE)
+
+    logger.info(f"Loaded {len(entries)} ZIP code gazetteer entries from {path}")
+    return len(entries)
@@ -8,25 +8,40 @@ Classes:
     GeocodingResult: Result object for geocoding operations
     GeocodingProvider: Abstract base class for geocoding providers
     NominatimProvider: Implementation using OpenStreetMap Nominatim
+    GazetteerProvider: Offline lookups from the TIGER-derived gazetteer
+    MemoryResultCache: Bounded in-process LRU (with TTL) for hot queries
     GeocodingService: Main service class with provider management
 
+The service returned by ``get_geocoding_service()`` is shared by the whole
+process, so provider setup, rate-limiter and circuit-breaker state, the text
+matcher's coverage-area cache and the in-memory result cache survive across
+requests. Lookups go memory cache → GeocodingCache table → providers.
+Reverse lookups are cached the same way, keyed by the grid cell of the
+point, and fall back to the coverage areas containing the point.
+
 Example:
-    >>> from directory.services.geocoding import GeocodingService
-    >>> service = GeocodingService()
+    >>> from directory.services.geocoding import get_geocoding_service
+    >>> service = get_geocoding_service()
     >>> result = service.geocode("123 Main St, London, KY")
     >>> print(f"Lat: {result.latitude}, Lon: {result.longitude}")
 """
 
+import copy
 import logging
+import threading
 import time
 import random
 from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Tuple, Union, Callable, Any
 from urllib.parse import quote
 from functools import wraps
 
 import requests
 from django.conf import settings
+from django.utils import timezone
 
 # Only import geopy modules if GIS is enabled
 if getattr(settings, 'GIS_ENABLED', False):
@@ -46,6 +61,15 @@ else:
 
 logger = logging.getLogger(__name__)
 
+# Shortest trailing query token expanded as a prefix by the text matcher
+MIN_PREFIX_LENGTH = 3
+
+# GeocodingCache query prefix for reverse lookups (keyed by grid cell)
+REVERSE_CACHE_PREFIX = "reverse:"
+
+# Coverage area kinds used to describe a point, most specific first
+REVERSE_AREA_KINDS = ("CITY", "COUNTY", "STATE")
+
 
 class GeocodingResult:
     """Result object for geocoding operations.
@@ -105,6 +129,7 @@ class CircuitBreaker:
     of operations and can temporarily disable a service when it's failing too often.
     
     Attributes:
+        name: Name of the protected service (used in messages)
         failure_threshold: Number of failures before opening the circuit
         recovery_timeout: Time in seconds to wait before attempting recovery
         expected_exception: Exception type that indicates a failure
@@ -117,7 +142,8 @@ class CircuitBreaker:
         self,
         failure_threshold: int = 5,
         recovery_timeout: int = 60,
-        expected_exception: type = Exception
+        expected_exception: type = Exception,
+        name: str = "service",
     ):
         """Initialize the circuit breaker.
         
@@ -125,13 +151,17 @@ class CircuitBreaker:
             failure_threshold: Number of failures before opening the circuit
             recovery_timeout: Time in seconds to wait before attempting recovery
             expected_exception: Exception type that indicates a failure
+            name: Name of the protected service (used in messages)
         """
+        self.name = name
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
         self.expected_exception = expected_exception
         self.last_failure_time = 0
         self.failure_count = 0
         self.state = "CLOSED"  # CLOSED, OPEN, HALF_OPEN
+        # State is shared by every request in the process
+        self._lock = threading.Lock()
     
     def call(self, func: Callable, *args, **kwargs) -> Any:
         """Execute a function with circuit breaker protection.
@@ -147,12 +177,13 @@ class CircuitBreaker:
         Raises:
             Exception: If circuit is open or function fails
         """
-        if self.state == "OPEN":
-            if time.time() - self.last_failure_time >= self.recovery_timeout:
-                self.state = "HALF_OPEN"
-                logger.info("Circuit breaker attempting recovery")
-            else:
-                raise Exception(f"Circuit breaker is OPEN for {self.name}")
+        with self._lock:
+            if self.state == "OPEN":
+                if time.time() - self.last_failure_time >= self.recovery_timeout:
+                    self.state = "HALF_OPEN"
+                    logger.info("Circuit breaker attempting recovery")
+                else:
+                    raise Exception(f"Circuit breaker is OPEN for {self.name}")
         
         try:
             result = func(*args, **kwargs)
@@ -164,20 +195,24 @@ class CircuitBreaker:
     
     def _on_success(self) -> None:
         """Handle successful operation."""
-        self.failure_count = 0
-        self.state = "CLOSED"
+        with self._lock:
+            self.failure_count = 0
+            self.state = "CLOSED"
         logger.debug("Circuit breaker: Operation successful")
     
     def _on_failure(self) -> None:
         """Handle failed operation."""
-        self.failure_count += 1
-        self.last_failure_time = time.time()
+        with self._lock:
+            self.failure_count += 1
+            self.last_failure_time = time.time()
+            failure_count = self.failure_count
+            if failure_count >= self.failure_threshold:
+                self.state = "OPEN"
         
-        if self.failure_count >= self.failure_threshold:
-            self.state = "OPEN"
-            logger.warning(f"Circuit breaker opened after {self.failure_count} failures")
+        if failure_count >= self.failure_threshold:
+            logger.warning(f"Circuit breaker opened after {failure_count} failures")
         else:
-            logger.debug(f"Circuit breaker: Failure {self.failure_count}/{self.failure_threshold}")
+            logger.debug(f"Circuit breaker: Failure {failure_count}/{self.failure_threshold}")
 
 
 def retry_with_backoff(
@@ -242,36 +277,181 @@ class TextBasedLocationMatcher:
     
     This class provides text-based location matching using CoverageArea data
     when geocoding services are unavailable or fail.
+    
+    Matching runs against an in-memory index built from the coverage areas
+    that have a known center:
+    
+        - Exact normalized name → area
+        - Token → areas whose names contain it, with a sorted token list
+          for prefix lookups ("laur" → "laurel")
+        - Anchor token (each name's rarest token) → areas, so names
+          contained in a longer query are found without scanning
+        - ext_ids value (FIPS codes, etc.) → areas
+    
+    Results carry the matched area's real center. The index is rebuilt when
+    the coverage areas change, checked at most every ``_cache_ttl`` seconds.
     """
     
     def __init__(self):
         """Initialize the text-based location matcher."""
-        self._coverage_areas_cache = None
+        self._index: Optional[Dict[str, Any]] = None
+        self._snapshot: Optional[Tuple[Any, Any]] = None
         self._last_cache_update = 0
         self._cache_ttl = 300  # 5 minutes
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Lowercase, replace punctuation with spaces and collapse whitespace."""
+        return " ".join("".join(ch if ch.isalnum() else " " for ch in text.lower()).split())
+    
+    def _coverage_snapshot(self) -> Tuple[Any, Any]:
+        """Return (count, latest update) of coverage areas."""
+        from django.db.models import Count, Max
+        
+        from directory.models import CoverageArea
+        
+        stats = CoverageArea.objects.aggregate(count=Count('id'), latest=Max('updated_at'))
+        return stats['count'], stats['latest']
     
-    def _get_coverage_areas(self) -> List[Dict]:
-        """Get coverage areas for text matching.
+    def _load_areas(self) -> List[Dict]:
+        """Load coverage areas with their centers.
         
         Returns:
-            List of coverage area dictionaries with name and kind
+            List of dicts with name, kind, ext_ids, lat and lon (areas without
+            a known center are skipped)
         """
+        from directory.models import CoverageArea
+        
+        if not getattr(settings, 'GIS_ENABLED', False):
+            return []
+        
+        from django.contrib.gis.db.models.functions import Centroid
+        
+        rows = CoverageArea.objects.annotate(centroid=Centroid('geom')).values_list(
+            'id', 'name', 'kind', 'ext_ids', 'center', 'centroid'
+        )
+        areas = []
+        for area_id, name, kind, ext_ids, center, centroid in rows:
+            point = center or centroid
+            if point is None:
+                continue
+            areas.append({
+                'id': area_id,
+                'name': name,
+                'kind': kind,
+                'ext_ids': ext_ids or {},
+                'lat': point.y,
+                'lon': point.x,
+            })
+        return areas
+    
+    def _build_index(self, areas: List[Dict]) -> Dict[str, Any]:
+        """Build the lookup structures for a list of areas."""
+        from directory.models import ResourceServiceArea
+        
+        # Most specific kinds first, so ties resolve to the smallest area
+        areas = sorted(areas, key=lambda a: -ResourceServiceArea.specificity_for(a['kind']))
+        
+        exact: Dict[str, int] = {}
+        tokens: Dict[str, List[int]] = {}
+        ext_ids: Dict[str, int] = {}
+        area_tokens: List[frozenset] = []
+        
+        for position, area in enumerate(areas):
+            normalized = self.normalize(area['name'])
+            exact.setdefault(normalized, position)
+            name_tokens = frozenset(normalized.split())
+            area_tokens.append(name_tokens)
+            for token in name_tokens:
+                tokens.setdefault(token, []).append(position)
+            for value in area['ext_ids'].values():
+                if isinstance(value, str) and value.strip():
+                    ext_ids.setdefault(value.strip().lower(), position)
+        
+        anchors: Dict[str, List[int]] = {}
+        for position, name_tokens in enumerate(area_tokens):
+            if name_tokens:
+                anchor = min(name_tokens, key=lambda token: (len(tokens[token]), token))
+                anchors.setdefault(anchor, []).append(position)
+        
+        return {
+            'areas': areas,
+            'exact': exact,
+            'tokens': tokens,
+            'sorted_tokens': sorted(tokens),
+            'anchors': anchors,
+            'area_tokens': area_tokens,
+            'ext_ids': ext_ids,
+        }
+    
+    def _get_index(self) -> Dict[str, Any]:
+        """Return the current index, rebuilding it if coverage areas changed."""
         current_time = time.time()
+        if self._index is not None and current_time - self._last_cache_update <= self._cache_ttl:
+            return self._index
         
-        # Refresh cache if expired
-        if (self._coverage_areas_cache is None or 
-            current_time - self._last_cache_update > self._cache_ttl):
+        with self._lock:
+            if self._index is not None and current_time - self._last_cache_update <= self._cache_ttl:
+                return self._index
             try:
-                from directory.models import CoverageArea
-                areas = CoverageArea.objects.values('name', 'kind', 'ext_ids')
-                self._coverage_areas_cache = list(areas)
-                self._last_cache_update = current_time
-                logger.debug(f"Cached {len(self._coverage_areas_cache)} coverage areas for text matching")
+                snapshot = self._coverage_snapshot()
+                if self._index is None or snapshot != self._snapshot:
+                    self._index = self._build_index(self._load_areas())
+                    self._snapshot = snapshot
+                    logger.debug(f"Indexed {len(self._index['areas'])} coverage areas for text matching")
             except Exception as e:
                 logger.warning(f"Failed to load coverage areas for text matching: {e}")
-                self._coverage_areas_cache = []
+                if self._index is None:
+                    self._index = self._build_index([])
+            self._last_cache_update = current_time
+        
+        return self._index
+    
+    def _prefix_matches(self, index: Dict[str, Any], prefix: str) -> set:
+        """Return positions of areas with a name token starting with ``prefix``."""
+        sorted_tokens = index['sorted_tokens']
+        matches = set()
+        position = bisect_left(sorted_tokens, prefix)
+        while position < len(sorted_tokens) and sorted_tokens[position].startswith(prefix):
+            matches.update(index['tokens'][sorted_tokens[position]])
+            position += 1
+        return matches
+    
+    def _partial_match(self, index: Dict[str, Any], query_tokens: List[str]) -> Optional[int]:
+        """Find an area whose name contains the query or is contained in it.
         
-        return self._coverage_areas_cache
+        Returns:
+            Position of the best candidate (most name tokens, then most
+            specific kind), or None
+        """
+        area_tokens = index['area_tokens']
+        query_set = set(query_tokens)
+        
+        # Area names contained in the query, found via their anchor token
+        contained = [
+            position
+            for token in query_set
+            for position in index['anchors'].get(token, ())
+            if area_tokens[position] <= query_set
+        ]
+        if contained:
+            return min(contained, key=lambda position: (-len(area_tokens[position]), position))
+        
+        # Query contained in an area name (last token may be a prefix)
+        postings = [index['tokens'].get(token, ()) for token in query_tokens[:-1]]
+        last = query_tokens[-1]
+        if len(last) >= MIN_PREFIX_LENGTH:
+            postings.append(self._prefix_matches(index, last))
+        else:
+            postings.append(index['tokens'].get(last, ()))
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                break
+        return min(candidates) if candidates else None
     
     def find_location_match(self, query: str) -> Optional[GeocodingResult]:
         """Find a location match using text-based matching.
@@ -285,30 +465,30 @@ class TextBasedLocationMatcher:
         if not query:
             return None
         
-        query_lower = query.lower().strip()
-        coverage_areas = self._get_coverage_areas()
+        normalized = self.normalize(query)
+        if not normalized:
+            return None
+        
+        index = self._get_index()
+        areas = index['areas']
         
         # Try exact matches first
-        for area in coverage_areas:
-            area_name = area['name'].lower()
-            if query_lower == area_name:
-                logger.info(f"Text-based exact match found: {area['name']}")
-                return self._create_result_from_area(area, query, confidence=0.9)
+        position = index['exact'].get(normalized)
+        if position is not None:
+            logger.info(f"Text-based exact match found: {areas[position]['name']}")
+            return self._create_result_from_area(areas[position], query, confidence=0.9)
         
         # Try partial matches
-        for area in coverage_areas:
-            area_name = area['name'].lower()
-            if query_lower in area_name or area_name in query_lower:
-                logger.info(f"Text-based partial match found: {area['name']}")
-                return self._create_result_from_area(area, query, confidence=0.7)
+        position = self._partial_match(index, normalized.split())
+        if position is not None:
+            logger.info(f"Text-based partial match found: {areas[position]['name']}")
+            return self._create_result_from_area(areas[position], query, confidence=0.7)
         
         # Try matching against ext_ids (FIPS codes, etc.)
-        for area in coverage_areas:
-            ext_ids = area.get('ext_ids', {})
-            for key, value in ext_ids.items():
-                if isinstance(value, str) and query_lower in value.lower():
-                    logger.info(f"Text-based ext_id match found: {area['name']} ({key}={value})")
-                    return self._create_result_from_area(area, query, confidence=0.6)
+        position = index['ext_ids'].get(query.strip().lower())
+        if position is not None:
+            logger.info(f"Text-based ext_id match found: {areas[position]['name']}")
+            return self._create_result_from_area(areas[position], query, confidence=0.6)
         
         logger.debug(f"No text-based match found for query: {query}")
         return None
@@ -317,28 +497,20 @@ class TextBasedLocationMatcher:
         """Create a GeocodingResult from a coverage area.
         
         Args:
-            area: Coverage area dictionary
+            area: Indexed coverage area dictionary
             original_query: Original query string
             confidence: Confidence score for the match
             
         Returns:
-            GeocodingResult with area information
+            GeocodingResult located at the area's center
         """
-        # For text-based matching, we don't have exact coordinates
-        # We'll use a default location (center of the area if available)
-        # This is a simplified approach - in a real implementation,
-        # you might want to store center coordinates in CoverageArea
-        
-        # Use a default location (this could be enhanced with actual area centers)
-        default_lat = 37.7749  # Default to a reasonable location
-        default_lon = -122.4194
-        
         return GeocodingResult(
-            latitude=default_lat,
-            longitude=default_lon,
+            latitude=area['lat'],
+            longitude=area['lon'],
             address=f"{area['name']} (text-based match)",
             raw_data={
                 "text_match": True,
+                "area_id": area['id'],
                 "area_name": area['name'],
                 "area_kind": area['kind'],
                 "ext_ids": area.get('ext_ids', {}),
@@ -354,8 +526,13 @@ class GeocodingProvider(ABC):
     
     This class defines the interface that all geocoding providers must implement.
     Providers handle the actual communication with external geocoding services.
+    
+    Providers that answer from the local database set ``offline = True``;
+    batch geocoding runs them on the calling thread.
     """
     
+    offline = False
+    
     def __init__(self, name: str, rate_limit_per_minute: int = 60):
         """Initialize the provider.
         
@@ -366,6 +543,7 @@ class GeocodingProvider(ABC):
         self.name = name
         self.rate_limit_per_minute = rate_limit_per_minute
         self.last_request_time = 0
+        self._rate_lock = threading.Lock()
     
     @abstractmethod
     def geocode(self, query: str) -> Optional[GeocodingResult]:
@@ -393,16 +571,21 @@ class GeocodingProvider(ABC):
         pass
     
     def _rate_limit(self) -> None:
-        """Implement rate limiting for API calls."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
+        """Implement rate limiting for API calls.
+        
+        Each caller reserves the next free request slot under a lock and then
+        sleeps outside it, so concurrent requests sharing this provider are
+        spaced out without serializing on the sleep.
+        """
         min_interval = 60.0 / self.rate_limit_per_minute
         
-        if time_since_last < min_interval:
-            sleep_time = min_interval - time_since_last
-            time.sleep(sleep_time)
+        with self._rate_lock:
+            current_time = time.time()
+            slot = max(current_time, self.last_request_time + min_interval)
+            self.last_request_time = slot
         
-        self.last_request_time = time.time()
+        if slot > current_time:
+            time.sleep(slot - current_time)
 
 
 class NominatimProvider(GeocodingProvider):
@@ -443,7 +626,8 @@ class NominatimProvider(GeocodingProvider):
         self.circuit_breaker = CircuitBreaker(
             failure_threshold=3,
             recovery_timeout=120,  # 2 minutes
-            expected_exception=(GeocoderTimedOut, GeocoderUnavailable, requests.RequestException)
+            expected_exception=(GeocoderTimedOut, GeocoderUnavailable, requests.RequestException),
+            name=self.name,
         )
     
     @property
@@ -567,6 +751,199 @@ class NominatimProvider(GeocodingProvider):
             return None
 
 
+class GazetteerProvider(GeocodingProvider):
+    """Offline provider answering place, county, state, ZIP and FIPS queries.
+    
+    Looks queries up in the GazetteerEntry table (built from the imported
+    TIGER coverage areas, see directory.services.gazetteer), held in memory
+    as a key → candidates dict. Street-level addresses and ambiguous names
+    ("London" without a state) return None so the next provider handles
+    them.
+    
+    Attributes:
+        refresh_interval: Seconds between checks for a rebuilt table
+    """
+    
+    offline = True
+    
+    # Trailing country names ignored in queries
+    COUNTRY_SUFFIXES = ("united states of america", "united states", "usa", "us")
+    
+    def __init__(self, refresh_interval: int = 300):
+        """Initialize the gazetteer provider.
+        
+        Args:
+            refresh_interval: Seconds between checks for a rebuilt table
+        """
+        super().__init__("gazetteer", rate_limit_per_minute=60000)
+        self.refresh_interval = refresh_interval
+        self._table: Optional[Dict[str, List[Tuple]]] = None
+        self._snapshot: Optional[Tuple[Any, Any]] = None
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+    
+    def _get_table(self) -> Dict[str, List[Tuple]]:
+        """Return the in-memory table, reloading it if the entries changed."""
+        now = time.time()
+        if self._table is not None and now - self._last_check <= self.refresh_interval:
+            return self._table
+        
+        with self._lock:
+            if self._table is not None and now - self._last_check <= self.refresh_interval:
+                return self._table
+            try:
+                from django.db.models import Count, Max
+                
+                from directory.models import GazetteerEntry
+                
+                stats = GazetteerEntry.objects.aggregate(count=Count('id'), latest=Max('id'))
+                snapshot = (stats['count'], stats['latest'])
+                if self._table is None or snapshot != self._snapshot:
+                    table: Dict[str, List[Tuple]] = {}
+                    for key, rank, latitude, longitude, name, kind in GazetteerEntry.objects.values_list(
+                        'key', 'rank', 'latitude', 'longitude', 'name', 'kind'
+                    ).iterator(chunk_size=2000):
+                        table.setdefault(key, []).append((rank, latitude, longitude, name, kind))
+                    self._table = table
+                    self._snapshot = snapshot
+                    logger.debug(f"Loaded {len(table)} gazetteer keys")
+            except Exception as e:
+                logger.warning(f"Failed to load gazetteer: {e}")
+                if self._table is None:
+                    self._table = {}
+            self._last_check = now
+        
+        return self._table
+    
+    def _lookup(self, table: Dict[str, List[Tuple]], key: str) -> Optional[Tuple]:
+        """Return the best candidate for a key, or None if missing or ambiguous."""
+        candidates = table.get(key)
+        if not candidates:
+            return None
+        best_rank = min(candidate[0] for candidate in candidates)
+        best = {candidate[1:3]: candidate for candidate in candidates if candidate[0] == best_rank}
+        if len(best) > 1:
+            logger.debug(f"Gazetteer key '{key}' is ambiguous ({len(best)} places)")
+            return None
+        return next(iter(best.values()))
+    
+    def geocode(self, query: str) -> Optional[GeocodingResult]:
+        """Geocode a place, county, state, ZIP or FIPS query offline.
+        
+        Args:
+            query: Location query string
+            
+        Returns:
+            GeocodingResult at the place's center, or None for street
+            addresses, unknown places and ambiguous names
+        """
+        from .gazetteer import normalize_place_name
+        
+        tokens = normalize_place_name(query or "").split()
+        for suffix in self.COUNTRY_SUFFIXES:
+            suffix_tokens = suffix.split()
+            if len(tokens) > len(suffix_tokens) and tokens[-len(suffix_tokens):] == suffix_tokens:
+                tokens = tokens[:-len(suffix_tokens)]
+                break
+        if not tokens:
+            return None
+        
+        # "123 Main St ..." is a street address; leave it to network providers
+        if len(tokens) > 1 and tokens[0][0].isdigit():
+            return None
+        
+        # "London, KY 40741": try the place, then the ZIP code
+        keys = [" ".join(tokens)]
+        if len(tokens) > 1 and len(tokens[-1]) == 5 and tokens[-1].isdigit():
+            keys = [" ".join(tokens[:-1]), tokens[-1]]
+        
+        table = self._get_table()
+        for key in keys:
+            match = self._lookup(table, key)
+            if match:
+                _, latitude, longitude, name, kind = match
+                return GeocodingResult(
+                    latitude=latitude,
+                    longitude=longitude,
+                    address=name,
+                    raw_data={"gazetteer_key": key, "kind": kind},
+                    provider=self.name,
+                    confidence=0.85,
+                )
+        return None
+    
+    def reverse_geocode(self, latitude: float, longitude: float) -> Optional[GeocodingResult]:
+        """Reverse geocoding is not supported by the gazetteer."""
+        return None
+
+
+class MemoryResultCache:
+    """Bounded, thread-safe LRU cache of geocoding results with a TTL.
+    
+    Sits in front of the GeocodingCache table so hot queries are answered
+    without a database round trip. Entries are evicted least-recently-used
+    once ``max_size`` is reached, and ignored once older than ``ttl``.
+    
+    Attributes:
+        max_size: Maximum number of entries (0 disables the cache)
+        ttl: Entry lifetime in seconds
+        hits: Number of lookups answered from memory
+        misses: Number of lookups not found (or expired)
+    """
+    
+    def __init__(self, max_size: int = 1000, ttl: int = 3600):
+        """Initialize the cache.
+        
+        Args:
+            max_size: Maximum number of entries (0 disables the cache)
+            ttl: Entry lifetime in seconds
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Any) -> Optional[Any]:
+        """Return the cached value for ``key``, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+    
+    def set(self, key: Any, value: Any, ttl: Optional[int] = None) -> None:
+        """Store a value, evicting the least recently used entries if full.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Lifetime in seconds (capped at the cache TTL)
+        """
+        if self.max_size <= 0:
+            return
+        lifetime = self.ttl if ttl is None else min(ttl, self.ttl)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + lifetime, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class GeocodingService:
     """Main geocoding service with provider management and caching.
     
@@ -577,6 +954,7 @@ class GeocodingService:
         providers: List of available geocoding providers
         cache_enabled: Whether caching is enabled
         default_provider: Name of the default provider
+        memory_cache: In-process LRU in front of the GeocodingCache table
     """
     
     def __init__(self, providers: Optional[List[GeocodingProvider]] = None, cache_enabled: bool = True):
@@ -590,6 +968,14 @@ class GeocodingService:
         self.cache_enabled = cache_enabled
         self.default_provider = None
         
+        self.memory_cache = MemoryResultCache(
+            max_size=getattr(settings, 'GEOCODING_MEMORY_CACHE_SIZE', 1000),
+            ttl=getattr(settings, 'GEOCODING_MEMORY_CACHE_TTL', 3600),
+        )
+        self._stats_lock = threading.Lock()
+        self.db_cache_hits = 0
+        self.provider_lookups = 0
+        
         # Initialize text-based location matcher for fallback
         self.text_matcher = TextBasedLocationMatcher()
         
@@ -599,6 +985,11 @@ class GeocodingService:
     
     def _setup_default_providers(self) -> None:
         """Set up default geocoding providers."""
+        # Offline gazetteer first: place/county/state/ZIP queries never
+        # need the network, and it declines street-level addresses
+        if getattr(settings, 'GEOCODING_GAZETTEER_ENABLED', True):
+            self.providers.append(GazetteerProvider())
+        
         # Add Nominatim as the default provider
         nominatim = NominatimProvider(
             rate_limit_per_minute=getattr(settings, 'GEOCODING_RATE_LIMIT_PER_MINUTE', 60)
@@ -634,6 +1025,59 @@ class GeocodingService:
                 return provider
         return None
     
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters for this service.
+        
+        Returns:
+            dict: memory_hits, memory_misses, db_hits, provider_lookups,
+                memory_size and memory_hit_rate
+        """
+        memory = self.memory_cache
+        lookups = memory.hits + memory.misses
+        return {
+            'memory_hits': memory.hits,
+            'memory_misses': memory.misses,
+            'memory_size': len(memory),
+            'memory_hit_rate': round(memory.hits / lookups, 3) if lookups else 0.0,
+            'db_hits': self.db_cache_hits,
+            'provider_lookups': self.provider_lookups,
+        }
+    
+    def _count(self, counter: str) -> None:
+        """Increment a service-level counter."""
+        with self._stats_lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+    
+    @staticmethod
+    def _memory_key(query: str, provider_name: Optional[str]) -> Tuple[str, Optional[str]]:
+        """Build the in-memory cache key (normalized like GeocodingCache)."""
+        return (query.lower().strip(), provider_name)
+    
+    def _remember(
+        self,
+        query: str,
+        provider_name: Optional[str],
+        result: GeocodingResult,
+        expires_at: Optional[Any] = None,
+    ) -> None:
+        """Keep a result in the in-memory cache.
+        
+        Args:
+            query: Query (or reverse cache key) the result answers
+            provider_name: Provider the query was made for
+            result: Result to keep
+            expires_at: Expiry of the GeocodingCache entry the result came
+                from; the in-memory copy never outlives it
+        """
+        if not self.cache_enabled:
+            return
+        ttl = self._cache_duration_hours(result) * 3600
+        if expires_at is not None:
+            ttl = min(ttl, int((expires_at - timezone.now()).total_seconds()))
+            if ttl <= 0:
+                return
+        self.memory_cache.set(self._memory_key(query, provider_name), result, ttl=ttl)
+    
     def geocode(self, query: str, provider_name: Optional[str] = None) -> Optional[GeocodingResult]:
         """Geocode an address using the specified or default provider.
         
@@ -650,66 +1094,123 @@ class GeocodingService:
         
         # Check cache first if enabled
         if self.cache_enabled:
+            remembered = self.memory_cache.get(self._memory_key(query, provider_name))
+            if remembered is not None:
+                logger.debug(f"Memory cache hit for query: {query}")
+                result = copy.copy(remembered)
+                result.cache_hit = True
+                return result
+            
             try:
                 from directory.models import GeocodingCache
                 cached_result = GeocodingCache.get_cached_result(query, provider_name)
                 if cached_result:
                     logger.info(f"Cache hit for query: {query}")
-                    return GeocodingResult(
-                        latitude=cached_result.latitude,
-                        longitude=cached_result.longitude,
-                        address=cached_result.address,
-                        raw_data={
-                            "cached": True,
-                            "provider": cached_result.provider,
-                            "confidence": cached_result.confidence,
-                        },
-                        provider=cached_result.provider,
-                        confidence=cached_result.confidence,
-                        cache_hit=True,
-                    )
+                    self._count('db_cache_hits')
+                    result = self._result_from_cache_entry(cached_result)
+                    self._remember(query, provider_name, result, cached_result.expires_at)
+                    return result
             except Exception as e:
                 logger.warning(f"Cache lookup failed for query '{query}': {e}")
         
+        self._count('provider_lookups')
+        
+        result = self._query_providers(query, provider_name)
+        if result:
+            # Cache the result if caching is enabled
+            if self.cache_enabled:
+                self._cache_result(query, result)
+                self._remember(query, provider_name, result)
+            return result
+        
+        # Try text-based location matching as fallback
+        logger.info(f"All geocoding providers failed, trying text-based matching for query: {query}")
+        text_result = self.text_matcher.find_location_match(query)
+        if text_result:
+            logger.info(f"Text-based location match found for query: {query}")
+            # Cache the text-based result with shorter duration
+            if self.cache_enabled:
+                self._cache_result(query, text_result)
+                self._remember(query, provider_name, text_result)
+            return text_result
+        
+        logger.error(f"All geocoding methods failed for query: {query}")
+        return None
+    
+    @staticmethod
+    def _result_from_cache_entry(cached_result: Any) -> GeocodingResult:
+        """Build a GeocodingResult from a GeocodingCache entry."""
+        return GeocodingResult(
+            latitude=cached_result.latitude,
+            longitude=cached_result.longitude,
+            address=cached_result.address,
+            raw_data={
+                "cached": True,
+                "provider": cached_result.provider,
+                "confidence": cached_result.confidence,
+            },
+            provider=cached_result.provider,
+            confidence=cached_result.confidence,
+            cache_hit=True,
+        )
+    
+    def _query_providers(
+        self,
+        query: str,
+        provider_name: Optional[str] = None,
+        online_only: bool = False,
+    ) -> Optional[GeocodingResult]:
+        """Ask the providers for a query, without touching any cache.
+        
+        With ``online_only`` it is safe to call from worker threads: network
+        providers do no database access, and their rate limiting and circuit
+        breakers are shared and locked.
+        
+        Args:
+            query: Address string to geocode
+            provider_name: Name of provider to try first (optional)
+            online_only: Skip offline (database-backed) providers
+            
+        Returns:
+            GeocodingResult if a provider succeeded, None otherwise
+        """
+        providers = [p for p in self.providers if not (online_only and p.offline)]
+        
         # Try to get the specified provider
         if provider_name:
-            provider = self.get_provider(provider_name)
+            provider = next((p for p in providers if p.name == provider_name), None)
             if provider:
                 result = provider.geocode(query)
                 if result:
-                    # Cache the result if caching is enabled
-                    if self.cache_enabled:
-                        self._cache_result(query, result)
                     return result
                 logger.warning(f"Provider {provider_name} failed, trying others")
         
         # Try all providers in order
-        for provider in self.providers:
+        for provider in providers:
             try:
                 result = provider.geocode(query)
                 if result and result.is_valid():
                     logger.info(f"Geocoding successful with provider {provider.name}")
-                    # Cache the result if caching is enabled
-                    if self.cache_enabled:
-                        self._cache_result(query, result)
                     return result
             except Exception as e:
                 logger.error(f"Provider {provider.name} failed: {e}")
                 continue
         
-        # Try text-based location matching as fallback
-        logger.info(f"All geocoding providers failed, trying text-based matching for query: {query}")
-        text_result = self.text_matcher.find_location_match(query)
-        if text_result:
-            logger.info(f"Text-based location match found for query: {query}")
-            # Cache the text-based result with shorter duration
-            if self.cache_enabled:
-                self._cache_result(query, text_result)
-            return text_result
-        
-        logger.error(f"All geocoding methods failed for query: {query}")
         return None
     
+    @staticmethod
+    def _cache_duration_hours(result: GeocodingResult) -> int:
+        """Return how long to cache a result, based on its confidence."""
+        cache_duration_hours = 24  # Default 24 hours
+        if result.confidence:
+            if result.confidence >= 0.9:
+                cache_duration_hours = 168  # 1 week for high confidence
+            elif result.confidence >= 0.7:
+                cache_duration_hours = 72   # 3 days for medium confidence
+            else:
+                cache_duration_hours = 12   # 12 hours for low confidence
+        return cache_duration_hours
+    
     def _cache_result(self, query: str, result: GeocodingResult) -> None:
         """Cache a geocoding result.
         
@@ -720,15 +1221,7 @@ class GeocodingService:
         try:
             from directory.models import GeocodingCache
             
-            # Determine cache duration based on confidence
-            cache_duration_hours = 24  # Default 24 hours
-            if result.confidence:
-                if result.confidence >= 0.9:
-                    cache_duration_hours = 168  # 1 week for high confidence
-                elif result.confidence >= 0.7:
-                    cache_duration_hours = 72   # 3 days for medium confidence
-                else:
-                    cache_duration_hours = 12   # 12 hours for low confidence
+            cache_duration_hours = self._cache_duration_hours(result)
             
             GeocodingCache.store_result(
                 query=query,
@@ -745,9 +1238,70 @@ class GeocodingService:
         except Exception as e:
             logger.warning(f"Failed to cache geocoding result for query '{query}': {e}")
     
+    @staticmethod
+    def _reverse_cache_key(latitude: float, longitude: float) -> str:
+        """Snap coordinates to the reverse-geocoding grid and build a cache key.
+        
+        The grid step is GEOCODING_REVERSE_GRID_METERS converted to degrees of
+        latitude; every point in a cell shares one cached address.
+        """
+        step = getattr(settings, 'GEOCODING_REVERSE_GRID_METERS', 100) / 111320.0
+        snapped_lat = round(latitude / step) * step
+        snapped_lon = round(longitude / step) * step
+        return f"{REVERSE_CACHE_PREFIX}{snapped_lat:.5f},{snapped_lon:.5f}"
+    
+    def _reverse_from_coverage_areas(self, latitude: float, longitude: float) -> Optional[GeocodingResult]:
+        """Describe a point by the city, county and state areas containing it.
+        
+        Answered from the in-process coverage index without any network call.
+        
+        Args:
+            latitude: Latitude coordinate
+            longitude: Longitude coordinate
+            
+        Returns:
+            GeocodingResult such as "London, Laurel County, Kentucky", or None
+            when GIS is disabled or no named area contains the point
+        """
+        if not getattr(settings, 'GIS_ENABLED', False):
+            return None
+        
+        try:
+            from directory.models import CoverageArea
+            from .coverage_index import get_coverage_index
+            
+            area_ids = get_coverage_index().areas_containing(latitude, longitude)
+            if not area_ids:
+                return None
+            
+            names = {}
+            for name, kind in CoverageArea.objects.filter(
+                id__in=area_ids, kind__in=REVERSE_AREA_KINDS
+            ).order_by('name').values_list('name', 'kind'):
+                names.setdefault(kind, name)
+        except Exception as e:
+            logger.warning(f"Coverage area reverse lookup failed for ({latitude}, {longitude}): {e}")
+            return None
+        
+        parts = [names[kind] for kind in REVERSE_AREA_KINDS if kind in names]
+        if not parts:
+            return None
+        
+        return GeocodingResult(
+            latitude=latitude,
+            longitude=longitude,
+            address=", ".join(parts),
+            raw_data={"coverage_areas": names},
+            provider="coverage_areas",
+            confidence=0.5,
+        )
+    
     def reverse_geocode(self, latitude: float, longitude: float, provider_name: Optional[str] = None) -> Optional[GeocodingResult]:
         """Reverse geocode coordinates using the specified or default provider.
         
+        Lookups go memory cache → GeocodingCache (both keyed by the grid cell
+        of the point) → providers → the coverage areas containing the point.
+        
         Args:
             latitude: Latitude coordinate
             longitude: Longitude coordinate
@@ -760,6 +1314,53 @@ class GeocodingService:
             logger.error("No geocoding providers available")
             return None
         
+        cache_key = self._reverse_cache_key(latitude, longitude)
+        
+        def located(result: GeocodingResult) -> GeocodingResult:
+            """Return a copy of a cell's result placed at the requested point."""
+            result = copy.copy(result)
+            result.latitude = latitude
+            result.longitude = longitude
+            result.cache_hit = True
+            return result
+        
+        if self.cache_enabled:
+            remembered = self.memory_cache.get(self._memory_key(cache_key, provider_name))
+            if remembered is not None:
+                return located(remembered)
+            
+            try:
+                from directory.models import GeocodingCache
+                cached_result = GeocodingCache.get_cached_result(cache_key, provider_name)
+                if cached_result:
+                    self._count('db_cache_hits')
+                    result = self._result_from_cache_entry(cached_result)
+                    self._remember(cache_key, provider_name, result, cached_result.expires_at)
+                    return located(result)
+            except Exception as e:
+                logger.warning(f"Reverse cache lookup failed for {cache_key}: {e}")
+        
+        self._count('provider_lookups')
+        result = self._query_reverse_providers(latitude, longitude, provider_name)
+        
+        if not result:
+            result = self._reverse_from_coverage_areas(latitude, longitude)
+            if result:
+                logger.info(f"Reverse geocoded ({latitude}, {longitude}) from coverage areas")
+        
+        if not result:
+            logger.error(f"All reverse geocoding providers failed for coordinates: ({latitude}, {longitude})")
+            return None
+        
+        if self.cache_enabled:
+            self._cache_result(cache_key, result)
+            self._remember(cache_key, provider_name, result)
+        return result
+    
+    def _query_reverse_providers(
+        self, latitude: float, longitude: float, provider_name: Optional[str] = None
+    ) -> Optional[GeocodingResult]:
+        """Ask the providers to reverse geocode a point, without any cache."""
         # Try to get the specified provider
         if provider_name:
             provider = self.get_provider(provider_name)
@@ -780,31 +1381,169 @@ class GeocodingService:
                 logger.error(f"Provider {provider.name} failed: {e}")
                 continue
         
-        logger.error(f"All reverse geocoding providers failed for coordinates: ({latitude}, {longitude})")
         return None
     
     def batch_geocode(self, queries: List[str], provider_name: Optional[str] = None) -> List[Optional[GeocodingResult]]:
         """Geocode multiple addresses in batch.
         
+        Queries are normalized and deduplicated, then resolved in stages:
+        
+            1. In-memory cache
+            2. One GeocodingCache lookup for all remaining queries
+            3. Offline providers (gazetteer), on the calling thread
+            4. Network providers, called from a bounded thread pool (the
+               shared rate limiter and circuit breaker still apply)
+            5. Text-based matching for queries no provider could answer
+        
+        New results are written to GeocodingCache in one bulk upsert.
+        
         Args:
             queries: List of address strings to geocode
             provider_name: Name of provider to use (uses default if None)
             
         Returns:
-            List of GeocodingResult objects (None for failed queries)
+            List of GeocodingResult objects (None for failed queries), in the
+            order of ``queries``
         """
-        results = []
+        if not self.providers:
+            logger.error("No geocoding providers available")
+            return [None] * len(queries)
+        
+        # Normalize and dedupe, keeping the first spelling of each query
+        unique: Dict[Tuple[str, Optional[str]], str] = {}
         for query in queries:
-            result = self.geocode(query, provider_name)
-            results.append(result)
-        return results
+            if query and query.strip():
+                unique.setdefault(self._memory_key(query, provider_name), query)
+        
+        resolved: Dict[Tuple[str, Optional[str]], GeocodingResult] = {}
+        pending = dict(unique)
+        
+        if self.cache_enabled:
+            for key in list(pending):
+                remembered = self.memory_cache.get(key)
+                if remembered is not None:
+                    result = copy.copy(remembered)
+                    result.cache_hit = True
+                    resolved[key] = result
+                    del pending[key]
+            
+            if pending:
+                try:
+                    from directory.models import GeocodingCache
+                    entries = GeocodingCache.get_cached_results(pending.values(), provider_name)
+                    for key, query in list(pending.items()):
+                        entry = entries.get(query)
+                        if entry is not None:
+                            self._count('db_cache_hits')
+                            resolved[key] = self._result_from_cache_entry(entry)
+                            self._remember(query, provider_name, resolved[key], entry.expires_at)
+                            del pending[key]
+                except Exception as e:
+                    logger.warning(f"Batch cache lookup failed: {e}")
+        
+        fresh: Dict[str, GeocodingResult] = {}
+        if pending:
+            logger.info(
+                f"Batch geocoding {len(pending)} uncached queries "
+                f"({len(unique) - len(pending)} cached, {len(queries)} total)"
+            )
+            # Offline providers read the database, so they run on this thread
+            remote = dict(pending)
+            for provider in (p for p in self.providers if p.offline):
+                for key, query in list(remote.items()):
+                    result = provider.geocode(query)
+                    if result and result.is_valid():
+                        fresh[query] = result
+                        resolved[key] = result
+                        del remote[key]
+            
+            workers = max(1, min(getattr(settings, 'GEOCODING_BATCH_WORKERS', 4), len(remote) or 1))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="geocode") as executor:
+                futures = {
+                    executor.submit(self._query_providers, query, provider_name, True): key
+                    for key, query in remote.items()
+                }
+                for future in as_completed(futures):
+                    key = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.error(f"Batch geocoding failed for query '{pending[key]}': {e}")
+                        result = None
+                    if result:
+                        fresh[pending[key]] = result
+                        resolved[key] = result
+            
+            for key, query in pending.items():
+                self._count('provider_lookups')
+                if key not in resolved:
+                    # Text matching reads the database, so it stays on this thread
+                    text_result = self.text_matcher.find_location_match(query)
+                    if text_result:
+                        fresh[query] = text_result
+                        resolved[key] = text_result
+        
+        if fresh and self.cache_enabled:
+            self._cache_results(fresh)
+            for query, result in fresh.items():
+                self._remember(query, provider_name, result)
+        
+        return [
+            resolved.get(self._memory_key(query, provider_name)) if query else None
+            for query in queries
+        ]
+    
+    def _cache_results(self, results: Dict[str, GeocodingResult]) -> None:
+        """Cache many geocoding results with one bulk write.
+        
+        Args:
+            results: Mapping of original query to geocoding result
+        """
+        try:
+            from directory.models import GeocodingCache
+            
+            GeocodingCache.store_results([
+                {
+                    'query': query,
+                    'latitude': result.latitude,
+                    'longitude': result.longitude,
+                    'address': result.address,
+                    'provider': result.provider,
+                    'confidence': result.confidence,
+                    'cache_duration_hours': self._cache_duration_hours(result),
+                }
+                for query, result in results.items()
+            ])
+            logger.debug(f"Cached {len(results)} geocoding results")
+        except Exception as e:
+            logger.warning(f"Failed to cache {len(results)} geocoding results: {e}")
+
+
+_service: Optional[GeocodingService] = None
+_service_lock = threading.Lock()
 
 
 # Convenience function for easy access
 def get_geocoding_service() -> GeocodingService:
-    """Get a configured geocoding service instance.
+    """Get the process-wide geocoding service.
+    
+    The instance is created on first use and shared afterwards, so provider
+    rate limiting, circuit breakers and in-memory caches apply across
+    requests.
     
     Returns:
         GeocodingService instance with default providers
     """
-    return GeocodingService()
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = GeocodingService()
+    return _service
+
+
+def reset_geocoding_service() -> None:
+    """Discard the process-wide service (e.g. after settings change)."""
+    global _service
+    with _service_lock:
+        _service = None
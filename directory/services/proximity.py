@@ -0,0 +1,233 @@
+"""Proximity ranking of resources around a search point.
+
+Location results are ranked by how close and how specific the coverage
+areas serving each resource are. This module computes both in a single
+grouped pass over the ResourceServiceArea table (see
+directory.models.resource_service_area), restricted to the candidate
+resources and joined back to the resource query by primary key:
+
+    - Min great-circle distance from the search point to the centers of the
+      resource's coverage areas
+    - Max coverage specificity (RADIUS > POLYGON > CITY > COUNTY > STATE)
+    - Count of coverage areas
+
+Distances are computed in SQL with the haversine formula on the center
+coordinates stored in the table, so no geometry is loaded or transformed.
+The resource query itself is never grouped (no GROUP BY over every resource
+column); ranking, distance bounds and ordering read the joined columns, so
+each aggregate is computed once per resource.
+
+Functions:
+    haversine_expression: ORM expression for the distance to a point
+    annotate_proximity: Add distance, specificity and proximity score to a
+        resource queryset, optionally bounded by distance
+
+Example:
+    >>> queryset = annotate_proximity(
+    ...     Resource.objects.filter(status="published"),
+    ...     lat=37.1283, lon=-84.0836, max_distance_miles=25,
+    ... ).order_by("-proximity_score")
+"""
+
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.db import models
+from django.db.models.functions import ASin, Coalesce, Cos, Power, Radians, Sin, Sqrt
+from django.db.models.sql.constants import LOUTER
+
+from directory.utils.geodesy import EARTH_RADIUS_M, METERS_PER_MILE
+
+# Alias of the joined per-resource aggregate
+PROXIMITY_ALIAS = "resource_proximity"
+
+
+def haversine_expression(
+    lat: float,
+    lon: float,
+    lat_field: str = "center_lat",
+    lon_field: str = "center_lon",
+) -> models.Expression:
+    """Build an ORM expression for the distance (meters) to a fixed point.
+
+    The point's trigonometric terms are computed in Python so the database
+    only evaluates the terms that depend on the row.
+
+    Args:
+        lat: Latitude of the search point (degrees)
+        lon: Longitude of the search point (degrees)
+        lat_field: Field (or lookup path) holding the row latitude
+        lon_field: Field (or lookup path) holding the row longitude
+
+    Returns:
+        Expression: Great-circle distance in meters (NULL if the row has no
+            coordinates)
+    """
+    lat_rad = math.radians(lat)
+    row_lat = Radians(models.F(lat_field))
+    row_lon = Radians(models.F(lon_field))
+
+    half_dlat = (row_lat - models.Value(lat_rad)) / 2
+    half_dlon = (row_lon - models.Value(math.radians(lon))) / 2
+
+    a = Power(Sin(half_dlat), 2) + models.Value(math.cos(lat_rad)) * Cos(row_lat) * Power(
+        Sin(half_dlon), 2
+    )
+    # No clamp is needed on sqrt(a): rounding only pushes it above 1 for
+    # near-antipodal points, far outside any service region
+    return models.ExpressionWrapper(
+        models.Value(2 * EARTH_RADIUS_M) * ASin(Sqrt(a)),
+        output_field=models.FloatField(),
+    )
+
+
+class _AggregateJoin:
+    """LEFT OUTER JOIN of a per-resource aggregate subquery, by primary key.
+
+    The ORM has no public API for joining a derived table, so this is an
+    ``alias_map`` entry (the interface documented on
+    ``django.db.models.sql.datastructures.Join``) that renders
+    ``LEFT OUTER JOIN (<subquery>) alias ON alias.resource_id = parent.id``.
+    """
+
+    join_type = LOUTER
+    nullable = True
+    filtered_relation = None
+
+    def __init__(self, subquery: models.QuerySet, parent_alias: str, table_alias: str):
+        self.subquery = subquery
+        self.parent_alias = parent_alias
+        self.table_name = table_alias
+        self.table_alias = table_alias
+
+    def as_sql(self, compiler: Any, connection: Any) -> Tuple[str, List[Any]]:
+        sql, params = self.subquery.query.get_compiler(connection=connection).as_sql()
+        qn = compiler.quote_name_unless_alias
+        alias = qn(self.table_alias)
+        return (
+            f"LEFT OUTER JOIN ({sql}) {alias} "
+            f"ON ({alias}.{qn('resource_id')} = {qn(self.parent_alias)}.{qn('id')})",
+            list(params),
+        )
+
+    def relabeled_clone(self, change_map: Dict[str, str]) -> "_AggregateJoin":
+        clone = self.__class__(
+            self.subquery,
+            change_map.get(self.parent_alias, self.parent_alias),
+            change_map.get(self.table_alias, self.table_alias),
+        )
+        clone.table_name = self.table_name
+        return clone
+
+    @property
+    def identity(self) -> Tuple[Any, ...]:
+        return (self.__class__, self.table_name, self.parent_alias, id(self.subquery))
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, _AggregateJoin) and self.identity == other.identity
+
+    def __hash__(self) -> int:
+        return hash(self.identity)
+
+    def demote(self) -> "_AggregateJoin":
+        # Resources without service areas must stay in the results
+        return self
+
+    def promote(self) -> "_AggregateJoin":
+        return self
+
+
+class _AggregateColumn(models.Expression):
+    """A column of the joined aggregate subquery."""
+
+    def __init__(self, alias: str, column: str, output_field: models.Field):
+        super().__init__(output_field=output_field)
+        self.alias = alias
+        self.column = column
+
+    def as_sql(self, compiler: Any, connection: Any) -> Tuple[str, List[Any]]:
+        return (
+            f"{compiler.quote_name_unless_alias(self.alias)}.{connection.ops.quote_name(self.column)}",
+            [],
+        )
+
+    def relabeled_clone(self, change_map: Dict[str, str]) -> "_AggregateColumn":
+        return self.__class__(
+            change_map.get(self.alias, self.alias), self.column, self.output_field
+        )
+
+    def get_group_by_cols(self) -> List[models.Expression]:
+        return [self]
+
+
+def annotate_proximity(
+    queryset: models.QuerySet,
+    lat: float,
+    lon: float,
+    min_distance_miles: Optional[float] = None,
+    max_distance_miles: Optional[float] = None,
+) -> models.QuerySet:
+    """Annotate resources with proximity ranking in one query.
+
+    Adds:
+        coverage_distance_m: Distance to the nearest coverage area center
+        specificity_score: Highest specificity of the resource's areas
+        coverage_count: Number of coverage areas
+        distance_miles: coverage_distance_m in miles
+        proximity_score: specificity_score / (1 + distance_miles)
+
+    Args:
+        queryset: Resource queryset to rank
+        lat: Latitude of the search point
+        lon: Longitude of the search point
+        min_distance_miles: Exclude resources closer than this
+        max_distance_miles: Exclude resources farther than this
+
+    Returns:
+        QuerySet: Annotated (and optionally distance-bounded) queryset
+    """
+    from directory.models import ResourceServiceArea
+
+    # One grouped pass over the service areas of the candidate resources
+    aggregates = (
+        ResourceServiceArea.objects.filter(resource__in=queryset.order_by().values("pk"))
+        .order_by()
+        .values("resource_id")
+        .annotate(
+            distance_m=models.Min(haversine_expression(lat, lon)),
+            specificity=models.Max("specificity"),
+            area_count=models.Count("pk"),
+        )
+    )
+
+    queryset = queryset.all()
+    query = queryset.query
+    alias = query.join(
+        _AggregateJoin(aggregates, query.get_initial_alias(), PROXIMITY_ALIAS)
+    )
+
+    def column(name: str) -> _AggregateColumn:
+        return _AggregateColumn(alias, name, models.FloatField())
+
+    queryset = queryset.annotate(
+        coverage_distance_m=column("distance_m"),
+        specificity_score=Coalesce(column("specificity"), 0, output_field=models.IntegerField()),
+        coverage_count=Coalesce(column("area_count"), 0, output_field=models.IntegerField()),
+    ).annotate(
+        distance_miles=models.ExpressionWrapper(
+            models.F("coverage_distance_m") / METERS_PER_MILE,
+            output_field=models.FloatField(),
+        ),
+        # Higher scores for closer, more specific coverage areas
+        proximity_score=models.ExpressionWrapper(
+            models.F("specificity_score") * (1.0 / (1.0 + models.F("distance_miles"))),
+            output_field=models.FloatField(),
+        ),
+    )
+
+    if max_distance_miles is not None:
+        queryset = queryset.filter(distance_miles__lte=max_distance_miles)
+    if min_distance_miles is not None:
+        queryset = queryset.filter(distance_miles__gte=min_distance_miles)
+
+    return queryset
@@ -0,0 +1,313 @@
+"""Precomputed "related resources" suggestions for public detail pages.
+
+Every published resource gets a ranked list of up to
+RELATED_RESOURCES_LIMIT other published resources, stored in the
+RelatedResource table. Candidates must share the category or a service
+type; their score adds:
+
+    - CATEGORY_WEIGHT for the same category
+    - SERVICE_TYPE_WEIGHT per shared service type (up to three)
+    - COVERAGE_WEIGHT per shared coverage area, scaled by its specificity
+      (so a shared city counts more than a shared state)
+    - Up to PROXIMITY_WEIGHT for nearby resources, falling to zero at
+      PROXIMITY_RADIUS_MILES (using the center of each resource's most
+      specific service area)
+
+Coverage areas served by more than MAX_AREA_RESOURCES resources (national
+and state-wide coverage) say little about relatedness and are ignored.
+
+Lists are recomputed for a resource when it or its service types are saved,
+once per transaction after it commits (``schedule_related_rebuild``), so a
+request that saves a resource several times pays for one recompute and a
+rolled-back save for none. Suggestions of *other* resources are refreshed
+by ``rebuild_related_resources`` (``manage.py build_related_resources``),
+which should run nightly; until then the detail page still hides
+suggestions that are no longer published.
+
+Functions:
+    compute_related: Ranked suggestions for a set of resources
+    rebuild_related_resources: Recompute and store suggestion lists
+    schedule_related_rebuild: Recompute lists once the transaction commits
+    related_resources_for: A resource's stored suggestions
+
+Example:
+    >>> from directory.services.related_resources import rebuild_related_resources
+    >>> rebuild_related_resources()
+    2105
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Q
+from django.db.models.signals import m2m_changed, post_save
+from django.dispatch import receiver
+
+from directory.utils.geodesy import METERS_PER_MILE, haversine_m
+
+from .facets import published_resources
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 500
+DEFAULT_LIMIT = 5
+
+CATEGORY_WEIGHT = 3.0
+SERVICE_TYPE_WEIGHT = 2.0
+MAX_SHARED_SERVICE_TYPES = 3
+COVERAGE_WEIGHT = 1.0
+PROXIMITY_WEIGHT = 2.0
+PROXIMITY_RADIUS_MILES = 50.0
+MAX_AREA_RESOURCES = 200
+
+_local = threading.local()
+
+
+class _Features:
+    """Category, service types, coverage and location of published resources."""
+
+    def __init__(self, queryset: Any, targets: Optional[List[int]] = None):
+        from directory.models import Resource, ResourceServiceArea
+
+        self.category: Dict[int, Optional[int]] = dict(queryset.values_list("id", "category_id"))
+        ids = queryset.values("pk")
+
+        self.service_types: Dict[int, Set[int]] = defaultdict(set)
+        self.by_category: Dict[int, Set[int]] = defaultdict(set)
+        self.by_service_type: Dict[int, Set[int]] = defaultdict(set)
+        for resource_id, category_id in self.category.items():
+            if category_id is not None:
+                self.by_category[category_id].add(resource_id)
+        links = Resource.service_types.through.objects.filter(resource__in=ids)
+        for resource_id, service_type_id in links.values_list("resource_id", "servicetype_id"):
+            self.service_types[resource_id].add(service_type_id)
+            self.by_service_type[service_type_id].add(resource_id)
+
+        # Areas serving many resources (national, state-wide) are ignored.
+        # Only the targets' own areas can be shared, so only those are counted
+        counted = ResourceServiceArea.objects.all()
+        if targets is not None:
+            counted = counted.filter(
+                coverage_area_id__in=ResourceServiceArea.objects.filter(
+                    resource_id__in=targets
+                ).values("coverage_area_id")
+            )
+        common = set(
+            counted.values("coverage_area_id")
+            .annotate(resources=Count("id"))
+            .filter(resources__gt=MAX_AREA_RESOURCES)
+            .values_list("coverage_area_id", flat=True)
+        )
+
+        self.areas: Dict[int, Dict[int, int]] = defaultdict(dict)
+        self.points: Dict[int, Tuple[float, float]] = {}
+        best_specificity: Dict[int, int] = {}
+        area_rows = ResourceServiceArea.objects.filter(resource__in=ids).values_list(
+            "resource_id", "coverage_area_id", "specificity", "center_lat", "center_lon"
+        )
+        for resource_id, area_id, specificity, lat, lon in area_rows:
+            if area_id not in common:
+                self.areas[resource_id][area_id] = specificity
+            if lat is not None and specificity > best_specificity.get(resource_id, -1):
+                best_specificity[resource_id] = specificity
+                self.points[resource_id] = (lat, lon)
+
+    def candidates(self, resource_id: int) -> Set[int]:
+        """Return resources sharing the category or a service type."""
+        found = set()
+        category_id = self.category.get(resource_id)
+        if category_id is not None:
+            found |= self.by_category[category_id]
+        for service_type_id in self.service_types.get(resource_id, ()):
+            found |= self.by_service_type[service_type_id]
+        found.discard(resource_id)
+        return found
+
+    def score(self, a: int, b: int) -> float:
+        """Return the relatedness score of two resources."""
+        score = 0.0
+        if self.category[a] is not None and self.category[a] == self.category[b]:
+            score += CATEGORY_WEIGHT
+
+        shared_types = len(self.service_types.get(a, set()) & self.service_types.get(b, set()))
+        score += SERVICE_TYPE_WEIGHT * min(shared_types, MAX_SHARED_SERVICE_TYPES)
+
+        areas_a = self.areas.get(a)
+        areas_b = self.areas.get(b)
+        if areas_a and areas_b:
+            for area_id in areas_a.keys() & areas_b.keys():
+                score += COVERAGE_WEIGHT * areas_a[area_id] / 100.0
+
+        point_a = self.points.get(a)
+        point_b = self.points.get(b)
+        if point_a and point_b:
+            miles = haversine_m(point_a[0], point_a[1], point_b[0], point_b[1]) / METERS_PER_MILE
+            if miles < PROXIMITY_RADIUS_MILES:
+                score += PROXIMITY_WEIGHT * (1.0 - miles / PROXIMITY_RADIUS_MILES)
+
+        return score
+
+
+def _limit() -> int:
+    return getattr(settings, "RELATED_RESOURCES_LIMIT", DEFAULT_LIMIT)
+
+
+def compute_related(
+    resource_ids: Iterable[int], features: "_Features", limit: Optional[int] = None
+) -> Dict[int, List[Tuple[int, float]]]:
+    """Rank the related resources of each resource.
+
+    Args:
+        resource_ids: Published resources to compute lists for
+        features: Features of (at least) the resources and their candidates
+        limit: List length (defaults to the RELATED_RESOURCES_LIMIT setting)
+
+    Returns:
+        Dict mapping resource ID to [(related ID, score)], best first (ties
+        broken by ID so rebuilds are stable)
+    """
+    if limit is None:
+        limit = _limit()
+
+    related = {}
+    for resource_id in resource_ids:
+        if resource_id not in features.category:
+            continue
+        scored = [
+            (candidate, features.score(resource_id, candidate))
+            for candidate in features.candidates(resource_id)
+        ]
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        related[resource_id] = scored[:limit]
+    return related
+
+
+def rebuild_related_resources(resource_ids: Optional[List[int]] = None) -> int:
+    """Recompute and store suggestion lists.
+
+    Args:
+        resource_ids: Only recompute these resources' lists (default: all).
+            Lists of resources that are no longer published are removed.
+
+    Returns:
+        int: Number of RelatedResource rows written
+    """
+    from directory.models import RelatedResource
+
+    published = published_resources()
+    if resource_ids is None:
+        features = _Features(published)
+        targets = list(features.category)
+    else:
+        # Only candidates that share a category or service type matter
+        targets = list(published.filter(pk__in=resource_ids).values_list("pk", flat=True))
+        target_rows = published.filter(pk__in=targets)
+        candidates = published.filter(
+            Q(pk__in=targets)
+            | Q(category__in=target_rows.values("category_id"))
+            | Q(service_types__resources__in=target_rows)
+        ).distinct()
+        features = _Features(published.filter(pk__in=candidates.values("pk")), targets)
+
+    rows = [
+        RelatedResource(resource_id=resource_id, related_id=related_id, rank=rank, score=score)
+        for resource_id, related in compute_related(targets, features).items()
+        for rank, (related_id, score) in enumerate(related)
+    ]
+
+    with transaction.atomic():
+        stale = RelatedResource.objects.all()
+        if resource_ids is not None:
+            stale = stale.filter(resource_id__in=resource_ids)
+        stale.delete()
+        RelatedResource.objects.bulk_create(rows, batch_size=BATCH_SIZE)
+
+    logger.info(f"Stored {len(rows)} related-resource suggestions for {len(targets)} resources")
+    return len(rows)
+
+
+def related_resources_for(resource: Any, limit: Optional[int] = None) -> List[Any]:
+    """Return a resource's stored suggestions that are still published.
+
+    Args:
+        resource: The resource being displayed
+        limit: Maximum number of suggestions
+
+    Returns:
+        List of Resource instances, best first
+    """
+    from directory.models import RelatedResource
+
+    if limit is None:
+        limit = _limit()
+
+    links = (
+        RelatedResource.objects.filter(
+            resource=resource,
+            related__status="published",
+            related__is_deleted=False,
+            related__is_archived=False,
+        )
+        .select_related("related__category")
+        .order_by("rank")[:limit]
+    )
+    return [link.related for link in links]
+
+
+def schedule_related_rebuild(resource_ids: Iterable[int]) -> None:
+    """Recompute resources' suggestions once the current transaction commits.
+
+    IDs scheduled during one transaction are recomputed together in a
+    single ``rebuild_related_resources`` call; nothing is recomputed if the
+    transaction rolls back. Outside a transaction the lists are recomputed
+    immediately.
+
+    Args:
+        resource_ids: Resources whose lists should be recomputed
+    """
+    resource_ids = set(resource_ids)
+    if not resource_ids:
+        return
+
+    connection = transaction.get_connection()
+    pending = getattr(_local, "pending", None)
+    if pending is not None and connection.in_atomic_block and any(
+        callback is pending[1] for _, callback, _ in connection.run_on_commit
+    ):
+        pending[0].update(resource_ids)
+        return
+
+    def rebuild() -> None:
+        if getattr(_local, "pending", None) is batch:
+            _local.pending = None
+        rebuild_related_resources(sorted(batch[0]))
+
+    batch = (resource_ids, rebuild)
+    _local.pending = batch
+    # Suggestions are advisory: a failure is logged, not raised after commit
+    transaction.on_commit(rebuild, robust=True)
+
+
+@receiver(post_save, sender="directory.Resource")
+def handle_resource_save(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Recompute a saved resource's suggestions after commit."""
+    if kwargs.get("raw", False):
+        return
+    schedule_related_rebuild([instance.pk])
+
+
+@receiver(m2m_changed, sender="directory.Resource_service_types")
+def handle_service_types_change(
+    sender: Any, instance: Any, action: str, reverse: bool, pk_set: Any, **kwargs: Any
+) -> None:
+    """Recompute suggestions when a resource's service types change."""
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        schedule_related_rebuild([instance.pk])
+    elif pk_set:
+        schedule_related_rebuild(pk_set)
@@ -0,0 +1,376 @@
+"""Cached, ordered result sets for paginated search and location results.
+
+Search and location queries (full-text, spatial, proximity ranking) are far
+more expensive than fetching 20 rows by primary key. A ``ResultSet`` runs the
+expensive query once, stores the ordered list of primary keys in the Django
+cache and then serves every page by slicing that list and fetching only the
+rows on the page. ``Paginator`` takes its count from the cached list, so
+clicking through pages never re-runs the search.
+
+Cache keys combine a namespace, the normalized query parameters (minus the
+page number) and a generation counter that is bumped whenever a resource,
+its coverage or the taxonomy changes, so edits are visible on the next
+request. The same counter versions every other cache of directory data
+(facet counts, rendered public pages and their ETags). The counter is kept
+in the database (``DirectoryGeneration``), not in the cache, so a change
+made by any process (another gunicorn worker, the import worker, a
+management command) expires the caches of all of them. Changes bump it
+once per transaction, after commit (``schedule_invalidation``), so saves do
+not queue on the counter row, and a request reads it at most once.
+
+Classes:
+    ResultSet: Paginator-compatible sequence backed by a cached PK list
+
+Functions:
+    normalize_params: Canonical, hashable form of request parameters
+    get_generation: Current directory generation
+    get_generation_changed_at: When the generation was last bumped
+    invalidate_result_sets: Bump the generation so all cached lists expire
+    schedule_invalidation: Bump the generation once the transaction commits
+
+Example:
+    >>> result_set = ResultSet.for_query(
+    ...     "public_resource_list",
+    ...     request.GET,
+    ...     build=lambda: Resource.objects.search_combined(query),
+    ...     row_queryset=Resource.objects.select_related("category"),
+    ... )
+    >>> page_obj = Paginator(result_set, 20).get_page(request.GET.get("page"))
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.signals import request_finished, request_started
+from django.db import models, transaction
+from django.db.models import F
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 300
+
+# Parameters that select a page rather than a result set
+PAGE_PARAMETERS = ("page",)
+
+# Generation row read during the current request (None outside requests)
+_request_generation: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
+    "request_generation", default=None
+)
+
+_local = threading.local()
+
+
+def _generation_row() -> Tuple[int, Optional[datetime]]:
+    """Return (generation, changed_at), creating the counter row if needed.
+
+    A new counter starts from the current time rather than 1, so
+    generations, and the ETags built from them, are never reused after the
+    table is reset. During a request the row is read once and reused.
+    """
+    from directory.models import DirectoryGeneration
+
+    memo = _request_generation.get()
+    if memo is not None and "row" in memo:
+        return memo["row"]
+
+    row = DirectoryGeneration.objects.filter(pk=1).values_list("generation", "changed_at").first()
+    if row is None:
+        counter, _ = DirectoryGeneration.objects.get_or_create(
+            pk=1, defaults={"generation": int(time.time())}
+        )
+        row = (counter.generation, counter.changed_at)
+    if memo is not None:
+        memo["row"] = row
+    return row
+
+
+def get_generation() -> int:
+    """Return the current directory generation counter."""
+    return _generation_row()[0]
+
+
+def get_generation_changed_at() -> Optional[datetime]:
+    """Return when the generation was last bumped, if known."""
+    return _generation_row()[1]
+
+
+def invalidate_result_sets() -> None:
+    """Expire every cached result set by bumping the generation counter."""
+    from directory.models import DirectoryGeneration
+
+    now = timezone.now().replace(microsecond=0)
+    bumped = DirectoryGeneration.objects.filter(pk=1).update(
+        generation=F("generation") + 1, changed_at=now
+    )
+    if not bumped:
+        DirectoryGeneration.objects.get_or_create(
+            pk=1, defaults={"generation": int(time.time()), "changed_at": now}
+        )
+
+    memo = _request_generation.get()
+    if memo is not None:
+        memo.clear()
+
+
+def schedule_invalidation() -> None:
+    """Bump the generation once the current transaction commits.
+
+    Changes made during one transaction share a single bump, and nothing is
+    bumped if the transaction rolls back. Outside a transaction the
+    generation is bumped immediately.
+    """
+    connection = transaction.get_connection()
+    pending = getattr(_local, "pending", None)
+    if pending is not None and connection.in_atomic_block and any(
+        callback is pending for _, callback, _ in connection.run_on_commit
+    ):
+        return
+
+    def invalidate() -> None:
+        if getattr(_local, "pending", None) is invalidate:
+            _local.pending = None
+        invalidate_result_sets()
+
+    _local.pending = invalidate
+    transaction.on_commit(invalidate)
+
+
+def normalize_params(
+    params: Any,
+    exclude: Sequence[str] = PAGE_PARAMETERS,
+) -> List[Tuple[str, List[str]]]:
+    """Return a canonical form of request parameters for cache keys.
+
+    Keys are sorted (but keep their case), values are stripped and
+    lowercased (all directory filters are case-insensitive) and page
+    parameters are dropped, so ``?q=Food&page=2`` and ``?q=food`` share a
+    result set.
+
+    Args:
+        params: QueryDict or plain dict of request parameters
+        exclude: Parameter names that should not affect the result set
+
+    Returns:
+        List of (key, sorted values) pairs
+    """
+    if hasattr(params, "lists"):
+        items = params.lists()
+    else:
+        items = (
+            (key, value if isinstance(value, (list, tuple)) else [value])
+            for key, value in params.items()
+        )
+
+    normalized = []
+    for key, values in items:
+        if key in exclude:
+            continue
+        normalized.append((key, sorted(str(value).strip().lower() for value in values)))
+    return sorted(normalized)
+
+
+def _dedupe(rows: Iterable[Tuple]) -> List[Tuple]:
+    """Remove rows with a repeated primary key, keeping the first occurrence."""
+    seen = set()
+    unique = []
+    for row in rows:
+        if row[0] not in seen:
+            seen.add(row[0])
+            unique.append(row)
+    return unique
+
+
+class ResultSet:
+    """Ordered primary keys of a search result, cached between page requests.
+
+    The object behaves like the sequences ``Paginator`` expects: ``count()``
+    returns the cached length and slicing returns model instances for just
+    that slice, fetched with one ``pk__in`` query against ``row_queryset``.
+
+    Attributes:
+        ids: Ordered list of primary keys
+        extras: Per-PK values of selected annotations (e.g. distance_miles)
+        row_queryset: Queryset used to load the rows of a page
+        cache_key: Cache key the IDs are stored under (None if uncached)
+        cache_hit: Whether the IDs came from the cache
+    """
+
+    def __init__(
+        self,
+        ids: List[Any],
+        row_queryset: models.QuerySet,
+        extras: Optional[Dict[Any, Dict[str, Any]]] = None,
+        cache_key: Optional[str] = None,
+        cache_hit: bool = False,
+    ):
+        self.ids = ids
+        self.row_queryset = row_queryset
+        self.extras = extras or {}
+        self.cache_key = cache_key
+        self.cache_hit = cache_hit
+        self.model = row_queryset.model
+
+    @classmethod
+    def from_queryset(
+        cls,
+        queryset: models.QuerySet,
+        row_queryset: Optional[models.QuerySet] = None,
+        extra_fields: Sequence[str] = (),
+    ) -> "ResultSet":
+        """Evaluate ``queryset`` once and capture its ordered primary keys.
+
+        Args:
+            queryset: The (expensive) search queryset, already ordered
+            row_queryset: Queryset used to load page rows (defaults to the
+                model's default manager)
+            extra_fields: Annotation names to carry over to page rows when
+                the queryset defines them
+
+        Returns:
+            ResultSet: Uncached result set
+        """
+        if row_queryset is None:
+            row_queryset = queryset.model._default_manager.all()
+
+        fields = [name for name in extra_fields if name in queryset.query.annotations]
+        rows = _dedupe(queryset.values_list("pk", *fields))
+
+        ids = [row[0] for row in rows]
+        extras = {row[0]: dict(zip(fields, row[1:])) for row in rows} if fields else {}
+        return cls(ids, row_queryset, extras)
+
+    @classmethod
+    def for_query(
+        cls,
+        namespace: str,
+        params: Any,
+        build: Callable[[], models.QuerySet],
+        row_queryset: models.QuerySet,
+        extra_fields: Sequence[str] = (),
+        timeout: Optional[int] = None,
+    ) -> "ResultSet":
+        """Return the cached result set for ``params``, building it if needed.
+
+        Args:
+            namespace: Name of the view or search the result set belongs to
+            params: Request parameters (QueryDict or dict)
+            build: Callable returning the ordered search queryset; only called
+                on a cache miss
+            row_queryset: Queryset used to load page rows
+            extra_fields: Annotation names to carry over to page rows
+            timeout: Cache timeout in seconds (defaults to the
+                SEARCH_RESULT_CACHE_TIMEOUT setting)
+
+        Returns:
+            ResultSet: Cached or freshly built result set
+        """
+        if timeout is None:
+            timeout = getattr(settings, "SEARCH_RESULT_CACHE_TIMEOUT", DEFAULT_TIMEOUT)
+
+        key = cls.make_key(namespace, params)
+        cached = cache.get(key)
+        if cached is not None:
+            return cls(cached["ids"], row_queryset, cached["extras"], key, cache_hit=True)
+
+        result_set = cls.from_queryset(build(), row_queryset, extra_fields)
+        result_set.cache_key = key
+        cache.set(key, {"ids": result_set.ids, "extras": result_set.extras}, timeout)
+        return result_set
+
+    @staticmethod
+    def make_key(namespace: str, params: Any) -> str:
+        """Build the cache key for a namespace and set of request parameters."""
+        payload = json.dumps(normalize_params(params), separators=(",", ":"))
+        digest = hashlib.md5(payload.encode("utf-8")).hexdigest()
+        return f"result_set:{namespace}:{get_generation()}:{digest}"
+
+    def count(self) -> int:
+        """Return the number of results without touching the database."""
+        return len(self.ids)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self):
+        return iter(self.fetch(self.ids))
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return self.fetch(self.ids[index])
+        rows = self.fetch([self.ids[index]])
+        if not rows:
+            raise IndexError("Result no longer available")
+        return rows[0]
+
+    def fetch(self, ids: List[Any]) -> List[models.Model]:
+        """Load the given primary keys in order, with any carried annotations.
+
+        Rows that no longer match ``row_queryset`` (e.g. archived since the
+        result set was cached) are skipped.
+
+        Args:
+            ids: Ordered primary keys to load
+
+        Returns:
+            List of model instances in the order of ``ids``
+        """
+        if not ids:
+            return []
+
+        rows = {obj.pk: obj for obj in self.row_queryset.filter(pk__in=ids)}
+        ordered = []
+        for pk in ids:
+            obj = rows.get(pk)
+            if obj is None:
+                continue
+            for name, value in self.extras.get(pk, {}).items():
+                setattr(obj, name, value)
+            ordered.append(obj)
+        return ordered
+
+
+@receiver(post_save, sender="directory.Resource")
+@receiver(post_delete, sender="directory.Resource")
+@receiver(post_save, sender="directory.ResourceCoverage")
+@receiver(post_delete, sender="directory.ResourceCoverage")
+@receiver(post_save, sender="directory.CoverageArea")
+@receiver(post_delete, sender="directory.CoverageArea")
+@receiver(post_save, sender="directory.TaxonomyCategory")
+@receiver(post_delete, sender="directory.TaxonomyCategory")
+@receiver(post_save, sender="directory.ServiceType")
+@receiver(post_delete, sender="directory.ServiceType")
+def handle_directory_change(sender: Any, **kwargs: Any) -> None:
+    """Expire cached result sets when resources, coverage or taxonomy change."""
+    if kwargs.get("raw", False):
+        return
+    schedule_invalidation()
+
+
+@receiver(m2m_changed, sender="directory.Resource_service_types")
+def handle_service_types_change(sender: Any, action: str, **kwargs: Any) -> None:
+    """Expire cached result sets when a resource's service types change."""
+    if action in ("post_add", "post_remove", "post_clear"):
+        schedule_invalidation()
+
+
+@receiver(request_started)
+def start_generation_memo(sender: Any, **kwargs: Any) -> None:
+    """Read the generation at most once per request."""
+    _request_generation.set({})
+
+
+@receiver(request_finished)
+def clear_generation_memo(sender: Any, **kwargs: Any) -> None:
+    """Stop reusing the generation read by the finished request."""
+    _request_generation.set(None)
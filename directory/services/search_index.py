@@ -0,0 +1,347 @@
+"""Backend-aware full-text search index for resources.
+
+This module owns the full-text index that backs ``ResourceManager.search_fts``.
+The index is created by migration ``0019_add_full_text_search`` and is kept in
+sync by the database itself, so normal ORM saves need no extra work:
+
+- SQLite/SpatiaLite: an external-content FTS5 virtual table (``resource_fts``)
+  maintained by INSERT/UPDATE/DELETE triggers on ``directory_resource``.
+- PostgreSQL: a generated ``search_vector`` tsvector column with a GIN index.
+
+Functions:
+    get_search_backend: Name of the full-text engine for a connection
+    build_fts5_query: Convert user input into a safe FTS5 MATCH expression
+    build_tsquery: Convert user input into a safe PostgreSQL tsquery string
+    match_ids_sql: SQL selecting the IDs of matching resources
+    rank_sql: Correlated SQL expression scoring a resource row (higher is better)
+    ranked_resource_ids: Matching resource IDs ordered by relevance
+    install_search_index: Create the index, triggers and initial contents
+    drop_search_index: Remove the index and its triggers
+    rebuild_search_index: Re-populate the index from the resource table
+
+Example:
+    >>> from directory.services.search_index import ranked_resource_ids
+    >>> ranked_resource_ids("mental health")
+    [42, 7, 19]
+"""
+
+import logging
+import re
+from typing import List, Optional, Tuple
+
+from django.db import NotSupportedError, connection as default_connection
+
+logger = logging.getLogger(__name__)
+
+RESOURCE_TABLE = "directory_resource"
+FTS_TABLE = "resource_fts"
+SEARCH_VECTOR_COLUMN = "search_vector"
+SEARCH_VECTOR_INDEX = "resource_search_vector_idx"
+TEXT_SEARCH_CONFIG = "english"
+
+# Columns indexed for full-text search, in FTS5 column order
+INDEXED_COLUMNS = ("name", "description", "city", "county", "state")
+
+# bm25() column weights matching INDEXED_COLUMNS (name matters most)
+FTS5_COLUMN_WEIGHTS = (10.0, 4.0, 2.0, 2.0, 1.0)
+
+# Guard against pathological queries
+MAX_QUERY_LENGTH = 1000
+MAX_QUERY_TERMS = 32
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+_COLUMN_LIST = ", ".join(INDEXED_COLUMNS)
+_NEW_VALUES = ", ".join(f"new.{column}" for column in INDEXED_COLUMNS)
+_OLD_VALUES = ", ".join(f"old.{column}" for column in INDEXED_COLUMNS)
+
+SQLITE_INSTALL_SQL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        {_COLUMN_LIST},
+        content='{RESOURCE_TABLE}',
+        content_rowid='id',
+        tokenize='porter unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON {RESOURCE_TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, {_COLUMN_LIST}) VALUES (new.id, {_NEW_VALUES});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON {RESOURCE_TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_COLUMN_LIST}) VALUES ('delete', old.id, {_OLD_VALUES});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF {_COLUMN_LIST} ON {RESOURCE_TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_COLUMN_LIST}) VALUES ('delete', old.id, {_OLD_VALUES});
+        INSERT INTO {FTS_TABLE}(rowid, {_COLUMN_LIST}) VALUES (new.id, {_NEW_VALUES});
+    END
+    """,
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+
+SQLITE_DROP_SQL = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+_PG_DOCUMENT = (
+    f"setweight(to_tsvector('{TEXT_SEARCH_CONFIG}'::regconfig, coalesce(name, '')), 'A') || "
+    f"setweight(to_tsvector('{TEXT_SEARCH_CONFIG}'::regconfig, coalesce(description, '')), 'B') || "
+    f"setweight(to_tsvector('{TEXT_SEARCH_CONFIG}'::regconfig, "
+    f"coalesce(city, '') || ' ' || coalesce(county, '') || ' ' || coalesce(state, '')), 'C')"
+)
+
+POSTGRESQL_INSTALL_SQL = [
+    f"""
+    ALTER TABLE {RESOURCE_TABLE}
+    ADD COLUMN IF NOT EXISTS {SEARCH_VECTOR_COLUMN} tsvector
+    GENERATED ALWAYS AS ({_PG_DOCUMENT}) STORED
+    """,
+    f"""
+    CREATE INDEX IF NOT EXISTS {SEARCH_VECTOR_INDEX}
+    ON {RESOURCE_TABLE} USING gin ({SEARCH_VECTOR_COLUMN})
+    """,
+]
+
+POSTGRESQL_DROP_SQL = [
+    f"DROP INDEX IF EXISTS {SEARCH_VECTOR_INDEX}",
+    f"ALTER TABLE {RESOURCE_TABLE} DROP COLUMN IF EXISTS {SEARCH_VECTOR_COLUMN}",
+]
+
+
+def get_search_backend(connection=None) -> str:
+    """Return the full-text engine used for the given database connection.
+
+    Args:
+        connection: Database connection (defaults to the default connection)
+
+    Returns:
+        str: ``"fts5"`` for SQLite/SpatiaLite, ``"tsvector"`` for PostgreSQL
+
+    Raises:
+        NotSupportedError: If the database vendor has no full-text index
+    """
+    connection = connection or default_connection
+    if connection.vendor == "sqlite":
+        return "fts5"
+    if connection.vendor == "postgresql":
+        return "tsvector"
+    raise NotSupportedError(
+        f"Full-text search is not supported on '{connection.vendor}' databases."
+    )
+
+
+def _query_terms(query: str) -> List[str]:
+    """Split user input into lowercase word tokens.
+
+    Only word characters survive, so the resulting terms can be embedded in
+    FTS5 or tsquery syntax without any escaping. Only the first
+    MAX_QUERY_LENGTH characters and MAX_QUERY_TERMS terms are used; longer
+    input is cut off rather than rejected, since it comes from public
+    search forms.
+    """
+    return _TOKEN_RE.findall(query[:MAX_QUERY_LENGTH].lower())[:MAX_QUERY_TERMS]
+
+
+def build_fts5_query(query: str) -> str:
+    """Convert user input into an FTS5 MATCH expression.
+
+    Every term becomes a quoted prefix query and terms are implicitly ANDed,
+    so ``"mental heal"`` matches "Mental Health Services".
+
+    Args:
+        query: Raw search text from the user
+
+    Returns:
+        str: FTS5 expression, or an empty string when there are no terms
+    """
+    return " ".join(f'"{term}"*' for term in _query_terms(query))
+
+
+def build_tsquery(query: str) -> str:
+    """Convert user input into a PostgreSQL ``to_tsquery`` string.
+
+    Args:
+        query: Raw search text from the user
+
+    Returns:
+        str: tsquery text such as ``mental:* & health:*``, or an empty string
+    """
+    return " & ".join(f"{term}:*" for term in _query_terms(query))
+
+
+def match_ids_sql(query: str, connection=None) -> Tuple[str, List[str]]:
+    """Return SQL selecting the IDs of resources matching ``query``.
+
+    The statement is suitable for ``pk__in=RawSQL(...)`` filters.
+
+    Args:
+        query: Raw search text from the user
+        connection: Database connection (defaults to the default connection)
+
+    Returns:
+        Tuple of (sql, params); sql is empty when the query has no terms
+    """
+    backend = get_search_backend(connection)
+    if backend == "fts5":
+        expression = build_fts5_query(query)
+        if not expression:
+            return "", []
+        return f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [expression]
+
+    expression = build_tsquery(query)
+    if not expression:
+        return "", []
+    return (
+        f"SELECT id FROM {RESOURCE_TABLE} "
+        f"WHERE {SEARCH_VECTOR_COLUMN} @@ to_tsquery('{TEXT_SEARCH_CONFIG}', %s)",
+        [expression],
+    )
+
+
+def rank_sql(query: str, connection=None) -> Tuple[str, List[str]]:
+    """Return a correlated SQL expression scoring the current resource row.
+
+    The expression references ``directory_resource.id`` and evaluates to a
+    relevance score normalized to the range [0, 1) (higher is better), or 0
+    when the row does not match. It is meant for ``RawSQL`` annotations on
+    Resource querysets.
+
+    Args:
+        query: Raw search text from the user
+        connection: Database connection (defaults to the default connection)
+
+    Returns:
+        Tuple of (sql, params); sql is empty when the query has no terms
+    """
+    backend = get_search_backend(connection)
+    if backend == "fts5":
+        expression = build_fts5_query(query)
+        if not expression:
+            return "", []
+        weights = ", ".join(str(weight) for weight in FTS5_COLUMN_WEIGHTS)
+        return (
+            f"COALESCE((SELECT 1.0 - 1.0 / (1.0 - bm25({FTS_TABLE}, {weights})) FROM {FTS_TABLE} "
+            f"WHERE {FTS_TABLE} MATCH %s AND {FTS_TABLE}.rowid = {RESOURCE_TABLE}.id), 0)",
+            [expression],
+        )
+
+    expression = build_tsquery(query)
+    if not expression:
+        return "", []
+    return (
+        f"ts_rank_cd({RESOURCE_TABLE}.{SEARCH_VECTOR_COLUMN}, "
+        f"to_tsquery('{TEXT_SEARCH_CONFIG}', %s), 32)",
+        [expression],
+    )
+
+
+def ranked_resource_ids(
+    query: str,
+    limit: Optional[int] = None,
+    connection=None,
+) -> List[int]:
+    """Return IDs of resources matching ``query`` ordered by relevance.
+
+    The result includes archived and deleted rows; callers are expected to
+    apply the usual manager filters on top.
+
+    Args:
+        query: Raw search text from the user
+        limit: Maximum number of IDs to return (optional)
+        connection: Database connection (defaults to the default connection)
+
+    Returns:
+        List[int]: Resource IDs, most relevant first
+    """
+    connection = connection or default_connection
+    backend = get_search_backend(connection)
+
+    if backend == "fts5":
+        expression = build_fts5_query(query)
+        weights = ", ".join(str(weight) for weight in FTS5_COLUMN_WEIGHTS)
+        sql = (
+            f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s "
+            f"ORDER BY bm25({FTS_TABLE}, {weights}), rowid"
+        )
+    else:
+        expression = build_tsquery(query)
+        sql = (
+            f"SELECT id FROM {RESOURCE_TABLE}, to_tsquery('{TEXT_SEARCH_CONFIG}', %s) query "
+            f"WHERE {SEARCH_VECTOR_COLUMN} @@ query "
+            f"ORDER BY ts_rank_cd({SEARCH_VECTOR_COLUMN}, query) DESC, id"
+        )
+
+    if not expression:
+        return []
+
+    params: List = [expression]
+    if limit:
+        sql += " LIMIT %s"
+        params.append(limit)
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return [row[0] for row in cursor.fetchall()]
+
+
+def _execute_all(connection, statements: List[str]) -> None:
+    """Execute a list of DDL/DML statements on ``connection``."""
+    with connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
+
+
+def install_search_index(connection=None) -> None:
+    """Create the full-text index for the connection's database vendor.
+
+    The statements are idempotent, so this is safe to run against a database
+    that already has the index.
+
+    Args:
+        connection: Database connection (defaults to the default connection)
+    """
+    connection = connection or default_connection
+    backend = get_search_backend(connection)
+    if backend == "fts5":
+        _execute_all(connection, SQLITE_INSTALL_SQL)
+    else:
+        _execute_all(connection, POSTGRESQL_INSTALL_SQL)
+    logger.info(f"Installed {backend} full-text search index")
+
+
+def drop_search_index(connection=None) -> None:
+    """Remove the full-text index and any triggers that maintain it.
+
+    Args:
+        connection: Database connection (defaults to the default connection)
+    """
+    connection = connection or default_connection
+    backend = get_search_backend(connection)
+    if backend == "fts5":
+        _execute_all(connection, SQLITE_DROP_SQL)
+    else:
+        _execute_all(connection, POSTGRESQL_DROP_SQL)
+
+
+def rebuild_search_index(connection=None) -> None:
+    """Re-populate the full-text index from ``directory_resource``.
+
+    On SQLite this re-reads every row into the FTS5 table. On PostgreSQL the
+    generated column is always current, so only the GIN index is rebuilt.
+
+    Args:
+        connection: Database connection (defaults to the default connection)
+    """
+    connection = connection or default_connection
+    backend = get_search_backend(connection)
+    if backend == "fts5":
+        _execute_all(connection, [f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"])
+    else:
+        _execute_all(connection, [f"REINDEX INDEX {SEARCH_VECTOR_INDEX}"])
@@ -0,0 +1,228 @@
+"""Maintenance of the denormalized resource→service-area table.
+
+``ResourceServiceArea`` mirrors ``ResourceCoverage`` with the coverage-area
+data location search needs copied onto every row. This module keeps it in
+sync:
+
+    - ResourceCoverage saved/deleted: re-materialize that resource's rows
+    - CoverageArea saved: refresh kind, specificity, bbox and center on
+      every row for that area (deletes cascade through the foreign key)
+
+Bulk operations that bypass signals (``bulk_create``, ``QuerySet.update``,
+raw SQL imports) should call ``sync_resources`` or ``rebuild_service_areas``
+afterwards, or run ``manage.py rebuild_service_areas``.
+
+Functions:
+    area_metadata: Kind, specificity, bbox and center of a coverage area
+    sync_resources: Re-materialize rows for specific resources
+    refresh_coverage_area: Update rows for one coverage area
+    rebuild_service_areas: Rebuild the whole table
+    rebuffer_radius_areas: Recompute radius-area geometries in meters
+
+Example:
+    >>> from directory.services.service_areas import rebuild_service_areas
+    >>> rebuild_service_areas()
+    1342
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 500
+
+
+def area_metadata(area: Any) -> Dict[str, Any]:
+    """Return the denormalized fields for a coverage area.
+
+    Args:
+        area: CoverageArea instance (geometry fields loaded)
+
+    Returns:
+        Dict of ResourceServiceArea field values
+    """
+    from directory.models import ResourceServiceArea
+
+    metadata = {
+        "kind": area.kind,
+        "specificity": ResourceServiceArea.specificity_for(area.kind),
+        "min_lon": None,
+        "min_lat": None,
+        "max_lon": None,
+        "max_lat": None,
+        "center_lon": None,
+        "center_lat": None,
+    }
+
+    bounds = area.get_bounds()
+    if bounds:
+        metadata.update(bounds)
+
+    center = area.get_center_coordinates()
+    if center:
+        metadata["center_lon"] = center["lon"]
+        metadata["center_lat"] = center["lat"]
+
+    return metadata
+
+
+def _area_metadata_map(area_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+    """Compute metadata for many coverage areas, loading each once."""
+    from directory.models import CoverageArea
+
+    area_ids = list(set(area_ids))
+    metadata = {}
+    for start in range(0, len(area_ids), BATCH_SIZE):
+        chunk = area_ids[start:start + BATCH_SIZE]
+        for area in CoverageArea.objects.filter(id__in=chunk).only(
+            "id", "kind", "geom", "center"
+        ):
+            metadata[area.id] = area_metadata(area)
+    return metadata
+
+
+def sync_resources(resource_ids: Iterable[int]) -> int:
+    """Re-materialize the service-area rows of the given resources.
+
+    Args:
+        resource_ids: IDs of resources whose coverage changed
+
+    Returns:
+        int: Number of rows written
+    """
+    from directory.models import ResourceCoverage, ResourceServiceArea
+
+    resource_ids = list(set(resource_ids))
+    if not resource_ids:
+        return 0
+
+    pairs = list(
+        ResourceCoverage.objects.filter(resource_id__in=resource_ids).values_list(
+            "resource_id", "coverage_area_id"
+        )
+    )
+    metadata = _area_metadata_map(area_id for _, area_id in pairs)
+
+    rows = [
+        ResourceServiceArea(resource_id=resource_id, coverage_area_id=area_id, **metadata[area_id])
+        for resource_id, area_id in pairs
+        if area_id in metadata
+    ]
+
+    with transaction.atomic():
+        ResourceServiceArea.objects.filter(resource_id__in=resource_ids).delete()
+        ResourceServiceArea.objects.bulk_create(rows, batch_size=BATCH_SIZE)
+    return len(rows)
+
+
+def refresh_coverage_area(area: Any) -> int:
+    """Copy a coverage area's current metadata onto its service-area rows.
+
+    Args:
+        area: The saved CoverageArea
+
+    Returns:
+        int: Number of rows updated
+    """
+    from directory.models import ResourceServiceArea
+
+    return ResourceServiceArea.objects.filter(coverage_area_id=area.pk).update(
+        **area_metadata(area)
+    )
+
+
+def rebuild_service_areas(resource_ids: Optional[List[int]] = None) -> int:
+    """Rebuild the service-area table from ResourceCoverage.
+
+    Args:
+        resource_ids: Limit the rebuild to these resources (default: all)
+
+    Returns:
+        int: Number of rows written
+    """
+    from directory.models import Resource, ResourceServiceArea
+
+    written = 0
+    with transaction.atomic():
+        if resource_ids is None:
+            ResourceServiceArea.objects.all().delete()
+            resource_ids = list(
+                Resource._base_manager.filter(
+                    resource_coverage_associations__isnull=False
+                ).values_list("id", flat=True).distinct()
+            )
+
+        for start in range(0, len(resource_ids), BATCH_SIZE):
+            written += sync_resources(resource_ids[start:start + BATCH_SIZE])
+
+    logger.info(f"Rebuilt {written} resource service area rows")
+    return written
+
+
+def rebuffer_radius_areas(area_ids: Optional[List[int]] = None) -> int:
+    """Recompute the geometry of radius areas and refresh their rows.
+
+    Radius areas saved before buffers were computed in meters were buffered
+    by ``radius_m`` degrees. This re-buffers them from ``center`` and
+    ``radius_m`` and copies the new bbox onto their service-area rows.
+    Requires GIS.
+
+    Args:
+        area_ids: Limit to these coverage areas (default: all radius areas)
+
+    Returns:
+        int: Number of coverage areas re-buffered
+    """
+    from django.contrib.gis.geos import MultiPolygon
+
+    from directory.models import CoverageArea
+    from directory.services.coverage_index import invalidate_coverage_index
+    from directory.services.result_sets import invalidate_result_sets
+    from directory.utils.geodesy import geodesic_buffer
+
+    areas = CoverageArea.objects.filter(
+        kind="RADIUS", center__isnull=False, radius_m__isnull=False
+    )
+    if area_ids is not None:
+        areas = areas.filter(id__in=area_ids)
+
+    count = 0
+    with transaction.atomic():
+        for area in areas.only("id", "kind", "center", "radius_m", "geom").iterator():
+            geom = geodesic_buffer(area.center, area.radius_m)
+            if geom.geom_type == "Polygon":
+                geom = MultiPolygon([geom], srid=4326)
+
+            # Update directly: save() would re-run full_clean on legacy rows
+            CoverageArea.objects.filter(pk=area.pk).update(geom=geom)
+            area.geom = geom
+            refresh_coverage_area(area)
+            count += 1
+
+    if count:
+        invalidate_coverage_index()
+        invalidate_result_sets()
+    logger.info(f"Re-buffered {count} radius coverage areas")
+    return count
+
+
+@receiver(post_save, sender="directory.ResourceCoverage")
+@receiver(post_delete, sender="directory.ResourceCoverage")
+def handle_resource_coverage_change(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Keep a resource's service-area rows in step with its coverage."""
+    if kwargs.get("raw", False):
+        return
+    sync_resources([instance.resource_id])
+
+
+@receiver(post_save, sender="directory.CoverageArea")
+def handle_coverage_area_save(sender: Any, instance: Any, created: bool, **kwargs: Any) -> None:
+    """Propagate coverage area edits (kind, geometry) to service-area rows."""
+    if created or kwargs.get("raw", False):
+        return
+    refresh_coverage_area(instance)
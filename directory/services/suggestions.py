@@ -0,0 +1,353 @@
+"""In-memory prefix index for location autocomplete suggestions.
+
+Suggestions come from three sources, merged into one sorted list of
+normalized keys so a prefix query is a binary search plus a short scan:
+
+    - Cities of published resources ("London, KY"), weighted by how many
+      resources are there
+    - Coverage-area names (states, counties, cities)
+    - ZIP codes of published resources and of the gazetteer
+
+The index is built once per process and then maintained incrementally:
+resource and coverage-area signals add and remove single entries, so an
+edit shows up in this process immediately. Changes made by other processes
+are picked up by a full rebuild when the table snapshots change, checked at
+most every SUGGESTION_INDEX_REFRESH_SECONDS.
+
+Classes:
+    SuggestionIndex: Sorted prefix index with per-entry reference counts
+
+Functions:
+    get_suggestion_index: Process-wide SuggestionIndex instance
+    invalidate_suggestion_index: Force a rebuild on next use
+
+Example:
+    >>> get_suggestion_index().suggest("lon")
+    [{'address': 'London, KY', 'type': 'City'}, ...]
+"""
+
+import logging
+import threading
+import time
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .gazetteer import normalize_place_name
+
+logger = logging.getLogger(__name__)
+
+# Ranking bonus per coverage area kind (resource counts add 10 each)
+AREA_KIND_WEIGHTS = {"STATE": 30, "CITY": 20, "COUNTY": 15}
+AREA_KIND_LABELS = {"STATE": "State", "COUNTY": "County", "CITY": "City"}
+RESOURCE_WEIGHT = 10
+ZIP_WEIGHT = 1
+
+DEFAULT_REFRESH_SECONDS = 60
+
+# Most keys examined per prefix before ranking (bounds very short prefixes)
+MAX_SCAN = 2000
+
+# Ranked results remembered per prefix (cleared on every change)
+PREFIX_MEMO_SIZE = 512
+
+
+def _resource_places(city: str, state: str, postal_code: str) -> List[Tuple[str, str, int]]:
+    """Return (display, type, weight) suggestions contributed by one resource."""
+    places = []
+    if city and state:
+        places.append((f"{city.strip()}, {state.strip().upper()}", "City", RESOURCE_WEIGHT))
+    zip_code = (postal_code or "").strip()[:5]
+    if len(zip_code) == 5 and zip_code.isdigit():
+        places.append((zip_code, "ZIP", ZIP_WEIGHT))
+    return places
+
+
+def _is_listed(resource: Any) -> bool:
+    """Return True if a resource's places should be suggested."""
+    return (
+        resource.status == "published"
+        and not resource.is_deleted
+        and not getattr(resource, "is_archived", False)
+    )
+
+
+class SuggestionIndex:
+    """Sorted prefix index of location suggestions.
+
+    Each entry is keyed by its normalized display text and counts the
+    resources and coverage areas referring to it; an entry disappears when
+    nothing refers to it any more.
+    """
+
+    def __init__(self, refresh_seconds: Optional[int] = None):
+        if refresh_seconds is None:
+            refresh_seconds = getattr(
+                settings, "SUGGESTION_INDEX_REFRESH_SECONDS", DEFAULT_REFRESH_SECONDS
+            )
+        self.refresh_seconds = refresh_seconds
+
+        self._lock = threading.RLock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._keys: List[str] = []
+        self._resource_refs: Dict[int, List[Tuple[str, int]]] = {}
+        self._area_refs: Dict[int, Tuple[str, str]] = {}
+        self._memo: "OrderedDict[Tuple[str, int], List[Dict[str, str]]]" = OrderedDict()
+        self._snapshot: Optional[Tuple] = None
+        self._checked_at = 0.0
+
+    # Entry bookkeeping -------------------------------------------------
+
+    def _add(self, display: str, kind: str, weight: int) -> str:
+        """Add a reference to an entry, creating it if needed."""
+        key = normalize_place_name(display)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = {"address": display, "type": kind, "weight": 0, "refs": 0}
+            insort(self._keys, key)
+        entry["weight"] += weight
+        entry["refs"] += 1
+        return key
+
+    def _remove(self, key: str, weight: int) -> None:
+        """Drop a reference to an entry, deleting it when unreferenced."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        entry["weight"] -= weight
+        entry["refs"] -= 1
+        if entry["refs"] <= 0:
+            del self._entries[key]
+            position = bisect_left(self._keys, key)
+            if position < len(self._keys) and self._keys[position] == key:
+                del self._keys[position]
+
+    # Incremental updates -----------------------------------------------
+
+    def update_resource(self, resource: Any) -> None:
+        """Re-index one resource after it was saved."""
+        with self._lock:
+            if self._snapshot is None:
+                return
+            self._drop_resource(resource.pk)
+            if _is_listed(resource):
+                self._index_resource(
+                    resource.pk, resource.city, resource.state, resource.postal_code
+                )
+            self._memo.clear()
+
+    def remove_resource(self, resource_id: int) -> None:
+        """Remove one resource's entries after it was deleted."""
+        with self._lock:
+            if self._snapshot is not None:
+                self._drop_resource(resource_id)
+                self._memo.clear()
+
+    def _index_resource(self, resource_id: int, city: str, state: str, postal_code: str) -> None:
+        self._resource_refs[resource_id] = [
+            (self._add(display, kind, weight), weight)
+            for display, kind, weight in _resource_places(city, state, postal_code)
+        ]
+
+    def _drop_resource(self, resource_id: int) -> None:
+        for key, weight in self._resource_refs.pop(resource_id, []):
+            self._remove(key, weight)
+
+    def update_area(self, area_id: int, name: str, kind: str) -> None:
+        """Re-index one coverage area after it was saved."""
+        with self._lock:
+            if self._snapshot is None:
+                return
+            self._drop_area(area_id)
+            if kind in AREA_KIND_WEIGHTS and name:
+                self._area_refs[area_id] = (
+                    self._add(name, AREA_KIND_LABELS[kind], AREA_KIND_WEIGHTS[kind]), kind
+                )
+            self._memo.clear()
+
+    def remove_area(self, area_id: int) -> None:
+        """Remove one coverage area's entry after it was deleted."""
+        with self._lock:
+            if self._snapshot is not None:
+                self._drop_area(area_id)
+                self._memo.clear()
+
+    def _drop_area(self, area_id: int) -> None:
+        ref = self._area_refs.pop(area_id, None)
+        if ref:
+            key, kind = ref
+            self._remove(key, AREA_KIND_WEIGHTS[kind])
+
+    # Full builds -------------------------------------------------------
+
+    def invalidate(self) -> None:
+        """Drop the index so the next query rebuilds it."""
+        with self._lock:
+            self._snapshot = None
+
+    @staticmethod
+    def _database_snapshot() -> Tuple:
+        """Return (count, latest change) of every source table."""
+        from django.db.models import Count, Max
+
+        from directory.models import CoverageArea, GazetteerEntry, Resource
+
+        resources = Resource._base_manager.aggregate(count=Count("id"), latest=Max("updated_at"))
+        areas = CoverageArea.objects.aggregate(count=Count("id"), latest=Max("updated_at"))
+        zips = GazetteerEntry.objects.filter(kind="ZIP").aggregate(count=Count("id"), latest=Max("id"))
+        return tuple(stats[field] for stats in (resources, areas, zips) for field in ("count", "latest"))
+
+    def load(self) -> None:
+        """(Re)build the whole index from the database."""
+        from directory.models import CoverageArea, GazetteerEntry, Resource
+
+        with self._lock:
+            started = time.monotonic()
+            snapshot = self._database_snapshot()
+            self._entries, self._keys = {}, []
+            self._resource_refs, self._area_refs = {}, {}
+
+            for resource_id, city, state, postal_code in Resource.objects.filter(
+                status="published"
+            ).values_list("id", "city", "state", "postal_code").iterator(chunk_size=2000):
+                self._index_resource(resource_id, city, state, postal_code)
+
+            for area_id, name, kind in CoverageArea.objects.filter(
+                kind__in=list(AREA_KIND_WEIGHTS)
+            ).values_list("id", "name", "kind").iterator(chunk_size=2000):
+                if name:
+                    self._area_refs[area_id] = (
+                        self._add(name, AREA_KIND_LABELS[kind], AREA_KIND_WEIGHTS[kind]), kind
+                    )
+
+            for zip_code in GazetteerEntry.objects.filter(kind="ZIP").values_list(
+                "key", flat=True
+            ).iterator(chunk_size=5000):
+                self._add(zip_code, "ZIP", ZIP_WEIGHT)
+
+            self._memo.clear()
+            self._snapshot = snapshot
+            self._checked_at = time.monotonic()
+
+            logger.info(
+                "Loaded suggestion index: %d entries in %.0f ms",
+                len(self._keys),
+                (time.monotonic() - started) * 1000,
+            )
+
+    def ensure_fresh(self) -> None:
+        """Build the index, or rebuild it if the source tables have changed.
+
+        Saves in this process are applied incrementally by the signal
+        handlers; the snapshot check catches changes made elsewhere (other
+        workers, bulk imports that bypass signals).
+        """
+        with self._lock:
+            if self._snapshot is None:
+                self.load()
+                return
+
+            if time.monotonic() - self._checked_at < self.refresh_seconds:
+                return
+
+            self._checked_at = time.monotonic()
+            if self._database_snapshot() != self._snapshot:
+                self.load()
+
+    # Queries -----------------------------------------------------------
+
+    def suggest(self, prefix: str, limit: int = 8) -> List[Dict[str, str]]:
+        """Return the best suggestions whose text starts with ``prefix``.
+
+        Args:
+            prefix: Text typed so far
+            limit: Maximum number of suggestions
+
+        Returns:
+            List of {"address", "type"} dicts, highest weight first
+        """
+        key = normalize_place_name(prefix or "")
+        if not key:
+            return []
+
+        self.ensure_fresh()
+        with self._lock:
+            memo_key = (key, limit)
+            cached = self._memo.get(memo_key)
+            if cached is not None:
+                self._memo.move_to_end(memo_key)
+                return cached
+
+            start = bisect_left(self._keys, key)
+            matches = []
+            for candidate in self._keys[start:start + MAX_SCAN]:
+                if not candidate.startswith(key):
+                    break
+                matches.append(self._entries[candidate])
+
+            matches.sort(key=lambda entry: (-entry["weight"], len(entry["address"]), entry["address"]))
+            results = [{"address": entry["address"], "type": entry["type"]} for entry in matches[:limit]]
+
+            self._memo[memo_key] = results
+            while len(self._memo) > PREFIX_MEMO_SIZE:
+                self._memo.popitem(last=False)
+            return results
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+_index: Optional[SuggestionIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_suggestion_index() -> SuggestionIndex:
+    """Return the process-wide suggestion index."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = SuggestionIndex()
+    return _index
+
+
+def invalidate_suggestion_index() -> None:
+    """Mark the process-wide index (if built) for a rebuild."""
+    if _index is not None:
+        _index.invalidate()
+
+
+@receiver(post_save, sender="directory.Resource")
+def handle_resource_save(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Keep a saved resource's city and ZIP suggestions current."""
+    if kwargs.get("raw", False) or _index is None:
+        return
+    _index.update_resource(instance)
+
+
+@receiver(post_delete, sender="directory.Resource")
+def handle_resource_delete(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Drop a deleted resource's suggestions."""
+    if _index is None:
+        return
+    _index.remove_resource(instance.pk)
+
+
+@receiver(post_save, sender="directory.CoverageArea")
+def handle_coverage_area_save(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Keep a saved coverage area's suggestion current."""
+    if kwargs.get("raw", False) or _index is None:
+        return
+    _index.update_area(instance.pk, instance.name, instance.kind)
+
+
+@receiver(post_delete, sender="directory.CoverageArea")
+def handle_coverage_area_delete(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Drop a deleted coverage area's suggestion."""
+    if _index is None:
+        return
+    _index.remove_area(instance.pk)
@@ -26,6 +26,7 @@ Usage:
 from datetime import timedelta
 
 from django.contrib.auth.models import Group, User
+from django.core.cache import cache
 from django.test import TestCase
 from django.utils import timezone
 
@@ -77,19 +78,22 @@ class BaseTestCase(TestCase):
         cls.reviewer.groups.add(cls.reviewer_group)
         cls.admin.groups.add(cls.admin_group)
 
-        # Create categories and service types
-        cls.category = TaxonomyCategory.objects.create(
-            name="Test Category", slug="test-category"
-        )
-        
-        cls.service_type = ServiceType.objects.create(
-            name="Test Service", slug="test-service"
-        )
+        # Create categories and service types, running the cache
+        # invalidation they schedule so it does not absorb later changes
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.category = TaxonomyCategory.objects.create(
+                name="Test Category", slug="test-category"
+            )
+
+            cls.service_type = ServiceType.objects.create(
+                name="Test Service", slug="test-service"
+            )
 
     def setUp(self):
         """Set up test-specific data (runs for each test)."""
-        # Any test-specific setup can go here
-        pass
+        # Directory caches are versioned by a generation that each test
+        # rolls back, so start every test from an empty cache
+        cache.clear()
 
     def create_test_resource(self, **kwargs):
         """Helper function to create a valid test resource."""
@@ -0,0 +1,180 @@
+"""
+Audit Tests - Batched Versions and Audit Log Entries
+
+This module contains tests for ``audit_batch()`` and
+``AuditManager.update_resources``.
+
+Test Coverage:
+    - Versions and audit entries of saves buffered and inserted in bulk
+    - Nothing written when the batch raises
+    - Stale instances renumbered after the latest version at flush
+    - Bulk admin actions recording a version and audit entry per resource
+    - Bounded query count for bulk updates
+    - Bulk updates expiring public pages and recomputing related resources
+    - Merging duplicates archives them with a version and audit trail
+
+Author: Resource Directory Team
+Created: 2025-01-15
+Version: 1.0.0
+"""
+
+import io
+
+from django.contrib.admin.sites import AdminSite
+from django.core.management import call_command
+from django.test import RequestFactory
+from django.urls import reverse
+
+from audit.buffer import audit_batch
+from audit.models import AuditManager
+from directory.admin import ResourceAdmin
+from directory.models import AuditLog, Resource, ResourceVersion
+from directory.services.related_resources import related_resources_for
+
+from .base_test_case import BaseTestCase
+
+
+class AuditBatchTestCase(BaseTestCase):
+    """Test cases for buffered audit writes."""
+
+    def test_saves_are_buffered_until_the_batch_ends(self):
+        """Test that versions and audit entries are written when the batch exits."""
+        resource = self.create_test_resource()
+        with audit_batch() as buffer:
+            resource.name = "Renamed"
+            resource.save()
+            self.assertEqual(len(buffer.versions), 1)
+            self.assertEqual(ResourceVersion.objects.filter(resource=resource).count(), 1)
+
+        version = ResourceVersion.objects.get(resource=resource, version_number=2)
+        self.assertEqual(version.changed_field_list, ["name"])
+        self.assertEqual(version.snapshot["name"], "Renamed")
+        self.assertTrue(
+            AuditLog.objects.filter(action="update_resource", target_id=str(resource.pk)).exists()
+        )
+
+    def test_failed_batch_writes_nothing(self):
+        """Test that an exception discards the changes and their audit trail."""
+        resource = self.create_test_resource()
+        with self.assertRaises(RuntimeError):
+            with audit_batch():
+                resource.name = "Renamed"
+                resource.save()
+                raise RuntimeError("abort")
+
+        self.assertEqual(Resource.objects.get(pk=resource.pk).name, "Test Resource")
+        self.assertEqual(ResourceVersion.objects.filter(resource=resource).count(), 1)
+        self.assertFalse(AuditLog.objects.filter(action="update_resource").exists())
+
+    def test_stale_instance_is_renumbered_at_flush(self):
+        """Test that a stale copy saved in a batch gets the next free number."""
+        resource = self.create_test_resource()
+        stale = Resource.objects.get(pk=resource.pk)
+        resource.name = "First Edit"
+        resource.save()
+
+        with audit_batch():
+            stale.city = "London"
+            stale.save()
+
+        version = ResourceVersion.objects.get(resource=resource, version_number=3)
+        self.assertTrue(version.is_full_snapshot)
+        self.assertEqual(version.snapshot["city"], "London")
+        self.assertEqual(Resource.objects.get(pk=resource.pk).current_version, 3)
+
+    def test_update_resources_records_versions(self):
+        """Test that bulk updates version and log every resource."""
+        resources = [self.create_test_resource(name=f"Resource {i}") for i in range(3)]
+
+        updated = AuditManager.update_resources(
+            Resource.objects.filter(pk__in=[r.pk for r in resources]),
+            self.admin,
+            "archive_resource",
+            is_archived=True,
+            archive_reason="Bulk archived by admin",
+        )
+
+        self.assertEqual(updated, 3)
+        for resource in resources:
+            version = ResourceVersion.objects.get(resource=resource, version_number=2)
+            self.assertEqual(version.changed_by, self.admin)
+            self.assertEqual(version.changed_field_list, ["is_archived", "archive_reason"])
+            self.assertTrue(version.snapshot["is_archived"])
+            self.assertEqual(Resource._base_manager.get(pk=resource.pk).current_version, 2)
+        self.assertEqual(AuditLog.objects.filter(action="archive_resource").count(), 3)
+
+    def test_update_resources_query_count_is_constant(self):
+        """Test that bulk updates do not issue per-resource queries."""
+        resources = [self.create_test_resource(name=f"Resource {i}") for i in range(10)]
+        queryset = Resource.objects.filter(pk__in=[r.pk for r in resources])
+
+        # IDs, update, reload, latest versions, two bulk inserts (plus the
+        # savepoint and its release)
+        with self.assertNumQueries(8):
+            AuditManager.update_resources(
+                queryset,
+                self.admin,
+                "unpublish_resource",
+                change_type="status_change",
+                status="needs_review",
+            )
+
+    def test_admin_publish_action_is_audited(self):
+        """Test that the admin publish action records versions."""
+        resource = self.create_test_resource(status="needs_review")
+        request = RequestFactory().post("/admin/directory/resource/")
+        request.user = self.admin
+        model_admin = ResourceAdmin(Resource, AdminSite())
+        model_admin.message_user = lambda *args, **kwargs: None
+        model_admin.publish_resource(request, Resource.objects.filter(pk=resource.pk))
+
+        version = ResourceVersion.objects.get(resource=resource, version_number=2)
+        self.assertEqual(version.change_type, "status_change")
+        self.assertEqual(version.snapshot["status"], "published")
+        self.assertTrue(AuditLog.objects.filter(action="publish_resource").exists())
+
+    def test_admin_bulk_publish_changes_public_etag(self):
+        """Test that a bulk publish expires public pages and related lists."""
+        with self.captureOnCommitCallbacks(execute=True):
+            listed = self.create_test_resource(name="Listed", category=self.category, status="published")
+            resource = self.create_test_resource(category=self.category, status="needs_review")
+        url = reverse("directory:public_resource_list")
+        etag = self.client.get(url)["ETag"]
+
+        request = RequestFactory().post("/admin/directory/resource/")
+        request.user = self.admin
+        model_admin = ResourceAdmin(Resource, AdminSite())
+        model_admin.message_user = lambda *args, **kwargs: None
+        with self.captureOnCommitCallbacks(execute=True):
+            model_admin.publish_resource(request, Resource.objects.filter(pk=resource.pk))
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertContains(response, "Test Resource")
+        self.assertEqual(related_resources_for(resource), [listed])
+
+    def test_merge_duplicates_archives_duplicates(self):
+        """Test that merging archives the duplicates and records their versions."""
+        primary = self.create_test_resource(name="Food Pantry")
+        duplicate = self.create_test_resource(name="Food Pantry", hours_of_operation="Mon-Fri 9-5")
+
+        out = io.StringIO()
+        call_command(
+            "merge_duplicates",
+            primary_id=primary.pk,
+            duplicate_ids=str(duplicate.pk),
+            merge_notes="Same phone number",
+            stdout=out,
+        )
+
+        self.assertIn("Archived 1 duplicate resources", out.getvalue())
+        archived = Resource._base_manager.get(pk=duplicate.pk)
+        self.assertTrue(archived.is_archived)
+        self.assertIn(f"primary resource ID {primary.pk}", archived.archive_reason)
+        self.assertEqual(Resource.objects.get(pk=primary.pk).hours_of_operation, "Mon-Fri 9-5")
+
+        version = ResourceVersion.objects.get(resource=duplicate, version_number=archived.current_version)
+        self.assertTrue(version.snapshot["is_archived"])
+        self.assertIn("is_archived", version.changed_field_list)
+        self.assertTrue(AuditLog.objects.filter(action="archive_duplicate", target_id=str(duplicate.pk)).exists())
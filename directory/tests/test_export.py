@@ -0,0 +1,147 @@
+"""
+Export Tests - Streaming Resource Exports
+
+This module contains tests for the resource export utilities shared by the
+admin action, the importer export view and ``export_resources_to_csv``.
+
+Test Coverage:
+    - Streaming CSV responses and field formatting
+    - Bounded query count (no per-row queries)
+    - NDJSON records with service-type and coverage-area ID lists
+    - Parquet row groups (when pyarrow is installed)
+    - Archived resources in the ``export_resources`` command
+
+Author: Resource Directory Team
+Created: 2025-01-15
+Version: 1.0.0
+"""
+
+import csv
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from django.core.management import call_command
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+
+from directory.models import CoverageArea, Resource, ResourceCoverage, ServiceType
+from directory.utils.export_utils import (
+    PARQUET_AVAILABLE,
+    export_resources_to_csv,
+    iter_export_chunks,
+    stream_resources_csv,
+    stream_resources_ndjson,
+    write_resources_parquet,
+)
+
+from .base_test_case import BaseTestCase
+
+
+def _read_csv(response):
+    """Consume a streaming response and parse its rows."""
+    content = b"".join(response.streaming_content).decode("utf-8")
+    return list(csv.reader(io.StringIO(content)))
+
+
+class ExportTestCase(BaseTestCase):
+    """Test cases for streaming exports."""
+
+    def setUp(self):
+        super().setUp()
+        self.shelter = ServiceType.objects.create(name="Shelter")
+        self.food = ServiceType.objects.create(name="Food")
+        for number in range(3):
+            resource = self.create_test_resource(
+                name=f"Resource {number}", category=self.category, is_emergency_service=True
+            )
+            resource.service_types.add(self.shelter, self.food)
+
+    def test_export_streams_formatted_rows(self):
+        """Test the full export's header and value formatting."""
+        response = export_resources_to_csv(Resource.objects.order_by("name"))
+        self.assertIsInstance(response, StreamingHttpResponse)
+        self.assertIn("attachment;", response["Content-Disposition"])
+
+        rows = _read_csv(response)
+        header = rows[0]
+        first = dict(zip(header, rows[1]))
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(header[-1], "Service Types")
+        self.assertEqual(first["Category"], self.category.name)
+        self.assertEqual(first["Created By"], self.user.username)
+        self.assertEqual(first["Emergency Service"], "Yes")
+        self.assertEqual(sorted(first["Service Types"].split(", ")), ["Food", "Shelter"])
+
+    def test_export_query_count_is_independent_of_rows(self):
+        """Test that rows and service types are loaded in bulk."""
+        response = stream_resources_csv(
+            Resource.objects.all(), ["name", "category", "created_by", "service_types"]
+        )
+        with self.assertNumQueries(2):
+            rows = _read_csv(response)
+        self.assertEqual(len(rows), 3)
+
+    def test_ndjson_export_includes_id_lists(self):
+        """Test NDJSON records keep native types and list columns."""
+        resource = Resource.objects.order_by("pk").first()
+        # bulk_create skips CoverageArea.full_clean(), which needs GEOS
+        area, = CoverageArea.objects.bulk_create([CoverageArea(
+            kind="STATE", name="Kentucky", ext_ids={"state_fips": "21"},
+            created_by=self.user, updated_by=self.user,
+        )])
+        ResourceCoverage.objects.create(resource=resource, coverage_area=area, created_by=self.user)
+
+        response = stream_resources_ndjson(Resource.objects.all())
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        lines = b"".join(response.streaming_content).decode("utf-8").splitlines()
+        records = [json.loads(line) for line in lines]
+
+        self.assertEqual(len(records), 3)
+        first = records[0]
+        self.assertEqual(first["id"], resource.pk)
+        self.assertEqual(first["category_id"], self.category.pk)
+        self.assertIs(first["is_emergency_service"], True)
+        self.assertEqual(first["service_type_ids"], sorted([self.shelter.pk, self.food.pk]))
+        self.assertEqual(first["coverage_area_ids"], [area.pk])
+        self.assertEqual(records[1]["coverage_area_ids"], [])
+
+    def test_chunks_use_keyset_pagination(self):
+        """Test each chunk costs three queries plus one final empty read."""
+        with self.assertNumQueries(7):
+            chunks = list(iter_export_chunks(Resource.objects.all(), chunk_size=2))
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 1])
+
+    def test_command_includes_archived_only_when_asked(self):
+        """Test --include-archived adds archived resources to the export."""
+        archived = Resource.objects.order_by("pk").first()
+        Resource.objects.filter(pk=archived.pk).update(is_archived=True, archived_at=timezone.now())
+
+        def exported_ids(**options):
+            with tempfile.TemporaryDirectory() as directory:
+                output = os.path.join(directory, "resources.ndjson")
+                call_command("export_resources", output=output, stdout=io.StringIO(), **options)
+                with open(output, encoding="utf-8") as handle:
+                    return [json.loads(line)["id"] for line in handle]
+
+        self.assertNotIn(archived.pk, exported_ids())
+        ids = exported_ids(include_archived=True)
+        self.assertIn(archived.pk, ids)
+        self.assertEqual(len(ids), 3)
+
+    @unittest.skipUnless(PARQUET_AVAILABLE, "pyarrow is not installed")
+    def test_parquet_export_writes_row_groups(self):
+        """Test Parquet output has one row group per chunk and list columns."""
+        import pyarrow.parquet as pq
+
+        buffer = io.BytesIO()
+        written = write_resources_parquet(Resource.objects.all(), buffer, row_group_size=2)
+        buffer.seek(0)
+        parquet_file = pq.ParquetFile(buffer)
+
+        self.assertEqual(written, 3)
+        self.assertEqual(parquet_file.num_row_groups, 2)
+        table = parquet_file.read()
+        self.assertEqual(len(table.column("service_type_ids")[0].as_py()), 2)
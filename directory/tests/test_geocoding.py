@@ -0,0 +1,360 @@
+"""
+Geocoding Tests - Service Caching and Lookup Paths
+
+This module contains tests for the geocoding service layer.
+
+Test Coverage:
+    - Process-wide service instance
+    - In-memory LRU/TTL result cache in front of GeocodingCache
+    - Read-only GeocodingCache lookups with buffered hit counts
+    - Deduplicated, concurrent batch geocoding
+    - Indexed text-based location matching
+    - Reverse geocoding cache keyed by grid cell
+    - Offline gazetteer provider
+
+Author: Resource Directory Team
+Created: 2025-01-15
+Version: 1.0.0
+"""
+
+import time
+from datetime import timedelta
+from typing import List, Optional
+
+from django.test import SimpleTestCase
+from django.utils import timezone
+
+from directory.models import GazetteerEntry, GeocodingCache
+from directory.services.gazetteer import _area_keys
+from directory.models.geocoding_cache import flush_hit_counts_at_exit, hit_buffer
+from directory.services.geocoding import (
+    GazetteerProvider,
+    GeocodingProvider,
+    GeocodingResult,
+    GeocodingService,
+    MemoryResultCache,
+    TextBasedLocationMatcher,
+    get_geocoding_service,
+    reset_geocoding_service,
+)
+
+from .base_test_case import BaseTestCase
+
+
+class StaticProvider(GeocodingProvider):
+    """Provider that answers every query with a fixed point."""
+
+    def __init__(self):
+        super().__init__("static", rate_limit_per_minute=60000)
+        self.queries: List[str] = []
+        self.points: List[tuple] = []
+
+    def geocode(self, query: str) -> Optional[GeocodingResult]:
+        self.queries.append(query)
+        return GeocodingResult(37.1283, -84.0836, query, provider=self.name, confidence=0.9)
+
+    def reverse_geocode(self, latitude: float, longitude: float) -> Optional[GeocodingResult]:
+        self.points.append((latitude, longitude))
+        return GeocodingResult(latitude, longitude, "Main St, London, KY", provider=self.name, confidence=0.8)
+
+
+class MemoryResultCacheTestCase(SimpleTestCase):
+    """Test cases for the in-memory result cache."""
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that the cache keeps the most recently used entries."""
+        cache = MemoryResultCache(max_size=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.set("c", 3)
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual((cache.hits, cache.misses), (3, 1))
+
+    def test_expired_entries_are_ignored(self):
+        """Test that entries past their TTL are treated as misses."""
+        cache = MemoryResultCache(max_size=10, ttl=60)
+        cache.set("a", 1, ttl=0)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+
+class GeocodingServiceCacheTestCase(BaseTestCase):
+    """Test cases for geocoding service caching."""
+
+    def tearDown(self):
+        reset_geocoding_service()
+        super().tearDown()
+
+    def test_service_is_shared(self):
+        """Test that get_geocoding_service returns one instance per process."""
+        self.assertIs(get_geocoding_service(), get_geocoding_service())
+
+    def test_repeat_query_served_from_memory(self):
+        """Test that a hot query skips both the provider and the database."""
+        provider = StaticProvider()
+        service = GeocodingService(providers=[provider])
+
+        first = service.geocode("London, KY")
+        self.assertFalse(first.cache_hit)
+
+        with self.assertNumQueries(0):
+            second = service.geocode("  london, ky ")
+
+        self.assertTrue(second.cache_hit)
+        self.assertFalse(first.cache_hit)
+        self.assertEqual(second.coordinates, first.coordinates)
+        self.assertEqual(provider.queries, ["London, KY"])
+
+        stats = service.get_cache_stats()
+        self.assertEqual(stats["memory_hits"], 1)
+        self.assertEqual(stats["provider_lookups"], 1)
+
+    def test_database_hit_is_promoted_to_memory(self):
+        """Test that a GeocodingCache hit is kept in memory for next time."""
+        GeocodingService(providers=[StaticProvider()]).geocode("Corbin, KY")
+
+        provider = StaticProvider()
+        service = GeocodingService(providers=[provider])
+        self.assertTrue(service.geocode("Corbin, KY").cache_hit)
+        with self.assertNumQueries(0):
+            self.assertTrue(service.geocode("Corbin, KY").cache_hit)
+
+        self.assertEqual(provider.queries, [])
+        self.assertEqual(service.get_cache_stats()["db_hits"], 1)
+
+    def test_promoted_hit_does_not_outlive_database_entry(self):
+        """Test that a promoted hit expires with its GeocodingCache entry."""
+        GeocodingCache.store_result(
+            query="Corbin, KY", latitude=36.9487, longitude=-84.0969,
+            address="Corbin, KY, USA", provider="static", confidence=0.9,
+        )
+        GeocodingCache.objects.update(expires_at=timezone.now() + timedelta(seconds=30))
+
+        service = GeocodingService(providers=[StaticProvider()])
+        self.assertTrue(service.geocode("Corbin, KY").cache_hit)
+
+        key = service._memory_key("Corbin, KY", None)
+        expires, _ = service.memory_cache._entries[key]
+        self.assertLessEqual(expires - time.monotonic(), 30)
+
+    def test_expired_database_entry_is_not_promoted(self):
+        """Test that an entry expiring now is not kept in memory."""
+        entry = GeocodingCache.store_result(
+            query="Corbin, KY", latitude=36.9487, longitude=-84.0969,
+            address="Corbin, KY, USA", provider="static", confidence=0.9,
+        )
+        service = GeocodingService(providers=[StaticProvider()])
+        service._remember("Corbin, KY", None, service._result_from_cache_entry(entry), timezone.now())
+
+        self.assertIsNone(service.memory_cache.get(service._memory_key("Corbin, KY", None)))
+
+
+class GeocodingCacheHitCountTestCase(BaseTestCase):
+    """Test cases for buffered cache hit accounting."""
+
+    def setUp(self):
+        super().setUp()
+        hit_buffer.drain()
+        self.entry = GeocodingCache.store_result(
+            query="London, KY", latitude=37.1289, longitude=-84.0849,
+            address="London, KY, USA", provider="nominatim", confidence=0.9,
+        )
+        self.other = GeocodingCache.store_result(
+            query="Corbin, KY", latitude=36.9487, longitude=-84.0969,
+            address="Corbin, KY, USA", provider="nominatim", confidence=0.9,
+        )
+
+    def test_lookup_does_not_write(self):
+        """Test that a cache hit costs a single SELECT."""
+        with self.assertNumQueries(1):
+            self.assertEqual(GeocodingCache.get_cached_result("london, ky").pk, self.entry.pk)
+
+        self.entry.refresh_from_db()
+        self.assertEqual(self.entry.hit_count, 1)
+        self.assertEqual(hit_buffer.pending(), 1)
+
+    def test_flush_applies_buffered_hits(self):
+        """Test that a flush writes one UPDATE per distinct hit count."""
+        for _ in range(3):
+            GeocodingCache.get_cached_result("London, KY")
+        GeocodingCache.get_cached_result("Corbin, KY")
+
+        with self.assertNumQueries(2):
+            self.assertEqual(GeocodingCache.flush_hit_counts(), 2)
+
+        self.entry.refresh_from_db()
+        self.other.refresh_from_db()
+        self.assertEqual(self.entry.hit_count, 4)
+        self.assertEqual(self.other.hit_count, 2)
+        self.assertEqual(hit_buffer.pending(), 0)
+        self.assertEqual(GeocodingCache.flush_hit_counts(), 0)
+
+    def test_pending_hits_are_flushed_at_exit(self):
+        """Test that hits still buffered when the process exits are written."""
+        GeocodingCache.get_cached_result("London, KY")
+        self.assertFalse(hit_buffer.is_due())
+
+        flush_hit_counts_at_exit()
+
+        self.entry.refresh_from_db()
+        self.assertEqual(self.entry.hit_count, 2)
+        self.assertEqual(hit_buffer.pending(), 0)
+
+
+class BatchGeocodeTestCase(BaseTestCase):
+    """Test cases for the batch geocoding pipeline."""
+
+    def setUp(self):
+        super().setUp()
+        GeocodingCache.store_result(
+            query="London, KY", latitude=37.1289, longitude=-84.0849,
+            address="London, KY, USA", provider="nominatim", confidence=0.9,
+        )
+
+    def test_batch_dedupes_and_uses_cache(self):
+        """Test one cache query, one provider call per new query, one bulk write."""
+        provider = StaticProvider()
+        service = GeocodingService(providers=[provider])
+        queries = ["London, KY", "Corbin, KY", "corbin, ky ", "Somerset, KY", ""]
+
+        with self.assertNumQueries(2):
+            results = service.batch_geocode(queries)
+
+        self.assertEqual(len(results), 5)
+        self.assertTrue(results[0].cache_hit)
+        self.assertIs(results[1], results[2])
+        self.assertIsNone(results[4])
+        self.assertEqual(sorted(provider.queries), ["Corbin, KY", "Somerset, KY"])
+
+        self.assertTrue(GeocodingCache.objects.filter(query="Somerset, KY").exists())
+        self.assertEqual(GeocodingCache.objects.count(), 3)
+
+        # Everything is now cached in memory
+        with self.assertNumQueries(0):
+            again = service.batch_geocode(queries[:4])
+        self.assertTrue(all(result.cache_hit for result in again))
+        self.assertEqual(len(provider.queries), 2)
+
+
+class TextBasedLocationMatcherTestCase(SimpleTestCase):
+    """Test cases for the indexed text matcher."""
+
+    def setUp(self):
+        self.matcher = TextBasedLocationMatcher()
+        self.matcher._index = self.matcher._build_index([
+            {"id": 1, "name": "Kentucky", "kind": "STATE",
+             "ext_ids": {"state_fips": "21"}, "lat": 37.5, "lon": -85.3},
+            {"id": 2, "name": "Laurel County", "kind": "COUNTY",
+             "ext_ids": {"county_fips": "21125"}, "lat": 37.11, "lon": -84.12},
+            {"id": 3, "name": "London", "kind": "CITY",
+             "ext_ids": {}, "lat": 37.13, "lon": -84.08},
+        ])
+        self.matcher._last_cache_update = time.time()
+
+    def match(self, query):
+        result = self.matcher.find_location_match(query)
+        return result.raw_data["area_id"] if result else None
+
+    def test_exact_match_returns_area_center(self):
+        """Test that exact names match regardless of case and punctuation."""
+        result = self.matcher.find_location_match("  laurel   COUNTY ")
+        self.assertEqual(result.raw_data["area_id"], 2)
+        self.assertEqual(result.coordinates, (37.11, -84.12))
+        self.assertEqual(result.confidence, 0.9)
+
+    def test_partial_matches(self):
+        """Test names inside the query, queries inside names, and prefixes."""
+        self.assertEqual(self.match("London, Kentucky"), 3)
+        self.assertEqual(self.match("Laurel"), 2)
+        self.assertEqual(self.match("laur"), 2)
+        self.assertEqual(self.match("Kentucky"), 1)
+
+    def test_ext_id_match(self):
+        """Test that FIPS codes resolve to their area."""
+        self.assertEqual(self.match("21125"), 2)
+        self.assertIsNone(self.match("99999"))
+        self.assertIsNone(self.match("Nowhere"))
+
+
+class ReverseGeocodeCacheTestCase(BaseTestCase):
+    """Test cases for reverse geocoding caching."""
+
+    def test_nearby_points_share_a_cached_address(self):
+        """Test that points in one grid cell reuse a single provider lookup."""
+        provider = StaticProvider()
+        service = GeocodingService(providers=[provider])
+
+        first = service.reverse_geocode(37.12830, -84.08360)
+        second = service.reverse_geocode(37.12832, -84.08361)
+        self.assertFalse(first.cache_hit)
+        self.assertTrue(second.cache_hit)
+        self.assertEqual(second.address, first.address)
+        self.assertEqual(second.coordinates, (37.12832, -84.08361))
+        self.assertEqual(len(provider.points), 1)
+
+        # A new service (another worker) finds the cell in the database
+        other = GeocodingService(providers=[StaticProvider()])
+        self.assertTrue(other.reverse_geocode(37.1283, -84.0836).cache_hit)
+
+        service.reverse_geocode(37.2, -84.2)
+        self.assertEqual(len(provider.points), 2)
+
+
+class GazetteerProviderTestCase(BaseTestCase):
+    """Test cases for the offline gazetteer provider."""
+
+    def setUp(self):
+        super().setUp()
+        entries = [
+            ("corbin ky", "CITY", "Corbin, KY", 0, 36.95, -84.10),
+            ("corbin", "CITY", "Corbin, KY", 3, 36.95, -84.10),
+            ("london ky", "CITY", "London, KY", 0, 37.13, -84.08),
+            ("london", "CITY", "London, KY", 3, 37.13, -84.08),
+            ("london", "CITY", "London, OH", 3, 39.89, -83.45),
+            ("laurel county", "COUNTY", "Laurel County", 2, 37.11, -84.12),
+            ("21125", "COUNTY", "Laurel County", 4, 37.11, -84.12),
+            ("40741", "ZIP", "40741", 0, 37.15, -84.09),
+        ]
+        GazetteerEntry.objects.bulk_create([
+            GazetteerEntry(key=key, kind=kind, name=name, rank=rank, latitude=lat, longitude=lon)
+            for key, kind, name, rank, lat, lon in entries
+        ])
+        self.provider = GazetteerProvider()
+
+    def test_place_county_zip_and_fips_queries(self):
+        """Test that administrative-area queries resolve offline."""
+        self.assertEqual(self.provider.geocode("Corbin, KY").coordinates, (36.95, -84.10))
+        self.assertEqual(self.provider.geocode("corbin, ky, USA").address, "Corbin, KY")
+        self.assertEqual(self.provider.geocode("Laurel County").address, "Laurel County")
+        self.assertEqual(self.provider.geocode("40741").coordinates, (37.15, -84.09))
+        self.assertEqual(self.provider.geocode("21125").address, "Laurel County")
+        self.assertEqual(self.provider.geocode("London, KY 40741").address, "London, KY")
+
+    def test_declines_streets_ambiguous_and_unknown(self):
+        """Test that other queries are left to network providers."""
+        self.assertIsNone(self.provider.geocode("123 Main St, Corbin, KY"))
+        self.assertIsNone(self.provider.geocode("London"))
+        self.assertIsNone(self.provider.geocode("Springfield, IL"))
+
+    def test_batch_resolves_offline_before_network(self):
+        """Test that batch geocoding only sends street addresses to the network."""
+        network = StaticProvider()
+        service = GeocodingService(providers=[self.provider, network])
+        results = service.batch_geocode(["Corbin, KY", "40741", "100 Main St, London, KY"])
+
+        self.assertEqual([r.provider for r in results], ["gazetteer", "gazetteer", "static"])
+        self.assertEqual(network.queries, ["100 Main St, London, KY"])
+
+    def test_area_keys(self):
+        """Test the keys generated for an imported city."""
+        keys = dict(_area_keys("CITY", "London, KY", {
+            "city_name": "London", "state_abbr": "KY", "state_name": "Kentucky",
+            "state_fips": "21", "place_fips": "47476",
+        }))
+        self.assertEqual(keys, {
+            "london": 3, "london ky": 0, "london kentucky": 0, "2147476": 0,
+        })
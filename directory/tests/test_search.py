@@ -0,0 +1,358 @@
+"""
+Search Tests - Full-Text Search Index and Ranking
+
+This module contains tests for the backend-aware full-text search index
+(FTS5 on SQLite, tsvector on PostgreSQL) used by ResourceManager.
+
+Test Coverage:
+    - Query tokenization and escaping
+    - Relevance-ranked full-text search
+    - Index maintenance on update and delete
+    - Cached result sets for pagination
+    - Location autocomplete prefix index
+    - Facet counts for public listings
+    - Precomputed related resources
+
+Author: Resource Directory Team
+Created: 2025-01-15
+Version: 1.0.0
+"""
+
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import transaction
+from django.http import QueryDict
+from django.urls import reverse
+from django.utils import timezone
+
+from directory.models import Resource, ServiceType
+from directory.services.facets import count_facets, get_published_facets, get_result_set_facets
+from directory.services.related_resources import rebuild_related_resources, related_resources_for
+from directory.services.result_sets import (ResultSet, get_generation, get_generation_changed_at,
+                                            invalidate_result_sets, normalize_params)
+from directory.services.search_index import build_fts5_query, build_tsquery
+from directory.services.suggestions import SuggestionIndex, invalidate_suggestion_index
+
+from .base_test_case import BaseTestCase
+
+
+class SearchIndexTestCase(BaseTestCase):
+    """Test cases for the full-text search index."""
+
+    def test_query_builders_strip_syntax(self):
+        """Test that user input is reduced to plain word terms."""
+        self.assertEqual(build_fts5_query('mental-health "OR" *'), '"mental"* "health"* "or"*')
+        self.assertEqual(build_tsquery("food & bank!"), "food:* & bank:*")
+        self.assertEqual(build_fts5_query("--; "), "")
+
+    def test_overlong_query_is_truncated(self):
+        """Test that very long input is cut off instead of raising."""
+        shelter = self.create_test_resource(name="Shelter of Hope")
+        self.assertEqual(build_fts5_query("a" * 1001), '"' + "a" * 1000 + '"*')
+
+        self.assertEqual(list(Resource.objects.search_combined("a" * 1001)), [])
+        self.assertEqual(list(Resource.objects.search_fts("shelter" + " " * 2000)), [shelter])
+        response = self.client.get(reverse("directory:public_resource_list"), {"q": "a" * 1001})
+        self.assertEqual(response.status_code, 200)
+
+    def test_search_fts_ranks_name_matches_first(self):
+        """Test that a name match outranks a description-only match."""
+        described = self.create_test_resource(
+            name="Community Center",
+            description="Offers a weekly shelter referral list and other help for families.",
+        )
+        named = self.create_test_resource(name="Shelter of Hope")
+        self.create_test_resource(name="Medical Clinic")
+
+        results = list(Resource.objects.search_fts("shelter"))
+
+        self.assertEqual(results, [named, described])
+
+    def test_search_fts_matches_prefixes(self):
+        """Test that partial words match as prefixes."""
+        resource = self.create_test_resource(name="Mental Health Services")
+
+        self.assertIn(resource, Resource.objects.search_fts("ment heal"))
+
+    def test_search_fts_empty_query(self):
+        """Test that blank and symbol-only queries return nothing."""
+        self.create_test_resource(name="Food Bank")
+
+        self.assertFalse(Resource.objects.search_fts("   ").exists())
+        self.assertFalse(Resource.objects.search_fts("!!!").exists())
+
+    def test_index_follows_updates_and_deletes(self):
+        """Test that triggers keep the index in sync with the resource table."""
+        resource = self.create_test_resource(name="Food Bank")
+
+        resource.name = "Clothing Closet"
+        resource.save()
+        self.assertFalse(Resource.objects.search_fts("food").exists())
+        self.assertIn(resource, Resource.objects.search_fts("closet"))
+
+        Resource.objects.filter(pk=resource.pk).delete()
+        self.assertFalse(Resource.objects.search_fts("closet").exists())
+
+    def test_search_combined_matches_phone_digits(self):
+        """Test that formatted phone queries match normalized phone numbers."""
+        resource = self.create_test_resource(name="Hotline", phone="(606) 555-9876")
+        self.create_test_resource(name="Other Resource", phone="6065551111")
+
+        results = list(Resource.objects.search_combined("555-9876"))
+
+        self.assertEqual(results, [resource])
+
+    def test_search_combined_ranks_exact_matches_first(self):
+        """Test that exact contact matches outrank text relevance."""
+        text_match = self.create_test_resource(name="Hope Shelter")
+        email_match = self.create_test_resource(
+            name="Family Services", email="shelter@example.org"
+        )
+
+        results = Resource.objects.search_combined("shelter")
+
+        self.assertEqual(list(results), [email_match, text_match])
+        self.assertEqual(results.count(), 2)
+        self.assertEqual(list(results[1:2]), [text_match])
+
+
+class ResultSetTestCase(BaseTestCase):
+    """Test cases for cached, ordered result sets."""
+
+    def build_result_set(self, params):
+        """Build a result set over resources ordered by name."""
+        return ResultSet.for_query(
+            "test",
+            params,
+            build=lambda: Resource.objects.order_by("name"),
+            row_queryset=Resource.objects.all(),
+        )
+
+    def test_normalize_params_ignores_page_and_case(self):
+        """Test that paging and letter case do not change the cache key."""
+        self.assertEqual(
+            normalize_params(QueryDict("Q=x&q= Food &page=3")),
+            normalize_params(QueryDict("q=food&Q=X")),
+        )
+
+    def test_pages_are_served_from_cached_ids(self):
+        """Test that paging reuses the cached ID list."""
+        names = ["Alpha", "Bravo", "Charlie", "Delta", "Echo"]
+        for name in names:
+            self.create_test_resource(name=name)
+
+        first = self.build_result_set(QueryDict("q=test"))
+        self.assertFalse(first.cache_hit)
+
+        second = self.build_result_set(QueryDict("q=test&page=2"))
+        self.assertTrue(second.cache_hit)
+
+        paginator = Paginator(second, 2)
+        with self.assertNumQueries(1):
+            page = paginator.page(2)
+            self.assertEqual(paginator.count, 5)
+            self.assertEqual([r.name for r in page], ["Charlie", "Delta"])
+
+    def test_saving_a_resource_expires_result_sets(self):
+        """Test that resource changes invalidate cached result sets."""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_test_resource(name="Alpha")
+        self.build_result_set(QueryDict("q=expire"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_test_resource(name="Bravo")
+        result_set = self.build_result_set(QueryDict("q=expire"))
+
+        self.assertFalse(result_set.cache_hit)
+        self.assertEqual(result_set.count(), 2)
+
+    def test_changes_bump_generation_once_after_commit(self):
+        """Test that a transaction's changes share one bump, made on commit."""
+        before = get_generation()
+        with self.captureOnCommitCallbacks(execute=True):
+            resource = self.create_test_resource(name="Alpha")
+            resource.name = "Bravo"
+            resource.save()
+            self.assertEqual(get_generation(), before)
+
+        self.assertEqual(get_generation(), before + 1)
+
+    def test_generation_is_shared_between_processes(self):
+        """Test that the generation does not depend on this process's cache."""
+        before = get_generation()
+        invalidate_result_sets()
+        cache.clear()  # as seen from a process with its own local cache
+
+        self.assertEqual(get_generation(), before + 1)
+        self.assertIsNotNone(get_generation_changed_at())
+
+
+class SuggestionIndexTestCase(BaseTestCase):
+    """Test cases for the location autocomplete prefix index."""
+
+    def setUp(self):
+        super().setUp()
+        invalidate_suggestion_index()
+        self.create_test_resource(name="Shelter A", city="London", state="KY", status="published")
+        self.create_test_resource(name="Shelter B", city="London", state="KY", status="published")
+        self.create_test_resource(
+            name="Pantry", city="Lexington", state="ky", postal_code="40507", status="published"
+        )
+        self.create_test_resource(name="Draft", city="Lebanon", state="KY")
+
+    def test_prefix_ranks_by_resource_count(self):
+        """Test that cities with more published resources rank first."""
+        index = SuggestionIndex()
+        self.assertEqual(
+            index.suggest("l"),
+            [
+                {"address": "London, KY", "type": "City"},
+                {"address": "Lexington, KY", "type": "City"},
+            ],
+        )
+        self.assertEqual(index.suggest("405"), [{"address": "40507", "type": "ZIP"}])
+        self.assertEqual(index.suggest("leb"), [])
+
+    def test_incremental_updates(self):
+        """Test that saves and deletes adjust a loaded index in place."""
+        index = SuggestionIndex()
+        index.suggest("l")
+
+        resource = Resource.objects.get(name="Pantry")
+        resource.city = "Corbin"
+        index.update_resource(resource)
+        self.assertEqual(index.suggest("lex"), [])
+        self.assertEqual(index.suggest("corb"), [{"address": "Corbin, KY", "type": "City"}])
+
+        index.remove_resource(resource.pk)
+        self.assertEqual(index.suggest("corb"), [])
+        self.assertEqual(len(index), 1)
+
+    def test_suggestions_endpoint(self):
+        """Test the endpoint's response and cache headers."""
+        response = self.client.get(reverse("directory:api_location_suggestions"), {"q": "Lon"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["suggestions"], [{"address": "London, KY", "type": "City"}])
+        self.assertIn("public", response["Cache-Control"])
+        self.assertIn("max-age=", response["Cache-Control"])
+
+
+class FacetsTestCase(BaseTestCase):
+    """Test cases for grouped facet counts."""
+
+    def setUp(self):
+        super().setUp()
+        # Run the cache invalidation these saves schedule, as a commit would
+        with self.captureOnCommitCallbacks(execute=True):
+            self.shelter = ServiceType.objects.create(name="Shelter")
+            first = self.create_test_resource(
+                name="Night Shelter", city="London", state="KY", category=self.category,
+                is_emergency_service=True, status="published",
+            )
+            first.service_types.add(self.shelter)
+            self.create_test_resource(name="Food Bank", city="Corbin", state="KY", status="published")
+            self.create_test_resource(name="Draft Shelter", city="London", state="KY")
+
+    def test_counts_in_two_queries(self):
+        """Test that every facet comes from two grouped queries."""
+        with self.assertNumQueries(2):
+            facets = count_facets(Resource.objects.filter(status="published"))
+        self.assertEqual(facets["total"], 2)
+        self.assertEqual(facets["emergency"], 1)
+        self.assertEqual(facets["categories"], {self.category.id: 1})
+        self.assertEqual(facets["service_types"], {self.shelter.id: 1})
+        self.assertEqual(facets["cities"], {"London": 1, "Corbin": 1})
+
+    def test_published_facets_expire_on_publish(self):
+        """Test that cached facets expire when a resource is published."""
+        self.assertEqual(get_published_facets()["total"], 2)
+        # Only the generation is read; the counts come from the cache
+        with self.assertNumQueries(1):
+            get_published_facets()
+
+        draft = Resource.objects.get(name="Draft Shelter")
+        draft.status = "published"
+        draft.source = "Test Source"
+        draft.last_verified_at = timezone.now()
+        draft.last_verified_by = self.reviewer
+        with self.captureOnCommitCallbacks(execute=True):
+            draft.save()
+        self.assertEqual(get_published_facets()["cities"]["London"], 2)
+
+    def test_result_set_facets_reflect_filter(self):
+        """Test that facets of a filtered result set count only its rows."""
+        result_set = ResultSet.for_query(
+            "facets-test",
+            {"city": "London"},
+            build=lambda: Resource.objects.filter(status="published", city="London"),
+            row_queryset=Resource.objects.all(),
+        )
+        facets = get_result_set_facets(result_set)
+        self.assertEqual(facets["total"], 1)
+        self.assertEqual(facets["cities"], {"London": 1})
+
+
+class RelatedResourcesTestCase(BaseTestCase):
+    """Test cases for precomputed related resources."""
+
+    def setUp(self):
+        super().setUp()
+        shelter = ServiceType.objects.create(name="Shelter")
+        # Run the recomputes these saves schedule, as a commit would
+        with self.captureOnCommitCallbacks(execute=True):
+            self.first = self.create_test_resource(name="First", category=self.category, status="published")
+            self.second = self.create_test_resource(name="Second", category=self.category, status="published")
+            self.third = self.create_test_resource(name="Third", category=self.category, status="published")
+            self.unrelated = self.create_test_resource(name="Unrelated", status="published")
+            self.first.service_types.add(shelter)
+            self.second.service_types.add(shelter)
+
+    def test_rebuild_ranks_shared_service_types_first(self):
+        """Test that candidates sharing more features rank higher."""
+        rebuild_related_resources()
+        with self.assertNumQueries(1):
+            related = related_resources_for(self.first)
+        self.assertEqual(related, [self.second, self.third])
+        self.assertEqual(related_resources_for(self.unrelated), [])
+
+    def test_unpublished_suggestions_are_hidden(self):
+        """Test that a suggestion archived since the rebuild is not shown."""
+        rebuild_related_resources()
+        self.second.is_archived = True
+        self.second.archived_at = timezone.now()
+        self.second.archived_by = self.user
+        self.second.archive_reason = "Closed"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.second.save()
+        self.assertEqual(related_resources_for(self.first), [self.third])
+        self.assertEqual(related_resources_for(self.second), [])
+
+    def test_saves_recompute_once_after_commit(self):
+        """Test that several saves in one transaction recompute once."""
+        with patch("directory.services.related_resources.rebuild_related_resources") as rebuild:
+            with self.captureOnCommitCallbacks(execute=True):
+                with transaction.atomic():
+                    self.first.name = "First Renamed"
+                    self.first.save()
+                    self.second.name = "Second Renamed"
+                    self.second.save()
+                    self.first.save()
+                    self.assertFalse(rebuild.called)
+
+        rebuild.assert_called_once_with(sorted([self.first.pk, self.second.pk]))
+
+    def test_rolled_back_save_recomputes_nothing(self):
+        """Test that a rolled-back save does not recompute, and later saves do."""
+        with patch("directory.services.related_resources.rebuild_related_resources") as rebuild:
+            with self.captureOnCommitCallbacks(execute=True):
+                try:
+                    with transaction.atomic():
+                        self.first.save()
+                        raise RuntimeError("abort")
+                except RuntimeError:
+                    pass
+                self.second.save()
+
+        rebuild.assert_called_once_with([self.second.pk])
@@ -0,0 +1,386 @@
+"""
+Spatial Tests - Coverage Area Indexing and Location Search
+
+This module contains tests for the in-process spatial structures used by
+location search.
+
+Test Coverage:
+    - STR-packed R-tree point queries
+    - Haversine distances (scalar and vectorized)
+    - Geodesic buffers, areas and lengths in meters (requires GDAL)
+    - Re-buffering legacy radius areas (requires GIS)
+    - Resource service-area table maintenance (including ResourceForm edits)
+    - Single-pass proximity ranking with distance bounds
+    - Batch location eligibility
+
+Author: Resource Directory Team
+Created: 2025-01-15
+Version: 1.0.0
+"""
+
+import io
+import json
+import math
+import random
+import unittest
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+from directory.forms import ResourceForm
+from directory.models import CoverageArea, Resource, ResourceCoverage, ResourceServiceArea
+from directory.services.coverage_index import NATIONAL_AREA_NAMES, STRTree, invalidate_coverage_index
+from directory.services.proximity import annotate_proximity
+from directory.services.service_areas import rebuild_service_areas, refresh_coverage_area
+from directory.utils import geodesy
+
+from .base_test_case import BaseTestCase
+
+try:
+    from django.contrib.gis.geos import LineString, MultiPolygon, Point, Polygon
+
+    geodesy.local_transforms(37.0, -84.0)
+    HAS_GDAL = True
+except (ImportError, ImproperlyConfigured, OSError):
+    HAS_GDAL = False
+
+
+class STRTreeTestCase(SimpleTestCase):
+    """Test cases for the bulk-loaded R-tree."""
+
+    def test_point_query_matches_brute_force(self):
+        """Test that tree lookups return exactly the boxes containing the point."""
+        rng = random.Random(42)
+        boxes = []
+        for item in range(500):
+            x, y = rng.uniform(-125, -65), rng.uniform(25, 50)
+            boxes.append(((x, y, x + rng.uniform(0.1, 5), y + rng.uniform(0.1, 5)), item))
+
+        tree = STRTree(boxes, node_capacity=8)
+        self.assertEqual(len(tree), 500)
+
+        for _ in range(200):
+            x, y = rng.uniform(-125, -65), rng.uniform(25, 50)
+            expected = {
+                item for (minx, miny, maxx, maxy), item in boxes
+                if minx <= x <= maxx and miny <= y <= maxy
+            }
+            self.assertEqual(set(tree.query_point(x, y)), expected)
+
+    def test_empty_and_small_trees(self):
+        """Test trees with no entries or fewer entries than one node."""
+        self.assertEqual(STRTree([]).query_point(0, 0), [])
+
+        tree = STRTree([((0, 0, 1, 1), "a"), ((2, 2, 3, 3), "b")])
+        self.assertEqual(tree.query_point(0.5, 0.5), ["a"])
+        self.assertEqual(tree.query_point(1.5, 1.5), [])
+
+
+class GeodesyTestCase(SimpleTestCase):
+    """Test cases for meter-correct distance helpers."""
+
+    def test_haversine_known_distances(self):
+        """Test distances against known values at different latitudes."""
+        # One degree of latitude is ~111.2 km everywhere
+        self.assertAlmostEqual(geodesy.haversine_m(37.0, -84.0, 38.0, -84.0), 111195, delta=50)
+        # One degree of longitude shrinks with cos(latitude)
+        self.assertAlmostEqual(geodesy.haversine_m(60.0, 10.0, 60.0, 11.0), 55597, delta=50)
+        self.assertEqual(geodesy.haversine_m(37.0, -84.0, 37.0, -84.0), 0.0)
+
+    def test_haversine_many_matches_scalar(self):
+        """Test that the vectorized path agrees with the scalar formula."""
+        rng = random.Random(7)
+        lats = [rng.uniform(25, 50) for _ in range(100)]
+        lons = [rng.uniform(-125, -65) for _ in range(100)]
+
+        distances = geodesy.haversine_many(37.1, -84.1, lats, lons)
+        self.assertEqual(len(distances), 100)
+        for distance, lat, lon in zip(distances, lats, lons):
+            self.assertAlmostEqual(distance, geodesy.haversine_m(37.1, -84.1, lat, lon), places=3)
+        self.assertEqual(geodesy.haversine_many(37.1, -84.1, [], []), [])
+
+    def test_region_center_groups_nearby_points(self):
+        """Test that nearby points share one cached projection region."""
+        self.assertEqual(geodesy.region_center(37.1, -84.1), geodesy.region_center(37.2, -84.2))
+        self.assertNotEqual(geodesy.region_center(37.1, -84.1), geodesy.region_center(38.1, -84.1))
+
+
+@unittest.skipUnless(HAS_GDAL, "GDAL is not installed")
+class GeodesicGeometryTestCase(SimpleTestCase):
+    """Test cases for projected buffers and measurements."""
+
+    def setUp(self):
+        """Set up a point in Kentucky."""
+        self.center = Point(-84.0849, 37.1289, srid=4326)
+
+    def test_buffer_radius_is_in_meters(self):
+        """Test that every buffer vertex lies radius_m from the center."""
+        circle = geodesy.geodesic_buffer(self.center, 5000)
+
+        self.assertEqual(circle.srid, 4326)
+        for lon, lat in circle.exterior_ring.coords:
+            distance = geodesy.haversine_m(self.center.y, self.center.x, lat, lon)
+            self.assertAlmostEqual(distance, 5000, delta=25)
+        # About 0.045 degrees of latitude, not 5000 degrees
+        min_lon, min_lat, max_lon, max_lat = circle.extent
+        self.assertAlmostEqual(max_lat - min_lat, 0.09, delta=0.002)
+
+    def test_buffer_area_and_perimeter(self):
+        """Test that a buffer's area and perimeter match the circle's."""
+        circle = geodesy.geodesic_buffer(self.center, 5000)
+
+        area = math.pi * 5000 ** 2
+        perimeter = 2 * math.pi * 5000
+        self.assertAlmostEqual(geodesy.geodesic_area_m2(circle), area, delta=0.01 * area)
+        self.assertAlmostEqual(geodesy.geodesic_length_m(circle), perimeter, delta=0.01 * perimeter)
+
+    def test_area_shrinks_with_latitude(self):
+        """Test the area of one-tenth-degree cells at different latitudes."""
+        def cell(lat):
+            return Polygon.from_bbox((-84.0, lat, -83.9, lat + 0.1))
+
+        cell_37 = geodesy.geodesic_area_m2(cell(37.0))
+        expected = 11119.5 * 11119.5 * math.cos(math.radians(37.05))
+        self.assertAlmostEqual(cell_37, expected, delta=0.01 * expected)
+        self.assertLess(geodesy.geodesic_area_m2(cell(60.0)), 0.7 * cell_37)
+
+    def test_length_and_point_distance(self):
+        """Test line lengths and point-to-geometry distances in meters."""
+        meridian = LineString((-84.0, 37.0), (-84.0, 37.1), srid=4326)
+        self.assertAlmostEqual(geodesy.geodesic_length_m(meridian), 11119.5, delta=20)
+
+        cell = Polygon.from_bbox((-84.0, 37.0, -83.9, 37.1))
+        cell.srid = 4326
+        self.assertEqual(geodesy.distance_to_geometry_m(cell, 37.05, -83.95), 0)
+        self.assertAlmostEqual(geodesy.distance_to_geometry_m(cell, 37.15, -83.95), 5560, delta=20)
+
+
+@unittest.skipUnless(settings.GIS_ENABLED, "GIS libraries are not enabled")
+class RebufferRadiusAreasTestCase(BaseTestCase):
+    """Test cases for re-buffering radius areas saved in degrees."""
+
+    def test_command_shrinks_legacy_buffers(self):
+        """Test that areas buffered by radius_m degrees are rebuilt in meters."""
+        center = Point(-84.0849, 37.1289, srid=4326)
+        area = CoverageArea.objects.create(
+            kind="RADIUS",
+            name="Five Kilometer Radius",
+            center=center,
+            radius_m=5000,
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        resource = self.create_test_resource()
+        ResourceCoverage.objects.create(resource=resource, coverage_area=area, created_by=self.user)
+
+        # Simulate a row saved by the old degree-based buffer
+        legacy = MultiPolygon([center.buffer(5000)], srid=4326)
+        CoverageArea.objects.filter(pk=area.pk).update(geom=legacy)
+        refresh_coverage_area(CoverageArea.objects.get(pk=area.pk))
+        row = ResourceServiceArea.objects.get(resource=resource)
+        self.assertGreater(row.max_lat - row.min_lat, 1)
+
+        call_command("rebuffer_radius_areas", stdout=io.StringIO())
+
+        row = ResourceServiceArea.objects.get(resource=resource)
+        self.assertAlmostEqual(row.max_lat - row.min_lat, 0.09, delta=0.002)
+        extent = CoverageArea.objects.get(pk=area.pk).geom.extent
+        self.assertAlmostEqual(extent[3] - extent[1], 0.09, delta=0.002)
+
+
+class ServiceAreaTestCase(BaseTestCase):
+    """Test cases for the denormalized resource service-area table."""
+
+    def setUp(self):
+        """Create a resource served by a county."""
+        super().setUp()
+        self.county = CoverageArea.objects.create(
+            name="Laurel County",
+            kind="COUNTY",
+            ext_ids={"state_fips": "21", "county_fips": "125"},
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        self.resource = self.create_test_resource()
+        ResourceCoverage.objects.create(
+            resource=self.resource, coverage_area=self.county, created_by=self.user
+        )
+
+    def test_rows_follow_coverage_changes(self):
+        """Test that adding, editing and removing coverage updates the table."""
+        row = ResourceServiceArea.objects.get(resource=self.resource)
+        self.assertEqual((row.coverage_area, row.kind, row.specificity), (self.county, "COUNTY", 60))
+
+        self.county.kind = "POLYGON"
+        self.county.name = "Laurel County Service Zone"
+        self.county.save()
+        self.assertEqual(ResourceServiceArea.objects.get(resource=self.resource).specificity, 90)
+
+        ResourceCoverage.objects.filter(resource=self.resource).delete()
+        self.assertFalse(ResourceServiceArea.objects.filter(resource=self.resource).exists())
+
+    def test_rebuild_restores_missing_rows(self):
+        """Test that a rebuild repopulates rows removed behind the signals' back."""
+        ResourceServiceArea.objects.all().delete()
+
+        self.assertEqual(rebuild_service_areas(), 1)
+        self.assertEqual(
+            list(Resource.objects.filter(service_areas__coverage_area=self.county)),
+            [self.resource],
+        )
+
+
+class ResourceFormServiceAreaTestCase(BaseTestCase):
+    """Test cases for coverage edited through ResourceForm."""
+
+    def setUp(self):
+        """Create a resource served by one area, plus a national area."""
+        super().setUp()
+        # bulk_create skips CoverageArea.save, which needs GIS libraries
+        self.old_area, self.national = CoverageArea.objects.bulk_create([
+            CoverageArea(name="Laurel County", kind="COUNTY", created_by=self.user, updated_by=self.user),
+            CoverageArea(
+                name=NATIONAL_AREA_NAMES[0], kind="STATE", created_by=self.user, updated_by=self.user
+            ),
+        ])
+        self.resource = self.create_test_resource()
+        ResourceCoverage.objects.create(
+            resource=self.resource, coverage_area=self.old_area, created_by=self.user
+        )
+
+    def _edit_coverage(self, area_ids):
+        form = ResourceForm(
+            data={
+                "name": self.resource.name,
+                "phone": self.resource.phone,
+                "status": "draft",
+                "verification_frequency_days": 180,
+                "service_areas": json.dumps(area_ids),
+            },
+            instance=self.resource,
+            user=self.user,
+        )
+        self.assertTrue(form.is_valid(), form.errors)
+        form.save()
+
+    def test_form_rebuilds_service_areas(self):
+        """Test that coverage saved by the form is in the service-area table."""
+        self._edit_coverage([self.national.id])
+
+        self.assertEqual(
+            list(ResourceServiceArea.objects.filter(resource=self.resource).values_list(
+                "coverage_area_id", flat=True
+            )),
+            [self.national.id],
+        )
+
+    @unittest.skipUnless(settings.GIS_ENABLED, "GIS libraries are not enabled")
+    def test_location_search_finds_form_edited_coverage(self):
+        """Test that a resource stays in location results after a form edit."""
+        invalidate_coverage_index()
+        self._edit_coverage([self.national.id])
+
+        results = Resource.objects.filter(Resource.objects.location_filter(37.1289, -84.0833))
+        self.assertEqual(list(results), [self.resource])
+
+
+class ProximityRankingTestCase(BaseTestCase):
+    """Test cases for proximity ranking."""
+
+    def setUp(self):
+        """Create resources served by areas at known distances from London, KY."""
+        super().setUp()
+        self.origin = (37.1289, -84.0833)
+
+        # bulk_create skips CoverageArea.save, which needs GIS libraries
+        london, lexington, louisville = CoverageArea.objects.bulk_create([
+            CoverageArea(name="London", kind="CITY", created_by=self.user, updated_by=self.user),
+            CoverageArea(name="Lexington", kind="CITY", created_by=self.user, updated_by=self.user),
+            CoverageArea(name="Kentucky", kind="STATE", created_by=self.user, updated_by=self.user),
+        ])
+        self.near = self.create_test_resource(name="Near Resource")
+        self.far = self.create_test_resource(name="Far Resource")
+
+        centers = {london: (37.1289, -84.0833), lexington: (38.0406, -84.5037), louisville: (38.2527, -85.7585)}
+        rows = [
+            (self.near, london, 80),
+            (self.near, louisville, 40),
+            (self.far, lexington, 80),
+        ]
+        ResourceServiceArea.objects.bulk_create([
+            ResourceServiceArea(
+                resource=resource,
+                coverage_area=area,
+                kind=area.kind,
+                specificity=specificity,
+                center_lat=centers[area][0],
+                center_lon=centers[area][1],
+            )
+            for resource, area, specificity in rows
+        ])
+
+    def test_minimum_distance_and_maximum_specificity(self):
+        """Test that each resource gets its nearest area and best specificity."""
+        results = {
+            r.pk: r for r in annotate_proximity(Resource.objects.all(), *self.origin)
+        }
+
+        self.assertEqual(len(results), 2)
+        self.assertAlmostEqual(results[self.near.pk].distance_miles, 0.0, places=3)
+        self.assertEqual(results[self.near.pk].specificity_score, 80)
+        self.assertEqual(results[self.near.pk].coverage_count, 2)
+        # London, KY to Lexington, KY is roughly 67 miles
+        self.assertAlmostEqual(results[self.far.pk].distance_miles, 67, delta=2)
+
+    def test_distance_bounds_apply_in_same_query(self):
+        """Test that distance bounds filter on the nearest distance in one query."""
+        with self.assertNumQueries(1):
+            nearby = list(
+                annotate_proximity(Resource.objects.all(), *self.origin, max_distance_miles=10)
+            )
+        self.assertEqual(nearby, [self.near])
+
+        distant = annotate_proximity(Resource.objects.all(), *self.origin, min_distance_miles=10)
+        self.assertEqual(list(distant), [self.far])
+
+    def test_areas_are_aggregated_once(self):
+        """Test that one grouped pass over the service areas feeds every value."""
+        ranked = annotate_proximity(
+            Resource.objects.all(), *self.origin, min_distance_miles=1, max_distance_miles=100
+        ).order_by("-proximity_score")
+        sql = str(ranked.query)
+        self.assertEqual(sql.count('FROM "directory_resourceservicearea"'), 1)
+        self.assertEqual(sql.count("ASIN("), 1)
+        self.assertIsNone(ranked.query.group_by)
+        self.assertNotIn("HAVING", sql)
+        self.assertEqual(list(ranked), [self.far])
+
+    def test_resources_without_areas_and_nested_use(self):
+        """Test unserved resources, counting and use as a subquery."""
+        unserved = self.create_test_resource(name="Unserved Resource")
+        ranked = annotate_proximity(Resource.objects.all(), *self.origin)
+
+        row = ranked.get(pk=unserved.pk)
+        self.assertIsNone(row.distance_miles)
+        self.assertEqual((row.specificity_score, row.coverage_count), (0, 0))
+        self.assertEqual(ranked.count(), 3)
+
+        bounded = annotate_proximity(Resource.objects.all(), *self.origin, max_distance_miles=10)
+        self.assertEqual(list(Resource.objects.filter(pk__in=bounded.values("pk"))), [self.near])
+
+
+class EligibilityTestCase(BaseTestCase):
+    """Test cases for batch location eligibility."""
+
+    def test_eligibility_queries_do_not_grow_with_results(self):
+        """Test that checking many resources costs a constant number of queries."""
+        for index in range(5):
+            self.create_test_resource(name=f"Resource {index}")
+
+        with self.assertNumQueries(1):
+            eligibility = Resource.objects.check_location_eligibility(37.1289, -84.0833)
+
+        self.assertEqual(eligibility['total_nearby'], 5)
+        self.assertEqual(eligibility['total_serving'], 0)
@@ -3,7 +3,9 @@ Tests for version control functionality.
 """
 
 from django.contrib.auth.models import Group, User
-from django.test import TestCase
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 
 from directory.models import Resource, ResourceVersion, ServiceType, TaxonomyCategory
 from directory.utils import compare_versions
@@ -123,6 +125,95 @@ class VersionTestCase(TestCase):
         self.assertEqual(snapshot["phone"], "5551234567")  # Normalized phone number
         self.assertEqual(snapshot["status"], "draft")
 
+    def test_update_stores_changed_fields_only(self):
+        """Test that updates record the real changed fields as a delta."""
+        resource = Resource.objects.create(
+            name="Test Resource",
+            phone="5551234567",
+            status="draft",
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        resource = Resource.objects.get(pk=resource.pk)
+        resource.city = "London"
+        resource.save()
+
+        version = ResourceVersion.objects.get(resource=resource, version_number=2)
+        self.assertFalse(version.is_full_snapshot)
+        self.assertEqual(version.changed_field_list, ["city"])
+        self.assertEqual(set(version.delta), {"city", "updated_at"})
+        self.assertEqual(version.snapshot["city"], "London")
+        self.assertEqual(version.snapshot["name"], "Test Resource")
+
+    def test_update_does_not_query_latest_version(self):
+        """Test that a save creates its version without looking up the latest one."""
+        resource = Resource.objects.create(
+            name="Test Resource",
+            phone="5551234567",
+            status="draft",
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        resource.name = "Renamed"
+        with CaptureQueriesContext(connection) as queries:
+            resource.save()
+
+        version_reads = [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith("SELECT") and "directory_resourceversion" in query["sql"]
+        ]
+        self.assertEqual(version_reads, [])
+        self.assertEqual(resource.current_version, 2)
+
+    @override_settings(VERSION_SNAPSHOT_INTERVAL=3)
+    def test_snapshot_reconstruction(self):
+        """Test that every version can be rebuilt from deltas and snapshots."""
+        resource = Resource.objects.create(
+            name="Name 0",
+            phone="5551234567",
+            status="draft",
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        for i in range(1, 7):
+            resource.name = f"Name {i}"
+            if i == 2:
+                resource.city = "London"
+            resource.save()
+
+        versions = ResourceVersion.objects.filter(resource=resource).order_by("version_number")
+        self.assertEqual(
+            [version.is_full_snapshot for version in versions],
+            [True, False, False, True, False, False, True],
+        )
+        for i, version in enumerate(versions):
+            snapshot = version.snapshot
+            self.assertEqual(snapshot["name"], f"Name {i}")
+            self.assertEqual(snapshot["city"], "London" if i >= 2 else "")
+            self.assertEqual(snapshot["phone"], "5551234567")
+
+    def test_stale_instance_records_full_snapshot(self):
+        """Test that saving a stale copy still gets the next version number."""
+        resource = Resource.objects.create(
+            name="Test Resource",
+            phone="5551234567",
+            status="draft",
+            created_by=self.user,
+            updated_by=self.user,
+        )
+        stale = Resource.objects.get(pk=resource.pk)
+        resource.name = "First Edit"
+        resource.save()
+
+        stale.city = "London"
+        stale.save()
+
+        version = ResourceVersion.objects.get(resource=resource, version_number=3)
+        self.assertTrue(version.is_full_snapshot)
+        self.assertEqual(version.snapshot["city"], "London")
+        self.assertEqual(Resource.objects.get(pk=resource.pk).current_version, 3)
+
     def test_version_comparison_utility(self):
         """Test the compare_versions utility function."""
         snapshot1 = {
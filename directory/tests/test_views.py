@@ -6,11 +6,14 @@ import unittest
 from datetime import timedelta
 
 from django.contrib.auth.models import Group, User
+from django.core.cache import cache
+from django.db import connection
 from django.test import Client, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
-from directory.models import Resource, ServiceType, TaxonomyCategory
+from directory.models import LocationSearchLog, Resource, ServiceType, TaxonomyCategory
 
 
 class BaseTestCase(TestCase):
@@ -59,19 +62,22 @@ class BaseTestCase(TestCase):
         cls.reviewer.groups.add(cls.reviewer_group)
         cls.admin.groups.add(cls.admin_group)
 
-        # Create categories and service types
-        cls.category = TaxonomyCategory.objects.create(
-            name="Test Category", slug="test-category"
-        )
-        
-        cls.service_type = ServiceType.objects.create(
-            name="Test Service", slug="test-service"
-        )
+        # Create categories and service types, running the cache
+        # invalidation they schedule so it does not absorb later changes
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.category = TaxonomyCategory.objects.create(
+                name="Test Category", slug="test-category"
+            )
+
+            cls.service_type = ServiceType.objects.create(
+                name="Test Service", slug="test-service"
+            )
 
     def setUp(self):
         """Set up test-specific data (runs for each test)."""
-        # Any test-specific setup can go here
-        pass
+        # Directory caches are versioned by a generation that each test
+        # rolls back, so start every test from an empty cache
+        cache.clear()
 
     def create_test_resource(self, **kwargs):
         """Helper function to create a valid test resource."""
@@ -496,3 +502,72 @@ class ViewTestCase(BaseTestCase):
         
         # Updated_by should be set to the editor
         self.assertEqual(published_resource.updated_by, self.editor)
+
+
+class PublicPageCachingTestCase(BaseTestCase):
+    """Test cases for conditional requests and caching of public pages."""
+
+    def test_unchanged_page_returns_304(self):
+        """Test that a repeated request with the ETag gets a 304."""
+        resource = self.create_test_resource(name="Night Shelter", status="published")
+        url = reverse("directory:public_resource_detail", args=[resource.pk])
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("no-cache", response["Cache-Control"])
+        etag = response["ETag"]
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_generation_is_read_once_per_request(self):
+        """Test that the ETag, cache keys and facets share one generation read."""
+        self.create_test_resource(name="Night Shelter", status="published")
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("directory:public_resource_list"), {"q": "shelter"})
+        self.assertEqual(response.status_code, 200)
+        reads = [query for query in queries if "directory_directorygeneration" in query["sql"]]
+        self.assertEqual(len(reads), 1)
+
+    def test_cached_list_page_runs_no_list_queries(self):
+        """Test that a fragment-cache hit skips the page, sidebar and facet queries."""
+        self.create_test_resource(name="Night Shelter", status="published")
+        url = reverse("directory:public_resource_list")
+        self.assertContains(self.client.get(url, {"q": "shelter"}), "Night Shelter")
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {"q": "shelter"})
+        self.assertContains(response, "Night Shelter")
+        self.assertEqual([query["sql"] for query in queries
+                          if "directory_directorygeneration" not in query["sql"]], [])
+
+    def test_location_search_is_logged_when_not_modified(self):
+        """Test that a 304 response still records the location search."""
+        self.create_test_resource(name="Night Shelter", city="London", status="published")
+        url = reverse("directory:public_resource_list")
+        etag = self.client.get(url, {"address": "London"})["ETag"]
+
+        response = self.client.get(url, {"address": "London"}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        logs = LocationSearchLog.objects.filter(address="London")
+        self.assertEqual([log.results_count for log in logs], [1, 1])
+
+    def test_changes_expire_etag_and_cached_content(self):
+        """Test that a resource or taxonomy change shows on the next request."""
+        with self.captureOnCommitCallbacks(execute=True):
+            resource = self.create_test_resource(name="Night Shelter", status="published")
+        url = reverse("directory:public_resource_detail", args=[resource.pk])
+        etag = self.client.get(url)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            resource.name = "Day Shelter"
+            resource.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Day Shelter")
+
+        etag = response["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.category.name = "Renamed Category"
+            self.category.save()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
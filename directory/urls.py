@@ -31,6 +31,7 @@ from .views import (
     # API views
     AreaSearchView,
     LocationSearchView,
+    LocationSuggestionsView,
     ResourceAreaManagementView,
     ResourceEligibilityView,
     ReverseGeocodingView,
@@ -117,6 +118,7 @@ urlpatterns = [
     path("api/areas/search/", AreaSearchView.as_view(), name="api_area_search"),
     path("api/areas/<int:area_id>/preview/", AreaSearchView.as_view(), name="api_area_preview"),
     path("api/search/by-location/", LocationSearchView.as_view(), name="api_location_search"),
+    path("api/search/suggestions/", LocationSuggestionsView.as_view(), name="api_location_suggestions"),
     path("api/geocode/reverse/", ReverseGeocodingView.as_view(), name="api_reverse_geocode"),
     path("api/location/states-counties/", StateCountyView.as_view(), name="api_states_counties"),
     path("api/resources/<int:resource_id>/areas/", ResourceAreaManagementView.as_view(), name="api_resource_areas"),
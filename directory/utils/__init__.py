@@ -6,7 +6,9 @@ export utilities, version comparison, formatting, and other helper functions.
 
 Modules:
     - geometry: Geometry processing utilities for coverage areas
-    - export_utils: Data export and CSV generation functions
+    - geodesy: Meter-correct distances, buffers and measurements for WGS84
+      geometries
+    - export_utils: Data export (CSV, NDJSON, Parquet) functions
     - version_utils: Version comparison and diff generation functions
     - formatting_utils: Text formatting and display value functions
     - duplicate_utils: Duplicate detection and resolution utilities
@@ -40,7 +42,12 @@ else:
     def optimize_for_display(*args, **kwargs):
         return None
 
-from .export_utils import export_resources_to_csv
+from .export_utils import (
+    export_resources_to_csv,
+    export_resources_to_parquet,
+    stream_resources_csv,
+    stream_resources_ndjson,
+)
 from .version_utils import compare_versions, generate_diff_html
 from .formatting_utils import escape_html, format_field_name, get_field_display_value
 from .data_quality import (
@@ -58,6 +65,9 @@ __all__ = [
     "validate_coverage_geometry",
     "optimize_for_display",
     "export_resources_to_csv",
+    "stream_resources_csv",
+    "stream_resources_ndjson",
+    "export_resources_to_parquet",
     "compare_versions",
     "generate_diff_html",
     "escape_html",
@@ -0,0 +1,177 @@
+"""Geodesic distance, buffer and measurement utilities.
+
+Coverage-area geometries are stored in WGS84 (SRID 4326), whose units are
+degrees. GEOS operations on them (``buffer``, ``distance``, ``area``,
+``length``) therefore return degrees, not meters, and one degree of
+longitude shrinks with latitude. This module provides meter-correct
+versions of those operations:
+
+- Projected operations run in a local azimuthal equidistant (AEQD)
+  projection centered on a small region around the geometry. The
+  transforms are built once per region and cached, and distortion within
+  a region is well under 0.1% at coverage-area scales.
+- Point-to-point distances use the haversine formula, with a vectorized
+  path (numpy when installed) for many points at once.
+
+Features:
+    - Geodesic buffers for radius-based coverage areas
+    - Point-to-geometry distances in meters
+    - Area and perimeter in square meters / meters
+    - Vectorized haversine for center-to-point distances
+
+Author: Resource Directory Team
+Created: 2025-01-15
+Version: 1.0.0
+"""
+
+import logging
+import math
+from functools import lru_cache
+from typing import Any, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+logger = logging.getLogger(__name__)
+
+METERS_PER_MILE = 1609.34
+
+# Mean Earth radius (IUGG) in meters
+EARTH_RADIUS_M = 6371008.8
+
+# Size (degrees) of the grid cells that share one cached projection
+REGION_DEGREES = 0.5
+
+AEQD_PROJ4 = (
+    "+proj=aeqd +lat_0={lat} +lon_0={lon} +x_0=0 +y_0=0 "
+    "+datum=WGS84 +units=m +no_defs"
+)
+
+
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Return the great-circle distance in meters between two points."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    half_dphi = (phi2 - phi1) / 2
+    half_dlambda = math.radians(lon2 - lon1) / 2
+    a = math.sin(half_dphi) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(half_dlambda) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+
+
+def haversine_many(
+    lat: float,
+    lon: float,
+    lats: Sequence[float],
+    lons: Sequence[float],
+) -> List[float]:
+    """Return distances in meters from one point to many points.
+
+    Uses numpy when it is installed and a plain loop otherwise.
+
+    Args:
+        lat: Latitude of the origin
+        lon: Longitude of the origin
+        lats: Latitudes of the destinations
+        lons: Longitudes of the destinations (same length as ``lats``)
+
+    Returns:
+        List of distances in meters, in input order
+    """
+    if np is None:
+        return [haversine_m(lat, lon, other_lat, other_lon) for other_lat, other_lon in zip(lats, lons)]
+
+    phi1 = math.radians(lat)
+    phi2 = np.radians(np.asarray(lats, dtype=float))
+    half_dphi = (phi2 - phi1) / 2
+    half_dlambda = np.radians(np.asarray(lons, dtype=float) - lon) / 2
+    a = np.sin(half_dphi) ** 2 + math.cos(phi1) * np.cos(phi2) * np.sin(half_dlambda) ** 2
+    return (2 * EARTH_RADIUS_M * np.arcsin(np.minimum(1.0, np.sqrt(a)))).tolist()
+
+
+def region_center(lat: float, lon: float) -> Tuple[float, float]:
+    """Return the center of the projection region containing a point."""
+    def snap(value: float) -> float:
+        return (math.floor(value / REGION_DEGREES) + 0.5) * REGION_DEGREES
+
+    return snap(lat), snap(lon)
+
+
+@lru_cache(maxsize=256)
+def _region_transforms(lat: float, lon: float) -> Tuple[Any, Any]:
+    """Build (to_local, to_wgs84) transforms for the AEQD centered on a point."""
+    from django.contrib.gis.gdal import CoordTransform, SpatialReference
+
+    wgs84 = SpatialReference(4326)
+    local = SpatialReference(AEQD_PROJ4.format(lat=lat, lon=lon))
+    return CoordTransform(wgs84, local), CoordTransform(local, wgs84)
+
+
+def local_transforms(lat: float, lon: float) -> Tuple[Any, Any]:
+    """Return cached transforms between WGS84 and the local projection.
+
+    Args:
+        lat: Latitude of a point in the region of interest
+        lon: Longitude of a point in the region of interest
+
+    Returns:
+        Tuple of (WGS84 → local meters, local meters → WGS84) CoordTransforms
+    """
+    return _region_transforms(*region_center(lat, lon))
+
+
+def _to_local(geometry: Any, lat: float, lon: float) -> Any:
+    """Return a copy of a WGS84 geometry projected to the local AEQD."""
+    to_local, _ = local_transforms(lat, lon)
+    projected = geometry.clone()
+    if projected.srid is None:
+        projected.srid = 4326
+    projected.transform(to_local)
+    return projected
+
+
+def geodesic_buffer(center: Any, radius_m: float, quadsegs: int = 16) -> Any:
+    """Return a polygon of all points within ``radius_m`` meters of ``center``.
+
+    Args:
+        center: GEOS Point in WGS84
+        radius_m: Radius in meters
+        quadsegs: Segments per quarter circle
+
+    Returns:
+        GEOS Polygon in WGS84 (SRID 4326)
+    """
+    _, to_wgs84 = local_transforms(center.y, center.x)
+    circle = _to_local(center, center.y, center.x).buffer(radius_m, quadsegs)
+    circle.transform(to_wgs84)
+    circle.srid = 4326
+    return circle
+
+
+def distance_to_geometry_m(geometry: Any, lat: float, lon: float) -> float:
+    """Return the distance in meters from a point to a WGS84 geometry.
+
+    Args:
+        geometry: GEOS geometry in WGS84
+        lat: Latitude of the point
+        lon: Longitude of the point
+
+    Returns:
+        float: Distance in meters (0 when the geometry contains the point)
+    """
+    from django.contrib.gis.geos import Point
+
+    point = Point(lon, lat, srid=4326)
+    return _to_local(geometry, lat, lon).distance(_to_local(point, lat, lon))
+
+
+def geodesic_area_m2(geometry: Any) -> float:
+    """Return the area of a WGS84 geometry in square meters."""
+    centroid = geometry.centroid
+    return _to_local(geometry, centroid.y, centroid.x).area
+
+
+def geodesic_length_m(geometry: Any) -> float:
+    """Return the length (perimeter for polygons) of a WGS84 geometry in meters."""
+    centroid = geometry.centroid
+    return _to_local(geometry, centroid.y, centroid.x).length
@@ -56,6 +56,7 @@ from .public_views import (
 from .api_views import (
     AreaSearchView,
     LocationSearchView,
+    LocationSuggestionsView,
     ResourceAreaManagementView,
     ResourceEligibilityView,
     ReverseGeocodingView,
@@ -95,6 +96,7 @@ __all__ = [
     # API views
     "AreaSearchView",
     "LocationSearchView",
+    "LocationSuggestionsView",
     "ResourceAreaManagementView",
     "ResourceEligibilityView",
     "ReverseGeocodingView",
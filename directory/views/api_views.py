@@ -9,6 +9,7 @@ coverage association.
 Key Views:
     - AreaSearchView: Search coverage areas by kind and name
     - RadiusCreationView: Create radius-based coverage areas
+    - LocationSuggestionsView: Location autocomplete from an in-memory prefix index
     - PolygonCreationView: Create custom polygon coverage areas
     - ResourceAreaManagementView: Manage resource-coverage associations
 
@@ -41,6 +42,7 @@ Usage:
 """
 
 import json
+import logging
 from typing import Any, Dict, List, Optional
 
 from django.conf import settings
@@ -54,8 +56,11 @@ from django.views.decorators.http import require_http_methods
 from django.views.generic import View
 
 from ..models import CoverageArea, Resource
+from ..services.eligibility import check_eligibility
 from ..services.geocoding import GeocodingResult
 
+logger = logging.getLogger(__name__)
+
 
 @method_decorator(csrf_exempt, name='dispatch')
 class AreaSearchView(View):
@@ -332,8 +337,10 @@ class AreaSearchView(View):
             float: Area in square miles
         """
         try:
-            # Calculate area in square meters
-            area_sq_meters = geometry.area
+            from ..utils.geodesy import geodesic_area_m2
+
+            # Calculate area in square meters (geometry is in degrees)
+            area_sq_meters = geodesic_area_m2(geometry)
             
             # Convert to square miles (1 sq mile = 2,589,988.11 sq meters)
             area_sq_miles = area_sq_meters / 2589988.11
@@ -595,6 +602,7 @@ class AreaSearchView(View):
             try:
                 from django.contrib.gis.geos import Point
                 from django.contrib.gis.geos import GEOSGeometry
+                from ..utils.geodesy import geodesic_buffer
                 
                 # Create center point
                 center_point = Point(lon, lat, srid=4326)
@@ -603,12 +611,12 @@ class AreaSearchView(View):
                 radius_meters = radius_miles * 1609.34
                 
                 # Create buffer polygon
-                buffer_polygon = center_point.buffer(radius_meters / 111320.0)  # Approximate degrees
+                buffer_polygon = geodesic_buffer(center_point, radius_meters)
                 
                 # Convert to MultiPolygon if needed
                 if buffer_polygon.geom_type == 'Polygon':
                     from django.contrib.gis.geos import MultiPolygon
-                    buffer_polygon = MultiPolygon([buffer_polygon])
+                    buffer_polygon = MultiPolygon([buffer_polygon], srid=4326)
                 
                 # Get or create default user for API operations
                 from django.contrib.auth.models import User
@@ -1022,59 +1030,79 @@ class LocationSearchView(View):
         Returns:
             List of suggestion dictionaries with address and type
         """
-        suggestions = []
-        
         try:
-            # Get popular cities from the database
-            from ..models import Resource
-            cities = Resource.objects.filter(
-                city__icontains=query
-            ).values_list('city', 'state').distinct()[:5]
-            
-            for city, state in cities:
-                if city and state:
-                    suggestions.append({
-                        'address': f"{city}, {state}",
-                        'type': 'City'
-                    })
-            
-            # Add common Kentucky cities if query matches
-            kentucky_cities = [
-                'London', 'Lexington', 'Louisville', 'Bowling Green', 
-                'Owensboro', 'Covington', 'Richmond', 'Georgetown'
-            ]
-            
-            for city in kentucky_cities:
-                if query.lower() in city.lower():
-                    suggestions.append({
-                        'address': f"{city}, KY",
-                        'type': 'City'
-                    })
-            
-            # Add state suggestions
-            states = ['Kentucky', 'Tennessee', 'Ohio', 'Indiana', 'West Virginia', 'Virginia']
-            for state in states:
-                if query.lower() in state.lower():
-                    suggestions.append({
-                        'address': state,
-                        'type': 'State'
-                    })
-            
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_suggestions = []
-            for suggestion in suggestions:
-                if suggestion['address'] not in seen:
-                    seen.add(suggestion['address'])
-                    unique_suggestions.append(suggestion)
-            
-            return unique_suggestions[:8]  # Limit to 8 suggestions
+            from ..services.suggestions import get_suggestion_index
+
+            return get_suggestion_index().suggest(query, limit=8)
             
         except Exception as e:
             logger.error(f"Error getting address suggestions: {e}")
             return []
 
 
+@method_decorator(csrf_exempt, name='dispatch')
+class LocationSuggestionsView(View):
+    """API view for location autocomplete suggestions.
+    
+    Answers from the in-memory prefix index of cities, coverage areas and
+    ZIP codes (see directory.services.suggestions), so a keystroke never
+    reaches the database. Responses are cacheable by browsers and proxies
+    for SUGGESTION_CACHE_SECONDS.
+    
+    Endpoint: GET /api/search/suggestions/
+    
+    Query Parameters:
+        - q: Text typed so far (required)
+        - limit: Maximum number of suggestions (default: 8, max: 20)
+        
+    Response Format:
+        {
+            "query": "lon",
+            "suggestions": [
+                {"address": "London, KY", "type": "City"}
+            ]
+        }
+    """
+    
+    MAX_LIMIT = 20
+    
+    def get(self, request: HttpRequest) -> JsonResponse:
+        """Handle GET requests for location suggestions.
+        
+        Args:
+            request: HTTP request object
+            
+        Returns:
+            JsonResponse: JSON response with matching suggestions
+        """
+        from django.utils.cache import patch_cache_control
+
+        from ..services.suggestions import get_suggestion_index
+
+        query = request.GET.get('q', '').strip()
+        try:
+            limit = min(max(int(request.GET.get('limit', 8)), 1), self.MAX_LIMIT)
+        except ValueError:
+            return JsonResponse({'error': 'limit must be a number'}, status=400)
+        
+        try:
+            suggestions = get_suggestion_index().suggest(query, limit=limit) if query else []
+        except Exception as e:
+            logger.error(f"Error getting location suggestions: {e}")
+            return JsonResponse(
+                {'error': f'Internal server error: {str(e)}'}, 
+                status=500
+            )
+        
+        response = JsonResponse({'query': query, 'suggestions': suggestions})
+        patch_cache_control(
+            response,
+            public=True,
+            max_age=getattr(settings, 'SUGGESTION_CACHE_SECONDS', 300),
+        )
+        return response
+
+
 @method_decorator(csrf_exempt, name='dispatch')
 class ResourceAreaManagementView(View):
     """API view for managing resource-coverage area associations.
@@ -1360,6 +1388,7 @@ class ResourceEligibilityView(View):
             "serves_location": true,
             "distance_miles": 2.5,
             "eligibility_reason": "Location is within Laurel County (COUNTY)",
+            "closest_area": {"id": 156, "name": "Laurel County", ...},
             "coverage_areas": [
                 {
                     "id": 156,
@@ -1421,8 +1450,12 @@ class ResourceEligibilityView(View):
                 )
             
             # Calculate eligibility information
-            eligibility_info = Resource.objects.calculate_resource_distance(
-                resource_id, lat, lon
+            eligibility_info = {
+                'resource_id': resource.id,
+                'resource_name': resource.name,
+            }
+            eligibility_info.update(
+                check_eligibility(lat, lon, [resource.id])[resource.id]
             )
             
             # Add address information if provided
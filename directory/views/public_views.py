@@ -13,11 +13,14 @@ Key Views:
 
 Features:
     - Public access without authentication requirements
-    - Full-text search using SQLite FTS5 with fallback
+    - Full-text search using the database full-text index
+    - Cached result sets so paging does not re-run searches
     - Advanced filtering by category, service type, location, and operational characteristics
     - Resource organization and statistics
     - Related resource suggestions
     - Optimized database queries for performance
+    - ETag/Last-Modified revalidation and rendered-fragment caching keyed on
+      the directory generation
 
 Author: Resource Directory Team
 Created: 2024
@@ -40,20 +43,76 @@ Usage:
 """
 
 import logging
+import time
+from datetime import datetime
+from functools import wraps
+from typing import Callable, Optional
 
 from django.conf import settings
 from django.contrib.auth import logout
 from django.core.paginator import Paginator
 from django.db import models
 from django.db.models import Q
-from django.http import HttpRequest, HttpResponse
+from django.http import HttpRequest, HttpResponse, QueryDict
 from django.shortcuts import get_object_or_404, redirect, render
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.functional import SimpleLazyObject
+from django.views.decorators.http import condition
 
-from ..models import Resource, ServiceType, TaxonomyCategory
+from ..models import LocationSearchLog, Resource, ServiceType, TaxonomyCategory
+from ..services.facets import get_published_facets, get_result_set_facets
+from ..services.related_resources import related_resources_for
+from ..services.result_sets import ResultSet, get_generation, get_generation_changed_at
 
 logger = logging.getLogger(__name__)
 
 
+def _public_etag(request: HttpRequest, *args, **kwargs) -> str:
+    """ETag of a public page: the directory generation and the viewer.
+    
+    The viewer is part of the tag because the navigation bar differs for
+    signed-in users.
+    """
+    return f'"{get_generation()}-{request.user.pk or 0}"'
+
+
+def _public_last_modified(request: HttpRequest, *args, **kwargs) -> Optional[datetime]:
+    """Last-Modified of a public page: when directory data last changed."""
+    return get_generation_changed_at()
+
+
+def public_page(view_func: Callable) -> Callable:
+    """Serve a public page conditionally on the directory generation.
+    
+    Clients revalidate on every request (``Cache-Control: no-cache``) and get
+    a 304 without the view running while no resource, coverage link or
+    taxonomy entry has changed. Rendered page content is fragment-cached in
+    the templates under the same generation (see ``_page_cache_context``).
+    """
+    conditional_view = condition(
+        etag_func=_public_etag,
+        last_modified_func=_public_last_modified,
+    )(view_func)
+    
+    @wraps(view_func)
+    def wrapper(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        response = conditional_view(request, *args, **kwargs)
+        patch_cache_control(response, no_cache=True)
+        patch_vary_headers(response, ("Cookie",))
+        return response
+    
+    return wrapper
+
+
+def _page_cache_context() -> dict:
+    """Template variables used to key rendered-fragment caches."""
+    return {
+        'cache_generation': get_generation(),
+        'cache_seconds': getattr(settings, 'PUBLIC_PAGE_CACHE_SECONDS', 600),
+    }
+
+
+@public_page
 def public_home(request: HttpRequest) -> HttpResponse:
     """Public home page showing resources organized by category and service type.
     
@@ -67,7 +126,7 @@ def public_home(request: HttpRequest) -> HttpResponse:
         - Resource organization by category and service type
         - Comprehensive statistics and counts
         - Emergency and 24-hour service highlighting
-        - Optimized database queries with select_related and prefetch_related
+        - Facet counts from two grouped queries, cached until resources change
         
     Template Context:
         - categories: All categories with published resources
@@ -84,105 +143,42 @@ def public_home(request: HttpRequest) -> HttpResponse:
     Example:
         GET / -> Display public home page with resource statistics
     """
-    # Get all published, non-archived resources
-    resources = Resource.objects.filter(
-        status="published", 
-        is_deleted=False, 
-        is_archived=False
-    ).select_related('category').prefetch_related('service_types')
+    # All counts come from two grouped queries, cached until resources change
+    facets = get_published_facets()
     
-    # Get all categories with published resources
     categories = TaxonomyCategory.objects.filter(
-        resources__status="published",
-        resources__is_deleted=False,
-        resources__is_archived=False
-    ).distinct().order_by('name')
-    
-    # Get all service types with published resources
+        id__in=list(facets['categories'])
+    ).order_by('name')
     service_types = ServiceType.objects.filter(
-        resources__status="published",
-        resources__is_deleted=False,
-        resources__is_archived=False
-    ).distinct().order_by('name')
-    
-    # Count resources by category
-    category_counts = {}
-    for category in categories:
-        category_counts[category.id] = resources.filter(category=category).count()
-    
-    # Count resources by service type
-    service_type_counts = {}
-    for service_type in service_types:
-        service_type_counts[service_type.id] = resources.filter(service_types=service_type).count()
-    
-    # Get emergency services count
-    emergency_count = resources.filter(is_emergency_service=True).count()
-    
-    # Get 24-hour services count
-    twenty_four_hour_count = resources.filter(is_24_hour_service=True).count()
+        id__in=list(facets['service_types'])
+    ).order_by('name')
     
     context = {
         'categories': categories,
         'service_types': service_types,
-        'category_counts': category_counts,
-        'service_type_counts': service_type_counts,
-        'emergency_count': emergency_count,
-        'twenty_four_hour_count': twenty_four_hour_count,
-        'total_resources': resources.count(),
+        'category_counts': facets['categories'],
+        'service_type_counts': facets['service_types'],
+        'emergency_count': facets['emergency'],
+        'twenty_four_hour_count': facets['twenty_four_hour'],
+        'total_resources': facets['total'],
+        **_page_cache_context(),
     }
     
     return render(request, 'directory/public_home.html', context)
 
 
-def public_resource_list(request: HttpRequest) -> HttpResponse:
-    """Public resource list view with comprehensive filtering and search capabilities.
+def _public_resource_queryset(params: QueryDict) -> models.QuerySet:
+    """Build the filtered, sorted queryset behind public_resource_list.
     
-    This view provides a public-facing list of published resources with advanced
-    search, filtering, and sorting capabilities. It allows non-authenticated users
-    to discover and browse available services based on various criteria.
+    This runs the expensive parts of the public listing (full-text search,
+    spatial filtering and proximity ranking). The view only calls it when no
+    cached result set exists for the same parameters.
     
-    Features:
-        - Public access without authentication
-        - Full-text search using SQLite FTS5 with fallback
-        - Multiple filter options (category, service type, location, operational)
-        - Sorting by various fields
-        - Pagination for large result sets
-        - Optimized database queries
-        - Comprehensive filter options in sidebar
-        
-    URL Parameters:
-        - q: Search query string
-        - category: Filter by taxonomy category ID
-        - service_type: Filter by service type ID
-        - city: Filter by city name (case-insensitive)
-        - state: Filter by state code (case-insensitive)
-        - emergency: Filter by emergency service status (true/false)
-        - 24hour: Filter by 24-hour service status (true/false)
-        - sort: Sort order (name, city, category, emergency)
-        - page: Page number for pagination
-        
-    Template Context:
-        - page_obj: Paginated queryset of filtered resources
-        - search_query: Current search query
-        - category_filter: Current category filter
-        - service_type_filter: Current service type filter
-        - city_filter: Current city filter
-        - state_filter: Current state filter
-        - emergency_filter: Current emergency filter
-        - twenty_four_hour_filter: Current 24-hour filter
-        - sort_by: Current sort order
-        - categories: All categories with published resources
-        - service_types: All service types with published resources
-        - categories_dict: Dictionary mapping category IDs to names
-        - service_types_dict: Dictionary mapping service type IDs to names
-        - cities: List of unique cities with published resources
-        - states: List of unique states with published resources
+    Args:
+        params: The request's GET parameters
         
     Returns:
-        HttpResponse: Rendered public resource list template with filtered data
-        
-    Example:
-        GET /resources/public/?q=mental+health&category=1&sort=name&page=2
+        QuerySet: Published resources matching the parameters, in display order
     """
     # Start with published, non-archived resources
     queryset = Resource.objects.filter(
@@ -192,7 +188,7 @@ def public_resource_list(request: HttpRequest) -> HttpResponse:
     ).select_related('category').prefetch_related('service_types', 'coverage_areas')
     
     # Search functionality
-    search_query = request.GET.get("q", "").strip()
+    search_query = params.get("q", "").strip()
     if search_query:
         search_results = Resource.objects.search_combined(search_query)
         if search_results.exists():
@@ -210,29 +206,29 @@ def public_resource_list(request: HttpRequest) -> HttpResponse:
             )
     
     # Filter by category
-    category_filter = request.GET.get("category", "")
+    category_filter = params.get("category", "")
     if category_filter:
         queryset = queryset.filter(category_id=category_filter)
     
     # Filter by service type
-    service_type_filter = request.GET.get("service_type", "")
+    service_type_filter = params.get("service_type", "")
     if service_type_filter:
         queryset = queryset.filter(service_types__id=service_type_filter)
     
     # Filter by city
-    city_filter = request.GET.get("city", "")
+    city_filter = params.get("city", "")
     if city_filter:
         queryset = queryset.filter(city__icontains=city_filter)
     
     # Filter by state
-    state_filter = request.GET.get("state", "")
+    state_filter = params.get("state", "")
     if state_filter:
         queryset = queryset.filter(state__icontains=state_filter)
     
     # Filter by state FIPS code and county ID (from our new dropdowns)
-    state_fips_filter = request.GET.get("state_fips", "")
-    county_id_filter = request.GET.get("county_id", "")
-    include_national = request.GET.get("include_national", "1") == "1"  # Default to True
+    state_fips_filter = params.get("state_fips", "")
+    county_id_filter = params.get("county_id", "")
+    include_national = params.get("include_national", "1") == "1"  # Default to True
     
     if state_fips_filter or county_id_filter:
         # Filter by coverage areas matching the selected state/county
@@ -254,85 +250,35 @@ def public_resource_list(request: HttpRequest) -> HttpResponse:
             queryset = queryset.filter(coverage_filters).exclude(coverage_areas__id=7855).distinct()
     
     # Location-based filtering
-    address_filter = request.GET.get("address", "").strip()
-    lat_filter = request.GET.get("lat", "")
-    lon_filter = request.GET.get("lon", "")
-    radius_miles = request.GET.get("radius_miles", "10.0")
-    
-    # Distance-based filtering (will be applied after spatial filtering)
-    max_distance_filter = request.GET.get("max_distance", "")
-    min_distance_filter = request.GET.get("min_distance", "")
+    address_filter = params.get("address", "").strip()
+    lat_filter = params.get("lat", "")
+    lon_filter = params.get("lon", "")
+    radius_miles = params.get("radius_miles", "10.0")
     
-    # Store distance filters for later use
-    distance_filters = {
-        'max_distance': max_distance_filter,
-        'min_distance': min_distance_filter
-    }
+    # Distance bounds, applied in the same pass as proximity ranking
+    max_distance_filter = params.get("max_distance", "")
+    min_distance_filter = params.get("min_distance", "")
+    distance_bounds = {}
     
-    # Log search for analytics (if address is provided)
-    if address_filter:
-        import time
-        start_time = time.time()
-        
-        # Get user info for analytics
-        user = request.user if request.user.is_authenticated else None
-        ip_address = request.META.get('REMOTE_ADDR')
-        user_agent = request.META.get('HTTP_USER_AGENT', '')
-        
-        # We'll log the search after we get the results
-        search_start_time = start_time
-
     if address_filter and lat_filter and lon_filter:
             # Use spatial filtering when coordinates are available
             try:
-                # Use proximity-based filtering for better ranking
-                spatial_queryset = Resource.objects.filter_by_location_with_proximity(
-                    lat=float(lat_filter),
-                    lon=float(lon_filter),
-                    radius_miles=float(radius_miles) if radius_miles else None,
-                    sort_by_proximity=True
+                # Match resources serving the point as part of this query
+                queryset = queryset.filter(
+                    Resource.objects.location_filter(
+                        lat=float(lat_filter),
+                        lon=float(lon_filter),
+                        radius_miles=float(radius_miles) if radius_miles else None,
+                    )
                 )
-                # Combine with existing filters
-                spatial_ids = list(spatial_queryset.values_list('pk', flat=True))
-                if spatial_ids:
-                    queryset = queryset.filter(pk__in=spatial_ids)
-                    
-                    # Apply distance filtering after spatial filtering
-                    if distance_filters['max_distance'] or distance_filters['min_distance']:
-                        try:
-                            # Re-apply spatial filtering with distance constraints
-                            spatial_queryset = Resource.objects.filter_by_location_with_proximity(
-                                lat=float(lat_filter),
-                                lon=float(lon_filter),
-                                radius_miles=float(radius_miles) if radius_miles else None,
-                                sort_by_proximity=True
-                            )
-                            
-                            # Apply distance filters
-                            if distance_filters['max_distance']:
-                                spatial_queryset = spatial_queryset.filter(distance_miles__lte=float(distance_filters['max_distance']))
-                            if distance_filters['min_distance']:
-                                spatial_queryset = spatial_queryset.filter(distance_miles__gte=float(distance_filters['min_distance']))
-                            
-                            # Update queryset with distance-filtered results
-                            distance_filtered_ids = list(spatial_queryset.values_list('pk', flat=True))
-                            if distance_filtered_ids:
-                                queryset = queryset.filter(pk__in=distance_filtered_ids)
-                            else:
-                                queryset = Resource.objects.none()
-                        except (ValueError, TypeError) as e:
-                            logger.warning(f"Distance filtering failed: {e}")
-                    
-                    # Preserve spatial ordering when proximity-based sorting is requested
-                    if request.GET.get("sort") in ["distance", "proximity"]:
-                        from django.db.models import Case, When
-                        preserved = Case(
-                            *[When(pk=pk, then=pos) for pos, pk in enumerate(spatial_ids)]
-                        )
-                        queryset = queryset.order_by(preserved)
-                else:
-                    # No spatial results, return empty queryset
-                    queryset = Resource.objects.none()
+                
+                try:
+                    if max_distance_filter:
+                        distance_bounds['max_distance_miles'] = float(max_distance_filter)
+                    if min_distance_filter:
+                        distance_bounds['min_distance_miles'] = float(min_distance_filter)
+                except (ValueError, TypeError) as e:
+                    logger.warning(f"Distance filtering failed: {e}")
             except (ValueError, TypeError) as e:
                 # Fallback to text-based search if spatial filtering fails
                 logger.warning(f"Spatial filtering failed for {address_filter}: {e}")
@@ -350,51 +296,56 @@ def public_resource_list(request: HttpRequest) -> HttpResponse:
             )
     
     # Filter by emergency services
-    emergency_filter = request.GET.get("emergency", "")
+    emergency_filter = params.get("emergency", "")
     if emergency_filter == "true":
         queryset = queryset.filter(is_emergency_service=True)
     elif emergency_filter == "false":
         queryset = queryset.filter(is_emergency_service=False)
     
     # Filter by 24-hour services
-    twenty_four_hour_filter = request.GET.get("24hour", "")
+    twenty_four_hour_filter = params.get("24hour", "")
     if twenty_four_hour_filter == "true":
         queryset = queryset.filter(is_24_hour_service=True)
     elif twenty_four_hour_filter == "false":
         queryset = queryset.filter(is_24_hour_service=False)
     
     # Advanced location filtering
-    coverage_area_type_filter = request.GET.get("coverage_area_type", "")
+    coverage_area_type_filter = params.get("coverage_area_type", "")
     if coverage_area_type_filter:
         queryset = queryset.filter(coverage_areas__kind=coverage_area_type_filter)
     
     # Enhanced Location-Based Result Ranking
-    sort_by = request.GET.get("sort", "name")
+    sort_by = params.get("sort", "name")
     
-    # Handle location-based sorting when coordinates are available
-    if (lat_filter and lon_filter) and sort_by in ["distance", "proximity", "coverage_specificity"]:
+    location_sort = sort_by in ["distance", "proximity", "coverage_specificity"]
+    
+    # Rank by proximity (and apply distance bounds) in one aggregate pass
+    ranked = False
+    if (lat_filter and lon_filter) and (location_sort or distance_bounds):
         try:
-            # Apply proximity ranking annotations
             queryset = Resource.objects.annotate_proximity_ranking(
-                queryset, float(lat_filter), float(lon_filter)
+                queryset, float(lat_filter), float(lon_filter), **distance_bounds
             )
-            
-            if sort_by == "proximity":
-                # Sort by proximity score (combines distance and coverage specificity)
-                queryset = queryset.order_by('-proximity_score', '-specificity_score', 'distance_miles', 'name')
-            elif sort_by == "distance":
-                # Sort by distance only
-                queryset = queryset.order_by('distance_miles', '-specificity_score', 'name')
-            elif sort_by == "coverage_specificity":
-                # Sort by coverage specificity first, then by proximity
-                queryset = queryset.order_by('-specificity_score', '-proximity_score', 'distance_miles', 'name')
-            
+            ranked = True
         except Exception as e:
             logger.warning(f"Proximity ranking failed: {e}")
-            # Fallback to basic coverage specificity sorting
-            queryset = queryset.annotate(
-                coverage_count=models.Count('coverage_areas')
-            ).order_by('-coverage_count', 'name')
+    
+    # Handle location-based sorting when coordinates are available
+    if ranked and location_sort:
+        if sort_by == "proximity":
+            # Sort by proximity score (combines distance and coverage specificity)
+            queryset = queryset.order_by('-proximity_score', '-specificity_score', 'distance_miles', 'name')
+        elif sort_by == "distance":
+            # Sort by distance only
+            queryset = queryset.order_by('distance_miles', '-specificity_score', 'name')
+        elif sort_by == "coverage_specificity":
+            # Sort by coverage specificity first, then by proximity
+            queryset = queryset.order_by('-specificity_score', '-proximity_score', 'distance_miles', 'name')
+    elif (lat_filter and lon_filter) and location_sort:
+        # Fallback to basic coverage specificity sorting
+        queryset = queryset.annotate(
+            coverage_count=models.Count('coverage_areas')
+        ).order_by('-coverage_count', 'name')
     
     # Handle non-location-based sorting or when coordinates are not available
     elif sort_by:
@@ -423,64 +374,171 @@ def public_resource_list(request: HttpRequest) -> HttpResponse:
             coverage_count=models.Count('coverage_areas')
         ).order_by('-coverage_count', 'name')
     
-    # Pagination
-    paginator = Paginator(queryset, 20)
-    page_number = request.GET.get("page")
-    page_obj = paginator.get_page(page_number)
+    return queryset
+
+
+def _public_result_set(request: HttpRequest) -> ResultSet:
+    """Return the ordered result set of a public list request, built once.
     
-    # Log search for analytics (if address was provided)
-    if address_filter and 'search_start_time' in locals():
-        import time
-        search_duration_ms = int((time.time() - search_start_time) * 1000)
-        results_count = paginator.count
+    Paging reuses the cached result set, so the search runs once per query.
+    """
+    if not hasattr(request, '_public_result_set'):
+        request._public_result_set = ResultSet.for_query(
+            "public_resource_list",
+            request.GET,
+            build=lambda: _public_resource_queryset(request.GET),
+            row_queryset=Resource.objects.filter(
+                status="published",
+                is_deleted=False,
+                is_archived=False
+            ).select_related('category').prefetch_related('service_types', 'coverage_areas'),
+            extra_fields=("distance_miles",),
+        )
+    return request._public_result_set
+
+
+def _log_location_search(request: HttpRequest, address: str, start_time: float) -> None:
+    """Record a public location search in ``LocationSearchLog``.
+    
+    Args:
+        request: The public list request
+        address: The searched address
+        start_time: When the request started (``time.time()``)
+    """
+    lat_filter = request.GET.get("lat", "")
+    lon_filter = request.GET.get("lon", "")
+    radius_miles = request.GET.get("radius_miles", "10.0")
+    results_count = _public_result_set(request).count()
+    
+    LocationSearchLog.log_search(
+        address=address,
+        lat=float(lat_filter) if lat_filter else None,
+        lon=float(lon_filter) if lon_filter else None,
+        radius_miles=float(radius_miles) if radius_miles else 10.0,
+        results_count=results_count,
+        search_duration_ms=int((time.time() - start_time) * 1000),
+        geocoding_success=bool(lat_filter and lon_filter),
+        user=request.user if request.user.is_authenticated else None,
+        ip_address=request.META.get('REMOTE_ADDR'),
+        user_agent=request.META.get('HTTP_USER_AGENT', '')
+    )
+
+
+def public_resource_list(request: HttpRequest) -> HttpResponse:
+    """Public resource list view with comprehensive filtering and search capabilities.
+    
+    This view provides a public-facing list of published resources with advanced
+    search, filtering, and sorting capabilities. It allows non-authenticated users
+    to discover and browse available services based on various criteria.
+    
+    Features:
+        - Public access without authentication
+        - Full-text search using the database full-text index
+        - Multiple filter options (category, service type, location, operational)
+        - Sorting by various fields
+        - Pagination over a cached result set (search runs once per query)
+        - Optimized database queries
+        - Comprehensive filter options in sidebar, with counts for the current results
         
-        # Determine geocoding success
-        geocoding_success = bool(lat_filter and lon_filter)
+    URL Parameters:
+        - q: Search query string
+        - category: Filter by taxonomy category ID
+        - service_type: Filter by service type ID
+        - city: Filter by city name (case-insensitive)
+        - state: Filter by state code (case-insensitive)
+        - emergency: Filter by emergency service status (true/false)
+        - 24hour: Filter by 24-hour service status (true/false)
+        - sort: Sort order (name, city, category, emergency)
+        - page: Page number for pagination
         
-        # Log the search
-        from ..models import LocationSearchLog
-        LocationSearchLog.log_search(
-            address=address_filter,
-            lat=float(lat_filter) if lat_filter else None,
-            lon=float(lon_filter) if lon_filter else None,
-            radius_miles=float(radius_miles) if radius_miles else 10.0,
-            results_count=results_count,
-            search_duration_ms=search_duration_ms,
-            geocoding_success=geocoding_success,
-            user=user,
-            ip_address=ip_address,
-            user_agent=user_agent
-        )
+    Template Context:
+        - page_obj: Paginated queryset of filtered resources
+        - search_query: Current search query
+        - category_filter: Current category filter
+        - service_type_filter: Current service type filter
+        - city_filter: Current city filter
+        - state_filter: Current state filter
+        - emergency_filter: Current emergency filter
+        - twenty_four_hour_filter: Current 24-hour filter
+        - sort_by: Current sort order
+        - categories: All categories with published resources
+        - service_types: All service types with published resources
+        - categories_dict: Dictionary mapping category IDs to names
+        - service_types_dict: Dictionary mapping service type IDs to names
+        - cities: List of unique cities with published resources
+        - states: List of unique states with published resources
+        - facets: Facet counts of the current results (see services.facets)
+        
+    Returns:
+        HttpResponse: Rendered public resource list template with filtered data
+        
+    Note:
+        Location searches (``address``) are logged for analytics on every
+        request, including those answered with 304 Not Modified.
+        
+    Example:
+        GET /resources/public/?q=mental+health&category=1&sort=name&page=2
+    """
+    start_time = time.time()
+    response = _public_resource_list_page(request)
     
-    # Get filter options for the sidebar
-    categories = TaxonomyCategory.objects.filter(
-        resources__status="published",
-        resources__is_deleted=False,
-        resources__is_archived=False
-    ).distinct().order_by('name')
+    # Log search for analytics (if address was provided)
+    address_filter = request.GET.get("address", "").strip()
+    if address_filter:
+        _log_location_search(request, address_filter, start_time)
     
-    service_types = ServiceType.objects.filter(
-        resources__status="published",
-        resources__is_deleted=False,
-        resources__is_archived=False
-    ).distinct().order_by('name')
+    return response
+
+
+@public_page
+def _public_resource_list_page(request: HttpRequest) -> HttpResponse:
+    """Render the public resource list (see ``public_resource_list``)."""
+    search_query = request.GET.get("q", "").strip()
+    category_filter = request.GET.get("category", "")
+    service_type_filter = request.GET.get("service_type", "")
+    city_filter = request.GET.get("city", "")
+    state_filter = request.GET.get("state", "")
+    state_fips_filter = request.GET.get("state_fips", "")
+    county_id_filter = request.GET.get("county_id", "")
+    include_national = request.GET.get("include_national", "1") == "1"  # Default to True
+    address_filter = request.GET.get("address", "").strip()
+    lat_filter = request.GET.get("lat", "")
+    lon_filter = request.GET.get("lon", "")
+    radius_miles = request.GET.get("radius_miles", "10.0")
+    max_distance_filter = request.GET.get("max_distance", "")
+    min_distance_filter = request.GET.get("min_distance", "")
+    emergency_filter = request.GET.get("emergency", "")
+    twenty_four_hour_filter = request.GET.get("24hour", "")
+    coverage_area_type_filter = request.GET.get("coverage_area_type", "")
+    sort_by = request.GET.get("sort", "name")
     
-    # Create dictionaries for template filter usage
-    categories_dict = {str(cat.id): cat.name for cat in categories}
-    service_types_dict = {str(st.id): st.name for st in service_types}
+    # Nothing below runs a query until the template needs it, so a page
+    # served from the fragment cache costs only the generation read
+    page_obj = SimpleLazyObject(
+        lambda: Paginator(_public_result_set(request), 20).get_page(request.GET.get("page"))
+    )
     
-    # Get unique cities and states for filters
-    cities = Resource.objects.filter(
-        status="published", 
-        is_deleted=False, 
-        is_archived=False
-    ).exclude(city="").values_list('city', flat=True).distinct().order_by('city')
+    # Sidebar options come from all published resources; their counts
+    # reflect the active filters
+    published_facets = SimpleLazyObject(get_published_facets)
+    result_facets = SimpleLazyObject(
+        lambda: get_result_set_facets(_public_result_set(request), published_facets)
+    )
     
-    states = Resource.objects.filter(
-        status="published", 
-        is_deleted=False, 
-        is_archived=False
-    ).exclude(state="").values_list('state', flat=True).distinct().order_by('state')
+    categories = SimpleLazyObject(lambda: list(TaxonomyCategory.objects.filter(
+        id__in=list(published_facets['categories'])
+    ).order_by('name')))
+    service_types = SimpleLazyObject(lambda: list(ServiceType.objects.filter(
+        id__in=list(published_facets['service_types'])
+    ).order_by('name')))
+    
+    # Create dictionaries for template filter usage
+    categories_dict = SimpleLazyObject(lambda: {str(cat.id): cat.name for cat in categories})
+    service_types_dict = SimpleLazyObject(lambda: {str(st.id): st.name for st in service_types})
+    
+    # Unique cities and states for filters
+    cities = SimpleLazyObject(lambda: sorted(published_facets['cities']))
+    states = SimpleLazyObject(lambda: sorted(published_facets['states']))
     
     context = {
         'page_obj': page_obj,
@@ -508,25 +566,27 @@ def public_resource_list(request: HttpRequest) -> HttpResponse:
         'service_types_dict': service_types_dict,
         'cities': cities,
         'states': states,
+        'facets': result_facets,
+        **_page_cache_context(),
     }
     
     return render(request, 'directory/public_resource_list.html', context)
 
 
+@public_page
 def public_resource_detail(request: HttpRequest, pk: int) -> HttpResponse:
     """Public resource detail view for published resources with related resource suggestions.
     
     This view displays comprehensive information about a published resource for
-    non-authenticated users. It includes related resource suggestions based on
-    category and service type similarities to help users discover additional
-    relevant services.
+    non-authenticated users. It includes related resource suggestions,
+    precomputed from category, service type, coverage and proximity
+    similarities, to help users discover additional relevant services.
     
     Features:
         - Public access without authentication
         - Complete resource information display
         - Related resource suggestions
-        - Category and service type-based recommendations
-        - Deduplication of related resources
+        - Precomputed recommendations read with one indexed lookup
         - Limited to published, non-archived resources
         
     Args:
@@ -541,7 +601,7 @@ def public_resource_detail(request: HttpRequest, pk: int) -> HttpResponse:
         
     Template Context:
         - resource: The published resource object
-        - related_resources: List of related resources (up to 5, deduplicated)
+        - related_resources: List of related resources (up to RELATED_RESOURCES_LIMIT)
         
     Example:
         GET /resources/public/123/ -> Display published resource 123 with related suggestions
@@ -554,32 +614,11 @@ def public_resource_detail(request: HttpRequest, pk: int) -> HttpResponse:
         is_archived=False
     )
     
-    # Get related resources (same category or service types)
-    related_resources = Resource.objects.filter(
-        status="published",
-        is_deleted=False,
-        is_archived=False
-    ).exclude(pk=resource.pk)
-    
-    if resource.category:
-        category_related = related_resources.filter(category=resource.category)[:3]
-    else:
-        category_related = []
-    
-    if resource.service_types.exists():
-        service_related = related_resources.filter(
-            service_types__in=resource.service_types.all()
-        ).distinct()[:3]
-    else:
-        service_related = []
-    
-    # Combine and deduplicate related resources
-    related = list(category_related) + list(service_related)
-    related = list({r.pk: r for r in related}.values())[:5]
-    
     context = {
         'resource': resource,
-        'related_resources': related,
+        # Evaluated by the template only when the page fragment is not cached
+        'related_resources': SimpleLazyObject(lambda: related_resources_for(resource)),
+        **_page_cache_context(),
     }
     
     return render(request, 'directory/public_resource_detail.html', context)
@@ -5,7 +5,8 @@ This module contains the ResourceListView which provides comprehensive resource
 listing functionality with advanced search, filtering, and pagination capabilities.
 
 Features:
-    - Full-text search using SQLite FTS5 with fallback
+    - Full-text search using the database full-text index
+    - Cached result sets so paging does not re-run searches
     - Advanced filtering by status, category, location, and operational characteristics
     - Archive status filtering (active vs archived resources)
     - Sorting by various fields
@@ -33,6 +34,7 @@ from django.db.models import Q
 from django.views.generic import ListView
 
 from ..models import Resource, ServiceType, TaxonomyCategory
+from ..services.result_sets import ResultSet
 from ..permissions import user_can_publish, user_can_submit_for_review
 
 logger = logging.getLogger(__name__)
@@ -88,7 +90,28 @@ class ResourceListView(LoginRequiredMixin, ListView):
     context_object_name = "resources"
     paginate_by = 20
 
-    def get_queryset(self) -> models.QuerySet:
+    def get_queryset(self) -> ResultSet:
+        """Return the cached, ordered result set for the current parameters.
+        
+        The filtered queryset from build_queryset is evaluated once per
+        distinct set of parameters and its ordered primary keys are cached.
+        Pagination then counts from the cached list and fetches only the
+        rows of the requested page.
+        
+        Returns:
+            ResultSet: Paginator-compatible result set of resources
+        """
+        return ResultSet.for_query(
+            "resource_list",
+            self.request.GET,
+            build=self.build_queryset,
+            row_queryset=Resource.objects.all_including_archived().select_related(
+                'category'
+            ).prefetch_related('service_types', 'coverage_areas'),
+            extra_fields=("distance_miles", "proximity_score", "specificity_score"),
+        )
+
+    def build_queryset(self) -> models.QuerySet:
         """Filter queryset based on search and filter parameters.
         
         This method builds a filtered queryset based on URL parameters including
@@ -176,27 +199,14 @@ class ResourceListView(LoginRequiredMixin, ListView):
         if address_filter and lat_filter and lon_filter:
             # Use spatial filtering when coordinates are available
             try:
-                # Use proximity-based filtering for better ranking
-                spatial_queryset = Resource.objects.filter_by_location_with_proximity(
-                    lat=float(lat_filter),
-                    lon=float(lon_filter),
-                    radius_miles=float(radius_miles) if radius_miles else None,
-                    sort_by_proximity=True
+                # Match resources serving the point as part of this query
+                queryset = queryset.filter(
+                    Resource.objects.location_filter(
+                        lat=float(lat_filter),
+                        lon=float(lon_filter),
+                        radius_miles=float(radius_miles) if radius_miles else None,
+                    )
                 )
-                # Combine with existing filters
-                spatial_ids = list(spatial_queryset.values_list('pk', flat=True))
-                if spatial_ids:
-                    queryset = queryset.filter(pk__in=spatial_ids)
-                    # Preserve spatial ordering when proximity-based sorting is requested
-                    if self.request.GET.get("sort") in ["distance", "proximity"]:
-                        from django.db.models import Case, When
-                        preserved = Case(
-                            *[When(pk=pk, then=pos) for pos, pk in enumerate(spatial_ids)]
-                        )
-                        queryset = queryset.order_by(preserved)
-                else:
-                    # No spatial results, return empty queryset
-                    queryset = Resource.objects.none()
             except (ValueError, TypeError) as e:
                 # Fallback to text-based search if spatial filtering fails
                 logger.warning(f"Spatial filtering failed for {address_filter}: {e}")
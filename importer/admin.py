@@ -36,6 +36,9 @@ class ImportJobAdmin(admin.ModelAdmin):
         "valid_rows",
         "invalid_rows",
         "resources_created",
+        "rows_processed",
+        "heartbeat_at",
+        "last_error",
         "duration_display",
         "success_rate_display",
         "column_mapping_display",
@@ -47,7 +50,17 @@ class ImportJobAdmin(admin.ModelAdmin):
         ("File Information", {"fields": ("file_name", "file_size", "uploaded_at")}),
         (
             "Processing Status",
-            {"fields": ("status", "started_at", "completed_at", "duration_display")},
+            {
+                "fields": (
+                    "status",
+                    "started_at",
+                    "completed_at",
+                    "duration_display",
+                    "rows_processed",
+                    "heartbeat_at",
+                    "last_error",
+                )
+            },
         ),
         (
             "Results",
@@ -2,8 +2,8 @@
 Forms for CSV import/export functionality.
 """
 
+import codecs
 import csv
-from io import StringIO
 from typing import Any, Dict, List
 
 from django import forms
@@ -65,14 +65,10 @@ class CSVUploadForm(forms.ModelForm):
         if not csv_file.name.lower().endswith(".csv"):
             raise ValidationError(_("Please upload a CSV file."))
 
-        # Validate CSV format
+        # Validate CSV format from the header line only; rows are read
+        # lazily when the import runs
         try:
-            content = csv_file.read().decode("utf-8")
-            csv_file.seek(0)  # Reset file pointer
-
-            # Try to parse as CSV
-            csv_file_obj = StringIO(content)
-            reader = csv.reader(csv_file_obj)
+            reader = csv.reader(codecs.iterdecode(csv_file, "utf-8"))
 
             # Check if we can read at least one row
             try:
@@ -81,6 +77,8 @@ class CSVUploadForm(forms.ModelForm):
                     raise ValidationError(_("CSV file must have at least 2 columns."))
             except StopIteration:
                 raise ValidationError(_("CSV file appears to be empty."))
+            finally:
+                csv_file.seek(0)  # Reset file pointer
 
         except UnicodeDecodeError:
             raise ValidationError(_("CSV file must be encoded in UTF-8."))
@@ -100,6 +98,8 @@ class CSVUploadForm(forms.ModelForm):
             csv_file = self.cleaned_data["csv_file"]
             import_job.file_name = csv_file.name
             import_job.file_size = csv_file.size
+            # Stored in MEDIA_ROOT when the job is saved
+            import_job.source_file = csv_file
 
         if commit:
             import_job.save()
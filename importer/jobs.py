@@ -0,0 +1,142 @@
+"""
+Background processing of CSV import jobs.
+
+Imports run outside the web request. ``ImportPreviewView`` queues the job
+(its upload is already stored in ``source_file``); ``manage.py
+process_import_jobs`` polls the ImportJob table, claims queued jobs one at
+a time and streams their files through ``BulkCSVProcessor``. Each chunk commits its rows together with the job's
+counters, so the job detail page can poll progress and a failed job can be
+queued again to continue after its last committed chunk.
+
+A job whose worker died stops updating ``heartbeat_at``; workers requeue
+such jobs after IMPORT_JOB_STALE_SECONDS.
+
+Functions:
+    enqueue_import_job: Queue a configured job for the worker
+    claim_next_job: Atomically take the oldest queued job
+    run_import_job: Process a claimed job to completion or failure
+    resume_import_job: Queue a failed job again from its last chunk
+    requeue_stale_jobs: Queue jobs whose worker stopped reporting progress
+"""
+
+import logging
+from datetime import timedelta
+from typing import Optional
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import BulkCSVProcessor, ImportJob
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STALE_SECONDS = 600
+
+
+def enqueue_import_job(import_job: ImportJob) -> None:
+    """
+    Queue a configured import job for the background worker.
+
+    Args:
+        import_job: Job with its source file and column mapping saved
+    """
+    import_job.status = "queued"
+    import_job.last_error = ""
+    import_job.save(update_fields=["status", "last_error"])
+
+
+def claim_next_job() -> Optional[ImportJob]:
+    """
+    Take the oldest queued job and mark it as processing.
+
+    The status update only succeeds for a job that is still queued, so two
+    workers can never claim the same job.
+
+    Returns:
+        The claimed job, or None if the queue is empty
+    """
+    for job_id in ImportJob.objects.filter(status="queued").order_by("uploaded_at", "id").values_list(
+        "id", flat=True
+    )[:10]:
+        now = timezone.now()
+        claimed = ImportJob.objects.filter(id=job_id, status="queued").update(
+            status="processing", heartbeat_at=now
+        )
+        if claimed:
+            job = ImportJob.objects.get(id=job_id)
+            if job.started_at is None:
+                job.started_at = now
+                job.save(update_fields=["started_at"])
+            return job
+    return None
+
+
+def run_import_job(import_job: ImportJob) -> ImportJob:
+    """
+    Process a claimed job, continuing after any rows already committed.
+
+    Args:
+        import_job: Job in "processing" status
+
+    Returns:
+        The job with its final status ("completed" or "failed")
+    """
+    try:
+        with import_job.open_source() as lines:
+            BulkCSVProcessor(import_job).process_csv(lines, resume=True)
+    except Exception as e:
+        logger.exception(f"Import job {import_job.pk} failed after {import_job.rows_processed} rows")
+        import_job.refresh_from_db()
+        import_job.status = "failed"
+        import_job.last_error = str(e)
+        import_job.completed_at = timezone.now()
+        import_job.save(update_fields=["status", "last_error", "completed_at"])
+        return import_job
+
+    import_job.refresh_from_db()
+    import_job.status = "completed"
+    import_job.completed_at = timezone.now()
+    import_job.save(update_fields=["status", "completed_at"])
+    logger.info(f"Import job {import_job.pk} completed: {import_job.resources_created} resources created")
+    return import_job
+
+
+def resume_import_job(import_job: ImportJob) -> bool:
+    """
+    Queue a failed job again; the worker skips its committed rows.
+
+    Args:
+        import_job: Failed job
+
+    Returns:
+        bool: True if the job was queued
+    """
+    if not import_job.can_resume:
+        return False
+    import_job.completed_at = None
+    import_job.save(update_fields=["completed_at"])
+    enqueue_import_job(import_job)
+    return True
+
+
+def requeue_stale_jobs(stale_seconds: Optional[int] = None) -> int:
+    """
+    Queue processing jobs whose worker has stopped reporting progress.
+
+    Args:
+        stale_seconds: Seconds without a heartbeat before a job is stale
+            (defaults to the IMPORT_JOB_STALE_SECONDS setting)
+
+    Returns:
+        int: Number of jobs queued again
+    """
+    if stale_seconds is None:
+        stale_seconds = getattr(settings, "IMPORT_JOB_STALE_SECONDS", DEFAULT_STALE_SECONDS)
+
+    cutoff = timezone.now() - timedelta(seconds=stale_seconds)
+    requeued = ImportJob.objects.filter(status="processing", heartbeat_at__lt=cutoff).update(
+        status="queued"
+    )
+    if requeued:
+        logger.warning(f"Requeued {requeued} stale import job(s)")
+    return requeued
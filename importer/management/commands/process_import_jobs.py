@@ -0,0 +1,81 @@
+"""
+Management command that runs queued CSV import jobs.
+
+Polls the ImportJob table, claims queued jobs one at a time and processes
+them in chunks, updating each job's progress as chunks commit. Run it as a
+long-lived worker next to the web server, or with --once from cron.
+
+Usage:
+    python manage.py process_import_jobs
+    python manage.py process_import_jobs --once
+    python manage.py process_import_jobs --resume 12
+
+Author: Resource Directory Team
+Created: 2025-01-15
+Version: 1.0.0
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+
+from importer.jobs import claim_next_job, requeue_stale_jobs, resume_import_job, run_import_job
+from importer.models import ImportJob
+
+
+class Command(BaseCommand):
+    """Process queued import jobs."""
+
+    help = "Run queued CSV import jobs (polls the queue until stopped)"
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Process the jobs currently queued, then exit'
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=5.0,
+            help='Seconds to wait between queue checks (default: 5)'
+        )
+        parser.add_argument(
+            '--resume',
+            type=int,
+            metavar='JOB_ID',
+            help='Queue a failed job again from its last committed chunk before processing'
+        )
+
+    def handle(self, *args, **options):
+        """Handle the command execution."""
+        if options['resume']:
+            try:
+                job = ImportJob.objects.get(pk=options['resume'])
+            except ImportJob.DoesNotExist:
+                raise CommandError(f"Import job {options['resume']} does not exist")
+            if not resume_import_job(job):
+                raise CommandError(f"Import job {job.pk} is {job.status} and cannot be resumed")
+            self.stdout.write(f"Queued job {job.pk} to resume after row {job.rows_processed}")
+
+        while True:
+            close_old_connections()
+            requeue_stale_jobs()
+
+            job = claim_next_job()
+            if job is None:
+                if options['once']:
+                    break
+                time.sleep(options['poll_interval'])
+                continue
+
+            self.stdout.write(f"Processing import job {job.pk} ({job.name})...")
+            job = run_import_job(job)
+            if job.status == "completed":
+                self.stdout.write(self.style.SUCCESS(
+                    f"Job {job.pk}: {job.resources_created} created, {job.invalid_rows} invalid rows"
+                ))
+            else:
+                self.stdout.write(self.style.ERROR(f"Job {job.pk} failed: {job.last_error}"))
@@ -0,0 +1,57 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("importer", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="importjob",
+            name="source_file",
+            field=models.FileField(
+                blank=True,
+                help_text="Uploaded CSV, read by the import worker",
+                upload_to="imports/%Y/%m/",
+            ),
+        ),
+        migrations.AddField(
+            model_name="importjob",
+            name="rows_processed",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="Data rows committed so far (imports resume after them)",
+            ),
+        ),
+        migrations.AddField(
+            model_name="importjob",
+            name="heartbeat_at",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="Last progress update from the import worker",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="importjob",
+            name="last_error",
+            field=models.TextField(blank=True, help_text="Error that stopped the last run"),
+        ),
+        migrations.AlterField(
+            model_name="importjob",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "Pending"),
+                    ("queued", "Queued"),
+                    ("processing", "Processing"),
+                    ("completed", "Completed"),
+                    ("failed", "Failed"),
+                ],
+                default="pending",
+                max_length=20,
+            ),
+        ),
+    ]
@@ -1,18 +1,40 @@
 """
 Models for CSV import/export functionality.
+
+``CSVProcessor`` creates resources one row at a time through
+``Resource.objects.create``. ``BulkCSVProcessor`` produces the same
+resources, versions, audit entries and import errors, but validates rows in
+memory against name maps loaded once and writes each chunk of
+IMPORT_CHUNK_SIZE rows with ``bulk_create`` in a single transaction.
+
+Uploaded files are stored on ``ImportJob.source_file`` and read lazily, one
+line at a time (``ImportJob.open_source``), so memory use does not grow with
+file size.
 """
 
+import codecs
 import csv
 import json
+from contextlib import contextmanager
 from io import StringIO
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
+from django.conf import settings
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 
-from directory.models import Resource, ServiceType, TaxonomyCategory
+from audit.models import AuditManager
+from directory.models import AuditLog, Resource, ResourceVersion, ServiceType, TaxonomyCategory
+from directory.services.related_resources import schedule_related_rebuild
+from directory.services.result_sets import schedule_invalidation
+
+DEFAULT_IMPORT_CHUNK_SIZE = 500
+
+# Foreign keys a bulk import sets itself; excluded from full_clean(), which
+# would otherwise query each one per row
+BULK_CLEAN_EXCLUDE = ["category", "created_by", "updated_by", "last_verified_by", "archived_by"]
 
 
 class ImportJob(models.Model):
@@ -20,6 +42,7 @@ class ImportJob(models.Model):
 
     STATUS_CHOICES = [
         ("pending", "Pending"),
+        ("queued", "Queued"),
         ("processing", "Processing"),
         ("completed", "Completed"),
         ("failed", "Failed"),
@@ -33,6 +56,11 @@ class ImportJob(models.Model):
     file_name = models.CharField(max_length=255)
     file_size = models.PositiveIntegerField()
     uploaded_at = models.DateTimeField(auto_now_add=True)
+    source_file = models.FileField(
+        upload_to="imports/%Y/%m/",
+        blank=True,
+        help_text="Uploaded CSV, read by the import worker",
+    )
 
     # Processing status
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
@@ -45,6 +73,15 @@ class ImportJob(models.Model):
     invalid_rows = models.PositiveIntegerField(default=0)
     resources_created = models.PositiveIntegerField(default=0)
 
+    # Background processing
+    rows_processed = models.PositiveIntegerField(
+        default=0, help_text="Data rows committed so far (imports resume after them)"
+    )
+    heartbeat_at = models.DateTimeField(
+        null=True, blank=True, help_text="Last progress update from the import worker"
+    )
+    last_error = models.TextField(blank=True, help_text="Error that stopped the last run")
+
     # Configuration
     column_mapping = models.TextField(
         blank=True, help_text="JSON mapping of CSV columns to resource fields"
@@ -90,6 +127,27 @@ class ImportJob(models.Model):
             return 0.0
         return (self.valid_rows / self.total_rows) * 100
 
+    @contextmanager
+    def open_source(self) -> Iterator[Iterator[str]]:
+        """
+        Open the uploaded CSV as a lazily decoded stream of lines.
+
+        Yields:
+            Iterator of text lines, suitable for ``csv.reader``
+        """
+        with self.source_file.open("rb") as source:
+            yield codecs.iterdecode(source, "utf-8")
+
+    @property
+    def is_active(self) -> bool:
+        """Whether the job is waiting for or being processed by a worker."""
+        return self.status in ("queued", "processing")
+
+    @property
+    def can_resume(self) -> bool:
+        """Whether a failed job can be queued again from its last chunk."""
+        return self.status == "failed" and bool(self.source_file)
+
 
 class ImportError(models.Model):
     """Track validation errors for individual rows in CSV imports."""
@@ -139,19 +197,25 @@ class CSVProcessor:
         self.import_job = import_job
         self.column_mapping = import_job.column_mapping_dict
 
-    def validate_csv_structure(self, csv_content: str) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _reader(source: Union[str, Iterable[str]]) -> Iterator[List[str]]:
+        """Return a csv.reader over CSV text or an iterable of lines."""
+        return csv.reader(StringIO(source) if isinstance(source, str) else source)
+
+    def validate_csv_structure(self, source: Union[str, Iterable[str]]) -> List[Dict[str, Any]]:
         """
         Validate CSV structure and return column information.
 
+        Only the header and the first five rows are read.
+
         Args:
-            csv_content: CSV file content as string
+            source: CSV content as a string, or an iterable of lines
 
         Returns:
             List of column information dictionaries
         """
         try:
-            csv_file = StringIO(csv_content)
-            reader = csv.reader(csv_file)
+            reader = self._reader(source)
 
             # Read header row
             header_row = next(reader)
@@ -163,10 +227,6 @@ class CSVProcessor:
                 )
 
             # Read a few rows to get sample values
-            csv_file.seek(0)
-            reader = csv.reader(csv_file)
-            next(reader)  # Skip header
-
             for row_num, row in enumerate(reader):
                 if row_num >= 5:  # Only sample first 5 rows
                     break
@@ -180,12 +240,13 @@ class CSVProcessor:
         except Exception as e:
             raise ValidationError(f"Invalid CSV format: {str(e)}")
 
-    def process_csv(self, csv_content: str) -> Dict[str, Any]:
+    def process_csv(self, source: Union[str, Iterable[str]]) -> Dict[str, Any]:
         """
         Process CSV content and create resources.
 
         Args:
-            csv_content: CSV file content as string
+            source: CSV content as a string, or an iterable of lines (read
+                lazily)
 
         Returns:
             Dictionary with processing results
@@ -199,8 +260,7 @@ class CSVProcessor:
         }
 
         try:
-            csv_file = StringIO(csv_content)
-            reader = csv.reader(csv_file)
+            reader = self._reader(source)
 
             # Skip header if configured
             if self.import_job.skip_header:
@@ -368,3 +428,271 @@ class CSVProcessor:
             error_message=error_message,
             row_data=json.dumps(dict(enumerate(row_data))),
         )
+
+
+class BulkCSVProcessor(CSVProcessor):
+    """CSV processor that validates rows in memory and inserts them in bulk.
+
+    Category and service type names are resolved from maps loaded once per
+    import, and rows are validated with the model's own ``clean`` rules.
+    Each chunk of valid rows is written inside one transaction: resources,
+    service-type links, initial versions and audit entries with
+    ``bulk_create``, so a chunk is either fully imported or not at all.
+    Invalid rows are recorded as ImportError rows exactly as in
+    ``CSVProcessor``.
+
+    The job's counters and ``rows_processed`` are updated in the same
+    transaction as each chunk, so they always describe committed work: a
+    detail page can poll them, and ``process_csv(..., resume=True)`` skips
+    the rows a failed run already committed.
+
+    ``bulk_create`` does not send ``post_save``, so cached result sets are
+    expired once at the end instead of once per row, and the related-resource
+    lists of each chunk's published resources are recomputed once, after the
+    chunk commits. Imported rows are normally drafts (publishing needs a
+    verifier, which a CSV cannot supply); their lists are computed when they
+    are published. Lists of existing resources pick up new resources at the
+    next ``build_related_resources`` run.
+    """
+
+    def __init__(self, import_job: ImportJob, chunk_size: Optional[int] = None):
+        super().__init__(import_job)
+        if chunk_size is None:
+            chunk_size = getattr(settings, "IMPORT_CHUNK_SIZE", DEFAULT_IMPORT_CHUNK_SIZE)
+        self.chunk_size = chunk_size
+        self.categories: Dict[str, TaxonomyCategory] = {}
+        self.service_types: Dict[str, ServiceType] = {}
+
+    def _load_lookups(self) -> None:
+        """Load category and service type name maps (one query each)."""
+        self.categories = {category.name: category for category in TaxonomyCategory.objects.all()}
+        self.service_types = {
+            service_type.name: service_type for service_type in ServiceType.objects.all()
+        }
+
+    def process_csv(self, source: Union[str, Iterable[str]], resume: bool = False) -> Dict[str, Any]:
+        """
+        Process CSV content and create resources in bulk.
+
+        Args:
+            source: CSV content as a string, or an iterable of lines (read
+                lazily, one chunk of rows in memory at a time)
+            resume: Skip the job's ``rows_processed`` rows and continue its
+                counters instead of starting from zero
+
+        Returns:
+            Dictionary with processing results (same keys as CSVProcessor;
+            "errors" only lists errors found by this run)
+        """
+        job = self.import_job
+        results = {
+            "total_rows": job.total_rows if resume else 0,
+            "valid_rows": job.valid_rows if resume else 0,
+            "invalid_rows": job.invalid_rows if resume else 0,
+            "resources_created": job.resources_created if resume else 0,
+            "errors": [],
+        }
+        skip_rows = job.rows_processed if resume else 0
+        created_before = results["resources_created"]
+
+        try:
+            self._load_lookups()
+
+            reader = self._reader(source)
+            if job.skip_header:
+                next(reader)
+
+            first_row_num = 2 if job.skip_header else 1
+            chunk: List[Tuple[int, List[str]]] = []
+            for row_num, row in enumerate(reader, start=first_row_num):
+                if row_num - first_row_num < skip_rows:
+                    continue
+                chunk.append((row_num, row))
+                if len(chunk) >= self.chunk_size:
+                    self._process_chunk(chunk, results)
+                    chunk = []
+            if chunk:
+                self._process_chunk(chunk, results)
+
+        except Exception as e:
+            raise ValidationError(f"CSV processing failed: {str(e)}")
+
+        finally:
+            if results["resources_created"] > created_before:
+                schedule_invalidation()
+
+        return results
+
+    def _process_chunk(
+        self, chunk: List[Tuple[int, List[str]]], results: Dict[str, Any]
+    ) -> None:
+        """
+        Validate a chunk of rows and write it in one transaction.
+
+        Args:
+            chunk: (row number, row values) pairs
+            results: Processing results, updated in place
+        """
+        valid = []
+        errors = []
+
+        for row_num, row in chunk:
+            results["total_rows"] += 1
+            try:
+                data = self._map_row_to_resource(row)
+                self._validate_resource_data(data, row_num)
+                service_types = data.pop("service_types", [])
+                resource = self._build_resource(data, row_num)
+                valid.append((resource, service_types, sorted(data)))
+            except ValidationError as e:
+                errors.append(self._build_import_error(row_num, row, str(e), "validation"))
+                results["errors"].append({"row": row_num, "error": str(e)})
+            except Exception as e:
+                errors.append(self._build_import_error(row_num, row, str(e), "data_type"))
+                results["errors"].append({"row": row_num, "error": str(e)})
+
+        with transaction.atomic():
+            if valid:
+                self._create_resources(valid)
+            ImportError.objects.bulk_create(errors)
+
+            results["valid_rows"] += len(valid)
+            results["resources_created"] += len(valid)
+            results["invalid_rows"] += len(errors)
+            self._save_progress(results)
+
+    def _save_progress(self, results: Dict[str, Any]) -> None:
+        """Record committed counters on the job (inside the chunk transaction)."""
+        progress = {
+            "total_rows": results["total_rows"],
+            "valid_rows": results["valid_rows"],
+            "invalid_rows": results["invalid_rows"],
+            "resources_created": results["resources_created"],
+            "rows_processed": results["total_rows"],
+            "heartbeat_at": timezone.now(),
+        }
+        ImportJob.objects.filter(pk=self.import_job.pk).update(**progress)
+        for field, value in progress.items():
+            setattr(self.import_job, field, value)
+
+    def _validate_resource_data(self, data: Dict[str, Any], row_num: int) -> None:
+        """
+        Validate resource data using the pre-loaded name maps.
+
+        Error messages match ``CSVProcessor._validate_resource_data``.
+
+        Args:
+            data: Dictionary of resource field data to validate
+            row_num: Row number for error reporting
+
+        Raises:
+            ValidationError: If data fails validation requirements
+        """
+        if not data.get("name"):
+            raise ValidationError(f"Row {row_num}: Name is required")
+
+        contact_methods = [data.get("phone"), data.get("email"), data.get("website")]
+        if not any(contact_methods):
+            raise ValidationError(
+                f"Row {row_num}: At least one contact method (phone, email, or website) is required"
+            )
+
+        if data.get("category"):
+            category = self.categories.get(data["category"])
+            if category is None:
+                raise ValidationError(
+                    f"Row {row_num}: Category '{data['category']}' does not exist"
+                )
+            data["category"] = category
+
+        if data.get("service_types"):
+            valid_service_types = []
+            for service_type_name in (name.strip() for name in data["service_types"].split(",")):
+                service_type = self.service_types.get(service_type_name)
+                if service_type is None:
+                    raise ValidationError(
+                        f"Row {row_num}: Service type '{service_type_name}' does not exist"
+                    )
+                valid_service_types.append(service_type)
+            data["service_types"] = valid_service_types
+
+    def _build_resource(self, data: Dict[str, Any], row_num: int) -> Resource:
+        """
+        Build and validate an unsaved resource, as ``Resource.save`` would.
+
+        Args:
+            data: Validated resource field data (without service types)
+            row_num: Row number for error reporting
+
+        Returns:
+            Unsaved Resource instance
+
+        Raises:
+            ValidationError: If the model's validation rules fail
+        """
+        resource = Resource(**data, current_version=1)
+        resource.normalize_fields()
+        try:
+            resource.full_clean(exclude=BULK_CLEAN_EXCLUDE, validate_unique=False)
+        except ValidationError as e:
+            messages = [
+                f"{field}: {message}"
+                for field, field_messages in e.message_dict.items()
+                for message in field_messages
+            ]
+            raise ValidationError(f"Row {row_num}: " + "; ".join(messages))
+        return resource
+
+    def _create_resources(self, valid: List[Tuple[Resource, List[ServiceType], List[str]]]) -> None:
+        """
+        Insert resources with their service types, versions and audit entries.
+
+        Args:
+            valid: (unsaved resource, service types, imported field names) tuples
+        """
+        resources = Resource.objects.bulk_create([resource for resource, _, _ in valid])
+        schedule_related_rebuild(
+            resource.pk for resource in resources if resource.status == "published"
+        )
+
+        links = [
+            Resource.service_types.through(resource_id=resource.pk, servicetype_id=service_type.pk)
+            for resource, (_, service_types, _) in zip(resources, valid)
+            for service_type in service_types
+        ]
+        Resource.service_types.through.objects.bulk_create(links)
+
+        actor = self.import_job.created_by
+        ResourceVersion.objects.bulk_create(
+            ResourceVersion(
+                resource=resource,
+                version_number=1,
+                snapshot_json=json.dumps(AuditManager.snapshot_resource(resource)),
+                changed_fields=json.dumps(fields),
+                change_type="create",
+                changed_by=actor,
+            )
+            for resource, (_, _, fields) in zip(resources, valid)
+        )
+        AuditLog.objects.bulk_create(
+            AuditLog(
+                actor=actor,
+                action="create_resource",
+                target_table="resource",
+                target_id=str(resource.pk),
+                metadata_json=json.dumps(AuditManager.resource_metadata(resource, "create")),
+            )
+            for resource in resources
+        )
+
+    def _build_import_error(
+        self, row_num: int, row_data: List[str], error_message: str, error_type: str
+    ) -> ImportError:
+        """Build an unsaved ImportError record (see ``_create_import_error``)."""
+        return ImportError(
+            import_job=self.import_job,
+            row_number=row_num,
+            error_type=error_type,
+            error_message=error_message,
+            row_data=json.dumps(dict(enumerate(row_data))),
+        )
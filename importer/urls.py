@@ -20,6 +20,8 @@ urlpatterns = [
     path("preview/<int:pk>/", views.ImportPreviewView.as_view(), name="import_preview"),
     # Import actions
     path("jobs/<int:pk>/cancel/", views.cancel_import, name="cancel_import"),
+    path("jobs/<int:pk>/resume/", views.resume_import, name="resume_import"),
+    path("jobs/<int:pk>/progress/", views.import_job_progress, name="import_job_progress"),
     path(
         "jobs/<int:pk>/errors/",
         views.download_error_report,
@@ -0,0 +1,205 @@
+"""
+Dry-run validation of a whole CSV import.
+
+``dry_run_import`` checks every row of an upload without writing anything:
+the column mapping, ``Resource`` field normalization and ``clean()`` rules,
+category and service-type names, and duplicates within the file. Rows are
+split into chunks and validated in a process pool; the only database reads
+are the category and service-type name maps, loaded once in the parent and
+shipped to every worker.
+
+Duplicates are rows with the same normalized name, city, state and phone
+number as an earlier row; each is reported against the first occurrence.
+
+The import preview page validates in-process and only up to
+IMPORT_PREVIEW_VALIDATION_ROWS rows, so a web request never starts a pool
+or walks a huge file; ``manage.py validate_import`` checks the whole file.
+
+Functions:
+    dry_run_import: Validate a job's rows and return a consolidated report
+    duplicate_key: Normalized identity of a mapped row
+"""
+
+import re
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+
+from .models import DEFAULT_IMPORT_CHUNK_SIZE, BulkCSVProcessor, CSVProcessor, ImportJob
+
+DEFAULT_WORKERS = 2
+DEFAULT_PREVIEW_VALIDATION_ROWS = 5000
+
+# Chunks submitted per worker before waiting for results (bounds memory)
+CHUNKS_IN_FLIGHT_PER_WORKER = 2
+
+# Per-row result: (row number, error type or None, message or None, duplicate key)
+RowResult = Tuple[int, Optional[str], Optional[str], Optional[Tuple[str, ...]]]
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Processor used by this worker process (set by _init_worker)
+_processor: Optional[BulkCSVProcessor] = None
+
+
+def _normalize_text(value: Any) -> str:
+    return _WHITESPACE_RE.sub(" ", str(value or "")).strip().casefold()
+
+
+def duplicate_key(data: Dict[str, Any]) -> Optional[Tuple[str, ...]]:
+    """
+    Return the normalized identity of a mapped row, or None without a name.
+
+    Args:
+        data: Mapped resource field data
+
+    Returns:
+        (name, city, state, phone digits) tuple
+    """
+    name = _normalize_text(data.get("name"))
+    if not name:
+        return None
+    return (
+        name,
+        _normalize_text(data.get("city")),
+        _normalize_text(data.get("state")),
+        "".join(filter(str.isdigit, str(data.get("phone") or ""))),
+    )
+
+
+def _init_worker(processor: BulkCSVProcessor) -> None:
+    """Set up a pool process (Django apps must be ready under spawn)."""
+    import django
+    from django.apps import apps
+
+    if not apps.ready:
+        django.setup()
+
+    global _processor
+    _processor = processor
+
+
+def _validate_chunk(chunk: List[Tuple[int, List[str]]]) -> List[RowResult]:
+    """Validate rows with the worker's processor; never touches the database."""
+    results = []
+    for row_num, row in chunk:
+        key = None
+        try:
+            data = _processor._map_row_to_resource(row)
+            key = duplicate_key(data)
+            _processor._validate_resource_data(data, row_num)
+            data.pop("service_types", None)
+            _processor._build_resource(data, row_num)
+            results.append((row_num, None, None, key))
+        except ValidationError as e:
+            results.append((row_num, "validation", "; ".join(e.messages), key))
+        except Exception as e:
+            results.append((row_num, "data_type", str(e), key))
+    return results
+
+
+def _chunks(rows: Iterator[List[str]], first_row_num: int, size: int) -> Iterator[List[Tuple[int, List[str]]]]:
+    numbered = enumerate(rows, start=first_row_num)
+    while True:
+        chunk = list(islice(numbered, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _run_pool(
+    processor: BulkCSVProcessor, chunks: Iterator[List[Tuple[int, List[str]]]], workers: int
+) -> Iterator[List[RowResult]]:
+    """Validate chunks in a process pool, in order, with a bounded backlog."""
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(processor,)
+    ) as executor:
+        pending: Deque = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_validate_chunk, chunk))
+            if len(pending) >= workers * CHUNKS_IN_FLIGHT_PER_WORKER:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def dry_run_import(
+    import_job: ImportJob,
+    source: Optional[Iterable[str]] = None,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    max_rows: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Validate every row of an import without writing to the database.
+
+    Args:
+        import_job: Job with its column mapping (and uploaded file)
+        source: CSV text or lines to validate (defaults to the job's file)
+        workers: Worker processes (defaults to IMPORT_VALIDATION_WORKERS;
+            1 validates in this process)
+        chunk_size: Rows per chunk (defaults to IMPORT_CHUNK_SIZE)
+        max_rows: Stop after this many data rows (default: no limit)
+
+    Returns:
+        Dictionary with "total_rows", "valid_rows", "invalid_rows",
+        "duplicate_rows", "seconds", "truncated" (True when rows were left
+        unchecked because of ``max_rows``) and "errors", a list of {"row",
+        "error_type", "error"} dicts ordered by row
+    """
+    if workers is None:
+        workers = getattr(settings, "IMPORT_VALIDATION_WORKERS", DEFAULT_WORKERS)
+    if chunk_size is None:
+        chunk_size = getattr(settings, "IMPORT_CHUNK_SIZE", DEFAULT_IMPORT_CHUNK_SIZE)
+
+    if source is None:
+        with import_job.open_source() as lines:
+            return dry_run_import(import_job, lines, workers, chunk_size, max_rows)
+
+    started = time.monotonic()
+
+    # Everything the workers need, loaded once: name maps and the job's user
+    # (fetched here so the pickled job carries it)
+    processor = BulkCSVProcessor(import_job, chunk_size=chunk_size)
+    processor._load_lookups()
+    _ = import_job.created_by
+
+    rows = CSVProcessor._reader(source)
+    if import_job.skip_header:
+        next(rows, None)
+    checked = rows if max_rows is None else islice(rows, max_rows)
+    chunks = _chunks(checked, 2 if import_job.skip_header else 1, chunk_size)
+
+    if workers > 1:
+        chunk_results = _run_pool(processor, chunks, workers)
+    else:
+        _init_worker(processor)
+        chunk_results = map(_validate_chunk, chunks)
+
+    report = {"total_rows": 0, "valid_rows": 0, "invalid_rows": 0, "duplicate_rows": 0, "errors": []}
+    first_seen: Dict[Tuple[str, ...], int] = {}
+    for results in chunk_results:
+        for row_num, error_type, message, key in results:
+            report["total_rows"] += 1
+            if key is not None and key in first_seen:
+                report["duplicate_rows"] += 1
+                duplicate = f"Row {row_num}: Duplicate of row {first_seen[key]}"
+                message = f"{message}; {duplicate}" if message else duplicate
+                error_type = error_type or "validation"
+            elif key is not None:
+                first_seen[key] = row_num
+
+            if error_type:
+                report["invalid_rows"] += 1
+                report["errors"].append({"row": row_num, "error_type": error_type, "error": message})
+            else:
+                report["valid_rows"] += 1
+
+    report["truncated"] = max_rows is not None and next(rows, None) is not None
+    report["seconds"] = round(time.monotonic() - started, 2)
+    return report
@@ -4,9 +4,9 @@ Views for CSV import/export functionality.
 
 import csv
 import json
-from io import StringIO
 from typing import Any, Dict
 
+from django.conf import settings
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.core.paginator import Paginator
@@ -14,17 +14,19 @@ from django.db import transaction
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse, reverse_lazy
-from django.utils import timezone
 from django.utils.decorators import method_decorator
 from django.views.decorators.http import require_http_methods
 from django.views.generic import CreateView, DetailView, ListView
 from django.views.generic.edit import FormView
 
 from directory.permissions import require_editor
+from directory.utils.export_utils import stream_resources_csv
 
 from .forms import (ColumnMappingForm, CSVUploadForm, ExportForm,
                     ImportPreviewForm)
+from .jobs import enqueue_import_job, resume_import_job
 from .models import CSVProcessor, ImportError, ImportJob
+from .validation import DEFAULT_PREVIEW_VALIDATION_ROWS, dry_run_import
 
 
 class ImportJobListView(LoginRequiredMixin, ListView):
@@ -82,14 +84,9 @@ class CSVUploadView(LoginRequiredMixin, CreateView):
         return kwargs
 
     def form_valid(self, form):
-        """Save the import job and store CSV content in session."""
+        """Save the import job (with its uploaded file) and remember it in the session."""
         import_job = form.save()
 
-        # Read and store CSV content in session
-        csv_file = form.cleaned_data["csv_file"]
-        csv_content = csv_file.read().decode("utf-8")
-
-        self.request.session["csv_content"] = csv_content
         self.request.session["import_job_id"] = import_job.id
 
         return super().form_valid(form)
@@ -109,8 +106,8 @@ class ColumnMappingView(LoginRequiredMixin, FormView):
     template_name = "importer/column_mapping.html"
 
     def dispatch(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
-        """Check if we have CSV content in session."""
-        if "csv_content" not in request.session:
+        """Check if we have an uploaded import job in the session."""
+        if "import_job_id" not in request.session:
             return redirect("importer:csv_upload")
         return super().dispatch(request, *args, **kwargs)
 
@@ -118,18 +115,16 @@ class ColumnMappingView(LoginRequiredMixin, FormView):
         """Get CSV columns and current mapping for form."""
         kwargs = super().get_form_kwargs()
 
-        # Get CSV content from session
-        csv_content = self.request.session.get("csv_content")
-
         # Get import job
         import_job_id = self.request.session.get("import_job_id")
         import_job = get_object_or_404(
             ImportJob, id=import_job_id, created_by=self.request.user
         )
 
-        # Process CSV to get columns
+        # Read the header and sample rows from the uploaded file
         processor = CSVProcessor(import_job)
-        csv_columns = processor.validate_csv_structure(csv_content)
+        with import_job.open_source() as lines:
+            csv_columns = processor.validate_csv_structure(lines)
 
         kwargs["csv_columns"] = csv_columns
         kwargs["current_mapping"] = import_job.column_mapping_dict
@@ -171,8 +166,8 @@ class ImportPreviewView(LoginRequiredMixin, FormView):
     template_name = "importer/import_preview.html"
 
     def dispatch(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
-        """Check if we have CSV content in session."""
-        if "csv_content" not in request.session:
+        """Check if we have an uploaded import job in the session."""
+        if "import_job_id" not in request.session:
             return redirect("importer:csv_upload")
         return super().dispatch(request, *args, **kwargs)
 
@@ -186,62 +181,73 @@ class ImportPreviewView(LoginRequiredMixin, FormView):
         )
         context["import_job"] = import_job
 
-        # Get CSV content from session
-        csv_content = self.request.session.get("csv_content")
-
         # Generate preview data
         processor = CSVProcessor(import_job)
-        preview_data = self._generate_preview(csv_content, processor)
+        preview_data = self._generate_preview(import_job, processor)
         context["preview_data"] = preview_data
 
+        # Optional dry run (?validate=1): in-process and capped, since it runs
+        # inside the request; validate_import checks files of any size
+        if self.request.GET.get("validate"):
+            try:
+                context["dry_run"] = dry_run_import(
+                    import_job,
+                    workers=1,
+                    max_rows=getattr(
+                        settings, "IMPORT_PREVIEW_VALIDATION_ROWS", DEFAULT_PREVIEW_VALIDATION_ROWS
+                    ),
+                )
+            except Exception as e:
+                context["dry_run"] = {"error": str(e)}
+
         return context
 
     def _generate_preview(
-        self, csv_content: str, processor: CSVProcessor
+        self, import_job: ImportJob, processor: CSVProcessor
     ) -> Dict[str, Any]:
-        """Generate preview data for the first few rows."""
+        """Generate preview data for the first few rows (only those are read)."""
         try:
-            csv_file = StringIO(csv_content)
-            reader = csv.reader(csv_file)
-
-            # Skip header if configured
-            if processor.import_job.skip_header:
-                next(reader)
-
-            preview_rows = []
-            sample_count = 0
-
-            for row_num, row in enumerate(reader):
-                if sample_count >= 5:  # Show first 5 rows
-                    break
-
-                try:
-                    # Map row data to resource fields
-                    resource_data = processor._map_row_to_resource(row)
-
-                    # Validate resource data
-                    processor._validate_resource_data(resource_data, row_num + 1)
-
-                    preview_rows.append(
-                        {
-                            "row_number": row_num + 1,
-                            "data": resource_data,
-                            "status": "valid",
-                            "error": None,
-                        }
-                    )
-
-                except Exception as e:
-                    preview_rows.append(
-                        {
-                            "row_number": row_num + 1,
-                            "data": processor._map_row_to_resource(row),
-                            "status": "invalid",
-                            "error": str(e),
-                        }
-                    )
-
-                sample_count += 1
+            with import_job.open_source() as lines:
+                reader = csv.reader(lines)
+
+                # Skip header if configured
+                if processor.import_job.skip_header:
+                    next(reader)
+
+                preview_rows = []
+                sample_count = 0
+
+                for row_num, row in enumerate(reader):
+                    if sample_count >= 5:  # Show first 5 rows
+                        break
+
+                    try:
+                        # Map row data to resource fields
+                        resource_data = processor._map_row_to_resource(row)
+
+                        # Validate resource data
+                        processor._validate_resource_data(resource_data, row_num + 1)
+
+                        preview_rows.append(
+                            {
+                                "row_number": row_num + 1,
+                                "data": resource_data,
+                                "status": "valid",
+                                "error": None,
+                            }
+                        )
+
+                    except Exception as e:
+                        preview_rows.append(
+                            {
+                                "row_number": row_num + 1,
+                                "data": processor._map_row_to_resource(row),
+                                "status": "invalid",
+                                "error": str(e),
+                            }
+                        )
+
+                    sample_count += 1
 
             return {"rows": preview_rows, "total_previewed": len(preview_rows)}
 
@@ -249,53 +255,18 @@ class ImportPreviewView(LoginRequiredMixin, FormView):
             return {"rows": [], "total_previewed": 0, "error": str(e)}
 
     def form_valid(self, form):
-        """Process the import."""
+        """Queue the import for the background worker."""
         # Get import job
         import_job = get_object_or_404(
             ImportJob, id=self.kwargs["pk"], created_by=self.request.user
         )
 
-        # Get CSV content from session
-        csv_content = self.request.session.get("csv_content")
-
-        # Process the import
-        return self._process_import(import_job, csv_content)
-
-    def _process_import(self, import_job: ImportJob, csv_content: str) -> HttpResponse:
-        """Process the CSV import."""
-        try:
-            # Update import job status
-            import_job.status = "processing"
-            import_job.started_at = timezone.now()
-            import_job.save()
-
-            # Process CSV
-            processor = CSVProcessor(import_job)
-            results = processor.process_csv(csv_content)
-
-            # Update import job with results
-            import_job.total_rows = results["total_rows"]
-            import_job.valid_rows = results["valid_rows"]
-            import_job.invalid_rows = results["invalid_rows"]
-            import_job.resources_created = results["resources_created"]
-            import_job.status = "completed"
-            import_job.completed_at = timezone.now()
-            import_job.save()
-
-            # Clear session data
-            self.request.session.pop("csv_content", None)
-            self.request.session.pop("import_job_id", None)
-
-            return redirect("importer:import_job_detail", pk=import_job.id)
+        enqueue_import_job(import_job)
 
-        except Exception as e:
-            # Update import job status to failed
-            import_job.status = "failed"
-            import_job.completed_at = timezone.now()
-            import_job.save()
+        # Clear session data
+        self.request.session.pop("import_job_id", None)
 
-            # Re-raise the exception
-            raise e
+        return redirect("importer:import_job_detail", pk=import_job.id)
 
 
 class ExportView(LoginRequiredMixin, FormView):
@@ -313,56 +284,17 @@ class ExportView(LoginRequiredMixin, FormView):
         include_header = form.cleaned_data.get("include_header", True)
         fields_to_export = form.cleaned_data.get("fields_to_export", [])
 
-        # Generate CSV response
-        response = HttpResponse(content_type="text/csv")
-        response["Content-Disposition"] = 'attachment; filename="resources_export.csv"'
-
-        # Create CSV writer
-        writer = csv.writer(response)
-
-        # Write header if requested
-        if include_header:
-            header = list(fields_to_export)
-            if "service_types" not in fields_to_export:
+        # Service types are always exported, as the last column if not chosen
+        fields = list(fields_to_export)
+        header = list(fields_to_export) if include_header else None
+        if "service_types" not in fields:
+            fields.append("service_types")
+            if header is not None:
                 header.append("Service Types")
-            writer.writerow(header)
-
-        # Write data rows
-        for resource in queryset:
-            row = []
-            for field in fields_to_export:
-                value = getattr(resource, field, "")
-
-                # Handle special cases
-                if field == "category" and resource.category:
-                    value = resource.category.name
-                elif field == "last_verified_by" and value:
-                    value = value.username
-                elif field == "created_by" and value:
-                    value = value.username
-                elif field == "updated_by" and value:
-                    value = value.username
-                elif field == "archived_by" and value:
-                    value = value.username
-                elif (
-                    field in ["last_verified_at", "created_at", "updated_at", "archived_at"] and value
-                ):
-                    value = value.strftime("%Y-%m-%d %H:%M:%S")
-                elif field in ["is_emergency_service", "is_24_hour_service", "is_archived"]:
-                    value = "Yes" if value else "No"
-                elif field == "service_types":
-                    value = ", ".join([st.name for st in resource.service_types.all()])
-
-                row.append(str(value) if value is not None else "")
-
-            # Add service types if not already included
-            if "service_types" not in fields_to_export:
-                service_types = ", ".join([st.name for st in resource.service_types.all()])
-                row.append(service_types)
-            
-            writer.writerow(row)
-
-        return response
+
+        return stream_resources_csv(
+            queryset, fields, header, filename="resources_export.csv"
+        )
 
 
 @login_required
@@ -374,15 +306,42 @@ def cancel_import(request: HttpRequest, pk: int) -> HttpResponse:
     )
 
     # Clear session data
-    request.session.pop("csv_content", None)
     request.session.pop("import_job_id", None)
 
-    # Delete the import job
+    # Delete the uploaded file and the import job
+    import_job.source_file.delete(save=False)
     import_job.delete()
 
     return redirect("importer:import_job_list")
 
 
+@login_required
+def import_job_progress(request: HttpRequest, pk: int) -> JsonResponse:
+    """Return an import job's status and counters for progress polling."""
+    import_job = get_object_or_404(ImportJob, id=pk, created_by=request.user)
+    return JsonResponse(
+        {
+            "status": import_job.status,
+            "total_rows": import_job.total_rows,
+            "valid_rows": import_job.valid_rows,
+            "invalid_rows": import_job.invalid_rows,
+            "resources_created": import_job.resources_created,
+            "last_error": import_job.last_error,
+        }
+    )
+
+
+@login_required
+@require_http_methods(["POST"])
+def resume_import(request: HttpRequest, pk: int) -> HttpResponse:
+    """Queue a failed import job again from its last committed chunk."""
+    import_job = get_object_or_404(
+        ImportJob, id=pk, created_by=request.user, status="failed"
+    )
+    resume_import_job(import_job)
+    return redirect("importer:import_job_detail", pk=import_job.id)
+
+
 @login_required
 def download_error_report(request: HttpRequest, pk: int) -> HttpResponse:
     """Download error report for an import job."""
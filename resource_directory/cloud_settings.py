@@ -61,13 +61,11 @@ LOGGING = {
     },
 }
 
-# Skip SQLite-specific migrations for PostgreSQL
-MIGRATION_MODULES = {
-    'directory': 'directory.migrations_postgresql',
-}
+# Directory migrations are vendor-aware (0019_add_full_text_search creates the
+# tsvector column and GIN index on PostgreSQL), so the default migration
+# modules are used here.
 
 # Skip problematic migrations
 MIGRATION_EXCLUDE = [
-    ('directory', '0002_add_fts5_search'),
     ('audit', '0002_add_immutability_triggers'),
 ]
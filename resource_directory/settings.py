@@ -191,6 +191,10 @@ STATICFILES_DIRS = [
     BASE_DIR / "static",
 ]
 
+# Uploaded files (CSV imports waiting for the import worker)
+MEDIA_URL = "/media/"
+MEDIA_ROOT = Path(os.environ.get("MEDIA_ROOT", BASE_DIR / "media"))
+
 # WhiteNoise configuration for serving static files in production
 # and locally when DEBUG is False
 STORAGES = {
@@ -235,6 +239,57 @@ RESOURCE_STATUS_CHOICES = [
 MIN_DESCRIPTION_LENGTH = 20
 VERIFICATION_EXPIRY_DAYS = 180
 
+# Search settings
+# Seconds an ordered search/location result list stays cached for pagination
+SEARCH_RESULT_CACHE_TIMEOUT = int(os.environ.get("SEARCH_RESULT_CACHE_TIMEOUT", "300"))
+# Seconds rendered public page content stays cached (also expires when data changes)
+PUBLIC_PAGE_CACHE_SECONDS = int(os.environ.get("PUBLIC_PAGE_CACHE_SECONDS", "600"))
+# Related resources stored per published resource (rebuild nightly with build_related_resources)
+RELATED_RESOURCES_LIMIT = int(os.environ.get("RELATED_RESOURCES_LIMIT", "5"))
+
+# CSV import: rows validated and inserted per transaction by the bulk importer
+IMPORT_CHUNK_SIZE = int(os.environ.get("IMPORT_CHUNK_SIZE", "500"))
+# Seconds without progress before a processing import job is requeued
+# (imports run in `manage.py process_import_jobs`, not in the web request)
+IMPORT_JOB_STALE_SECONDS = int(os.environ.get("IMPORT_JOB_STALE_SECONDS", "600"))
+# Processes used to validate a whole file in a dry run (1 = validate in-process)
+IMPORT_VALIDATION_WORKERS = int(os.environ.get("IMPORT_VALIDATION_WORKERS", "2"))
+# Rows the import preview page validates in-process (the whole file is
+# checked with `manage.py validate_import`)
+IMPORT_PREVIEW_VALIDATION_ROWS = int(os.environ.get("IMPORT_PREVIEW_VALIDATION_ROWS", "5000"))
+# Every Nth resource version stores a full snapshot; the others store only
+# the changed fields
+VERSION_SNAPSHOT_INTERVAL = int(os.environ.get("VERSION_SNAPSHOT_INTERVAL", "10"))
+
+# Coverage area index (in-process R-tree used by location search, GIS only)
+COVERAGE_INDEX_PRELOAD = os.environ.get("COVERAGE_INDEX_PRELOAD", "True").lower() == "true"
+# Seconds between checks for coverage area changes made by other workers
+COVERAGE_INDEX_REFRESH_SECONDS = int(os.environ.get("COVERAGE_INDEX_REFRESH_SECONDS", "60"))
+# Number of prepared boundary geometries kept in memory per worker
+COVERAGE_INDEX_GEOMETRY_CACHE_SIZE = int(os.environ.get("COVERAGE_INDEX_GEOMETRY_CACHE_SIZE", "2000"))
+
+# Location autocomplete (in-process prefix index of cities, areas and ZIP codes)
+# Seconds between checks for changes made by other workers
+SUGGESTION_INDEX_REFRESH_SECONDS = int(os.environ.get("SUGGESTION_INDEX_REFRESH_SECONDS", "60"))
+# Seconds browsers and proxies may cache a suggestions response
+SUGGESTION_CACHE_SECONDS = int(os.environ.get("SUGGESTION_CACHE_SECONDS", "300"))
+
+# Geocoding in-memory cache (per worker, in front of the GeocodingCache table)
+GEOCODING_MEMORY_CACHE_SIZE = int(os.environ.get("GEOCODING_MEMORY_CACHE_SIZE", "1000"))
+# Seconds a geocoding result stays in memory (never longer than its DB entry)
+GEOCODING_MEMORY_CACHE_TTL = int(os.environ.get("GEOCODING_MEMORY_CACHE_TTL", "3600"))
+# Geocoding cache hit counts are buffered in memory and written back in bulk
+# after a response once this many seconds have passed...
+GEOCODING_HIT_FLUSH_SECONDS = int(os.environ.get("GEOCODING_HIT_FLUSH_SECONDS", "60"))
+# ...or once this many cache entries have unflushed hits
+GEOCODING_HIT_FLUSH_MAX_PENDING = int(os.environ.get("GEOCODING_HIT_FLUSH_MAX_PENDING", "500"))
+# Concurrent provider requests in batch_geocode (provider rate limits still apply)
+GEOCODING_BATCH_WORKERS = int(os.environ.get("GEOCODING_BATCH_WORKERS", "4"))
+# Reverse-geocoding results are cached per grid cell of this size (meters)
+GEOCODING_REVERSE_GRID_METERS = int(os.environ.get("GEOCODING_REVERSE_GRID_METERS", "100"))
+# Answer place/county/state/ZIP queries from the offline gazetteer before Nominatim
+GEOCODING_GAZETTEER_ENABLED = os.environ.get("GEOCODING_GAZETTEER_ENABLED", "True").lower() == "true"
+
 # Markdown Configuration
 # The verification notes field now uses Markdown formatting
 # Users can write in Markdown and see a live preview of the formatted content
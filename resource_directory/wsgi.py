@@ -14,3 +14,17 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "resource_directory.settings")
 
 application = get_wsgi_application()
+
+# Build the coverage area index once per worker so the first location search
+# does not pay for it
+from django.conf import settings  # noqa: E402
+
+if getattr(settings, "GIS_ENABLED", False) and getattr(settings, "COVERAGE_INDEX_PRELOAD", True):
+    import logging
+
+    try:
+        from directory.services.coverage_index import get_coverage_index
+
+        get_coverage_index().load()
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"Could not preload coverage area index: {e}")